@@ -5,6 +5,8 @@ import json
 from data_formulator.agent_config import reasoning_effort_for
 from data_formulator.agents.agent_utils import generate_data_summary, extract_json_objects, extract_code_from_gpt_response
 from data_formulator.agents.agent_language import inject_language_instruction
+from data_formulator.agents.response_cache import cached_completion
+from data_formulator.agents.response_cache import table_content_hashes
 
 import logging
 
@@ -150,10 +152,11 @@ def transform_data(df_movies):
 
 class CodeExplanationAgent(object):
 
-    def __init__(self, client, workspace, language_instruction=""):
+    def __init__(self, client, workspace, language_instruction="", bypass_cache=False):
         self.client = client
         self.workspace = workspace
         self.language_instruction = language_instruction
+        self.bypass_cache = bypass_cache
 
     def run(self, input_tables, code, n=1):
 
@@ -173,9 +176,17 @@ class CodeExplanationAgent(object):
         messages = [{"role":"system", "content": system_prompt},
                     {"role":"user","content": user_query}]
         
-        response = self.client.get_completion(messages = messages, reasoning_effort=reasoning_effort_for(_AGENT_ID, self.client.model))
+        # The summary only samples the data; key on the full content hashes too.
+        table_hashes = table_content_hashes(
+            self.workspace, [t.get("name") for t in input_tables if isinstance(t, dict)],
+        )
+        response, commit = cached_completion(
+            self.client, messages, bypass=self.bypass_cache, table_hashes=table_hashes,
+            reasoning_effort=reasoning_effort_for(_AGENT_ID, self.client.model),
+        )
 
         candidates = []
+        parsed = True
         for choice in response.choices:
             
             logger.debug("\n=== Code explanation result ===>\n")
@@ -199,6 +210,8 @@ class CodeExplanationAgent(object):
 
                 if json_blocks:
                     concepts = json_blocks[0]
+                else:
+                    parsed = False  # a concepts section we could not read
             
             # Build result
             if concepts:
@@ -216,6 +229,9 @@ class CodeExplanationAgent(object):
 
             candidates.append(result)
 
+        if candidates and parsed:
+            commit()
+
         status = candidates[0].get('status', '?') if candidates else 'empty'
         logger.info(f"[CodeExplanationAgent] run done | status={status}")
         return candidates
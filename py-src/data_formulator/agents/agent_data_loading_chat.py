@@ -20,6 +20,7 @@ import pandas as pd
 
 from data_formulator.agent_config import reasoning_effort_for
 from data_formulator.agents.agent_utils import accumulate_reasoning_content
+from data_formulator.agents.async_drive import STREAM_END, await_io, iter_chunks, next_chunk
 from data_formulator.datalake.parquet_utils import df_to_safe_records
 
 logger = logging.getLogger(__name__)
@@ -754,9 +755,11 @@ def _build_connector_summary_block(
 class DataLoadingAgent:
     """Conversational agent for data loading and extraction."""
 
-    def __init__(self, client, workspace, available_datasets=None, language_instruction="", knowledge_store=None, row_limit=None):
+    def __init__(self, client, workspace, available_datasets=None, language_instruction="", knowledge_store=None, row_limit=None, async_io=False):
         self.client = client
         self.workspace = workspace
+        # Await LLM streams on the event loop (ASGI server, see agents/async_drive.py).
+        self.async_io = async_io
         self.available_datasets = available_datasets or []
         self.language_instruction = language_instruction
         self._knowledge_store = knowledge_store
@@ -824,7 +827,10 @@ class DataLoadingAgent:
         for _iteration in range(max_iterations):
             # Call LLM with tool definitions
             try:
-                response = self._call_llm(llm_messages, stream=True)
+                if self.async_io:
+                    response = yield from await_io(lambda: self._acall_llm(llm_messages, stream=True))
+                else:
+                    response = self._call_llm(llm_messages, stream=True)
             except Exception as e:
                 logger.error(f"LLM call failed: {e}")
                 yield {"type": "text_delta", "content": f"\n\nError calling model: {e}"}
@@ -836,7 +842,8 @@ class DataLoadingAgent:
             accumulated_reasoning = None
             finish_reason = None
 
-            for chunk in response:
+            response = iter_chunks(response)
+            while (chunk := (yield from next_chunk(response))) is not STREAM_END:
                 if not hasattr(chunk, 'choices') or len(chunk.choices) == 0:
                     continue
 
@@ -988,10 +995,15 @@ class DataLoadingAgent:
         try:
             # get_completion() dispatches without tools, so the model must reply
             # with plain text rather than another tool call.
-            response = self.client.get_completion(
-                llm_messages, stream=True,
-                reasoning_effort=reasoning_effort_for(_AGENT_ID, self.client.model),
-            )
+            effort = reasoning_effort_for(_AGENT_ID, self.client.model)
+            if self.async_io:
+                response = yield from await_io(lambda: self.client.aget_completion(
+                    llm_messages, stream=True, reasoning_effort=effort,
+                ))
+            else:
+                response = self.client.get_completion(
+                    llm_messages, stream=True, reasoning_effort=effort,
+                )
         except Exception as e:
             logger.error(f"forced summary call failed: {e}")
             fallback = (
@@ -1003,7 +1015,8 @@ class DataLoadingAgent:
             return
 
         wrote_text = False
-        for chunk in response:
+        response = iter_chunks(response)
+        while (chunk := (yield from next_chunk(response))) is not STREAM_END:
             if not hasattr(chunk, 'choices') or len(chunk.choices) == 0:
                 continue
             delta = chunk.choices[0].delta
@@ -1030,6 +1043,12 @@ class DataLoadingAgent:
             messages, tools=TOOLS, stream=stream, reasoning_effort=reasoning_effort_for(_AGENT_ID, self.client.model),
         )
 
+    async def _acall_llm(self, messages, stream=True):
+        """Async :meth:`_call_llm` for ``async_io`` runs."""
+        return await self.client.aget_completion_with_tools(
+            messages, tools=TOOLS, stream=stream, reasoning_effort=reasoning_effort_for(_AGENT_ID, self.client.model),
+        )
+
     # ------------------------------------------------------------------
     # Tool execution
     # ------------------------------------------------------------------
@@ -13,6 +13,7 @@ import logging
 from data_formulator.agent_config import reasoning_effort_for
 from data_formulator.agents.agent_utils import extract_json_objects
 from data_formulator.agents.agent_language import inject_language_instruction
+from data_formulator.agents.response_cache import cached_completion
 
 logger = logging.getLogger(__name__)
 
@@ -101,9 +102,10 @@ _CHART_INTENT_SYSTEM_PROMPT = (
 class SimpleAgents:
     """Collection of lightweight single-turn LLM agents."""
 
-    def __init__(self, client, language_instruction: str = ""):
+    def __init__(self, client, language_instruction: str = "", bypass_cache: bool = False):
         self.client = client
         self.language_instruction = language_instruction
+        self.bypass_cache = bypass_cache
 
     # -- NL → structured filter conditions ----------------------------------
 
@@ -134,7 +136,7 @@ class SimpleAgents:
         ]
 
         logger.info("[SimpleAgents.nl_to_filter] run start")
-        response = self.client.get_completion(messages=messages, reasoning_effort=reasoning_effort_for(_AGENT_ID, self.client.model))
+        response, commit = cached_completion(self.client, messages, bypass=self.bypass_cache, reasoning_effort=reasoning_effort_for(_AGENT_ID, self.client.model))
         raw = response.choices[0].message.content.strip()
 
         # Strip markdown code fences if present
@@ -145,6 +147,9 @@ class SimpleAgents:
             raw = raw.strip()
 
         result = json.loads(raw)
+        if not isinstance(result, dict):
+            raise ValueError("Filter response is not a JSON object")
+        commit()
 
         # Validate: only allow known column names
         known_cols = {c["name"] for c in columns}
@@ -187,8 +192,10 @@ class SimpleAgents:
         ]
 
         logger.info("[SimpleAgents.workspace_name] run start")
-        response = self.client.get_completion(messages=messages, reasoning_effort=reasoning_effort_for(_AGENT_ID, self.client.model))
+        response, commit = cached_completion(self.client, messages, bypass=self.bypass_cache, reasoning_effort=reasoning_effort_for(_AGENT_ID, self.client.model))
         display_name = response.choices[0].message.content.strip().strip("\"'")
+        if display_name:
+            commit()
         if len(display_name) > 60:
             display_name = display_name[:57] + "..."
 
@@ -222,7 +229,7 @@ class SimpleAgents:
         ]
 
         try:
-            response = self.client.get_completion(messages=messages, reasoning_effort=reasoning_effort_for(_AGENT_ID, self.client.model))
+            response, commit = cached_completion(self.client, messages, bypass=self.bypass_cache, reasoning_effort=reasoning_effort_for(_AGENT_ID, self.client.model))
             raw = (response.choices[0].message.content or "").strip().upper()
         except Exception as e:
             logger.warning("[SimpleAgents.classify_chart_intent] LLM call failed: %s", e)
@@ -233,5 +240,7 @@ class SimpleAgents:
             verdict = "style"
         else:
             verdict = "data"
+        if ("STYLE" in raw) != ("DATA" in raw):
+            commit()  # only an unambiguous answer is worth replaying
         logger.info("[SimpleAgents.classify_chart_intent] %r -> %s", text[:80], verdict)
         return verdict
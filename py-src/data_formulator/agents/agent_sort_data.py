@@ -5,6 +5,7 @@ import json
 from data_formulator.agent_config import reasoning_effort_for
 from data_formulator.agents.agent_utils import extract_json_objects
 from data_formulator.agents.agent_language import inject_language_instruction
+from data_formulator.agents.response_cache import cached_completion
 
 import logging
 
@@ -69,9 +70,10 @@ For example:
 
 class SortDataAgent(object):
 
-    def __init__(self, client, language_instruction: str = ""):
+    def __init__(self, client, language_instruction: str = "", bypass_cache: bool = False):
         self.client = client
         self.language_instruction = language_instruction
+        self.bypass_cache = bypass_cache
 
     def run(self, name, values, n=1):
 
@@ -93,7 +95,10 @@ class SortDataAgent(object):
                     {"role":"user","content": user_query}]
         
         ###### the part that calls open_ai
-        response = self.client.get_completion(messages = messages, reasoning_effort=reasoning_effort_for(_AGENT_ID, self.client.model))
+        response, commit = cached_completion(
+            self.client, messages, bypass=self.bypass_cache,
+            reasoning_effort=reasoning_effort_for(_AGENT_ID, self.client.model),
+        )
 
         #log = {'messages': messages, 'response': response.model_dump(mode='json')}
 
@@ -120,6 +125,9 @@ class SortDataAgent(object):
 
             candidates.append(result)
 
+        if candidates and all(c['status'] == 'ok' for c in candidates):
+            commit()
+
         status = candidates[0].get('status', '?') if candidates else 'empty'
         logger.info(f"[SortDataAgent] run done | status={status}")
         return candidates
\ No newline at end of file
@@ -5,6 +5,7 @@ import json
 from data_formulator.agent_config import reasoning_effort_for
 from data_formulator.agents.agent_utils import extract_json_objects
 from data_formulator.agents.agent_language import inject_language_instruction
+from data_formulator.agents.response_cache import cached_completion
 
 import logging
 
@@ -59,9 +60,10 @@ Example:
 
 class StarterQuestionsAgent(object):
 
-    def __init__(self, client, language_instruction: str = ""):
+    def __init__(self, client, language_instruction: str = "", bypass_cache: bool = False):
         self.client = client
         self.language_instruction = language_instruction
+        self.bypass_cache = bypass_cache
 
     def run(self, tables, primary_table=None, n=2):
         """Generate a short list of starter exploration questions.
@@ -85,8 +87,8 @@ class StarterQuestionsAgent(object):
         messages = [{"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_query}]
 
-        response = self.client.get_completion(
-            messages=messages,
+        response, commit = cached_completion(
+            self.client, messages, bypass=self.bypass_cache,
             reasoning_effort=reasoning_effort_for(_AGENT_ID, self.client.model),
         )
 
@@ -114,6 +116,8 @@ class StarterQuestionsAgent(object):
             elif isinstance(candidate, list):
                 questions = [str(q).strip() for q in candidate if str(q).strip()]
 
+            if questions:
+                commit()
             return questions[:n]
 
         return []
@@ -1,10 +1,13 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 
+import copy
 import json
 import keyword
 import logging
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -121,11 +124,23 @@ def _source_table_matches_catalog_entry(
     return bool(source_table and source_table in candidates)
 
 
+# Catalog overlays are rebuilt on every prompt build; parsing every cached
+# catalog each time is the slow part. Memoized per (user_home, catalog file
+# signature, table -> source_table mapping), so any catalog sync or table
+# change misses naturally.
+_CATALOG_LOOKUPS_MAX = 64
+_catalog_lookups_memo: OrderedDict[tuple, tuple] = OrderedDict()
+_catalog_lookups_lock = threading.Lock()
+
+
 def build_catalog_metadata_lookups(
     workspace,
 ) -> tuple[dict[str, str], dict[str, dict[str, str]], dict[str, list[str]], dict[str, dict[str, dict]]]:
     """Build table/column metadata overlays from catalog cache (loader-only).
 
+    Results are memoized while the catalog cache files and the workspace's
+    table -> source table mapping are unchanged; callers get fresh copies.
+
     Returns
     -------
     4-tuple of (table_desc_cache, col_desc_cache, table_extra_cache, col_meta_cache)
@@ -145,7 +160,27 @@ def build_catalog_metadata_lookups(
         if not ws_meta:
             return table_desc_cache, col_desc_cache, table_extra_cache, col_meta_cache
 
-        from data_formulator.datalake.catalog_cache import list_cached_sources, load_catalog
+        from data_formulator.datalake.catalog_cache import (
+            catalog_signature,
+            list_cached_sources,
+            load_catalog,
+        )
+
+        source_tables = tuple(sorted(
+            (table_name, str(table_meta.source_table))
+            for table_name, table_meta in ws_meta.tables.items()
+            if getattr(table_meta, "source_table", None)
+        ))
+        if not source_tables:
+            # Nothing in the workspace can match a catalog entry.
+            return table_desc_cache, col_desc_cache, table_extra_cache, col_meta_cache
+        memo_key = (str(user_home), catalog_signature(user_home), source_tables)
+        with _catalog_lookups_lock:
+            memoized = _catalog_lookups_memo.get(memo_key)
+            if memoized is not None:
+                _catalog_lookups_memo.move_to_end(memo_key)
+        if memoized is not None:
+            return copy.deepcopy(memoized)
 
         # Source-only catalog: no user annotation merge. The agent now only
         # sees descriptions that came from the source system (SQL comments,
@@ -199,6 +234,12 @@ def build_catalog_metadata_lookups(
                 col_desc_cache[table_name] = column_descs
             if col_metas:
                 col_meta_cache[table_name] = col_metas
+
+        result = (table_desc_cache, col_desc_cache, table_extra_cache, col_meta_cache)
+        with _catalog_lookups_lock:
+            _catalog_lookups_memo[memo_key] = copy.deepcopy(result)
+            while len(_catalog_lookups_memo) > _CATALOG_LOOKUPS_MAX:
+                _catalog_lookups_memo.popitem(last=False)
     except Exception:
         _logger.debug("Failed to build catalog metadata lookups", exc_info=True)
 
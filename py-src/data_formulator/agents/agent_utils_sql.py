@@ -32,7 +32,10 @@ def create_duckdb_conn_with_parquet_views(workspace, input_tables: list[dict]):
     for table in input_tables:
         name = table["name"]
         view_name = sanitize_table_name(name)
-        path = workspace.get_parquet_path(name)
-        path_escaped = str(path).replace("\\", "\\\\").replace("'", "''")
-        conn.execute(f'CREATE VIEW "{view_name}" AS SELECT * FROM read_parquet(\'{path_escaped}\')')
+        # Main file plus any appended parts.
+        with workspace.parquet_files(name) as (_meta, paths):
+            sources = ", ".join(
+                "'" + str(p).replace("\\", "\\\\").replace("'", "''") + "'" for p in paths
+            )
+        conn.execute(f'CREATE VIEW "{view_name}" AS SELECT * FROM read_parquet([{sources}])')
     return conn
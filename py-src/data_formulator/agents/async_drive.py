@@ -0,0 +1,147 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+"""Drive synchronous agent generators from an asyncio event loop.
+
+Agents are written as synchronous generators of stream events.  Under the
+ASGI entry point (:mod:`data_formulator.asgi`) the long waits inside a run —
+LLM token streaming — should not pin a thread for minutes.  Agents built
+with ``async_io=True`` therefore do their LLM I/O through :func:`await_io`,
+which *yields* an :class:`AwaitIO` marker instead of blocking.  The driver
+(:func:`drive_async`) awaits the marker's coroutine on the event loop and
+then resumes the generator, which reads the outcome off the marker.  Every
+step between markers (prompt building, sandbox and DuckDB calls) runs on a
+bounded thread pool, so a thread is only held while there is CPU or
+blocking local work to do.
+
+In the WSGI server no marker is ever produced: agents keep their blocking
+LLM calls and :func:`next_chunk` iterates the sync stream directly.  Layers
+between the agent and the route pass markers through unchanged like any
+other event they do not recognise.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Generator, Iterator
+
+# WSGI environ key set by the ASGI bridge; routes read it to decide whether
+# to build agents with ``async_io=True``.
+ASYNC_IO_ENVIRON_KEY = "data_formulator.async_io"
+
+# Returned by ``next_chunk`` when an LLM stream is exhausted.
+STREAM_END = object()
+
+_DONE = object()
+
+
+class AwaitIO:
+    """Marker event: "await ``factory()`` on the loop, then resume me".
+
+    The driver stores the awaited value in ``result`` (or the exception in
+    ``error``) before resuming the generator that yielded the marker.
+    """
+
+    __slots__ = ("factory", "result", "error")
+
+    def __init__(self, factory: Callable[[], Awaitable[Any]]):
+        self.factory = factory
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+def await_io(factory: Callable[[], Awaitable[Any]]) -> Generator[AwaitIO, None, Any]:
+    """``value = yield from await_io(lambda: coro())`` inside an agent generator."""
+    marker = AwaitIO(factory)
+    yield marker
+    if marker.error is not None:
+        raise marker.error
+    return marker.result
+
+
+def iter_chunks(stream: Any) -> Any:
+    """Normalise an LLM stream for :func:`next_chunk` (sync iterator or async iterator)."""
+    if hasattr(stream, "__anext__"):
+        return stream
+    if hasattr(stream, "__aiter__"):
+        return stream.__aiter__()
+    return iter(stream)
+
+
+async def _anext_or_end(stream: Any) -> Any:
+    try:
+        return await stream.__anext__()
+    except StopAsyncIteration:
+        return STREAM_END
+
+
+def next_chunk(stream: Any) -> Generator[AwaitIO, None, Any]:
+    """``chunk = yield from next_chunk(stream)``; ``STREAM_END`` when exhausted.
+
+    *stream* comes from :func:`iter_chunks`.  Async streams are advanced on
+    the event loop via :func:`await_io`; sync streams are advanced inline.
+    """
+    if hasattr(stream, "__anext__"):
+        return (yield from await_io(lambda: _anext_or_end(stream)))
+    return next(stream, STREAM_END)
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_agent_executor() -> ThreadPoolExecutor:
+    """Bounded pool that runs agent steps between awaits (``DF_AGENT_WORKERS``, default 32)."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                workers = int(os.environ.get("DF_AGENT_WORKERS", "32"))
+                _executor = ThreadPoolExecutor(
+                    max_workers=max(1, workers), thread_name_prefix="df-agent",
+                )
+    return _executor
+
+
+async def drive_async(
+    gen: Iterator[Any],
+    executor: ThreadPoolExecutor | None = None,
+) -> AsyncIterator[Any]:
+    """Iterate a sync generator from the event loop, resolving ``AwaitIO`` markers.
+
+    Each ``next()`` runs on *executor* (default :func:`get_agent_executor`)
+    inside one copied :mod:`contextvars` context, so context-local state —
+    including Flask's request context pushed by ``stream_with_context`` —
+    survives the generator hopping between pool threads.  Closing the
+    returned iterator (e.g. on client disconnect) closes *gen*.
+    """
+    loop = asyncio.get_running_loop()
+    executor = executor or get_agent_executor()
+    ctx = contextvars.copy_context()
+    step: asyncio.Future | None = None
+    try:
+        while True:
+            step = loop.run_in_executor(executor, ctx.run, next, gen, _DONE)
+            # Shielded: if we are cancelled mid-step the thread keeps running
+            # ``next()``, and ``close()`` below must wait for it to finish.
+            item = await asyncio.shield(step)
+            step = None
+            if item is _DONE:
+                return
+            if isinstance(item, AwaitIO):
+                try:
+                    item.result = await item.factory()
+                except Exception as e:
+                    item.error = e
+                continue
+            yield item
+    finally:
+        if step is not None:
+            await asyncio.wait([step])
+        close = getattr(gen, "close", None)
+        if close is not None:
+            await loop.run_in_executor(executor, ctx.run, close)
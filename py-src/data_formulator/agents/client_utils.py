@@ -1,9 +1,36 @@
+import hashlib
+import importlib.util
 import json
+import logging
+import threading
+from collections import OrderedDict
 import litellm
 from types import SimpleNamespace
 
 from azure.identity import DefaultAzureCredential, get_bearer_token_provider
 
+logger = logging.getLogger(__name__)
+
+_AZURE_COGNITIVE_SCOPE = "https://cognitiveservices.azure.com/.default"
+
+# One credential chain per process: DefaultAzureCredential probes env, managed
+# identity, CLI, … on first use, and the bearer token provider caches the
+# token until shortly before it expires. Building them per request re-ran the
+# probe and defeated LiteLLM's own client cache (keyed on the provider).
+_azure_token_provider = None
+_azure_token_provider_lock = threading.Lock()
+
+
+def _shared_azure_token_provider():
+    global _azure_token_provider
+    if _azure_token_provider is None:
+        with _azure_token_provider_lock:
+            if _azure_token_provider is None:
+                _azure_token_provider = get_bearer_token_provider(
+                    DefaultAzureCredential(), _AZURE_COGNITIVE_SCOPE,
+                )
+    return _azure_token_provider
+
 
 def _synthesize_stream(response):
     """Yield LiteLLM-style streaming chunks reconstructed from a *buffered*
@@ -53,6 +80,12 @@ def _synthesize_stream(response):
         finish_reason=finish_reason)])
 
 
+async def _aiter_chunks(chunks):
+    """Async iterator over an in-memory (already buffered) chunk iterator."""
+    for chunk in chunks:
+        yield chunk
+
+
 def _extract_json_objects(text):
     """Return top-level brace-balanced JSON object substrings found in ``text``.
 
@@ -250,10 +283,7 @@ class Client(object):
             self.params["api_base"] = api_base
             self.params["api_version"] = api_version if api_version else "2025-04-01-preview"
             if api_key is None or api_key == "":
-                token_provider = get_bearer_token_provider(
-                    DefaultAzureCredential(), "https://cognitiveservices.azure.com/.default"
-                )
-                self.params["azure_ad_token_provider"] = token_provider
+                self.params["azure_ad_token_provider"] = _shared_azure_token_provider()
             self.params["custom_llm_provider"] = "azure"
         elif self.endpoint == "ollama":
             ollama_base = api_base if api_base else "http://localhost:11434"
@@ -370,13 +400,7 @@ class Client(object):
             max_tokens=3, drop_params=True, _skip_mcp_handler=True, **params,
         )
 
-    def _dispatch(self, *, messages, stream, params, tools=None, extra=None):
-        """Issue the LiteLLM call, transparently handling Ollama streaming.
-
-        Ollama's streaming path in LiteLLM fails to parse native tool calls, so
-        for Ollama we always call non-streaming and, when the caller asked for a
-        stream, replay the buffered response as streaming chunks via
-        ``_synthesize_stream``. All other providers stream natively."""
+    def _call_kwargs(self, *, messages, stream, params, tools=None, extra=None):
         is_ollama = self.endpoint == "ollama"
         effective_stream = stream and not is_ollama
         call_kwargs = dict(model=self.model, messages=messages,
@@ -389,13 +413,44 @@ class Client(object):
                            **params, **(extra or {}))
         if tools is not None:
             call_kwargs["tools"] = tools
-        resp = litellm.completion(**call_kwargs)
+        if self.endpoint == "anthropic":
+            # Anthropic only caches prompt prefixes up to an explicit
+            # breakpoint; agents keep their system prompt stable across turns,
+            # so mark it (LiteLLM injects cache_control on a copy of messages).
+            call_kwargs.setdefault(
+                "cache_control_injection_points",
+                [{"location": "message", "role": "system"}],
+            )
+        return call_kwargs
+
+    def _dispatch(self, *, messages, stream, params, tools=None, extra=None):
+        """Issue the LiteLLM call, transparently handling Ollama streaming.
+
+        Ollama's streaming path in LiteLLM fails to parse native tool calls, so
+        for Ollama we always call non-streaming and, when the caller asked for a
+        stream, replay the buffered response as streaming chunks via
+        ``_synthesize_stream``. All other providers stream natively."""
+        is_ollama = self.endpoint == "ollama"
+        resp = litellm.completion(**self._call_kwargs(
+            messages=messages, stream=stream, params=params, tools=tools, extra=extra))
         if is_ollama and tools:
             resp = _salvage_tool_calls_from_content(resp, tools)
         if is_ollama and stream:
             return _synthesize_stream(resp)
         return resp
 
+    async def _adispatch(self, *, messages, stream, params, tools=None, extra=None):
+        """Async ``_dispatch`` via ``litellm.acompletion``; a stream is returned
+        as an async iterator of the same chunks."""
+        is_ollama = self.endpoint == "ollama"
+        resp = await litellm.acompletion(**self._call_kwargs(
+            messages=messages, stream=stream, params=params, tools=tools, extra=extra))
+        if is_ollama and tools:
+            resp = _salvage_tool_calls_from_content(resp, tools)
+        if is_ollama and stream:
+            return _aiter_chunks(_synthesize_stream(resp))
+        return resp
+
     def get_completion(self, messages, stream=False, reasoning_effort="low",
                        **kwargs):
         """Send a chat completion request via LiteLLM.
@@ -442,4 +497,111 @@ class Client(object):
                 sanitized = self._strip_images_from_messages(messages)
                 return self._dispatch(messages=sanitized, stream=stream,
                                       params=params, tools=tools, extra=kwargs)
-            raise
\ No newline at end of file
+            raise
+
+    async def aget_completion(self, messages, stream=False, reasoning_effort="low",
+                              **kwargs):
+        """Async ``get_completion`` for callers running on an event loop."""
+        params = self.params.copy()
+        params["reasoning_effort"] = reasoning_effort
+        params.update(kwargs)
+        try:
+            return await self._adispatch(messages=messages, stream=stream, params=params)
+        except Exception as e:
+            err = str(e)
+            if self._is_reasoning_effort_error(err):
+                params.pop("reasoning_effort", None)
+                return await self._adispatch(messages=messages, stream=stream, params=params)
+            if self._is_image_deserialize_error(err, self._messages_contain_images(messages)):
+                sanitized = self._strip_images_from_messages(messages)
+                return await self._adispatch(messages=sanitized, stream=stream, params=params)
+            raise
+
+    async def aget_completion_with_tools(self, messages, tools, stream=False,
+                                         reasoning_effort="low", **kwargs):
+        """Async ``get_completion_with_tools`` for callers running on an event loop."""
+        params = self.params.copy()
+        params["reasoning_effort"] = reasoning_effort
+        try:
+            return await self._adispatch(messages=messages, stream=stream,
+                                         params=params, tools=tools, extra=kwargs)
+        except Exception as e:
+            err = str(e)
+            if self._is_reasoning_effort_error(err):
+                params.pop("reasoning_effort", None)
+                return await self._adispatch(messages=messages, stream=stream,
+                                             params=params, tools=tools, extra=kwargs)
+            if self._is_image_deserialize_error(err, self._messages_contain_images(messages)):
+                sanitized = self._strip_images_from_messages(messages)
+                return await self._adispatch(messages=sanitized, stream=stream,
+                                             params=params, tools=tools, extra=kwargs)
+            raise
+
+
+# ---------------------------------------------------------------------------
+# Process-wide client registry
+# ---------------------------------------------------------------------------
+
+_CLIENT_REGISTRY_MAX = 256
+_client_registry: OrderedDict[tuple, Client] = OrderedDict()
+_client_registry_lock = threading.Lock()
+_http_pool_configured = False
+
+
+def _configure_http_pool() -> None:
+    """Give LiteLLM's OpenAI-compatible providers one keep-alive HTTP pool.
+
+    Without a shared ``litellm.client_session`` every newly built SDK client
+    opens its own connections and pays a fresh TLS handshake. HTTP/2 is used
+    when the optional ``h2`` package is installed. A session the deployment
+    configured itself is left alone. Only the sync session is shared: async
+    clients are bound to the event loop that created them.
+    """
+    global _http_pool_configured
+    if _http_pool_configured:
+        return
+    _http_pool_configured = True
+    if litellm.client_session is not None:
+        return
+    try:
+        import httpx
+        from litellm.llms.custom_httpx.http_handler import get_ssl_configuration
+
+        litellm.client_session = httpx.Client(
+            verify=get_ssl_configuration(),
+            follow_redirects=True,
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=60,
+            ),
+        )
+    except Exception:
+        logger.debug("Could not configure a shared LLM HTTP pool", exc_info=True)
+
+
+def get_shared_client(endpoint, model, api_key=None, api_base=None, api_version=None) -> Client:
+    """Return the process-wide :class:`Client` for this model configuration.
+
+    Clients are stateless after construction (per-call params are copied), so
+    one instance per ``(endpoint, model, api_key, api_base, api_version)`` is
+    shared by every request and thread. The API key is only part of the key
+    as a digest. The registry is a bounded LRU because user-supplied model
+    configs are unbounded.
+    """
+    key_digest = hashlib.sha256(api_key.encode("utf-8")).hexdigest() if api_key else None
+    registry_key = (endpoint, model, key_digest, api_base, api_version)
+    with _client_registry_lock:
+        client = _client_registry.get(registry_key)
+        if client is not None:
+            _client_registry.move_to_end(registry_key)
+            return client
+    _configure_http_pool()
+    client = Client(endpoint, model, api_key, api_base, api_version)
+    with _client_registry_lock:
+        client = _client_registry.setdefault(registry_key, client)
+        _client_registry.move_to_end(registry_key)
+        while len(_client_registry) > _CLIENT_REGISTRY_MAX:
+            _client_registry.popitem(last=False)
+    return client
@@ -8,7 +8,10 @@ can construct tiered context (primary/other tables, focused thread,
 peripheral threads) from the same code.
 """
 
+import json
 import logging
+import threading
+from collections import OrderedDict
 from typing import Any
 
 from data_formulator.agents.agent_utils import (
@@ -25,6 +28,32 @@ logger = logging.getLogger(__name__)
 TABLE_SAMPLE_MAX_ROWS = 5
 TABLE_SAMPLE_CHAR_LIMIT = 1000
 
+# Rendered per-table blocks of build_lightweight_table_context. A block
+# (schema, sample rows, stats) is a pure function of the table's stored data
+# and the metadata overlays shown in it, so the key is the workspace's
+# table_data_identity (workspace storage, table name, file size/mtime or
+# ETag) plus those overlays: follow-up questions on an unchanged workspace
+# skip re-reading and re-summarising every table and get a byte-identical
+# prompt prefix (which provider-side prompt caching needs), while another
+# user's table never serves this one's sample rows.
+_TABLE_SECTION_CACHE_MAX = 512
+_table_section_cache: OrderedDict[str, str] = OrderedDict()
+_table_section_lock = threading.Lock()
+
+
+def _table_section_key(workspace: Any, table_name: str, overlays: dict[str, Any]) -> str | None:
+    """Cache key for a table block, or ``None`` when the table's data cannot be identified."""
+    try:
+        data_identity = workspace.table_data_identity(table_name)
+    except Exception:
+        return None
+    if not isinstance(data_identity, tuple):
+        return None
+    return json.dumps(
+        [table_name, data_identity, overlays],
+        sort_keys=True, default=str,
+    )
+
 
 def _ensure_no_auth_catalogs_cached(user_home: Any) -> None:
     """Populate the disk catalog cache for any admin connector that has no
@@ -187,6 +216,28 @@ def build_lightweight_table_context(
 
     def _table_section(table: dict[str, Any]) -> str:
         table_name = table['name']
+        key = _table_section_key(workspace, table_name, {
+            "description": table_desc_cache.get(table_name, ""),
+            "columns": col_desc_cache.get(table_name, {}),
+            "col_metas": col_meta_cache.get(table_name, {}),
+            "import_options": import_opts_cache.get(table_name, ""),
+            "extras": table_extra_cache.get(table_name, []),
+        })
+        if key is not None:
+            with _table_section_lock:
+                cached = _table_section_cache.get(key)
+                if cached is not None:
+                    _table_section_cache.move_to_end(key)
+                    return cached
+        section = _render_table_section(table_name)
+        if key is not None and section is not None:
+            with _table_section_lock:
+                _table_section_cache[key] = section
+                while len(_table_section_cache) > _TABLE_SECTION_CACHE_MAX:
+                    _table_section_cache.popitem(last=False)
+        return section or f"Table: {table_name} (error reading schema)"
+
+    def _render_table_section(table_name: str) -> str | None:
         try:
             df = workspace.read_data_as_df(table_name)
             data_file_path = workspace.get_relative_data_file_path(table_name)
@@ -271,7 +322,7 @@ def build_lightweight_table_context(
                 detail=str(e),
                 message_code="TABLE_SCHEMA_FAILED",
             )
-            return f"Table: {table_name} (error reading schema)"
+            return None
 
     load_hint = (
         "\nTo load a table in code: pd.read_parquet('file.parquet') or "
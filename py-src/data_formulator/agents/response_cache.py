@@ -0,0 +1,287 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+"""Persistent response cache for small, deterministic helper agents.
+
+Helper agents (sort-data, starter questions, code explanation, workspace
+name, NL → filter, chart-intent classification) are re-asked the same thing
+whenever a user re-opens a workspace or re-renders a chart.  Their answers
+depend only on the prompt, so :func:`cached_completion` keeps them on disk
+and replays them in milliseconds instead of paying another LLM round-trip.
+
+Layout under ``<df_home>/llm_response_cache/``::
+
+    <key[:2]>/<key>.json   # {"created_at", "model", "choices": [{"role", "content"}]}
+
+The key is a SHA-256 over the model identity (endpoint, model, api base),
+the normalized messages, the call parameters and, where the prompt is
+derived from workspace tables, their content hashes.
+
+Entries expire after ``LLM_RESPONSE_CACHE_TTL_SECONDS`` (default 7 days).
+Total size is capped by ``LLM_RESPONSE_CACHE_MAX_BYTES`` (default 64 MiB);
+when exceeded, the least recently used entries (by file mtime, refreshed on
+every hit) are evicted.  ``LLM_RESPONSE_CACHE=off`` disables the cache, and
+callers pass ``bypass=True`` to force a fresh answer (which then replaces
+the cached one); the agent routes take ``bypass_cache`` from the request.
+
+A fresh answer is only written once the agent has parsed it: the agent calls
+the ``commit`` function returned alongside the response, so a malformed
+reply is not replayed for the next week.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_NAME = "llm_response_cache"
+_DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+_DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# After an eviction pass the cache is trimmed to this fraction of max_bytes,
+# so a full cache does not rescan the directory on every write.
+_EVICT_TO_FRACTION = 0.8
+
+
+class ResponseCache:
+    """Size-bounded, TTL-expiring disk cache of LLM choices."""
+
+    def __init__(self, root: Path, *, ttl_seconds: float, max_bytes: int) -> None:
+        self.root = Path(root)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None  # lazily measured on first write
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[list[dict[str, Any]]]:
+        """Return the cached choices for *key*, or ``None`` on miss/expiry."""
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        choices = entry.get("choices") if isinstance(entry, dict) else None
+        if not choices or time.time() - float(entry.get("created_at", 0)) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)  # recency for LRU eviction
+        except OSError:
+            pass
+        return choices
+
+    def put(self, key: str, choices: list[dict[str, Any]], *, model: str = "") -> None:
+        data = json.dumps(
+            {"created_at": time.time(), "model": model, "choices": choices},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        if len(data) > self.max_bytes:
+            return
+        path = self._path(key)
+        try:
+            replaced = path.stat().st_size  # an overwrite only adds the difference
+        except OSError:
+            replaced = 0
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError:
+            logger.debug("Could not write LLM response cache entry", exc_info=True)
+            return
+        with self._lock:
+            if self._size is None:
+                self._size = self._measure_locked()
+            else:
+                self._size += len(data) - replaced
+            if self._size > self.max_bytes:
+                self._evict_locked()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        out: list[tuple[float, int, Path]] = []
+        if not self.root.exists():
+            return out
+        for path in self.root.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            out.append((st.st_mtime, st.st_size, path))
+        return out
+
+    def _measure_locked(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict_locked(self) -> None:
+        entries = sorted(self._entries(), key=lambda e: e[0])
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * _EVICT_TO_FRACTION)
+        evicted = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+        self._size = total
+        logger.info("[ResponseCache] evicted %d entries (%d bytes kept)", evicted, total)
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+_caches: dict[Path, ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the process-wide cache for the current data home (``None`` when disabled)."""
+    if os.getenv("LLM_RESPONSE_CACHE", "on").strip().lower() in ("off", "0", "false", "no"):
+        return None
+    from data_formulator.datalake.workspace import get_data_formulator_home
+
+    root = get_data_formulator_home() / CACHE_DIR_NAME
+    with _caches_lock:
+        cache = _caches.get(root)
+        if cache is None:
+            cache = _caches[root] = ResponseCache(
+                root,
+                ttl_seconds=_env_number("LLM_RESPONSE_CACHE_TTL_SECONDS", _DEFAULT_TTL_SECONDS),
+                max_bytes=int(_env_number("LLM_RESPONSE_CACHE_MAX_BYTES", _DEFAULT_MAX_BYTES)),
+            )
+    return cache
+
+
+def _normalize_text(text: str) -> str:
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip()
+
+
+def _normalize_content(content: Any) -> Any:
+    if isinstance(content, str):
+        return _normalize_text(content)
+    if isinstance(content, list):
+        return [
+            {**part, "text": _normalize_text(part["text"])}
+            if isinstance(part, dict) and isinstance(part.get("text"), str) else part
+            for part in content
+        ]
+    return content
+
+
+def response_cache_key(
+    client: Any,
+    messages: list[dict[str, Any]],
+    params: dict[str, Any] | None = None,
+    table_hashes: dict[str, str] | None = None,
+) -> str:
+    """SHA-256 key over model identity, normalized messages, params and table hashes."""
+    payload = {
+        "endpoint": getattr(client, "endpoint", ""),
+        "model": str(getattr(client, "model", "")),
+        "api_base": (getattr(client, "params", None) or {}).get("api_base"),
+        "messages": [
+            {"role": m.get("role"), "content": _normalize_content(m.get("content"))}
+            for m in messages
+        ],
+        "params": params or {},
+        "tables": table_hashes or {},
+    }
+    blob = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def table_content_hashes(workspace: Any, table_names: Iterable[str]) -> dict[str, str]:
+    """``{table: content_hash}`` for the workspace tables that have one."""
+    hashes: dict[str, str] = {}
+    for name in table_names:
+        try:
+            content_hash = getattr(workspace.get_table_metadata(name), "content_hash", None)
+        except Exception:
+            continue
+        if isinstance(content_hash, str) and content_hash:
+            hashes[name] = content_hash
+    return hashes
+
+
+def _replay(choices: list[dict[str, Any]], model: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        model=model,
+        cached=True,
+        choices=[
+            SimpleNamespace(
+                index=i,
+                finish_reason="stop",
+                message=SimpleNamespace(role=c.get("role", "assistant"), content=c.get("content")),
+            )
+            for i, c in enumerate(choices)
+        ],
+    )
+
+
+def _no_commit() -> None:
+    pass
+
+
+def cached_completion(
+    client: Any,
+    messages: list[dict[str, Any]],
+    *,
+    bypass: bool = False,
+    table_hashes: dict[str, str] | None = None,
+    **kwargs: Any,
+) -> tuple[Any, Callable[[], None]]:
+    """``client.get_completion(messages=..., **kwargs)`` through the response cache.
+
+    Returns ``(response, commit)``.  On a hit the response is replayed as
+    an object with the same ``choices[i].message.{role,content}`` shape.
+    A fresh response is stored only when the caller invokes ``commit()``
+    after parsing it successfully; replays and uncacheable responses get a
+    no-op.  ``bypass=True`` skips the lookup, and a committed fresh answer
+    replaces the cached one.  Only non-streaming calls belong here.
+    """
+    cache = get_response_cache()
+    key = None
+    if cache is not None:
+        key = response_cache_key(client, messages, kwargs, table_hashes)
+        if not bypass:
+            choices = cache.get(key)
+            if choices:
+                logger.info("[ResponseCache] hit for %s", getattr(client, "model", "?"))
+                return _replay(choices, str(getattr(client, "model", ""))), _no_commit
+
+    response = client.get_completion(messages=messages, **kwargs)
+
+    if cache is None:
+        return response, _no_commit
+    try:
+        choices = [
+            {"role": getattr(c.message, "role", None) or "assistant", "content": c.message.content}
+            for c in response.choices
+        ]
+    except Exception:
+        choices = []
+    if not choices or not all(isinstance(c["content"], str) and c["content"] for c in choices):
+        return response, _no_commit
+
+    def commit() -> None:
+        cache.put(key, choices, model=str(getattr(client, "model", "")))
+
+    return response, commit
@@ -30,11 +30,15 @@ routes the chosen action to the owning skill's ``handle_action(...)``, feeds the
 returned observation back, and forwards the channel-tagged events.
 """
 
+import asyncio
+import contextvars
 import json
 import logging
 import re
+import tempfile
 import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, Generator
@@ -51,6 +55,7 @@ from data_formulator.agents.context import (
     build_peripheral_thread_context,
     handle_inspect_source_data,
 )
+from data_formulator.agents.async_drive import STREAM_END, AwaitIO, await_io, iter_chunks, next_chunk
 from data_formulator.agents.client_utils import Client
 from data_formulator.datalake.parquet_utils import df_to_safe_records
 
@@ -82,6 +87,11 @@ _CORE_SKILL = "core"
 _SKILL_LOADED_BANNER = "[SKILL LOADED: {name}]"
 _SKILL_LOADED_RE = re.compile(r"^\[SKILL LOADED: ([^\]]+)\]")
 
+# Built-in inspection tools that may run concurrently when the agent is built
+# with ``parallel_inspection=True`` (skill-private tools qualify too).
+# ``load_skill`` is excluded: it mutates the loaded-skill set and is instant.
+_PARALLEL_SAFE_TOOLS = frozenset({"execute_python_script", "inspect_source_data"})
+
 # ── Action-argument coercion ──────────────────────────────────────────────
 # Weaker models sometimes JSON-encode a nested action argument as a string
 # (e.g. ``"chart": "{...}"``). Parse those back to objects before dispatch so
@@ -112,56 +122,152 @@ def _rescue_unpack_json_strings(data: dict) -> None:
 # so the agent can forward it as channel ``text_delta``s. It is forgiving of a
 # partial trailing escape (``\\`` or an incomplete ``\\uXXXX``): it holds those
 # bytes back until the next chunk completes them, never emitting half an escape.
+#
+# It is fed only the *new* chunk of the arguments each time and keeps its parse
+# state across chunks, so a long report costs O(total length) rather than
+# re-scanning and re-decoding the whole accumulated fragment on every delta.
+
+_SIMPLE_ESCAPES = {
+    '"': '"', "\\": "\\", "/": "/",
+    "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t",
+}
+_STRING_SPECIAL_RE = re.compile(r'["\\]')
 
 
 class _StreamingArgExtractor:
     """Incrementally extract the decoded string value of a top-level JSON key
-    from a growing tool-call ``arguments`` fragment.
+    from a tool-call ``arguments`` fragment streamed in chunks.
 
-    ``feed`` is given the full accumulated arguments so far and returns only the
-    newly-decoded suffix of the target field's value (``""`` while nothing new
-    can be safely decoded yet).
+    ``feed`` is given the next chunk of the arguments and returns only the
+    newly-decoded text of the target field's value (``""`` while nothing new
+    can be safely decoded yet, and after the value's closing quote).
     """
 
     def __init__(self, field: str):
-        # Matches ``"field"`` then ``:`` then the opening quote of the value.
-        self._open_re = re.compile(r'"' + re.escape(field) + r'"\s*:\s*"')
-        self._emitted = 0
-
-    def feed(self, args_so_far: str) -> str:
-        decoded = self._decode(args_so_far)
-        if decoded is None or len(decoded) <= self._emitted:
+        self._field = field
+        # Phase: "seek" (scanning for the key), "value" (inside the target
+        # string value) or "done".
+        self._phase = "seek"
+        # Seek-phase tokenizer state.
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expect_key = False
+        self._key_parts: list[str] | None = None  # collecting a depth-1 key
+        self._last_key: str | None = None  # closed key awaiting ``:``
+        self._await_value = False  # saw ``"field":``, next token is the value
+        # Value-phase state: an incomplete trailing escape held back.
+        self._carry = ""
+
+    def feed(self, chunk: str) -> str:
+        if not chunk or self._phase == "done":
             return ""
-        new = decoded[self._emitted:]
-        self._emitted = len(decoded)
-        return new
-
-    def _decode(self, args: str) -> str | None:
-        """Return the decoded value-so-far of the field, or ``None`` if the
-        value has not started or a trailing escape is incomplete."""
-        m = self._open_re.search(args)
-        if not m:
-            return None
-        rest = args[m.end():]
-        out: list[str] = []
-        i, n = 0, len(rest)
-        while i < n:
-            ch = rest[i]
-            if ch == "\\":
-                if i + 1 >= n:
-                    break  # dangling escape — wait for the next chunk
-                out.append(rest[i:i + 2])
-                i += 2
+        if self._phase == "seek":
+            start = self._seek(chunk)
+            if start is None:
+                return ""
+            chunk = chunk[start:]
+        return self._decode_value(chunk)
+
+    def _seek(self, chunk: str) -> int | None:
+        """Advance the tokenizer over *chunk*; return the index just past the
+        target value's opening quote, or ``None`` if it was not reached."""
+        for i, ch in enumerate(chunk):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._key_parts is not None:
+                        self._last_key = "".join(self._key_parts)
+                        self._key_parts = None
+                    continue
+                if self._key_parts is not None:
+                    self._key_parts.append(ch)
                 continue
+            if ch in " \t\r\n":
+                continue
+            if self._await_value:
+                self._await_value = False
+                if ch == '"':
+                    self._phase = "value"
+                    return i + 1
+                # Non-string value for the field: keep scanning.
             if ch == '"':
-                break  # closing quote — value complete
-            out.append(ch)
-            i += 1
+                self._in_string = True
+                if self._depth == 1 and self._expect_key:
+                    self._key_parts = []
+                    self._expect_key = False
+            elif ch == ":":
+                if self._depth == 1 and self._last_key == self._field:
+                    self._await_value = True
+                self._last_key = None
+            elif ch in "{[":
+                self._depth += 1
+                self._expect_key = self._depth == 1 and ch == "{"
+            elif ch in "}]":
+                self._depth -= 1
+            elif ch == ",":
+                self._expect_key = self._depth == 1
+        return None
+
+    def _decode_value(self, chunk: str) -> str:
+        data = self._carry + chunk
+        self._carry = ""
+        out: list[str] = []
+        pos, n = 0, len(data)
+        while pos < n:
+            m = _STRING_SPECIAL_RE.search(data, pos)
+            if m is None:
+                out.append(data[pos:])
+                break
+            i = m.start()
+            out.append(data[pos:i])
+            if data[i] == '"':
+                self._phase = "done"  # closing quote — value complete
+                break
+            escape_len = self._escape_length(data, i)
+            if escape_len is None:
+                self._carry = data[i:]  # incomplete — wait for the next chunk
+                break
+            out.append(self._decode_escape(data[i:i + escape_len]))
+            pos = i + escape_len
+        return "".join(out)
+
+    @staticmethod
+    def _escape_length(data: str, i: int) -> int | None:
+        """Length of the escape starting at ``data[i]`` (a backslash), or
+        ``None`` if it is not complete yet. A ``\\u`` high surrogate waits for
+        its low-surrogate partner so a pair is never split across emits."""
+        n = len(data)
+        if i + 1 >= n:
+            return None
+        if data[i + 1] != "u":
+            return 2
+        if i + 6 > n:
+            return None
         try:
-            # Re-wrap as a JSON string literal so escapes decode correctly.
-            return json.loads('"' + "".join(out) + '"')
+            code = int(data[i + 2:i + 6], 16)
+        except ValueError:
+            return 6
+        if 0xD800 <= code < 0xDC00:
+            if i + 8 > n:
+                return None
+            if data[i + 6:i + 8] == "\\u":
+                return 12 if i + 12 <= n else None
+        return 6
+
+    @staticmethod
+    def _decode_escape(escape: str) -> str:
+        simple = _SIMPLE_ESCAPES.get(escape[1])
+        if simple is not None and len(escape) == 2:
+            return simple
+        try:
+            return json.loads('"' + escape + '"')
         except (json.JSONDecodeError, ValueError):
-            return None  # e.g. partial ``\\uXXXX`` — wait for more
+            return escape  # malformed escape — pass it through verbatim
 
 
 
@@ -283,9 +389,17 @@ class AnalystAgent:
         max_iterations: int = 5,
         max_repair_attempts: int = 2,
         identity_id: str | None = None,
+        async_io: bool = False,
+        parallel_inspection: bool = False,
     ):
         self.client = client
         self.workspace = workspace
+        # Under the ASGI server the LLM stream is awaited on the event loop
+        # (see agents/async_drive.py) instead of blocking a thread.
+        self.async_io = async_io
+        # Opt-in: let the model batch inspection calls in one response and run
+        # them concurrently (see _start_parallel_inspection). Off by default.
+        self.parallel_inspection = parallel_inspection
         self.registry = skill_registry or build_registry()
         self.agent_exploration_rules = agent_exploration_rules
         self.agent_coding_rules = agent_coding_rules
@@ -480,7 +594,9 @@ class AnalystAgent:
                 final_text = ""
                 action_tool_call_id = None
                 for event in self._get_next_action(trajectory, input_tables, outer_iteration=iteration):
-                    if event.get("type") == "agent_action":
+                    if isinstance(event, AwaitIO):
+                        yield event  # resolved by drive_async (async_io runs)
+                    elif event.get("type") == "agent_action":
                         action = event.get("action_data")
                         action_reason = event.get("reason", "ok")
                         action_error = event.get("error_message", "")
@@ -827,6 +943,10 @@ class AnalystAgent:
         try:
             ev = next(gen)
             while True:
+                if isinstance(ev, AwaitIO):
+                    yield ev
+                    ev = gen.send(None)
+                    continue
                 ev.setdefault("iteration", iteration)
                 etype = ev.get("type")
                 drop = (
@@ -927,8 +1047,13 @@ class AnalystAgent:
         self,
         code: str,
         input_tables: list[dict[str, Any]],
+        session: Any = None,
     ) -> dict[str, Any]:
-        """Run explore code in sandbox, capturing stdout."""
+        """Run explore code in sandbox, capturing stdout.
+
+        Runs on *session* when given, else on the turn's explore session, else
+        on a one-shot warm worker.
+        """
         capture_code = (
             "import io as _io, sys as _sys, pandas as _pd\n"
             "_old_stdout = _sys.stdout\n"
@@ -948,7 +1073,7 @@ class AnalystAgent:
                 workspace_path = _os.path.abspath(str(local_path))
                 allowed_objects = {"_pack": None}
 
-                session = getattr(self, "_explore_session", None)
+                session = session or getattr(self, "_explore_session", None)
                 if session is not None:
                     raw = session.execute(capture_code, allowed_objects, workspace_path)
                 else:
@@ -1140,6 +1265,7 @@ class AnalystAgent:
         has_other_threads: bool = False,
         has_attached_images: bool = False,
         has_charts: bool = False,
+        knowledge_rules: list[dict[str, str]] | None = None,
     ) -> str:
         rules_block = ""
         if self.agent_exploration_rules and self.agent_exploration_rules.strip():
@@ -1166,6 +1292,12 @@ class AnalystAgent:
             "  Use `inspect_source_data` to get detailed stats and sample rows. "
             "Use `execute_python_script` for custom computations."
         )
+        if self.parallel_inspection:
+            context_lines.append(
+                "  Batch independent inspection calls into one response — they run "
+                "concurrently. Each batched `execute_python_script` starts from the "
+                "current variables, but only the first one's new variables are kept."
+            )
         if has_focused_thread:
             context_lines.append(
                 "- **[FOCUSED THREAD]**: The thread the user is continuing. "
@@ -1223,7 +1355,8 @@ class AnalystAgent:
         )
 
         if self._knowledge_store:
-            knowledge_rules = self._knowledge_store.load_always_apply_rules()
+            if knowledge_rules is None:
+                knowledge_rules = self._knowledge_store.load_always_apply_rules()
             self._injected_rules = [r["title"] for r in knowledge_rules]
             prompt += self._knowledge_store.format_rules_block(knowledge_rules)
         else:
@@ -1279,6 +1412,7 @@ class AnalystAgent:
             user_content += f"{charts_block}\n\n"
 
         self._injected_knowledge = []
+        always_apply_rules = None
         if self._knowledge_store:
             always_apply_rules = self._knowledge_store.load_always_apply_rules()
             if always_apply_rules:
@@ -1312,6 +1446,7 @@ class AnalystAgent:
             has_other_threads=bool(other_threads),
             has_attached_images=bool(attached_images),
             has_charts=bool(charts_block),
+            knowledge_rules=always_apply_rules,
         )
 
         has_images = bool(attached_images) and len(attached_images) > 0
@@ -1574,8 +1709,22 @@ class AnalystAgent:
                 # tool responses (Azure/OpenAI reject any other message in
                 # between). So we defer them past the per-tc loop.
                 pending_skill_bodies: list[dict] = []
+                # Opt-in: independent calls of this batch start now on their own
+                # threads; the loop below consumes their results in request
+                # order, so events and tool messages keep the serial shape.
+                prefetched: dict[int, Future] = {}
+                batch_pool: ThreadPoolExecutor | None = None
+                if self.parallel_inspection and len(readonly_calls) > 1:
+                    batch_pool = ThreadPoolExecutor(
+                        max_workers=len(readonly_calls),
+                        thread_name_prefix="df-inspect",
+                    )
+                    prefetched = self._start_parallel_inspection(
+                        readonly_calls, input_tables or [], messages,
+                        skill_tool_owners, batch_pool,
+                    )
 
-                for tc in readonly_calls:
+                for idx, tc in enumerate(readonly_calls):
                     tool_name = tc.function.name
                     try:
                         tool_args = json.loads(tc.function.arguments)
@@ -1595,10 +1744,13 @@ class AnalystAgent:
                     tool_status = "ok"
 
                     if tool_name == "execute_python_script":
-                        result = self._run_explore_code(
-                            tool_args.get("code", ""),
-                            input_tables or [],
-                        )
+                        if idx in prefetched:
+                            result = prefetched[idx].result()
+                        else:
+                            result = self._run_explore_code(
+                                tool_args.get("code", ""),
+                                input_tables or [],
+                            )
                         tool_content = result.get("stdout", "")
                         tool_status = result.get("status", "ok")
                         if result.get("error"):
@@ -1611,10 +1763,13 @@ class AnalystAgent:
                             "error": result.get("error"),
                         }
                     elif tool_name == "inspect_source_data":
-                        table_names = tool_args.get("table_names", [])
-                        tool_content = handle_inspect_source_data(
-                            table_names, input_tables or [], self.workspace,
-                        )
+                        if idx in prefetched:
+                            tool_content = prefetched[idx].result()
+                        else:
+                            table_names = tool_args.get("table_names", [])
+                            tool_content = handle_inspect_source_data(
+                                table_names, input_tables or [], self.workspace,
+                            )
                         yield {
                             "type": "tool_result",
                             "tool": tool_name,
@@ -1656,7 +1811,10 @@ class AnalystAgent:
                             payload=dict(self._run_payload),
                         )
                         try:
-                            result = skill.handle_tool(tool_name, tool_args, skill_ctx)
+                            if idx in prefetched:
+                                result = prefetched[idx].result()
+                            else:
+                                result = skill.handle_tool(tool_name, tool_args, skill_ctx)
                         except Exception as exc:
                             logger.warning("[AnalystAgent] Skill tool %r failed", tool_name, exc_info=exc)
                             result = ToolResult(text=f"Tool '{tool_name}' failed: {exc}")
@@ -1687,6 +1845,9 @@ class AnalystAgent:
                         "content": tool_content,
                     })
 
+                if batch_pool is not None:
+                    batch_pool.shutdown(wait=True)
+
                 # Attach any skill-tool images as a single follow-up vision turn
                 # (tool-result messages can't carry image content on most providers).
                 if pending_images:
@@ -1734,6 +1895,88 @@ class AnalystAgent:
                "llm_calls": llm_calls_in_cycle}
         return
 
+    def _start_parallel_inspection(
+        self,
+        readonly_calls: list,
+        input_tables: list[dict[str, Any]],
+        messages: list[dict],
+        skill_tool_owners: dict[str, Any],
+        pool: ThreadPoolExecutor,
+    ) -> dict[int, Future]:
+        """Submit this round's parallel-safe inspection calls to *pool*.
+
+        Returns ``{index in readonly_calls: future}``; calls left out (e.g.
+        ``load_skill``) run inline in the tool loop as before. The first
+        ``execute_python_script`` runs on the turn's explore session; each
+        further one gets its own warm worker seeded with a snapshot of that
+        session's namespace, so every script sees the variables defined in
+        earlier rounds but only the first one's new variables persist.
+        """
+        jobs: list[tuple[int, str, dict[str, Any]]] = []
+        for idx, tc in enumerate(readonly_calls):
+            name = tc.function.name
+            if name in _PARALLEL_SAFE_TOOLS or name in skill_tool_owners:
+                try:
+                    args = json.loads(tc.function.arguments)
+                except json.JSONDecodeError:
+                    args = {}
+                jobs.append((idx, name, args))
+        if len(jobs) < 2:
+            return {}
+
+        explore_jobs = [idx for idx, name, _ in jobs if name == "execute_python_script"]
+        snapshot_dir: Path | None = None
+        main_session = getattr(self, "_explore_session", None)
+        ws_path = str(self.workspace.confined_scratch.root.parent)
+        if len(explore_jobs) > 1 and main_session is not None:
+            snapshot_dir = Path(tempfile.mkdtemp(prefix="df_explore_ns_"))
+            if not main_session.save_namespace(snapshot_dir, ws_path):
+                snapshot_dir = None
+
+        def run_side_script(code: str) -> dict[str, Any]:
+            from data_formulator.sandbox.local_sandbox import SandboxSession
+            with SandboxSession() as side_session:
+                if snapshot_dir is not None:
+                    SandboxSession.restore_namespace(side_session, snapshot_dir, ws_path)
+                return self._run_explore_code(code, input_tables, session=side_session)
+
+        # Skill tools see the trajectory as of the batch start.
+        trajectory = list(messages)
+        futures: dict[int, Future] = {}
+        for idx, name, args in jobs:
+            if name == "execute_python_script":
+                if idx == explore_jobs[0] or main_session is None:
+                    fn, fn_args = self._run_explore_code, (args.get("code", ""), input_tables)
+                else:
+                    fn, fn_args = run_side_script, (args.get("code", ""),)
+            elif name == "inspect_source_data":
+                fn, fn_args = handle_inspect_source_data, (
+                    args.get("table_names", []), input_tables, self.workspace,
+                )
+            else:
+                skill_ctx = SkillContext(
+                    client=self.client,
+                    workspace=self.workspace,
+                    language_instruction=self.language_instruction,
+                    trajectory=trajectory,
+                    payload=dict(self._run_payload),
+                )
+                fn, fn_args = skill_tool_owners[name].handle_tool, (name, args, skill_ctx)
+            # A fresh context copy per call keeps the Flask request context
+            # (and stream warnings on ``g``) visible on the pool threads.
+            futures[idx] = pool.submit(contextvars.copy_context().run, fn, *fn_args)
+
+        if snapshot_dir is not None:
+            def _cleanup(_f: Future, pending=list(futures.values())) -> None:
+                if all(f.done() for f in pending):
+                    import shutil
+                    shutil.rmtree(snapshot_dir, ignore_errors=True)
+            for f in futures.values():
+                f.add_done_callback(_cleanup)
+
+        logger.info("[AnalystAgent] Running %d inspection tool call(s) concurrently", len(futures))
+        return futures
+
     def _commit_action(
         self,
         action_calls: list,
@@ -1885,7 +2128,9 @@ class AnalystAgent:
         tools — a minor extra round-trip — an acceptable trade for never silently
         dropping batched actions. Providers that don't support the flag drop it
         (``drop_params=True``); the first-wins cardinality guard remains as a
-        belt-and-suspenders net.
+        belt-and-suspenders net. With ``parallel_inspection`` the flag is
+        lifted so inspection calls can be batched; the cardinality guard is
+        then what keeps committing actions to one per turn.
         """
         last_exc: Exception | None = None
         for attempt in range(self._MAX_LLM_RETRIES):
@@ -1893,7 +2138,7 @@ class AnalystAgent:
                 return self.client.get_completion_with_tools(
                     messages, tools=tools, stream=True,
                     reasoning_effort=reasoning_effort_for(_AGENT_ID, self.client.model),
-                    parallel_tool_calls=False,
+                    parallel_tool_calls=self.parallel_inspection,
                 )
             except Exception as e:
                 last_exc = e
@@ -1909,6 +2154,30 @@ class AnalystAgent:
                 raise
         raise last_exc  # pragma: no cover
 
+    async def _aopen_stream(self, messages: list[dict], tools: list[dict]):
+        """Async :meth:`_open_stream` (same retry policy) for ``async_io`` runs."""
+        last_exc: Exception | None = None
+        for attempt in range(self._MAX_LLM_RETRIES):
+            try:
+                return await self.client.aget_completion_with_tools(
+                    messages, tools=tools, stream=True,
+                    reasoning_effort=reasoning_effort_for(_AGENT_ID, self.client.model),
+                    parallel_tool_calls=self.parallel_inspection,
+                )
+            except Exception as e:
+                last_exc = e
+                if self._is_transient_error(e) and attempt < self._MAX_LLM_RETRIES - 1:
+                    wait = 2 ** attempt
+                    logger.warning(
+                        "[AnalystAgent] Transient LLM error (attempt %d/%d), "
+                        "retrying in %ds: %s",
+                        attempt + 1, self._MAX_LLM_RETRIES, wait, e,
+                    )
+                    await asyncio.sleep(wait)
+                    continue
+                raise
+        raise last_exc  # pragma: no cover
+
     def _stream_llm(
         self, messages: list[dict], tools: list[dict],
     ) -> Generator[Event, None, Any]:
@@ -1933,7 +2202,11 @@ class AnalystAgent:
         # actually commits a streaming action leaves an entry for the run loop.
         self._streamed_channels = {}
 
-        stream = self._open_stream(messages, tools)
+        if self.async_io:
+            stream = yield from await_io(lambda: self._aopen_stream(messages, tools))
+        else:
+            stream = self._open_stream(messages, tools)
+        stream = iter_chunks(stream)
 
         content_parts: list[str] = []
         reasoning_acc: str | None = None
@@ -1943,7 +2216,7 @@ class AnalystAgent:
         # idx -> {"active", "channel", "extractor", "announced"} for streaming actions
         streamers: dict[int, dict[str, Any]] = {}
 
-        for chunk in stream:
+        while (chunk := (yield from next_chunk(stream))) is not STREAM_END:
             if not getattr(chunk, "choices", None):
                 continue
             choice0 = chunk.choices[0]
@@ -1962,7 +2235,7 @@ class AnalystAgent:
             for tcd in getattr(delta, "tool_calls", None) or []:
                 idx = getattr(tcd, "index", 0) or 0
                 slot = tool_calls_acc.setdefault(
-                    idx, {"id": None, "name": "", "arguments": ""},
+                    idx, {"id": None, "name": "", "arguments": []},
                 )
                 if getattr(tcd, "id", None):
                     slot["id"] = tcd.id
@@ -1972,7 +2245,7 @@ class AnalystAgent:
                         slot["name"] = fn.name
                     arg_delta = getattr(fn, "arguments", None)
                     if arg_delta:
-                        slot["arguments"] += arg_delta
+                        slot["arguments"].append(arg_delta)
                 yield from self._forward_stream_delta(slot, streamers)
 
         # Reconstruct a non-streaming-shaped response for the loop.
@@ -1982,7 +2255,7 @@ class AnalystAgent:
             tool_call_objs.append(SimpleNamespace(
                 id=tc["id"] or f"call_{i}",
                 type="function",
-                function=SimpleNamespace(name=tc["name"], arguments=tc["arguments"]),
+                function=SimpleNamespace(name=tc["name"], arguments="".join(tc["arguments"])),
             ))
         message = SimpleNamespace(
             content="".join(content_parts) or None,
@@ -2017,6 +2290,7 @@ class AnalystAgent:
                 "active": True,
                 "channel": channel,
                 "extractor": _StreamingArgExtractor(field),
+                "fed": 0,  # argument chunks already fed to the extractor
                 "announced": False,
             }
             streamers[idx] = st
@@ -2028,7 +2302,9 @@ class AnalystAgent:
             yield {"type": "action", "action": name}
             st["announced"] = True
 
-        new_text = st["extractor"].feed(slot["arguments"])
+        parts = slot["arguments"]
+        new_text = "".join(st["extractor"].feed(p) for p in parts[st["fed"]:])
+        st["fed"] = len(parts)
         if new_text:
             yield {"type": "text_delta", "channel": st["channel"], "content": new_text}
             tcid = slot.get("id")
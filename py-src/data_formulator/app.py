@@ -274,12 +274,16 @@ def _register_blueprints():
     # Import server-log inspection routes (local-mode gated)
     from data_formulator.routes.logs import logs_bp
 
+    # Import background job status/cancel/retry routes
+    from data_formulator.routes.jobs import jobs_bp
+
     # Register blueprints
     app.register_blueprint(tables_bp)
     app.register_blueprint(agent_bp)
     app.register_blueprint(session_bp)
     app.register_blueprint(demo_stream_bp)
     app.register_blueprint(logs_bp)
+    app.register_blueprint(jobs_bp)
 
     # Initialise pluggable authentication (reads AUTH_PROVIDER env var)
     from data_formulator.auth.identity import init_auth, get_active_provider
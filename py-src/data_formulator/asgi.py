@@ -0,0 +1,221 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+"""ASGI entry point — serve Data Formulator from an asyncio event loop.
+
+    uvicorn data_formulator.asgi:app --host 0.0.0.0 --port 5567
+
+Under a WSGI server every streaming agent request (``/analyst-streaming``,
+``/data-loading-chat``) holds a worker thread for the whole multi-minute
+run, mostly blocked on LLM token streaming.  This module wraps the Flask
+app in :class:`WsgiBridge`, which:
+
+* runs the Flask request handling on a bounded thread pool
+  (:func:`~data_formulator.agents.async_drive.get_agent_executor`);
+* sets ``environ["data_formulator.async_io"]`` so the agent routes build
+  agents that await their LLM streams on the event loop instead of
+  blocking (see :mod:`data_formulator.agents.async_drive`);
+* drives the response body with
+  :func:`~data_formulator.agents.async_drive.drive_async`, so between LLM
+  chunks a session holds no thread at all.
+
+One process can then keep hundreds of agent sessions streaming while only
+``DF_AGENT_WORKERS`` threads run sandbox, DuckDB and prompt-building work.
+All other routes behave exactly as under WSGI.  The ASGI server itself
+(``uvicorn``, ``hypercorn``, …) is not a dependency and must be installed
+separately, like ``gunicorn`` for the WSGI deployment.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import io
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from data_formulator.agents.async_drive import (
+    ASYNC_IO_ENVIRON_KEY,
+    drive_async,
+    get_agent_executor,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _iterate(iterable: Any):
+    """Generator over a WSGI response iterable that honours ``close()``."""
+    try:
+        yield from iterable
+    finally:
+        close = getattr(iterable, "close", None)
+        if close is not None:
+            close()
+
+
+class WsgiBridge:
+    """ASGI application that serves a WSGI app (HTTP only, plus lifespan)."""
+
+    def __init__(self, wsgi_app: Callable, executor: ThreadPoolExecutor | None = None):
+        self.wsgi_app = wsgi_app
+        self._executor = executor
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        return self._executor or get_agent_executor()
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            raise RuntimeError(f"Unsupported ASGI scope type: {scope['type']}")
+
+        body = await self._read_body(receive)
+        if body is None:
+            return  # client went away before the request was complete
+
+        environ = self.build_environ(scope, body)
+        loop = asyncio.get_running_loop()
+        started: dict[str, Any] = {}
+        written: list[bytes] = []
+
+        def start_response(status: str, headers: list, exc_info: Any = None):
+            if exc_info and started.get("sent"):
+                raise exc_info[1].with_traceback(exc_info[2])
+            started["status"] = int(status.split(" ", 1)[0])
+            started["headers"] = [
+                (k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers
+            ]
+            return written.append  # legacy write() callable
+
+        try:
+            iterable = await loop.run_in_executor(
+                self.executor, self.wsgi_app, environ, start_response,
+            )
+        except Exception:
+            logger.exception("Unhandled error in WSGI application")
+            await send({"type": "http.response.start", "status": 500,
+                        "headers": [(b"content-type", b"text/plain; charset=utf-8")]})
+            await send({"type": "http.response.body", "body": b"Internal Server Error"})
+            return
+
+        stream = asyncio.ensure_future(self._send_body(iterable, started, written, send))
+        disconnect = asyncio.ensure_future(self._wait_disconnect(receive))
+        try:
+            await asyncio.wait({stream, disconnect}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in (stream, disconnect):
+                if not task.done():
+                    task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await task
+        if stream.done() and not stream.cancelled():
+            stream.result()
+
+    async def _send_body(self, iterable: Any, started: dict, written: list[bytes], send: Callable) -> None:
+        body = drive_async(_iterate(iterable), self.executor)
+        try:
+            async for chunk in body:
+                if not started.get("sent"):
+                    await self._start(started, send)
+                    for data in written:
+                        await send({"type": "http.response.body", "body": data, "more_body": True})
+                if chunk:
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            if not started.get("sent"):
+                await self._start(started, send)
+                for data in written:
+                    await send({"type": "http.response.body", "body": data, "more_body": True})
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            await body.aclose()
+
+    @staticmethod
+    async def _start(started: dict, send: Callable) -> None:
+        started["sent"] = True
+        await send({
+            "type": "http.response.start",
+            "status": started.get("status", 500),
+            "headers": started.get("headers", []),
+        })
+
+    @staticmethod
+    async def _read_body(receive: Callable) -> bytes | None:
+        chunks: list[bytes] = []
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return None
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                return b"".join(chunks)
+
+    @staticmethod
+    async def _wait_disconnect(receive: Callable) -> None:
+        while (await receive())["type"] != "http.disconnect":
+            pass
+
+    @staticmethod
+    async def _lifespan(receive: Callable, send: Callable) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    @staticmethod
+    def build_environ(scope: dict, body: bytes) -> dict[str, Any]:
+        """PEP 3333 environ for an ASGI HTTP *scope* with a buffered *body*."""
+        root_path = scope.get("root_path", "")
+        path = scope["path"]
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+        server = scope.get("server") or ("localhost", 80)
+        client = scope.get("client") or ("", 0)
+        environ: dict[str, Any] = {
+            "REQUEST_METHOD": scope["method"],
+            "SCRIPT_NAME": root_path.encode("utf-8").decode("latin-1"),
+            "PATH_INFO": path.encode("utf-8").decode("latin-1"),
+            "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+            "SERVER_NAME": str(server[0]),
+            "SERVER_PORT": str(server[1]),
+            "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+            "REMOTE_ADDR": client[0],
+            "REMOTE_PORT": str(client[1]),
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": scope.get("scheme", "http"),
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": True,
+            "wsgi.run_once": False,
+            ASYNC_IO_ENVIRON_KEY: True,
+        }
+        for raw_name, raw_value in scope.get("headers", []):
+            name = raw_name.decode("latin-1").lower()
+            value = raw_value.decode("latin-1")
+            if name == "content-length":
+                continue  # the body is already buffered
+            if name == "content-type":
+                environ["CONTENT_TYPE"] = value
+                continue
+            key = "HTTP_" + name.upper().replace("-", "_")
+            environ[key] = f"{environ[key]},{value}" if key in environ else value
+        return environ
+
+
+def __getattr__(name: str) -> Any:
+    # ``app`` is built on first access so importing this module (e.g. for
+    # WsgiBridge in tests) does not load every route and agent.
+    if name == "app":
+        from data_formulator.app import app as flask_app
+        bridge = WsgiBridge(flask_app)
+        globals()["app"] = bridge
+        return bridge
+    raise AttributeError(name)
@@ -26,18 +26,21 @@ import logging
 import re
 import threading
 import time
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
-from flask import Blueprint, Flask, request
+from flask import Blueprint, Flask, Response, request, stream_with_context
 
-from data_formulator.error_handler import json_ok
+from data_formulator.error_handler import json_ok, stream_error_event
 from data_formulator.errors import AppError, ErrorCode
+from data_formulator.job_queue import JobContext, get_job_manager
 
 from data_formulator.data_loader.external_data_loader import (
     CatalogNode,
     ExternalDataLoader,
     SENSITIVE_PARAMS,
+    cancellation_scope,
 )
 from data_formulator.data_loader.connector_errors import classify_connector_error
 from data_formulator.datalake.parquet_utils import normalize_dtype_to_app_type, df_to_safe_records
@@ -93,6 +96,26 @@ def _clear_catalog_progress(connector_id: str) -> None:
 # Helpers
 # ---------------------------------------------------------------------------
 
+def _submit_job(
+    identity_id: str,
+    kind: str,
+    fn: Callable[[JobContext], dict[str, Any]],
+    *,
+    params: dict[str, Any],
+):
+    """Queue *fn* on the background job pool and return its job handle.
+
+    Used by routes that accept ``"async": true``; connector errors raised by
+    the job are classified the same way the synchronous path would.
+    """
+    job = get_job_manager().submit(
+        identity_id, kind, fn,
+        params=params,
+        classify_error=lambda e: classify_connector_error(e, operation=kind).to_error_dict(),
+    )
+    return json_ok({"job_id": job.job_id, "status": job.status})
+
+
 def classify_and_raise_connector_error(error: Exception, *, operation: str = "") -> None:
     """Classify a connector error and raise ``AppError``.
 
@@ -2134,22 +2157,37 @@ def connector_import_data():
         from data_formulator.workspace_factory import get_workspace
         from data_formulator.datalake.parquet_utils import sanitize_table_name
 
-        workspace = get_workspace(get_identity_id())
+        identity_id = get_identity_id()
+        workspace = get_workspace(identity_id)
 
         safe_name = sanitize_table_name(table_name)
+        source_metadata = _cached_source_metadata(source, source_id)
 
-        meta = loader.ingest_to_workspace(
-            workspace=workspace,
-            table_name=safe_name,
-            source_table=source_id,
-            import_options=import_options or None,
-            source_metadata=_cached_source_metadata(source, source_id),
-        )
-        return json_ok({
-            "table_name": meta.name,
-            "row_count": meta.row_count,
-            "refreshable": True,
-        })
+        def run_import(ctx: JobContext | None = None) -> dict[str, Any]:
+            if ctx is not None:
+                ctx.raise_if_cancelled()
+                ctx.report(f"Importing {source_id}…")
+            with cancellation_scope(ctx.raise_if_cancelled) if ctx is not None else nullcontext():
+                meta = loader.ingest_to_workspace(
+                    workspace=workspace,
+                    table_name=safe_name,
+                    source_table=source_id,
+                    import_options=import_options or None,
+                    source_metadata=source_metadata,
+                )
+            return {
+                "table_name": meta.name,
+                "row_count": meta.row_count,
+                "refreshable": True,
+            }
+
+        if data.get("async"):
+            return _submit_job(
+                identity_id, "import", run_import,
+                params={"connector_id": source._source_id, "source_table": source_id,
+                        "table_name": safe_name},
+            )
+        return json_ok(run_import())
     except AppError:
         raise
     except Exception as e:
@@ -2170,32 +2208,50 @@ def connector_refresh_data():
         from data_formulator.auth.identity import get_identity_id
         from data_formulator.workspace_factory import get_workspace
 
-        workspace = get_workspace(get_identity_id())
+        identity_id = get_identity_id()
+        workspace = get_workspace(identity_id)
         meta = workspace.get_table_metadata(table_name)
         if meta is None or not meta.source_table:
             raise AppError(ErrorCode.INVALID_REQUEST, f"No refreshable source for '{table_name}'")
+        cached_source_meta = _cached_source_metadata(source, meta.source_table)
+
+        def run_refresh(ctx: JobContext | None = None) -> dict[str, Any]:
+            if ctx is not None:
+                ctx.report(f"Fetching {meta.source_table}…")
+            with cancellation_scope(ctx.raise_if_cancelled) if ctx is not None else nullcontext():
+                arrow_table = loader.fetch_data_as_arrow(
+                    source_table=meta.source_table,
+                    import_options=meta.import_options,
+                )
+            if ctx is not None:
+                # Last checkpoint before the workspace is touched.
+                ctx.raise_if_cancelled()
+                ctx.report(f"Writing {table_name}…")
+            with workspace.metadata_batch():
+                new_meta, data_changed = workspace.refresh_parquet_from_arrow(table_name, arrow_table)
+
+                # Best-effort: refresh source metadata (table/column descriptions).
+                try:
+                    from data_formulator.data_loader.external_data_loader import _merge_source_metadata
+                    source_meta = cached_source_meta or loader.get_column_types(meta.source_table)
+                    if source_meta:
+                        _merge_source_metadata(new_meta, source_meta)
+                        workspace.add_table_metadata(new_meta)
+                except Exception:
+                    pass  # keep existing descriptions if refresh fails
 
-        arrow_table = loader.fetch_data_as_arrow(
-            source_table=meta.source_table,
-            import_options=meta.import_options,
-        )
-        new_meta, data_changed = workspace.refresh_parquet_from_arrow(table_name, arrow_table)
-
-        # Best-effort: refresh source metadata (table/column descriptions).
-        try:
-            from data_formulator.data_loader.external_data_loader import _merge_source_metadata
-            source_meta = _cached_source_metadata(source, meta.source_table) or loader.get_column_types(meta.source_table)
-            if source_meta:
-                _merge_source_metadata(new_meta, source_meta)
-                workspace.add_table_metadata(new_meta)
-        except Exception:
-            pass  # keep existing descriptions if refresh fails
+            return {
+                "table_name": table_name,
+                "row_count": new_meta.row_count,
+                "data_changed": data_changed,
+            }
 
-        return json_ok({
-            "table_name": table_name,
-            "row_count": new_meta.row_count,
-            "data_changed": data_changed,
-        })
+        if data.get("async"):
+            return _submit_job(
+                identity_id, "refresh", run_refresh,
+                params={"connector_id": source._source_id, "table_name": table_name},
+            )
+        return json_ok(run_refresh())
     except AppError:
         raise
     except Exception as e:
@@ -2290,7 +2346,14 @@ def connector_column_values():
 
 @connectors_bp.route("/api/connectors/import-group", methods=["POST"])
 def connector_import_group():
-    """Import all tables from a table_group with shared filters."""
+    """Import all tables from a table_group with shared filters.
+
+    Tables are fetched concurrently, bounded by the loader's
+    ``max_concurrent_imports``, and all workspace metadata changes are
+    committed once at the end.  With ``"stream": true`` the response is
+    NDJSON: one ``table_result`` event per table as it finishes, then a
+    ``done`` event carrying the full ``results`` list (in request order).
+    """
     data = request.get_json() or {}
     source = _resolve_connector(data)
 
@@ -2310,8 +2373,10 @@ def connector_import_group():
         from data_formulator.datalake.parquet_utils import sanitize_table_name
 
         workspace = get_workspace(get_identity_id())
-        results = []
 
+        # Resolve everything that needs the request context (identity,
+        # catalog cache) up front; workers only fetch and write.
+        jobs: list[dict[str, Any]] = []
         for table_entry in tables:
             ds_id = table_entry.get("dataset_id")
             ds_name = table_entry.get("name", f"dataset_{ds_id}")
@@ -2331,33 +2396,33 @@ def connector_import_group():
 
             source_table = str(ds_id)
             table_name = f"{group_name} / {ds_name}" if group_name else ds_name
-            safe_name = sanitize_table_name(table_name)
+            jobs.append({
+                "dataset_id": ds_id,
+                "name": ds_name,
+                "table_name": sanitize_table_name(table_name),
+                "source_table": source_table,
+                "import_options": import_options or None,
+                "source_metadata": _cached_source_metadata(source, source_table),
+            })
 
-            try:
-                meta = loader.ingest_to_workspace(
-                    workspace=workspace,
-                    table_name=safe_name,
-                    source_table=source_table,
-                    import_options=import_options or None,
-                    source_metadata=_cached_source_metadata(source, source_table),
-                )
-                results.append({
-                    "status": "success",
-                    "dataset_id": ds_id,
-                    "table_name": meta.name,
-                    "row_count": meta.row_count,
-                })
-            except Exception as e:
-                logger.warning("import-group: failed to load dataset %s: %s", ds_id, type(e).__name__)
-                error_info = classify_connector_error(e, operation="import")
-                results.append({
-                    "status": "error",
-                    "dataset_id": ds_id,
-                    "table_name": ds_name,
-                    "message": error_info.message,
-                    "error": error_info.to_error_dict(),
-                })
+        if data.get("stream"):
+            def generate():
+                try:
+                    for event in _run_group_import(loader, workspace, jobs):
+                        yield _json.dumps(event, ensure_ascii=False) + "\n"
+                except Exception as e:
+                    logger.error("import-group stream failed: %s", type(e).__name__)
+                    yield stream_error_event(classify_connector_error(e, operation="import").to_app_error())
 
+            return Response(
+                stream_with_context(generate()),
+                mimetype="application/x-ndjson",
+            )
+
+        results: list[dict[str, Any]] = []
+        for event in _run_group_import(loader, workspace, jobs):
+            if event["type"] == "done":
+                results = event["results"]
         return json_ok({"results": results})
     except AppError:
         raise
@@ -2365,6 +2430,70 @@ def connector_import_group():
         classify_and_raise_connector_error(e, operation="import")
 
 
+def _import_group_table(
+    loader: ExternalDataLoader, workspace: Any, job: dict[str, Any],
+) -> dict[str, Any]:
+    """Ingest one table of an import-group request; never raises."""
+    ds_id = job["dataset_id"]
+    try:
+        meta = loader.ingest_to_workspace(
+            workspace=workspace,
+            table_name=job["table_name"],
+            source_table=job["source_table"],
+            import_options=job["import_options"],
+            source_metadata=job["source_metadata"],
+        )
+        return {
+            "status": "success",
+            "dataset_id": ds_id,
+            "table_name": meta.name,
+            "row_count": meta.row_count,
+        }
+    except Exception as e:
+        logger.warning("import-group: failed to load dataset %s: %s", ds_id, type(e).__name__)
+        error_info = classify_connector_error(e, operation="import")
+        return {
+            "status": "error",
+            "dataset_id": ds_id,
+            "table_name": job["name"],
+            "message": error_info.message,
+            "error": error_info.to_error_dict(),
+        }
+
+
+def _run_group_import(
+    loader: ExternalDataLoader, workspace: Any, jobs: list[dict[str, Any]],
+):
+    """Run *jobs* concurrently and yield ``table_result`` / ``done`` events.
+
+    Concurrency is capped by ``loader.max_concurrent_imports`` (1 for
+    loaders whose connection is not thread-safe, which keeps the historical
+    sequential behaviour).  Everything runs inside one
+    :meth:`Workspace.metadata_batch`, so ``workspace.yaml`` is written once
+    for the whole group; the ``done`` event is emitted after that commit.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    results: list[dict[str, Any] | None] = [None] * len(jobs)
+    workers = max(1, min(len(jobs), getattr(loader, "max_concurrent_imports", 1) or 1))
+    with workspace.metadata_batch():
+        if workers == 1:
+            for i, job in enumerate(jobs):
+                results[i] = _import_group_table(loader, workspace, job)
+                yield {"type": "table_result", "index": i, **results[i]}
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="import-group") as pool:
+                futures = {
+                    pool.submit(_import_group_table, loader, workspace, job): i
+                    for i, job in enumerate(jobs)
+                }
+                for future in as_completed(futures):
+                    i = futures[future]
+                    results[i] = future.result()
+                    yield {"type": "table_result", "index": i, **results[i]}
+    yield {"type": "done", "results": results}
+
+
 
 # ---------------------------------------------------------------------------
 # Configuration loading — connectors.yaml (admin + user)
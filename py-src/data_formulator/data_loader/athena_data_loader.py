@@ -1,13 +1,18 @@
 import logging
 import re
+import threading
 import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 import pyarrow as pa
 import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 import boto3
 import botocore.exceptions
 from pyarrow import fs as pa_fs
 
-from data_formulator.data_loader.external_data_loader import ExternalDataLoader, CatalogNode, MAX_IMPORT_ROWS, sanitize_table_name
+from data_formulator.data_loader.external_data_loader import ExternalDataLoader, CatalogNode, MAX_IMPORT_ROWS, check_cancelled, sanitize_table_name
 from typing import Any
 
 log = logging.getLogger(__name__)
@@ -18,6 +23,130 @@ ATHENA_TABLE_PATTERN = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-
 ATHENA_COLUMN_PATTERN = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
 S3_URL_PATTERN = re.compile(r'^s3://[a-zA-Z0-9][a-zA-Z0-9.\-_]*[a-zA-Z0-9](/.*)?$')
 
+RESULT_FORMATS = ("csv", "parquet")
+# Concurrent S3 streams used to read the parquet parts written by UNLOAD.
+UNLOAD_READ_WORKERS = 8
+# How often a waiting import checks whether it was cancelled.
+CANCEL_CHECK_INTERVAL = 1.0
+# Athena error codes worth retrying on the next poll round.
+_THROTTLING_ERROR_CODES = frozenset({
+    "ThrottlingException", "TooManyRequestsException", "Throttling", "RequestLimitExceeded",
+})
+
+
+def _is_transient(exc: botocore.exceptions.ClientError) -> bool:
+    """Whether a ClientError is throttling or a server-side failure."""
+    code = exc.response.get("Error", {}).get("Code", "")
+    status = exc.response.get("ResponseMetadata", {}).get("HTTPStatusCode") or 0
+    return code in _THROTTLING_ERROR_CODES or status == 429 or status >= 500
+
+
+class _AthenaQueryPoller:
+    """One background thread that watches every in-flight Athena query.
+
+    Waiters register a query with :meth:`watch` and block on the returned
+    future.  The thread checks all pending queries with one
+    ``batch_get_query_execution`` call per client (50 ids per call) every
+    ``interval`` seconds and resolves each future with its
+    ``QueryExecution`` as soon as the query reaches a terminal state.  When
+    the batch call is refused for a non-transient reason (e.g. no
+    ``athena:BatchGetQueryExecution`` permission), each query is checked
+    with ``get_query_execution`` instead, and a query that cannot be
+    checked at all fails its future with that error.  The thread exits
+    when nothing is pending and is restarted on demand.
+    """
+
+    BATCH_SIZE = 50
+    TERMINAL_STATES = frozenset({"SUCCEEDED", "FAILED", "CANCELLED"})
+
+    def __init__(self, interval: float = 0.5, idle_timeout: float = 30.0) -> None:
+        self.interval = interval
+        self.idle_timeout = idle_timeout
+        self._cond = threading.Condition()
+        self._pending: dict[str, tuple[Any, Future]] = {}
+        self._thread: threading.Thread | None = None
+
+    def watch(self, client: Any, query_execution_id: str) -> Future:
+        future: Future = Future()
+        with self._cond:
+            self._pending[query_execution_id] = (client, future)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="athena-poller", daemon=True,
+                )
+                self._thread.start()
+            self._cond.notify()
+        return future
+
+    def forget(self, query_execution_id: str) -> None:
+        with self._cond:
+            self._pending.pop(query_execution_id, None)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._pending:
+                    self._cond.wait(timeout=self.idle_timeout)
+                    if not self._pending:
+                        self._thread = None
+                        return
+                groups: dict[int, tuple[Any, list[str]]] = {}
+                for qid, (client, _) in self._pending.items():
+                    groups.setdefault(id(client), (client, []))[1].append(qid)
+            for client, ids in groups.values():
+                for i in range(0, len(ids), self.BATCH_SIZE):
+                    self._poll_batch(client, ids[i:i + self.BATCH_SIZE])
+            time.sleep(self.interval)
+
+    def _poll_batch(self, client: Any, ids: list[str]) -> None:
+        try:
+            response = client.batch_get_query_execution(QueryExecutionIds=ids)
+        except botocore.exceptions.ClientError as e:
+            if _is_transient(e):
+                log.warning("batch_get_query_execution throttled for %d queries", len(ids), exc_info=True)
+                return
+            log.debug("batch_get_query_execution refused (%s); polling queries one by one",
+                      e.response.get("Error", {}).get("Code"))
+            for qid in ids:
+                self._poll_one(client, qid)
+            return
+        except Exception:
+            # Transient API errors: retry next round; waiters enforce their own timeout.
+            log.warning("batch_get_query_execution failed for %d queries", len(ids), exc_info=True)
+            return
+        for execution in response.get("QueryExecutions", []):
+            self._resolve(execution)
+
+    def _poll_one(self, client: Any, query_execution_id: str) -> None:
+        try:
+            execution = client.get_query_execution(QueryExecutionId=query_execution_id)["QueryExecution"]
+        except botocore.exceptions.ClientError as e:
+            if not _is_transient(e):
+                self._fail(query_execution_id, e)
+            return
+        except Exception:
+            log.warning("get_query_execution failed for %s", query_execution_id, exc_info=True)
+            return
+        self._resolve(execution)
+
+    def _resolve(self, execution: dict[str, Any]) -> None:
+        state = execution.get("Status", {}).get("State")
+        if state not in self.TERMINAL_STATES:
+            return
+        with self._cond:
+            entry = self._pending.pop(execution.get("QueryExecutionId"), None)
+        if entry is not None and not entry[1].done():
+            entry[1].set_result(execution)
+
+    def _fail(self, query_execution_id: str, error: Exception) -> None:
+        with self._cond:
+            entry = self._pending.pop(query_execution_id, None)
+        if entry is not None and not entry[1].done():
+            entry[1].set_exception(error)
+
+
+_query_poller = _AthenaQueryPoller()
+
 
 def _validate_athena_table_name(table_name: str) -> None:
     """Validate that table_name is a safe Athena identifier (database.table format)."""
@@ -71,7 +200,8 @@ class AthenaDataLoader(ExternalDataLoader):
             {"name": "workgroup", "type": "string", "required": False, "default": "primary", "tier": "connection", "advanced": True, "description": "Athena workgroup name (output location is fetched from workgroup configuration)"},
             {"name": "output_location", "type": "string", "required": False, "default": "", "tier": "connection", "advanced": True, "description": "S3 output location for query results (e.g., s3://bucket/path/). If empty, uses workgroup configuration."},
             {"name": "database", "type": "string", "required": False, "default": "", "tier": "filter", "description": "Default database/catalog to use for queries"},
-            {"name": "query_timeout", "type": "number", "required": False, "default": 300, "tier": "connection", "advanced": True, "description": "Query execution timeout in seconds (default: 300 = 5 minutes)"}
+            {"name": "query_timeout", "type": "number", "required": False, "default": 300, "tier": "connection", "advanced": True, "description": "Query execution timeout in seconds (default: 300 = 5 minutes)"},
+            {"name": "result_format", "type": "string", "required": False, "default": "csv", "tier": "connection", "advanced": True, "description": "How imports read results: 'csv' (query result file) or 'parquet' (UNLOAD to typed parquet parts read in parallel; faster for large tables, needs S3 write access to the output location)"}
         ]
         return params_list
 
@@ -87,7 +217,7 @@ Set `aws_profile` to a profile name from `~/.aws/credentials`. Set up with `aws
 **Option 2 — Explicit Credentials:**
 Enter `aws_access_key_id` and `aws_secret_access_key` directly. Add `aws_session_token` for temporary credentials.
 
-**Required IAM permissions:** `athena:StartQueryExecution`, `athena:GetQueryExecution`, `athena:GetQueryResults`, `athena:GetWorkGroup`, `athena:ListDatabases`, `athena:ListTableMetadata`, plus S3 and Glue permissions on your data/results buckets."""
+**Required IAM permissions:** `athena:StartQueryExecution`, `athena:GetQueryExecution`, `athena:BatchGetQueryExecution`, `athena:StopQueryExecution`, `athena:GetQueryResults`, `athena:GetWorkGroup`, `athena:ListDatabases`, `athena:ListTableMetadata`, plus S3 and Glue permissions on your data/results buckets."""
 
     def __init__(self, params: dict[str, Any]):
         self.params = params
@@ -101,6 +231,7 @@ Enter `aws_access_key_id` and `aws_secret_access_key` directly. Add `aws_session
         self.workgroup = params.get("workgroup", "primary")
         self.output_location_param = params.get("output_location", "")
         self.database = params.get("database", "")
+        self.result_format = self._normalize_result_format(params.get("result_format"))
 
         # Normalize and validate query timeout
         raw_timeout = params.get("query_timeout", 300)
@@ -221,6 +352,15 @@ Enter `aws_access_key_id` and `aws_secret_access_key` directly. Add `aws_session
         )
         log.info("Initialized PyArrow S3 filesystem for Athena results")
 
+    @staticmethod
+    def _normalize_result_format(value: Any) -> str:
+        fmt = (str(value).strip().lower() if value else "") or "csv"
+        if fmt not in RESULT_FORMATS:
+            raise ValueError(
+                f"Invalid result_format: {value!r}. Expected one of: {', '.join(RESULT_FORMATS)}."
+            )
+        return fmt
+
     def _get_output_location(self) -> str:
         """Get the output location for query results.
 
@@ -263,7 +403,9 @@ Enter `aws_access_key_id` and `aws_secret_access_key` directly. Add `aws_session
     def _execute_query(self, query: str) -> str:
         """Execute an Athena query and wait for completion.
 
-        Returns the S3 path to the query results (CSV file).
+        Returns the S3 path to the query results (CSV file).  Completion is
+        reported by the shared :class:`_AthenaQueryPoller`; a timeout or a
+        cancelled import (see ``cancellation_scope``) stops the query.
         """
         # Start query execution
         start_params = {
@@ -281,42 +423,54 @@ Enter `aws_access_key_id` and `aws_secret_access_key` directly. Add `aws_session
         query_execution_id = response['QueryExecutionId']
         log.info(f"Started Athena query execution: {query_execution_id}")
 
-        # Poll for query completion
-        start_time = time.time()
+        # Completion is detected by the shared poller; this thread only wakes
+        # up to notice a timeout or a cancelled import.
+        future = _query_poller.watch(self.athena_client, query_execution_id)
+        deadline = time.monotonic() + self.query_timeout
         while True:
-            elapsed = time.time() - start_time
-            if elapsed > self.query_timeout:
-                # Try to cancel the query. This is a best-effort operation: failures are logged
-                # but do not prevent raising the timeout error for the caller.
-                try:
-                    self.athena_client.stop_query_execution(QueryExecutionId=query_execution_id)
-                except Exception:
-                    log.warning(
-                        "Failed to cancel Athena query execution %s after timeout",
-                        query_execution_id,
-                        exc_info=True,
-                    )
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._stop_query(query_execution_id, "timeout")
                 raise TimeoutError(
                     f"Query execution timed out after {self.query_timeout} seconds. "
                     "Consider increasing the query_timeout parameter."
                 )
+            try:
+                execution = future.result(timeout=min(remaining, CANCEL_CHECK_INTERVAL))
+                break
+            except FutureTimeoutError:
+                pass
+            except botocore.exceptions.ClientError:
+                # The query's status cannot be read (e.g. access denied).
+                self._stop_query(query_execution_id, "status error")
+                raise
+            try:
+                check_cancelled()
+            except BaseException:
+                self._stop_query(query_execution_id, "cancellation")
+                raise
 
-            response = self.athena_client.get_query_execution(QueryExecutionId=query_execution_id)
-            state = response['QueryExecution']['Status']['State']
-
-            if state == 'SUCCEEDED':
-                output_location = response['QueryExecution']['ResultConfiguration']['OutputLocation']
-                log.info(f"Query completed successfully. Results at: {output_location}")
-                return output_location
-            elif state == 'FAILED':
-                reason = response['QueryExecution']['Status'].get('StateChangeReason', 'Unknown error')
-                raise RuntimeError(f"Athena query failed: {reason}")
-            elif state == 'CANCELLED':
-                raise RuntimeError("Athena query was cancelled")
-
-            # Wait before polling again (exponential backoff with cap)
-            wait_time = min(2 ** (elapsed // 10), 10)
-            time.sleep(wait_time)
+        state = execution['Status']['State']
+        if state == 'SUCCEEDED':
+            output_location = execution['ResultConfiguration']['OutputLocation']
+            log.info(f"Query completed successfully. Results at: {output_location}")
+            return output_location
+        elif state == 'FAILED':
+            reason = execution['Status'].get('StateChangeReason', 'Unknown error')
+            raise RuntimeError(f"Athena query failed: {reason}")
+        raise RuntimeError("Athena query was cancelled")
+
+    def _stop_query(self, query_execution_id: str, why: str) -> None:
+        """Stop a query the caller no longer waits for (best effort)."""
+        _query_poller.forget(query_execution_id)
+        try:
+            self.athena_client.stop_query_execution(QueryExecutionId=query_execution_id)
+        except Exception:
+            log.warning(
+                "Failed to cancel Athena query execution %s after %s",
+                query_execution_id, why,
+                exc_info=True,
+            )
 
     def fetch_data_as_arrow(
         self,
@@ -326,13 +480,20 @@ Enter `aws_access_key_id` and `aws_secret_access_key` directly. Add `aws_session
         """
         Fetch data from Athena as a PyArrow Table.
         
-        Executes the query on Athena and reads the CSV results from S3
-        using PyArrow's S3 filesystem.
+        With ``result_format='csv'`` (default) the query runs as a plain
+        SELECT and the CSV result file is read from S3.  With ``'parquet'``
+        (connection param, or ``import_options["result_format"]``) it runs
+        as ``UNLOAD ... WITH (format = 'PARQUET')`` and the typed parquet
+        parts are read concurrently through the PyArrow S3 filesystem.
         """
         opts = import_options or {}
         size = min(opts.get("size", MAX_IMPORT_ROWS), MAX_IMPORT_ROWS)
         sort_columns = opts.get("sort_columns")
         sort_order = opts.get("sort_order", "asc")
+        result_format = (
+            self._normalize_result_format(opts["result_format"])
+            if opts.get("result_format") else self.result_format
+        )
 
         if not source_table:
             raise ValueError("source_table must be provided")
@@ -350,7 +511,17 @@ Enter `aws_access_key_id` and `aws_secret_access_key` directly. Add `aws_session
             order_by_clause = f" ORDER BY {', '.join(sanitized_cols)}"
         
         query = f"{base_query}{order_by_clause} LIMIT {size}"
-        
+
+        if result_format == "parquet":
+            arrow_table = self._fetch_via_unload(query)
+            if arrow_table is not None:
+                if sort_columns:
+                    # Parts carry no global order; restore the requested one.
+                    direction = "descending" if sort_order == 'desc' else "ascending"
+                    arrow_table = arrow_table.sort_by([(c, direction) for c in sort_columns])
+                log.info(f"Fetched {arrow_table.num_rows} rows from Athena [UNLOAD parquet]")
+                return arrow_table
+
         log.info(f"Executing Athena query: {query[:200]}...")
         
         # Execute query and get result location
@@ -370,6 +541,54 @@ Enter `aws_access_key_id` and `aws_secret_access_key` directly. Add `aws_session
         
         return arrow_table
 
+    def _fetch_via_unload(self, select_query: str) -> pa.Table | None:
+        """Run *select_query* as an UNLOAD to parquet and read the parts.
+
+        Each UNLOAD writes to a fresh prefix under the output location (the
+        target must be empty).  Returns ``None`` when the query produced no
+        parts — an empty result has no parquet schema, so the caller falls
+        back to the CSV path to keep the column names.
+        """
+        target = f"{self.output_location.rstrip('/')}/unload/{uuid.uuid4().hex}/"
+        _validate_s3_url(target)
+        unload_query = (
+            f"UNLOAD ({select_query}) TO '{target}' "
+            f"WITH (format = 'PARQUET', compression = 'SNAPPY')"
+        )
+        log.info(f"Executing Athena UNLOAD: {unload_query[:200]}...")
+        self._execute_query(unload_query)
+
+        prefix = target[5:].rstrip('/')
+        try:
+            infos = self.s3_fs.get_file_info(pa_fs.FileSelector(prefix, recursive=True))
+            parts = sorted(
+                info.path for info in infos
+                if info.type == pa_fs.FileType.File and info.size
+                and not info.base_name.startswith(('_', '.'))
+            )
+            if not parts:
+                return None
+
+            def read_part(path: str) -> pa.Table:
+                return pq.read_table(path, filesystem=self.s3_fs)
+
+            if len(parts) == 1:
+                tables = [read_part(parts[0])]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(UNLOAD_READ_WORKERS, len(parts)),
+                    thread_name_prefix="athena-unload",
+                ) as pool:
+                    tables = list(pool.map(read_part, parts))
+            log.info(f"Read {len(parts)} UNLOAD parquet part(s) from {target}")
+            return pa.concat_tables(tables)
+        finally:
+            # The parts are a transient copy of the data; keep the bucket tidy.
+            try:
+                self.s3_fs.delete_dir(prefix)
+            except Exception:
+                log.debug("Could not clean up UNLOAD output %s", target, exc_info=True)
+
     def list_tables(self, table_filter: str | None = None) -> list[dict[str, Any]]:
         """List tables from Athena catalog (Glue Data Catalog)."""
         results = []
@@ -3,15 +3,22 @@ import logging
 import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
-import pyarrow.csv as pa_csv
 from azure.storage.blob import BlobServiceClient
 from azure.identity import DefaultAzureCredential
 from pyarrow import fs as pa_fs
 
 from data_formulator.data_loader.external_data_loader import ExternalDataLoader, CatalogNode, MAX_IMPORT_ROWS, sanitize_table_name
 from data_formulator.data_loader import probe_utils
+from data_formulator.data_loader.file_scan import (
+    group_partitioned_files,
+    partition_keys,
+    read_text,
+    scan_parquet,
+    scan_text,
+    text_format,
+)
 from data_formulator.datalake.parquet_utils import df_to_safe_records
-from typing import Any
+from typing import Any, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -88,19 +95,17 @@ Just provide `account_name` + `container_name`. Requires `az login` or Managed I
     def _read_sample(self, azure_url: str, limit: int) -> pd.DataFrame:
         """Read sample rows from an Azure blob using PyArrow. Returns a pandas DataFrame."""
         azure_path = self._azure_path(azure_url)
-        if azure_url.lower().endswith('.parquet'):
-            table = pq.read_table(azure_path, filesystem=self.azure_fs)
-        elif azure_url.lower().endswith('.csv'):
-            with self.azure_fs.open_input_file(azure_path) as f:
-                table = pa_csv.read_csv(f)
-        elif azure_url.lower().endswith('.json') or azure_url.lower().endswith('.jsonl'):
-            import pyarrow.json as pa_json
-            with self.azure_fs.open_input_file(azure_path) as f:
-                table = pa_json.read_json(f)
+        if azure_url.endswith('/'):
+            table, _ = scan_parquet(azure_path.rstrip('/'), self.azure_fs, {}, limit, partitioning="hive")
+        elif azure_url.lower().endswith('.parquet'):
+            table, _ = scan_parquet(azure_path, self.azure_fs, {}, limit)
+        elif text_format(azure_url) is not None:
+            file_type, parse_options = text_format(azure_url)
+            table, _ = read_text(
+                lambda: self.azure_fs.open_input_stream(azure_path), file_type, {}, limit, parse_options,
+            )
         else:
             raise ValueError(f"Unsupported file type: {azure_url}")
-        if table.num_rows > limit:
-            table = table.slice(0, limit)
         return table.to_pandas()
 
     def fetch_data_as_arrow(
@@ -112,11 +117,13 @@ Just provide `account_name` + `container_name`. Requires `az login` or Managed I
         Fetch data from Azure Blob as a PyArrow Table.
         
         For files (parquet, csv), reads directly using PyArrow's Azure filesystem.
+        Parquet reads push ``columns``, ``source_filters`` and ``size`` into
+        the scan (see :mod:`file_scan`); CSV/JSON are streamed with the same
+        options and stop reading the blob once ``size`` rows are collected.  A blob prefix ending in ``/`` is a Hive-partitioned
+        parquet dataset (as listed by :meth:`ls`) and is read as one table.
         """
         opts = import_options or {}
         size = min(opts.get("size", MAX_IMPORT_ROWS), MAX_IMPORT_ROWS)
-        sort_columns = opts.get("sort_columns")
-        sort_order = opts.get("sort_order", "asc")
 
         if not source_table:
             raise ValueError("source_table (Azure blob URL) must be provided")
@@ -126,33 +133,39 @@ Just provide `account_name` + `container_name`. Requires `az login` or Managed I
 
         logger.info("Reading Azure blob via PyArrow: %s", azure_url)
         
-        if azure_url.lower().endswith('.parquet'):
-            arrow_table = pq.read_table(azure_path, filesystem=self.azure_fs)
-        elif azure_url.lower().endswith('.csv'):
-            with self.azure_fs.open_input_file(azure_path) as f:
-                arrow_table = pa_csv.read_csv(f)
-        elif azure_url.lower().endswith('.json') or azure_url.lower().endswith('.jsonl'):
-            import pyarrow.json as pa_json
-            with self.azure_fs.open_input_file(azure_path) as f:
-                arrow_table = pa_json.read_json(f)
+        if azure_url.endswith('/'):
+            arrow_table, _ = scan_parquet(azure_path.rstrip('/'), self.azure_fs, opts, size, partitioning="hive")
+        elif azure_url.lower().endswith('.parquet'):
+            arrow_table, _ = scan_parquet(azure_path, self.azure_fs, opts, size)
+        elif text_format(azure_url) is not None:
+            file_type, parse_options = text_format(azure_url)
+            arrow_table, _ = read_text(
+                lambda: self.azure_fs.open_input_stream(azure_path), file_type, opts, size, parse_options,
+            )
         else:
             raise ValueError(f"Unsupported file type: {azure_url}")
         
-        # Apply sorting if specified
-        if sort_columns and len(sort_columns) > 0:
-            df = arrow_table.to_pandas()
-            ascending = sort_order != 'desc'
-            df = df.sort_values(by=sort_columns, ascending=ascending)
-            arrow_table = pa.Table.from_pandas(df, preserve_index=False)
-        
-        # Apply size limit
-        if arrow_table.num_rows > size:
-            arrow_table = arrow_table.slice(0, size)
-        
         logger.info(f"Fetched {arrow_table.num_rows} rows from Azure Blob [Arrow-native]")
         
         return arrow_table
 
+    def fetch_data_as_batches(
+        self,
+        source_table: str,
+        import_options: dict[str, Any] | None = None,
+    ) -> Iterator[pa.Table] | None:
+        """Stream unsorted CSV/JSON imports block by block (see :func:`scan_text`)."""
+        opts = import_options or {}
+        fmt = text_format(source_table)
+        if fmt is None or opts.get("sort_columns"):
+            return None
+        azure_path = self._azure_path(source_table)
+        size = min(opts.get("size", MAX_IMPORT_ROWS), MAX_IMPORT_ROWS)
+        file_type, parse_options = fmt
+        return scan_text(
+            lambda: self.azure_fs.open_input_stream(azure_path), file_type, opts, size, parse_options,
+        )
+
     def probe(self, path: list[str], query: dict[str, Any]) -> dict[str, Any]:
         """Read the blob into DuckDB and compute the SPJQ there."""
         return probe_utils.run_probe_on_duckdb(self, path, query, scan_size=MAX_IMPORT_ROWS)
@@ -183,15 +196,12 @@ Just provide `account_name` + `container_name`. Requires `az login` or Managed I
         container_client = blob_service_client.get_container_client(self.container_name)
         
         # List blobs in the container
-        blob_list = container_client.list_blobs()        
+        blob_list = list(container_client.list_blobs())
+        blobs = {blob.name: blob for blob in blob_list}
         results = []
         
-        for blob in blob_list:
-            blob_name = blob.name
-            
-            # Skip directories and non-data files
-            if blob_name.endswith('/') or not self._is_supported_file(blob_name):
-                continue
+        for blob_name in self._table_names(blob_list):
+            blob = blobs.get(blob_name)
             
             # Apply table filter if provided
             if table_filter and table_filter.lower() not in blob_name.lower():
@@ -228,14 +238,28 @@ Just provide `account_name` + `container_name`. Requires `az login` or Managed I
         
         return results
     
+    def _table_names(self, blobs: list[Any]) -> list[str]:
+        """Table names from a listing: data blobs, plus one ``root/`` name per
+        Hive-partitioned parquet dataset in place of its member blobs."""
+        names = [
+            blob.name for blob in blobs
+            if not blob.name.endswith('/') and self._is_supported_file(blob.name)
+        ]
+        files, datasets = group_partitioned_files(names)
+        return files + [f"{root}/" for root in datasets]
+
     def _is_supported_file(self, blob_name: str) -> bool:
         """Check if the file type is supported (PyArrow can read it)."""
         supported_extensions = ['.csv', '.parquet', '.json', '.jsonl']
         return any(blob_name.lower().endswith(ext) for ext in supported_extensions)
 
-    def _estimate_row_count(self, azure_url: str, blob_properties=None) -> int:
-        """Estimate the number of rows in a file."""
+    def _estimate_row_count(self, azure_url: str, blob_properties=None) -> int | None:
+        """Estimate the number of rows in a file; ``None`` for a partitioned dataset."""
         try:
+            # Partitioned datasets would need every file's footer; leave
+            # the count unknown rather than reporting an empty table.
+            if azure_url.endswith('/'):
+                return None
             file_extension = azure_url.lower().split('.')[-1]
 
             if file_extension == 'parquet':
@@ -324,16 +348,25 @@ Just provide `account_name` + `container_name`. Requires `az login` or Managed I
                 from azure.identity import DefaultAzureCredential
                 bsc = _BSC(account_url=f"https://{self.account_name}.{self.endpoint}", credential=DefaultAzureCredential())
             container_client = bsc.get_container_client(self.container_name)
+            blobs = list(container_client.list_blobs())
+            sizes = {blob.name: getattr(blob, "size", 0) or 0 for blob in blobs}
+            _, datasets = group_partitioned_files(sizes)
             nodes = []
-            for blob in container_client.list_blobs():
-                name = blob.name
-                if name.endswith("/") or not self._is_supported_file(name):
-                    continue
+            for name in self._table_names(blobs):
                 if filter and filter.lower() not in name.lower():
                     continue
+                members = datasets.get(name.rstrip("/"))
+                if members is None:
+                    metadata = {"size_bytes": sizes[name]}
+                else:
+                    metadata = {
+                        "size_bytes": sum(sizes[n] for n in members),
+                        "file_count": len(members),
+                        "partition_keys": partition_keys(members, name),
+                    }
                 nodes.append(CatalogNode(
                     name=name, node_type="table", path=path + [name],
-                    metadata={"size_bytes": blob.size if hasattr(blob, "size") else 0},
+                    metadata=metadata,
                 ))
             return nodes
 
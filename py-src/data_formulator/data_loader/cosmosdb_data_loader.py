@@ -1,3 +1,4 @@
+import json
 import logging
 from datetime import datetime
 
@@ -8,11 +9,24 @@ from azure.cosmos import CosmosClient, exceptions as cosmos_exceptions
 from azure.cosmos.partition_key import PartitionKey
 
 from data_formulator.data_loader.external_data_loader import ExternalDataLoader, CatalogNode, MAX_IMPORT_ROWS, sanitize_table_name
+from data_formulator.data_loader.document_arrow import (
+    DOCUMENT_BATCH_SIZE,
+    PATH_SAMPLE_SIZE,
+    documents_to_arrow,
+    flattened_field_paths,
+    iter_document_batches,
+    select_columns,
+)
 from data_formulator.datalake.parquet_utils import df_to_safe_records
-from typing import Any
+from typing import Any, Callable, Iterator
 
 logger = logging.getLogger(__name__)
 
+# Internal Cosmos metadata fields dropped when flattening documents.
+_SYSTEM_KEYS = frozenset({'_rid', '_self', '_etag', '_attachments', '_ts'})
+
+_COMPARISON_OPS = {"EQ": "=", "NEQ": "!=", "GT": ">", "GTE": ">=", "LT": "<", "LTE": "<="}
+
 
 class CosmosDBDataLoader(ExternalDataLoader):
     DISPLAY_NAME = "Cosmos DB"
@@ -110,10 +124,9 @@ class CosmosDBDataLoader(ExternalDataLoader):
         Use recursion to flatten nested Cosmos DB documents.
         Skips internal Cosmos metadata fields (_rid, _self, _etag, _attachments, _ts).
         """
-        skip_keys = {'_rid', '_self', '_etag', '_attachments', '_ts'}
         items = []
         for key, value in doc.items():
-            if key in skip_keys:
+            if key in _SYSTEM_KEYS:
                 continue
             new_key = f"{parent_key}{sep}{key}" if parent_key else key
 
@@ -158,6 +171,11 @@ class CosmosDBDataLoader(ExternalDataLoader):
                 result[key] = value
         return result
 
+    @classmethod
+    def _document_to_row(cls, doc: dict[str, Any]) -> dict[str, Any]:
+        """Convert and flatten one document into a flat row dict."""
+        return cls._flatten_document(cls._convert_special_types(doc))
+
     def _process_documents(self, documents: list[dict[str, Any]]) -> pd.DataFrame:
         """
         Process Cosmos DB documents, flatten and convert to DataFrame.
@@ -179,22 +197,57 @@ class CosmosDBDataLoader(ExternalDataLoader):
         source_table: str,
         import_options: dict[str, Any] | None = None,
     ) -> pa.Table:
-        opts = import_options or {}
-        size = min(opts.get("size", MAX_IMPORT_ROWS), MAX_IMPORT_ROWS)
-        sort_columns = opts.get("sort_columns")
-        sort_order = opts.get("sort_order", "asc")
         """
         Fetch data from Cosmos DB as a PyArrow Table.
 
-        Cosmos DB NoSQL API returns JSON documents; we flatten and convert
-        to Arrow format.
+        ``source_filters``, ``columns`` and sort options are compiled into a
+        parameterized ``SELECT TOP n ... WHERE ... ORDER BY`` query, so only
+        matching items and requested fields are transferred.  Items are
+        paged in ``DOCUMENT_BATCH_SIZE`` at a time, flattened and converted
+        to Arrow batch by batch.
 
         Args:
             source_table: Container name to fetch from
-            size: Maximum number of documents to fetch
-            sort_columns: Columns to sort by (applied client-side)
-            sort_order: Sort direction ('asc' or 'desc')
+            import_options: See ``ExternalDataLoader.fetch_data_as_arrow``.
         """
+        opts = import_options or {}
+        columns = [str(c) for c in opts.get("columns") or []]
+        items, container_name = self._query_import_items(source_table, opts)
+
+        arrow_table = documents_to_arrow(items, self._document_to_row)
+        if arrow_table.num_rows == 0:
+            logger.warning(f"No data found in Cosmos DB container '{container_name}'")
+            return pa.table({})
+        if columns:
+            arrow_table = select_columns(arrow_table, columns)
+
+        logger.info(f"Fetched {arrow_table.num_rows} rows from Cosmos DB container '{container_name}'")
+
+        return arrow_table
+
+    def fetch_data_as_batches(
+        self,
+        source_table: str,
+        import_options: dict[str, Any] | None = None,
+    ) -> Iterator[pa.Table]:
+        """Stream the import one ``DOCUMENT_BATCH_SIZE`` page at a time.
+
+        Same query as :meth:`fetch_data_as_arrow`, but each page is handed
+        to the workspace as soon as it is converted, so the container is
+        never joined into one in-memory table.
+        """
+        opts = import_options or {}
+        columns = [str(c) for c in opts.get("columns") or []]
+        items, _ = self._query_import_items(source_table, opts)
+        batches = iter_document_batches(items, self._document_to_row)
+        if columns:
+            return (select_columns(batch, columns) for batch in batches)
+        return batches
+
+    def _query_import_items(self, source_table: str, opts: dict[str, Any]) -> tuple[Any, str]:
+        """Start the import query; return its item pager and the container name."""
+        size = min(opts.get("size", MAX_IMPORT_ROWS), MAX_IMPORT_ROWS)
+
         if not source_table:
             raise ValueError("source_table (container name) must be provided")
 
@@ -207,26 +260,104 @@ class CosmosDBDataLoader(ExternalDataLoader):
 
         logger.info(f"Fetching from Cosmos DB container: {container_name}")
 
-        # Query items with TOP to limit results
-        query = f"SELECT TOP {int(size)} * FROM c"
-        if sort_columns and len(sort_columns) > 0:
-            direction = "DESC" if sort_order == "desc" else "ASC"
-            order_parts = [f"c.{col} {direction}" for col in sort_columns]
-            query += " ORDER BY " + ", ".join(order_parts)
-
-        items = list(container.query_items(query=query, enable_cross_partition_query=True))
-
-        if not items:
-            logger.warning(f"No data found in Cosmos DB container '{container_name}'")
-            return pa.table({})
-
-        df = self._process_documents(items)
+        query, parameters = self._compile_import_query(container, opts, size)
+        items = container.query_items(
+            query=query,
+            parameters=parameters or None,
+            enable_cross_partition_query=True,
+            max_item_count=DOCUMENT_BATCH_SIZE,
+        )
+        return items, container_name
+
+    def _compile_import_query(
+        self, container: Any, opts: dict[str, Any], size: int,
+    ) -> tuple[str, list[dict[str, Any]]]:
+        """Compile import options into a Cosmos SQL query and its parameters.
+
+        Import options name *flattened* columns, so they are mapped back to
+        item paths from a small sample (``address_city`` →
+        ``c["address"]["city"]``, ``tags_1`` → ``c["tags"][0]``).  The
+        projection keeps whole top-level properties, which are flattened
+        client-side; filter values are always bound as parameters.
+        """
+        columns = [str(c) for c in opts.get("columns") or []]
+        sort_columns = [str(c) for c in opts.get("sort_columns") or []]
+        filters = [
+            sf for sf in opts.get("source_filters") or []
+            if isinstance(sf, dict) and sf.get("column")
+        ]
 
-        arrow_table = pa.Table.from_pandas(df, preserve_index=False)
+        paths: dict[str, tuple[str | int, ...]] = {}
+        if columns or sort_columns or filters:
+            sample = container.query_items(
+                query=f"SELECT TOP {PATH_SAMPLE_SIZE} * FROM c",
+                enable_cross_partition_query=True,
+            )
+            paths = flattened_field_paths(sample, skip_keys=_SYSTEM_KEYS)
+
+        def ref(name: str) -> str:
+            return self._item_ref(paths.get(name, (name,)))
+
+        select = "*"
+        if columns:
+            tops = dict.fromkeys(paths.get(c, (c,))[0] for c in columns + sort_columns)
+            select = ", ".join(self._item_ref((str(k),)) for k in tops)
+        query = f"SELECT TOP {int(size)} {select} FROM c"
+
+        parameters: list[dict[str, Any]] = []
+        conds = self._compile_where(filters, ref, parameters)
+        if conds:
+            query += " WHERE " + " AND ".join(conds)
+        if sort_columns:
+            direction = "DESC" if opts.get("sort_order") == "desc" else "ASC"
+            query += " ORDER BY " + ", ".join(f"{ref(c)} {direction}" for c in sort_columns)
+        return query, parameters
 
-        logger.info(f"Fetched {arrow_table.num_rows} rows from Cosmos DB container '{container_name}'")
+    @staticmethod
+    def _item_ref(path: tuple[str | int, ...]) -> str:
+        """Render an item path as a bracketed Cosmos SQL property reference."""
+        return "c" + "".join(
+            f"[{p}]" if isinstance(p, int) else f"[{json.dumps(str(p))}]" for p in path
+        )
 
-        return arrow_table
+    @staticmethod
+    def _compile_where(
+        filters: list[dict[str, Any]],
+        ref: Callable[[str], str],
+        parameters: list[dict[str, Any]],
+    ) -> list[str]:
+        """Compile ``source_filters`` into Cosmos SQL conditions.
+
+        Values are appended to *parameters* as ``@pN`` bindings.  Text
+        matching is a case-insensitive ``CONTAINS``, like the Mongo
+        loader's ``$regex`` with ``$options: "i"``.
+        """
+        def bind(value: Any) -> str:
+            name = f"@p{len(parameters)}"
+            parameters.append({"name": name, "value": value})
+            return name
+
+        conds: list[str] = []
+        for f in filters:
+            op = (f.get("operator") or "").upper().strip()
+            col = ref(str(f["column"]))
+            val = f.get("value")
+            if op in _COMPARISON_OPS:
+                conds.append(f"{col} {_COMPARISON_OPS[op]} {bind(val)}")
+            elif op in ("LIKE", "ILIKE"):
+                conds.append(f"CONTAINS({col}, {bind(str(val))}, true)")
+            elif op in ("IN", "NOT_IN"):
+                vals = list(val) if isinstance(val, (list, tuple)) else [val]
+                cond = f"ARRAY_CONTAINS({bind(vals)}, {col})"
+                conds.append(cond if op == "IN" else f"NOT {cond}")
+            elif op == "IS_NULL":
+                conds.append(f"(NOT IS_DEFINED({col}) OR IS_NULL({col}))")
+            elif op == "IS_NOT_NULL":
+                conds.append(f"(IS_DEFINED({col}) AND NOT IS_NULL({col}))")
+            elif op == "BETWEEN":
+                if isinstance(val, (list, tuple)) and len(val) == 2:
+                    conds.append(f"{col} >= {bind(val[0])} AND {col} <= {bind(val[1])}")
+        return conds
 
     def list_tables(self, table_filter: str | None = None) -> list[dict[str, Any]]:
         """
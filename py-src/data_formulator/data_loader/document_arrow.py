@@ -0,0 +1,176 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+"""Batched document → Arrow conversion for the document-store loaders.
+
+MongoDB and Cosmos DB return JSON-like documents with no fixed schema.
+Instead of materialising the whole cursor as a list of dicts and going
+through a pandas DataFrame, documents are flattened one batch at a time
+and each batch is converted to Arrow in a single C++ pass.  The first
+batch fixes the column order; fields that first appear in later batches
+are appended as null-filled columns, and fields whose types conflict
+across batches are widened (int → double) or, failing that, stored as
+strings.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Collection, Iterable, Iterator
+
+import pyarrow as pa
+
+from data_formulator.data_loader.external_data_loader import check_cancelled
+
+logger = logging.getLogger(__name__)
+
+# Documents flattened and converted per Arrow batch.  Also used as the
+# driver-side cursor batch size so one network round-trip feeds one batch.
+DOCUMENT_BATCH_SIZE = 10_000
+
+# Documents sampled to map flattened column names back to document paths
+# when an import pushes columns, filters or sort keys down to the source.
+PATH_SAMPLE_SIZE = 200
+
+
+def rows_to_arrow(rows: list[dict[str, Any]]) -> pa.Table:
+    """Convert flat row dicts to an Arrow table.
+
+    ``pa.array`` converts the list of dicts to a struct array in one C++
+    pass, with columns in first-seen key order.  If Arrow cannot unify a
+    column's values, only that column is stringified.
+    """
+    try:
+        return pa.Table.from_struct_array(pa.array(rows))
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        pass
+    columns: dict[str, None] = {}
+    for row in rows:
+        columns.update(dict.fromkeys(row))
+    arrays = {}
+    for col in columns:
+        values = [row.get(col) for row in rows]
+        try:
+            arrays[col] = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+            arrays[col] = pa.array([None if v is None else str(v) for v in values], pa.string())
+    return pa.table(arrays)
+
+
+def iter_document_batches(
+    documents: Iterable[Any],
+    to_row: Callable[[Any], dict[str, Any]],
+    batch_size: int = DOCUMENT_BATCH_SIZE,
+) -> Iterator[pa.Table]:
+    """Yield one Arrow table per *batch_size* documents.
+
+    *to_row* flattens a single document into a ``{column: scalar}`` dict.
+    Each batch is typed on its own; :func:`concat_document_batches`
+    reconciles batches whose schema drifted from the first one.  The
+    import's cancellation checkpoint is consulted between batches.
+    """
+    rows: list[dict[str, Any]] = []
+    for doc in documents:
+        rows.append(to_row(doc))
+        if len(rows) >= batch_size:
+            yield rows_to_arrow(rows)
+            rows = []
+            check_cancelled()
+    if rows:
+        yield rows_to_arrow(rows)
+
+
+def concat_document_batches(batches: list[pa.Table]) -> pa.Table:
+    """Concatenate per-batch tables whose schemas may have drifted.
+
+    Missing columns become nulls and numeric types widen as in
+    ``promote_options="permissive"``.  Columns whose types still cannot be
+    unified (e.g. a field holding numbers in one batch and strings in
+    another) are converted to strings in every batch.
+    """
+    if not batches:
+        return pa.table({})
+    if len(batches) == 1:
+        return batches[0]
+    try:
+        return pa.concat_tables(batches, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+
+    types: dict[str, set[pa.DataType]] = {}
+    for batch in batches:
+        for field in batch.schema:
+            if not pa.types.is_null(field.type):
+                types.setdefault(field.name, set()).add(field.type)
+    conflicting = {
+        name for name, seen in types.items()
+        if len(seen) > 1 and not all(pa.types.is_integer(t) or pa.types.is_floating(t) for t in seen)
+    }
+    logger.debug("Stringifying document fields with mixed types: %s", sorted(conflicting))
+
+    def stringify(column: pa.ChunkedArray) -> pa.ChunkedArray:
+        try:
+            return column.cast(pa.string())
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            return pa.chunked_array(
+                [pa.array([None if v is None else str(v) for v in column.to_pylist()], pa.string())]
+            )
+
+    widened = []
+    for batch in batches:
+        for name in conflicting & set(batch.column_names):
+            idx = batch.column_names.index(name)
+            batch = batch.set_column(idx, name, stringify(batch.column(idx)))
+        widened.append(batch)
+    return pa.concat_tables(widened, promote_options="permissive")
+
+
+def documents_to_arrow(
+    documents: Iterable[Any],
+    to_row: Callable[[Any], dict[str, Any]],
+    batch_size: int = DOCUMENT_BATCH_SIZE,
+) -> pa.Table:
+    """Flatten *documents* with *to_row* and build one Arrow table, batch by batch."""
+    return concat_document_batches(list(iter_document_batches(documents, to_row, batch_size)))
+
+
+def flattened_field_paths(
+    documents: Iterable[dict[str, Any]],
+    sep: str = "_",
+    skip_keys: Collection[str] = (),
+) -> dict[str, tuple[str | int, ...]]:
+    """Map flattened column names back to the document paths they come from.
+
+    Mirrors the loaders' ``_flatten_document``: nested keys are joined with
+    *sep* and list items are numbered from 1.  Path elements are keys, or
+    0-based ``int`` indexes for list items.  The first document that
+    produces a name decides its path.
+    """
+    paths: dict[str, tuple[str | int, ...]] = {}
+
+    def walk(doc: dict[str, Any], name: str, path: tuple[str | int, ...]) -> None:
+        for key, value in doc.items():
+            if key in skip_keys:
+                continue
+            key_name = f"{name}{sep}{key}" if name else key
+            key_path = path + (key,)
+            if isinstance(value, dict):
+                walk(value, key_name, key_path)
+            elif isinstance(value, list) and value:
+                for idx, item in enumerate(value, start=1):
+                    if isinstance(item, dict):
+                        walk(item, f"{key_name}{sep}{idx}", key_path + (idx - 1,))
+                    else:
+                        paths.setdefault(f"{key_name}{sep}{idx}", key_path + (idx - 1,))
+            else:
+                paths.setdefault(key_name, key_path)
+
+    for doc in documents:
+        walk(doc, "", ())
+    return paths
+
+
+def select_columns(table: pa.Table, columns: list[str]) -> pa.Table:
+    """Keep the requested *columns* (in request order) that *table* has."""
+    present = set(table.column_names)
+    return table.select([c for c in dict.fromkeys(columns) if c in present])
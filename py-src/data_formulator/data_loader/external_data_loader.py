@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Any, Callable, TYPE_CHECKING
+from typing import Any, Callable, Iterator, TYPE_CHECKING
 import pandas as pd
 import pyarrow as pa
 import logging
@@ -18,6 +20,32 @@ logger = logging.getLogger(__name__)
 MAX_IMPORT_ROWS = 2_000_000
 
 
+# Cancellation checkpoint for the import running in the current context.
+# Job functions install ``JobContext.raise_if_cancelled`` via
+# ``cancellation_scope`` so loaders that wait on server-side work (e.g. an
+# Athena query) can stop it instead of running it to completion.
+_cancel_checkpoint: ContextVar[Callable[[], None] | None] = ContextVar(
+    "loader_cancel_checkpoint", default=None,
+)
+
+
+@contextmanager
+def cancellation_scope(checkpoint: Callable[[], None]):
+    """Make *checkpoint* (raises once cancelled) visible to loaders in this context."""
+    token = _cancel_checkpoint.set(checkpoint)
+    try:
+        yield
+    finally:
+        _cancel_checkpoint.reset(token)
+
+
+def check_cancelled() -> None:
+    """Raise if the surrounding import was cancelled; no-op outside a scope."""
+    checkpoint = _cancel_checkpoint.get()
+    if checkpoint is not None:
+        checkpoint()
+
+
 class ConnectorParamError(ValueError):
     """Raised when required connector parameters are missing or empty."""
 
@@ -370,6 +398,12 @@ class ExternalDataLoader(ABC):
     # Loaders that don't report progress simply never call the helper.
     progress_callback: Callable[[str], None] | None = None
 
+    # How many ``ingest_to_workspace`` calls the import-group route may run
+    # on this loader at once.  Most loaders hold a single DB-API connection
+    # that is not thread-safe, so the default keeps imports sequential;
+    # loaders whose fetches are independent HTTP calls can raise it.
+    max_concurrent_imports: int = 1
+
     def _report_progress(self, message: str) -> None:
         """Emit a high-level progress message if a sink is attached.
 
@@ -459,6 +493,23 @@ class ExternalDataLoader(ABC):
         )
         return arrow_table.to_pandas()
     
+    def fetch_data_as_batches(
+        self,
+        source_table: str,
+        import_options: dict[str, Any] | None = None,
+    ) -> Iterator[pa.Table] | None:
+        """
+        Stream an import as a sequence of PyArrow Tables, or return ``None``.
+
+        Loaders that can read their source incrementally (e.g. CSV files
+        parsed block by block) override this so :meth:`ingest_to_workspace`
+        writes row groups as they arrive instead of materialising the whole
+        import.  Batches may differ in schema; the workspace widens them.
+        Returning ``None`` (the default) means the import goes through
+        :meth:`fetch_data_as_arrow`.
+        """
+        return None
+
     def ingest_to_workspace(
         self,
         workspace: "Workspace",
@@ -471,7 +522,9 @@ class ExternalDataLoader(ABC):
         Fetch data from external source and store as parquet in workspace.
         
         Uses PyArrow for efficient data transfer: External Source → Arrow → Parquet.
-        This avoids pandas conversion overhead entirely.
+        This avoids pandas conversion overhead entirely.  Loaders that stream
+        (:meth:`fetch_data_as_batches`) have each batch written as a row group
+        as it arrives, so the import is never held in memory as one table.
         
         After writing the parquet file, performs a best-effort metadata
         enrichment: merges table/column descriptions into the persisted
@@ -479,7 +532,9 @@ class ExternalDataLoader(ABC):
         (served from the synced catalog cache) and only falls back to a live
         ``get_column_types()`` fetch when none is provided — so a load doesn't
         pay an extra metadata round-trip for data the catalog already has.
-        Metadata failures never block the import.
+        Metadata failures never block the import.  The parquet write and the
+        enrichment share one :meth:`Workspace.metadata_batch`, so the table
+        entry is persisted once.
         
         Args:
             workspace: The workspace to store data in
@@ -493,10 +548,13 @@ class ExternalDataLoader(ABC):
         Returns:
             TableMetadata for the created parquet file
         """
-        arrow_table = self.fetch_data_as_arrow(
-            source_table=source_table,
-            import_options=import_options,
-        )
+        batches = self.fetch_data_as_batches(source_table, import_options)
+        arrow_table = None
+        if batches is None:
+            arrow_table = self.fetch_data_as_arrow(
+                source_table=source_table,
+                import_options=import_options,
+            )
 
         source_info = {
             "loader_type": self.__class__.__name__,
@@ -505,29 +563,37 @@ class ExternalDataLoader(ABC):
             "import_options": import_options,
         }
 
-        table_metadata = workspace.write_parquet_from_arrow(
-            table=arrow_table,
-            table_name=table_name,
-            source_info=source_info,
-        )
-
-        # Best-effort metadata enrichment. Prefer caller-supplied metadata
-        # (from the synced catalog cache); only hit the source live when the
-        # catalog had nothing for this table.
-        try:
-            source_meta = source_metadata or self.get_column_types(source_table)
-            if source_meta:
-                _merge_source_metadata(table_metadata, source_meta)
-                workspace.add_table_metadata(table_metadata)
-        except Exception as e:
-            logger.debug(
-                "Metadata enrichment skipped for %s: %s",
-                table_name, type(e).__name__,
-            )
+        with workspace.metadata_batch():
+            if arrow_table is not None:
+                table_metadata = workspace.write_parquet_from_arrow(
+                    table=arrow_table,
+                    table_name=table_name,
+                    source_info=source_info,
+                )
+            else:
+                table_metadata = workspace.write_parquet_from_batches(
+                    batches,
+                    table_name=table_name,
+                    source_info=source_info,
+                )
+
+            # Best-effort metadata enrichment. Prefer caller-supplied metadata
+            # (from the synced catalog cache); only hit the source live when the
+            # catalog had nothing for this table.
+            try:
+                source_meta = source_metadata or self.get_column_types(source_table)
+                if source_meta:
+                    _merge_source_metadata(table_metadata, source_meta)
+                    workspace.add_table_metadata(table_metadata)
+            except Exception as e:
+                logger.debug(
+                    "Metadata enrichment skipped for %s: %s",
+                    table_name, type(e).__name__,
+                )
 
         logger.info(
-            "Ingested %d rows from %s to workspace as %s.parquet",
-            arrow_table.num_rows, self.__class__.__name__, table_name,
+            "Ingested %s rows from %s to workspace as %s.parquet",
+            table_metadata.row_count, self.__class__.__name__, table_name,
         )
 
         return table_metadata
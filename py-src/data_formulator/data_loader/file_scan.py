@@ -0,0 +1,581 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+"""Import-option pushdown and partitioned datasets for the file-based loaders.
+
+Used by the local folder, S3 and Azure Blob loaders.
+
+``import_options`` carry ``columns``, ``source_filters``, sort options and a
+row ``size``.  For parquet these are pushed into a ``pyarrow.dataset``
+scan: only the projected columns are decoded, row groups whose min/max
+statistics cannot match the filter are skipped, and an unsorted scan
+stops as soon as ``size`` rows have been collected.  Formats read whole
+(CSV, JSON, Excel) get the same options applied to the in-memory table,
+so every format honours the same contract.
+
+A directory of parquet files laid out with Hive partitions
+(``sales/year=2024/month=01/part-0.parquet``) is one table: the listing
+helpers here group such files under their dataset root, and
+:func:`scan_parquet` opens the root with ``partitioning="hive"`` so
+partition keys become columns, ``source_filters`` on them prune whole
+directories before any file is opened, and the surviving files are read
+in parallel.
+
+CSV and newline-delimited JSON are streamed: :func:`scan_text` parses
+them a block at a time, applies the import options per block and stops
+at ``size``, so loaders can hand the blocks straight to the workspace
+writer.  Column types are inferred from the first block; a later value
+that does not fit widens the column (null → int64 → float64 → string).
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import re
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Callable, Iterable, Iterator
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+import pyarrow.json as pa_json
+from pyarrow import fs as pa_fs
+
+from data_formulator.data_loader.document_arrow import concat_document_batches, rows_to_arrow
+from data_formulator.data_loader.external_data_loader import check_cancelled
+
+logger = logging.getLogger(__name__)
+
+# Files of a partitioned dataset read concurrently.
+DATASET_READ_WORKERS = 8
+
+# A ``key=value`` directory segment of a Hive-partitioned layout.
+_PARTITION_SEGMENT_RE = re.compile(r"^[^=/]+=[^=/]*$")
+
+# Bytes of CSV / JSON text parsed per streamed block.
+TEXT_BLOCK_SIZE = 8 << 20
+
+# ``In CSV column #3: Row #5002: CSV conversion error to int64: invalid value 'x'``
+_CSV_CONVERSION_ERROR_RE = re.compile(
+    r"In CSV column #(\d+): .*conversion error to \w+(?:: invalid value '(.*)')?", re.DOTALL,
+)
+
+# Numeric types a CSV column widens through before falling back to string.
+_CSV_NUMERIC_LADDER = (pa.int64(), pa.float64())
+
+_COMPARISONS = {
+    "EQ": lambda f, v: f == v,
+    "NEQ": lambda f, v: f != v,
+    "GT": lambda f, v: f > v,
+    "GTE": lambda f, v: f >= v,
+    "LT": lambda f, v: f < v,
+    "LTE": lambda f, v: f <= v,
+}
+
+
+def _literal(value: Any, type_: pa.DataType, column: str) -> Any:
+    """Cast a filter value to the column type so the expression binds.
+
+    A number that does not fit the column type exactly (``2.5`` or ``300``
+    against an int8 column) is compared as is: Arrow promotes numeric
+    comparisons.  Other values that cannot be cast (``"abc"`` against an
+    int column) would only fail later inside the scan, so a ``ValueError``
+    naming the filter is raised instead.
+    """
+    if value is None:
+        return None
+    try:
+        return pa.scalar(value).cast(type_)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and (
+            pa.types.is_integer(type_) or pa.types.is_floating(type_) or pa.types.is_decimal(type_)
+        ):
+            return pa.scalar(value)
+        raise ValueError(
+            f"Filter value {value!r} cannot be compared with column {column!r} of type {type_}"
+        ) from None
+
+
+def source_filters_to_expression(
+    source_filters: list[dict[str, Any]] | None,
+    schema: pa.Schema,
+) -> pc.Expression | None:
+    """Compile ``source_filters`` into a dataset filter expression.
+
+    Uses the same operator vocabulary as
+    :func:`build_source_filter_where_clause_inline`; ``LIKE``/``ILIKE``
+    are case-insensitive substring matches, like ``ILIKE '%value%'``.
+    Filters on unknown columns or with unknown operators are skipped.
+    Raises ``ValueError`` when a comparison value cannot be cast to its
+    column's type; ``IN`` lists that do not cast compare as strings.
+    """
+    parts: list[pc.Expression] = []
+    for sf in source_filters or []:
+        if not isinstance(sf, dict):
+            continue
+        col = sf.get("column")
+        op = (sf.get("operator") or "").upper().strip()
+        val = sf.get("value")
+        if not col or col not in schema.names:
+            logger.debug("Skipping filter on unknown column %r", col)
+            continue
+        field = pc.field(col)
+        type_ = schema.field(col).type
+        if op in _COMPARISONS:
+            parts.append(_COMPARISONS[op](field, _literal(val, type_, col)))
+        elif op in ("LIKE", "ILIKE"):
+            parts.append(pc.match_substring(
+                field.cast(pa.string()), str(val), ignore_case=True,
+            ))
+        elif op in ("IN", "NOT_IN"):
+            vals = val if isinstance(val, (list, tuple)) else [val]
+            try:
+                value_set = pa.array(vals).cast(type_)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                value_set = pa.array([str(v) for v in vals])
+                field = field.cast(pa.string())
+            expr = pc.is_in(field, value_set=value_set)
+            parts.append(expr if op == "IN" else ~expr)
+        elif op == "IS_NULL":
+            parts.append(field.is_null())
+        elif op == "IS_NOT_NULL":
+            parts.append(field.is_valid())
+        elif op == "BETWEEN":
+            if isinstance(val, (list, tuple)) and len(val) == 2:
+                parts.append((field >= _literal(val[0], type_, col)) & (field <= _literal(val[1], type_, col)))
+        else:
+            logger.debug("Skipping filter with unsupported operator %r", op)
+    if not parts:
+        return None
+    expr = parts[0]
+    for part in parts[1:]:
+        expr = expr & part
+    return expr
+
+
+def _sort_keys(opts: dict[str, Any], names: list[str]) -> list[tuple[str, str]]:
+    order = "descending" if opts.get("sort_order") == "desc" else "ascending"
+    return [(c, order) for c in opts.get("sort_columns") or [] if c in names]
+
+
+def _projection(opts: dict[str, Any], names: list[str]) -> list[str] | None:
+    columns = [c for c in dict.fromkeys(opts.get("columns") or []) if c in names]
+    return columns or None
+
+
+def _row_groups(dataset: ds.Dataset, expr: pc.Expression | None) -> Iterator[ds.ParquetFileFragment]:
+    """Yield the dataset's row groups, skipping those *expr* rules out.
+
+    ``split_by_row_group`` checks the filter against each row group's
+    min/max statistics, so pruned row groups are never read.
+    """
+    for fragment in dataset.get_fragments(filter=expr):
+        yield from fragment.split_by_row_group(filter=expr, schema=dataset.schema)
+
+
+def is_partition_segment(name: str) -> bool:
+    """Whether a directory name is a Hive ``key=value`` partition."""
+    return bool(_PARTITION_SEGMENT_RE.match(name))
+
+
+def partition_root(path: str) -> str | None:
+    """Return the dataset root of a file inside a Hive-partitioned layout.
+
+    ``"sales/year=2024/month=01/part-0.parquet"`` → ``"sales"``.  Returns
+    ``None`` for files with no ``key=value`` directory, and for layouts
+    partitioned right at the top (there is no directory to name the table).
+    Only parquet files are grouped into datasets.
+    """
+    if not path.lower().endswith(".parquet"):
+        return None
+    parts = path.strip("/").split("/")
+    for i, segment in enumerate(parts[:-1]):
+        if is_partition_segment(segment):
+            return "/".join(parts[:i]) or None
+    return None
+
+
+def group_partitioned_files(paths: Iterable[str]) -> tuple[list[str], dict[str, list[str]]]:
+    """Split listed file paths into standalone files and partitioned datasets.
+
+    Returns ``(files, datasets)`` where *datasets* maps each dataset root to
+    its member files, in listing order.
+    """
+    files: list[str] = []
+    datasets: dict[str, list[str]] = {}
+    for path in paths:
+        root = partition_root(path)
+        if root is None:
+            files.append(path)
+        else:
+            datasets.setdefault(root, []).append(path)
+    return files, datasets
+
+
+def partition_keys(paths: Iterable[str], root: str) -> list[str]:
+    """Partition key names of a dataset, in directory order."""
+    keys: dict[str, None] = {}
+    prefix = root.strip("/") + "/"
+    for path in paths:
+        for segment in path.strip("/")[len(prefix):].split("/")[:-1]:
+            if is_partition_segment(segment):
+                keys[segment.split("=", 1)[0]] = None
+    return list(keys)
+
+
+def open_parquet_dataset(
+    path: str,
+    filesystem: pa_fs.FileSystem | None,
+    partitioning: str | None = None,
+) -> ds.Dataset:
+    """Open a parquet file, or a directory with *partitioning* (e.g. ``"hive"``)."""
+    return ds.dataset(path, format="parquet", filesystem=filesystem, partitioning=partitioning)
+
+
+def _read_fragments(
+    dataset: ds.Dataset,
+    fragments: list[ds.Fragment],
+    expr: pc.Expression | None,
+    columns: list[str] | None,
+    size: int,
+) -> list[pa.Table]:
+    """Read *fragments* concurrently, in order, until *size* rows are collected.
+
+    At most ``DATASET_READ_WORKERS`` files are in flight; once enough rows
+    have arrived no further files are started.
+    """
+    parts: list[pa.Table] = []
+    collected = 0
+    remaining = iter(fragments)
+    with ThreadPoolExecutor(max_workers=min(DATASET_READ_WORKERS, len(fragments))) as pool:
+        in_flight: deque = deque()
+
+        def submit_next() -> None:
+            fragment = next(remaining, None)
+            if fragment is not None:
+                in_flight.append(pool.submit(
+                    fragment.to_table, schema=dataset.schema, columns=columns, filter=expr,
+                ))
+
+        for _ in range(DATASET_READ_WORKERS):
+            submit_next()
+        while in_flight:
+            part = in_flight.popleft().result()
+            parts.append(part)
+            collected += part.num_rows
+            if collected >= size:
+                break
+            check_cancelled()
+            submit_next()
+        for future in in_flight:
+            future.cancel()
+    return parts
+
+
+def scan_parquet(
+    path: str,
+    filesystem: pa_fs.FileSystem | None,
+    import_options: dict[str, Any],
+    size: int,
+    partitioning: str | None = None,
+) -> tuple[pa.Table, int | None]:
+    """Read a parquet file with projection, filter and limit pushed into the scan.
+
+    *path* is a single file, or with ``partitioning="hive"`` a dataset
+    directory.  Returns the table and the number of rows matching the
+    filter when that is known without an extra pass (the unfiltered
+    single-file row count, from parquet metadata); ``None`` otherwise.
+
+    Unsorted single-file imports read one row group at a time and stop
+    once *size* rows are collected; a dataset scan would read ahead and
+    pre-buffer the whole file.  Multi-file datasets are first pruned by
+    partition expression (from the directory names alone), then the
+    surviving files are read in parallel.  Sorted imports read the
+    filtered projection in full, since any row may sort first.
+    """
+    dataset = open_parquet_dataset(path, filesystem, partitioning)
+    names = dataset.schema.names
+    expr = source_filters_to_expression(import_options.get("source_filters"), dataset.schema)
+    columns = _projection(import_options, names)
+    sort_keys = _sort_keys(import_options, names)
+
+    if sort_keys:
+        read_columns = None if columns is None else list(dict.fromkeys(columns + [c for c, _ in sort_keys]))
+        table = dataset.to_table(columns=read_columns, filter=expr)
+        total = table.num_rows
+        table = table.sort_by(sort_keys).slice(0, size)
+        if columns is not None:
+            table = table.select(columns)
+        return table, total
+
+    fragments = list(dataset.get_fragments(filter=expr))
+    if len(fragments) > 1:
+        parts = _read_fragments(dataset, fragments, expr, columns, size)
+        table = pa.concat_tables(parts).slice(0, size)
+        return table, None
+
+    parts: list[pa.Table] = []
+    collected = 0
+    for row_group in _row_groups(dataset, expr):
+        part = row_group.to_table(schema=dataset.schema, columns=columns, filter=expr)
+        parts.append(part)
+        collected += part.num_rows
+        if collected >= size:
+            break
+        check_cancelled()
+    if parts:
+        table = pa.concat_tables(parts).slice(0, size)
+    else:
+        table = dataset.schema.empty_table()
+        if columns is not None:
+            table = table.select(columns)
+    total = dataset.count_rows() if expr is None and partitioning is None else None
+    return table, total
+
+
+def count_parquet_rows(
+    path: str,
+    filesystem: pa_fs.FileSystem | None,
+    import_options: dict[str, Any],
+    partitioning: str | None = None,
+) -> int:
+    """Number of rows of a parquet file or dataset matching ``source_filters``.
+
+    Unfiltered counts come from the file footers; filtered counts read only
+    the filter columns of row groups whose statistics may match.
+    """
+    dataset = open_parquet_dataset(path, filesystem, partitioning)
+    expr = source_filters_to_expression(import_options.get("source_filters"), dataset.schema)
+    return dataset.count_rows(filter=expr)
+
+
+def apply_import_options(table: pa.Table, import_options: dict[str, Any], size: int) -> pa.Table:
+    """Apply ``source_filters``, sort, ``columns`` and ``size`` to an in-memory table."""
+    expr = source_filters_to_expression(import_options.get("source_filters"), table.schema)
+    if expr is not None:
+        table = table.filter(expr)
+    sort_keys = _sort_keys(import_options, table.column_names)
+    if sort_keys:
+        table = table.sort_by(sort_keys)
+    columns = _projection(import_options, table.column_names)
+    if columns is not None:
+        table = table.select(columns)
+    if table.num_rows > size:
+        table = table.slice(0, size)
+    return table
+
+
+# Text formats streamed by :func:`scan_text`, by file extension.
+_TEXT_FORMATS = {
+    ".csv": ("csv", None),
+    ".tsv": ("csv", pa_csv.ParseOptions(delimiter="\t")),
+    ".json": ("json", None),
+    ".jsonl": ("json", None),
+}
+
+
+def text_format(name: str) -> tuple[str, pa_csv.ParseOptions | None] | None:
+    """``(file_type, parse_options)`` for a streamable CSV/TSV/JSON file name, else ``None``."""
+    for ext, fmt in _TEXT_FORMATS.items():
+        if name.lower().endswith(ext):
+            return fmt
+    return None
+
+
+def _widen_csv_type(current: pa.DataType, value: str | None) -> pa.DataType:
+    """Narrowest type past *current* on the widening ladder that accepts *value*."""
+    if pa.types.is_null(current):
+        ladder = _CSV_NUMERIC_LADDER
+    elif pa.types.is_integer(current):
+        ladder = _CSV_NUMERIC_LADDER[1:]
+    else:
+        ladder = ()
+    for candidate in ladder:
+        if value is None:
+            break
+        try:
+            pa.scalar(value).cast(candidate)
+            return candidate
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            continue
+    return pa.string()
+
+
+def _csv_batches(
+    open_source: Callable[[], IO[bytes]],
+    parse_options: pa_csv.ParseOptions | None,
+) -> Iterator[pa.RecordBatch]:
+    """Stream a CSV file block by block.
+
+    Arrow fixes column types from the first block.  When a later block
+    holds a value that does not convert, the column is widened and the
+    file re-read with that type pinned, skipping the rows already yielded —
+    so batches after a widening carry the wider schema.
+    """
+    column_types: dict[str, pa.DataType] = {}
+    schema: pa.Schema | None = None
+    emitted = 0
+    while True:
+        try:
+            with open_source() as f:
+                reader = pa_csv.open_csv(
+                    f,
+                    read_options=pa_csv.ReadOptions(block_size=TEXT_BLOCK_SIZE),
+                    parse_options=parse_options,
+                    convert_options=pa_csv.ConvertOptions(column_types=column_types),
+                )
+                schema = reader.schema
+                seen = 0
+                for batch in reader:
+                    start = seen
+                    seen += batch.num_rows
+                    if seen <= emitted:
+                        continue
+                    if start < emitted:
+                        batch = batch.slice(emitted - start)
+                    emitted += batch.num_rows
+                    yield batch
+            return
+        except pa.ArrowInvalid as exc:
+            match = _CSV_CONVERSION_ERROR_RE.search(str(exc))
+            if match is None or schema is None:
+                raise
+            name = schema.names[int(match.group(1))]
+            current = column_types.get(name, schema.field(name).type)
+            widened = _widen_csv_type(current, match.group(2))
+            if widened.equals(current):
+                raise
+            logger.info("Widening CSV column %r from %s to %s after %d rows", name, current, widened, emitted)
+            column_types[name] = widened
+
+
+def _parse_json_chunk(chunk: bytes) -> pa.Table:
+    try:
+        return pa_json.read_json(io.BytesIO(chunk))
+    except pa.ArrowInvalid:
+        # Arrow's JSON reader rejects a field that changes kind (number to
+        # string) within the chunk; parse in Python and stringify that field.
+        return rows_to_arrow([json.loads(line) for line in chunk.splitlines() if line.strip()])
+
+
+def _json_batches(open_source: Callable[[], IO[bytes]]) -> Iterator[pa.Table]:
+    """Stream newline-delimited JSON in chunks of whole lines, each typed on its own."""
+    with open_source() as f:
+        tail = b""
+        while True:
+            block = f.read(TEXT_BLOCK_SIZE)
+            if not block:
+                break
+            data = tail + block
+            cut = data.rfind(b"\n") + 1
+            if cut == 0:
+                tail = data
+                continue
+            tail = data[cut:]
+            yield _parse_json_chunk(data[:cut])
+        if tail.strip():
+            yield _parse_json_chunk(tail)
+
+
+def _absent_columns_can_match(source_filters: list[dict[str, Any]] | None, names: list[str]) -> bool:
+    """Whether rows of a JSON chunk that lacks some filtered fields can match.
+
+    A field missing from a chunk is null in every row of it, so only
+    ``IS_NULL`` matches there; any other filter on it rejects the chunk.
+    """
+    for sf in source_filters or []:
+        if not isinstance(sf, dict) or not sf.get("column") or sf["column"] in names:
+            continue
+        if (sf.get("operator") or "").upper().strip() != "IS_NULL":
+            return False
+    return True
+
+
+def scan_text(
+    open_source: Callable[[], IO[bytes]],
+    file_type: str,
+    import_options: dict[str, Any],
+    size: int,
+    parse_options: pa_csv.ParseOptions | None = None,
+) -> Iterator[pa.Table]:
+    """Stream a CSV (``file_type="csv"``) or NDJSON file as filtered, projected tables.
+
+    *open_source* opens the file as a binary stream (CSV may be re-opened
+    to widen a column).  ``source_filters`` and ``columns`` are applied to
+    each block, and the scan stops once *size* rows have been yielded.
+    Sort options are ignored; see :func:`read_text`.  Yielded tables may
+    drift in schema (a widened column, a JSON field first seen late); a
+    JSON chunk without a filtered field matches only ``IS_NULL`` on it.
+    """
+    if file_type == "csv":
+        batches = _csv_batches(open_source, parse_options)
+    else:
+        batches = _json_batches(open_source)
+    collected = 0
+    try:
+        for batch in batches:
+            table = pa.Table.from_batches([batch]) if isinstance(batch, pa.RecordBatch) else batch
+            source_filters = import_options.get("source_filters")
+            if file_type == "json" and not _absent_columns_can_match(source_filters, table.column_names):
+                table = table.slice(0, 0)
+            expr = source_filters_to_expression(source_filters, table.schema)
+            if expr is not None:
+                table = table.filter(expr)
+            columns = _projection(import_options, table.column_names)
+            if columns is not None:
+                table = table.select(columns)
+            table = table.slice(0, size - collected)
+            collected += table.num_rows
+            yield table
+            if collected >= size:
+                return
+            check_cancelled()
+    finally:
+        batches.close()
+
+
+def read_text(
+    open_source: Callable[[], IO[bytes]],
+    file_type: str,
+    import_options: dict[str, Any],
+    size: int,
+    parse_options: pa_csv.ParseOptions | None = None,
+    *,
+    count_all: bool = False,
+) -> tuple[pa.Table, int | None]:
+    """Read a CSV or NDJSON file into one table through :func:`scan_text`.
+
+    Returns the table and, as :func:`scan_parquet` does, the number of rows
+    matching the filter when the whole file was read; ``None`` when the
+    scan stopped at *size*.  With *count_all* the scan goes on past *size*,
+    counting the remaining matches without keeping them, so the total is
+    always known.  Sorted imports read every matching row.
+    """
+    sort_keys = import_options.get("sort_columns")
+    if not sort_keys and count_all:
+        parts: list[pa.Table] = []
+        total = 0
+        for block in scan_text(open_source, file_type, import_options, sys.maxsize, parse_options):
+            if total < size:
+                parts.append(block.slice(0, size - total))
+            total += block.num_rows
+        return concat_document_batches(parts), total
+    if not sort_keys:
+        table = concat_document_batches(list(
+            scan_text(open_source, file_type, import_options, size, parse_options)
+        ))
+        return table, (table.num_rows if table.num_rows < size else None)
+
+    scan_options = dict(import_options)
+    if import_options.get("columns"):
+        scan_options["columns"] = list(import_options["columns"]) + list(sort_keys)
+    table = concat_document_batches(list(
+        scan_text(open_source, file_type, scan_options, sys.maxsize, parse_options)
+    ))
+    remaining = {k: v for k, v in import_options.items() if k != "source_filters"}
+    return apply_import_options(table, remaining, size), table.num_rows
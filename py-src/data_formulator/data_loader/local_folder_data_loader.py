@@ -11,15 +11,26 @@ import json
 import logging
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import pandas as pd
 import pyarrow as pa
-import pyarrow.csv as pa_csv
 import pyarrow.parquet as pq
 
 from data_formulator.data_loader.external_data_loader import ExternalDataLoader, CatalogNode, MAX_IMPORT_ROWS
 from data_formulator.data_loader import probe_utils
+from data_formulator.data_loader.file_scan import (
+    apply_import_options,
+    count_parquet_rows,
+    group_partitioned_files,
+    is_partition_segment,
+    open_parquet_dataset,
+    partition_keys,
+    read_text,
+    scan_parquet,
+    scan_text,
+    text_format,
+)
 from data_formulator.datalake.parquet_utils import df_to_safe_records
 from data_formulator.security.path_safety import ConfinedDir
 
@@ -121,6 +132,8 @@ class LocalFolderDataLoader(ExternalDataLoader):
 
         path=[] → list top-level folders and files.
         path=["subfolder"] → list contents of subfolder.
+        A folder holding a Hive-partitioned parquet dataset
+        (``year=2024/...``) is listed as a single table.
         """
         path = path or []
         eff = self.effective_hierarchy()
@@ -153,6 +166,14 @@ class LocalFolderDataLoader(ExternalDataLoader):
             if child.is_dir():
                 if filter and filter.lower() not in child.name.lower():
                     continue
+                if self._is_partitioned_dir(child):
+                    nodes.append(CatalogNode(
+                        name=child.name,
+                        node_type="table",
+                        path=rel_parts,
+                        metadata=self._dataset_metadata(child),
+                    ))
+                    continue
                 nodes.append(CatalogNode(
                     name=child.name,
                     node_type="namespace",
@@ -173,18 +194,20 @@ class LocalFolderDataLoader(ExternalDataLoader):
         return nodes
 
     def get_metadata(self, path: list[str]) -> dict[str, Any]:
-        """Get detailed metadata for a single file, including sample rows."""
+        """Get detailed metadata for a file or partitioned dataset, including sample rows."""
         if not path:
             return {}
         try:
             resolved = self._jail / "/".join(path)
         except ValueError:
             return {}
-        if not resolved.is_file():
+        if resolved.is_file():
+            meta = self._file_metadata(resolved)
+        elif self._is_partitioned_dir(resolved):
+            meta = self._dataset_metadata(resolved)
+        else:
             return {}
 
-        meta = self._file_metadata(resolved)
-
         # Read a small sample for preview
         try:
             table = self.fetch_data_as_arrow("/".join(path), {"size": 5})
@@ -201,11 +224,14 @@ class LocalFolderDataLoader(ExternalDataLoader):
         return meta
 
     def list_tables(self, table_filter: str | None = None) -> list[dict[str, Any]]:
-        """Return data files as 'tables', with subdirectories as namespaces."""
+        """Return data files as 'tables', with subdirectories as namespaces.
+
+        Parquet files under Hive partition directories are returned once,
+        as their dataset root folder.
+        """
         if self._jail is None:
             self._jail = ConfinedDir(self.root_dir, mkdir=False)
 
-        results: list[dict[str, Any]] = []
         pattern = self.file_pattern or "*"
 
         if self.recursive:
@@ -213,6 +239,7 @@ class LocalFolderDataLoader(ExternalDataLoader):
         else:
             candidates = self.root_dir.glob(pattern)
 
+        files: list[str] = []
         for filepath in sorted(candidates):
             if not filepath.is_file():
                 continue
@@ -220,17 +247,20 @@ class LocalFolderDataLoader(ExternalDataLoader):
                 continue
             if filepath.name.startswith("."):
                 continue
+            files.append(filepath.relative_to(self.root_dir).as_posix())
 
-            rel = filepath.relative_to(self.root_dir)
-            name = str(rel)
+        standalone, datasets = group_partitioned_files(files)
+        entries = [(name, self._file_metadata) for name in standalone]
+        entries += [(root, self._dataset_metadata) for root in datasets]
 
+        results: list[dict[str, Any]] = []
+        for name, describe in sorted(entries, key=lambda e: Path(e[0]).parts):
             if table_filter and table_filter.lower() not in name.lower():
                 continue
-
-            metadata = self._file_metadata(filepath)
+            rel = Path(name)
             results.append({
-                "name": name,
-                "metadata": metadata,
+                "name": str(rel),
+                "metadata": describe(self.root_dir / rel),
                 "path": list(rel.parts),
             })
 
@@ -241,7 +271,14 @@ class LocalFolderDataLoader(ExternalDataLoader):
         source_table: str,
         import_options: dict[str, Any] | None = None,
     ) -> pa.Table:
-        """Read a file from the connected folder into an Arrow table."""
+        """Read a file from the connected folder into an Arrow table.
+
+        Parquet files are scanned with ``columns``, ``source_filters`` and
+        ``size`` pushed down (see :mod:`file_scan`); CSV/TSV/JSON are
+        streamed block by block with the same options and stop at ``size``;
+        Excel is read whole.  A folder holding a Hive-partitioned parquet
+        dataset is read as one table.
+        """
         if self._jail is None:
             self._jail = ConfinedDir(self.root_dir, mkdir=False)
 
@@ -250,43 +287,117 @@ class LocalFolderDataLoader(ExternalDataLoader):
         size = opts.get("size", 1_000_000)
 
         ext = resolved.suffix.lower()
-        if ext == ".parquet":
-            table = pq.read_table(str(resolved))
-        elif ext in (".csv", ".tsv"):
-            # ``.tsv`` is tab-separated; pyarrow's read_csv defaults to a comma
-            # delimiter, so without this a TSV collapses into a single column
-            # (e.g. "id\trate" stays one field). Keep comma for ``.csv``.
-            parse_options = (
-                pa_csv.ParseOptions(delimiter="\t") if ext == ".tsv" else None
+        fmt = text_format(resolved.name)
+        if resolved.is_dir():
+            if not self._is_partitioned_dir(resolved):
+                raise ValueError(f"Not a partitioned dataset folder: {source_table}")
+            table, total = scan_parquet(str(resolved), None, opts, size, partitioning="hive")
+            self._last_total_rows = self._parquet_total(resolved, opts, size, table, total, "hive")
+        elif ext == ".parquet":
+            table, total = scan_parquet(str(resolved), None, opts, size)
+            # Store the real count so callers can show it alongside the
+            # sliced preview.
+            self._last_total_rows = self._parquet_total(resolved, opts, size, table, total)
+        elif fmt is not None:
+            file_type, parse_options = fmt
+            table, total = read_text(
+                lambda: open(resolved, "rb"), file_type, opts, size, parse_options, count_all=True,
             )
-            table = pa_csv.read_csv(str(resolved), parse_options=parse_options)
-        elif ext in (".json", ".jsonl"):
-            import pyarrow.json as pa_json
-            table = pa_json.read_json(str(resolved))
+            self._last_total_rows = total
         elif ext in (".xlsx", ".xls"):
             df = pd.read_excel(str(resolved))
             table = pa.Table.from_pandas(df)
+            # Store total before slicing so callers can get the real count
+            self._last_total_rows = table.num_rows
+            table = apply_import_options(table, opts, size)
         else:
             raise ValueError(f"Unsupported file type: {ext}")
 
-        # Store total before slicing so callers can get the real count
-        self._last_total_rows = table.num_rows
-
-        if table.num_rows > size:
-            table = table.slice(0, size)
-
         logger.info(
             "Fetched %d rows from local file: %s",
             table.num_rows, source_table,
         )
         return table
 
+    def fetch_data_as_batches(
+        self,
+        source_table: str,
+        import_options: dict[str, Any] | None = None,
+    ) -> Iterator[pa.Table] | None:
+        """Stream unsorted CSV/TSV/JSON imports block by block (see :func:`scan_text`)."""
+        opts = import_options or {}
+        fmt = text_format(source_table)
+        if fmt is None or opts.get("sort_columns"):
+            return None
+        if self._jail is None:
+            self._jail = ConfinedDir(self.root_dir, mkdir=False)
+        resolved = self._jail / source_table
+        if not resolved.is_file():
+            return None
+        file_type, parse_options = fmt
+        return scan_text(
+            lambda: open(resolved, "rb"), file_type, opts, opts.get("size", 1_000_000), parse_options,
+        )
+
     def probe(self, path: list[str], query: dict[str, Any]) -> dict[str, Any]:
         """Read the file into DuckDB and compute the SPJQ there."""
         return probe_utils.run_probe_on_duckdb(self, path, query, scan_size=MAX_IMPORT_ROWS)
 
     # -- Helpers -----------------------------------------------------------
 
+    @staticmethod
+    def _parquet_total(
+        resolved: Path,
+        opts: dict[str, Any],
+        size: int,
+        table: pa.Table,
+        total: int | None,
+        partitioning: str | None = None,
+    ) -> int:
+        """Matching row count for a parquet scan that may have stopped at *size*."""
+        if total is not None:
+            return total
+        if table.num_rows < size:
+            return table.num_rows  # the scan ran out of rows before the limit
+        return count_parquet_rows(str(resolved), None, opts, partitioning)
+
+    @staticmethod
+    def _is_partitioned_dir(dirpath: Path) -> bool:
+        """Whether *dirpath* directly holds ``key=value`` partition folders."""
+        try:
+            return any(
+                child.is_dir() and is_partition_segment(child.name)
+                for child in dirpath.iterdir()
+            )
+        except OSError:
+            return False
+
+    def _dataset_metadata(self, dirpath: Path) -> dict[str, Any]:
+        """Describe a partitioned dataset folder from its file listing.
+
+        The schema comes from one file's footer plus the partition keys; the
+        row count is left unknown rather than opening every file.
+        """
+        files = [
+            p for p in dirpath.rglob("*.parquet")
+            if p.is_file() and not any(part.startswith((".", "_")) for part in p.relative_to(dirpath).parts)
+        ]
+        rel_files = [p.relative_to(self.root_dir).as_posix() for p in files]
+        meta: dict[str, Any] = {
+            "file_size": sum(p.stat().st_size for p in files),
+            "modified": max((p.stat().st_mtime for p in files), default=None),
+            "file_type": "parquet",
+            "file_count": len(files),
+            "partition_keys": partition_keys(rel_files, dirpath.relative_to(self.root_dir).as_posix()),
+            "row_count": None,
+        }
+        try:
+            schema = open_parquet_dataset(str(dirpath), None, "hive").schema
+            meta["columns"] = [{"name": f.name, "type": str(f.type)} for f in schema]
+        except Exception as exc:
+            logger.debug("Dataset schema discovery failed for %s: %s", dirpath, exc)
+        return meta
+
     def _file_metadata(self, filepath: Path) -> dict[str, Any]:
         """Extract lightweight metadata without reading the full file."""
         ext = filepath.suffix.lower()
@@ -9,8 +9,16 @@ from bson import ObjectId
 
 from data_formulator.data_loader.external_data_loader import ExternalDataLoader, CatalogNode, MAX_IMPORT_ROWS, sanitize_table_name
 from data_formulator.data_loader import probe_utils
+from data_formulator.data_loader.document_arrow import (
+    DOCUMENT_BATCH_SIZE,
+    PATH_SAMPLE_SIZE,
+    documents_to_arrow,
+    flattened_field_paths,
+    iter_document_batches,
+    select_columns,
+)
 from data_formulator.datalake.parquet_utils import df_to_safe_records
-from typing import Any
+from typing import Any, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -149,6 +157,11 @@ class MongoDBDataLoader(ExternalDataLoader):
                 result[key] = value
         return result
     
+    @classmethod
+    def _document_to_row(cls, doc: dict[str, Any]) -> dict[str, Any]:
+        """Convert and flatten one document into a flat row dict."""
+        return cls._flatten_document(cls._convert_special_types(doc))
+
     def _process_documents(self, documents: list[dict[str, Any]]) -> pd.DataFrame:
         """
         Process MongoDB documents list, flatten and convert to DataFrame
@@ -170,22 +183,58 @@ class MongoDBDataLoader(ExternalDataLoader):
         source_table: str,
         import_options: dict[str, Any] | None = None,
     ) -> pa.Table:
-        opts = import_options or {}
-        size = min(opts.get("size", MAX_IMPORT_ROWS), MAX_IMPORT_ROWS)
-        sort_columns = opts.get("sort_columns")
-        sort_order = opts.get("sort_order", "asc")
         """
         Fetch data from MongoDB as a PyArrow Table.
         
-        MongoDB doesn't have native Arrow support, so we fetch documents,
-        process them, and convert to Arrow format.
+        ``source_filters``, ``columns`` and sort options are compiled by the
+        probe compiler into a ``$match / $project / $sort / $limit``
+        aggregation pipeline, so only matching documents and requested
+        fields leave the server.  Documents are then pulled in batches of
+        ``DOCUMENT_BATCH_SIZE``, flattened and converted to Arrow batch by
+        batch.
         
         Args:
             source_table: Collection name to fetch from
-            size: Maximum number of documents to fetch
-            sort_columns: Columns to sort by
-            sort_order: Sort direction ('asc' or 'desc')
+            import_options: See ``ExternalDataLoader.fetch_data_as_arrow``.
         """
+        opts = import_options or {}
+        columns = [str(c) for c in opts.get("columns") or []]
+        data_cursor, collection_name = self._open_import_cursor(source_table, opts)
+
+        arrow_table = documents_to_arrow(data_cursor, self._document_to_row)
+        if arrow_table.num_rows == 0:
+            logger.warning(f"No data found in MongoDB collection '{collection_name}'")
+            return pa.table({})
+        if columns:
+            arrow_table = select_columns(arrow_table, columns)
+
+        logger.info(f"Fetched {arrow_table.num_rows} rows from MongoDB collection '{collection_name}'")
+        
+        return arrow_table
+
+    def fetch_data_as_batches(
+        self,
+        source_table: str,
+        import_options: dict[str, Any] | None = None,
+    ) -> Iterator[pa.Table]:
+        """Stream the import one ``DOCUMENT_BATCH_SIZE`` cursor batch at a time.
+
+        Same pipeline as :meth:`fetch_data_as_arrow`, but each batch is
+        handed to the workspace as soon as it is converted, so the
+        collection is never joined into one in-memory table.
+        """
+        opts = import_options or {}
+        columns = [str(c) for c in opts.get("columns") or []]
+        data_cursor, _ = self._open_import_cursor(source_table, opts)
+        batches = iter_document_batches(data_cursor, self._document_to_row)
+        if columns:
+            return (select_columns(batch, columns) for batch in batches)
+        return batches
+
+    def _open_import_cursor(self, source_table: str, opts: dict[str, Any]) -> tuple[Any, str]:
+        """Run the import pipeline; return its cursor and the collection name."""
+        size = min(opts.get("size", MAX_IMPORT_ROWS), MAX_IMPORT_ROWS)
+
         if not source_table:
             raise ValueError("source_table (collection name) must be provided")
         
@@ -199,29 +248,68 @@ class MongoDBDataLoader(ExternalDataLoader):
         collection = self.db[collection_name]
         
         logger.info(f"Fetching from MongoDB collection: {collection_name}")
-        
-        # Build cursor with optional sorting
-        data_cursor = collection.find()
-        if sort_columns and len(sort_columns) > 0:
-            sort_direction = -1 if sort_order == 'desc' else 1
-            sort_spec = [(col, sort_direction) for col in sort_columns]
-            data_cursor = data_cursor.sort(sort_spec)
-        data_cursor = data_cursor.limit(size)
-        
-        # Fetch and process documents
-        data_list = list(data_cursor)
-        if not data_list:
-            logger.warning(f"No data found in MongoDB collection '{collection_name}'")
-            return pa.table({})
-        
-        df = self._process_documents(data_list)
-        
-        # Convert to Arrow
-        arrow_table = pa.Table.from_pandas(df, preserve_index=False)
-        
-        logger.info(f"Fetched {arrow_table.num_rows} rows from MongoDB collection '{collection_name}'")
-        
-        return arrow_table
+
+        pipeline = self._compile_import_pipeline(collection, opts, size)
+        data_cursor = collection.aggregate(
+            pipeline, allowDiskUse=True, batchSize=DOCUMENT_BATCH_SIZE,
+        )
+        return data_cursor, collection_name
+
+    def _compile_import_pipeline(
+        self, collection: Any, opts: dict[str, Any], size: int,
+    ) -> list[dict[str, Any]]:
+        """Compile import options into an aggregation pipeline.
+
+        Import options name *flattened* columns (``address_city``,
+        ``tags_1``), so they are mapped back to document paths from a small
+        sample before being handed to :meth:`_compile_probe_pipeline`.
+        Filters and sort keys use the full dotted path (``address.city``,
+        ``tags.0``); projections stop at the first array so whole arrays
+        are kept and flattened client-side.  Sort keys are projected too,
+        since the pipeline sorts after ``$project``.
+        """
+        columns = [str(c) for c in opts.get("columns") or []]
+        sort_columns = [str(c) for c in opts.get("sort_columns") or []]
+        sort_dir = "desc" if opts.get("sort_order") == "desc" else "asc"
+        # ``source_filters`` use the source-agnostic ``operator`` field, while
+        # ``_compile_match`` (shared with probe) expects ``op``.
+        filters = [
+            {"column": str(sf.get("column")), "op": sf.get("operator"), "value": sf.get("value")}
+            for sf in opts.get("source_filters") or []
+            if isinstance(sf, dict) and sf.get("column")
+        ]
+
+        paths: dict[str, tuple[str | int, ...]] = {}
+        if columns or sort_columns or filters:
+            paths = flattened_field_paths(collection.find({}, limit=PATH_SAMPLE_SIZE))
+
+        def dotted(name: str) -> str:
+            return ".".join(str(p) for p in paths.get(name, (name,)))
+
+        projection: list[str] = []
+        if columns:
+            for name in columns + sort_columns:
+                path = paths.get(name, (name,))
+                cut = next((i for i, p in enumerate(path) if isinstance(p, int)), len(path))
+                projection.append(".".join(str(p) for p in path[:cut]))
+        query = {
+            "filters": [{**f, "column": dotted(f["column"])} for f in filters],
+            "columns": self._non_colliding_paths(projection),
+            "order_by": [{"column": dotted(c), "dir": sort_dir} for c in sort_columns],
+        }
+        return self._compile_probe_pipeline(query, size)
+
+    @staticmethod
+    def _non_colliding_paths(paths: list[str]) -> list[str]:
+        """Drop duplicate paths and paths nested under another kept path.
+
+        ``$project`` rejects ``{"a": 1, "a.b": 1}`` as a path collision.
+        """
+        kept: list[str] = []
+        for path in sorted(set(paths), key=lambda p: p.count(".")):
+            if not any(path.startswith(k + ".") for k in kept):
+                kept.append(path)
+        return [p for p in dict.fromkeys(paths) if p in kept]
 
     def probe(self, path: list[str], query: dict[str, Any]) -> dict[str, Any]:
         """Compile the SPJQ to a MongoDB aggregation pipeline and run it.
@@ -248,9 +336,7 @@ class MongoDBDataLoader(ExternalDataLoader):
                 "rows": [], "columns": [], "row_count": 0,
                 "exact": True, "compiled_note": None,
             }
-        arrow = pa.Table.from_pandas(
-            self._process_documents(docs), preserve_index=False,
-        )
+        arrow = documents_to_arrow(docs, self._document_to_row)
         return probe_utils.shape_probe_payload(arrow, out_limit, exact=True)
 
     # -- Aggregation-pipeline probe compiler -------------------------------
@@ -1,12 +1,14 @@
 import json
 import logging
 import math
-from typing import Any
+import threading
+import time
+from typing import Any, Callable
 
 import mssql_python
 import pyarrow as pa
 
-from data_formulator.data_loader.external_data_loader import ExternalDataLoader, CatalogNode, MAX_IMPORT_ROWS, sanitize_table_name
+from data_formulator.data_loader.external_data_loader import ExternalDataLoader, CatalogNode, MAX_IMPORT_ROWS, sanitize_table_name, _esc_str
 from data_formulator.data_loader import probe_utils
 from data_formulator.datalake.parquet_utils import df_to_safe_records
 
@@ -181,6 +183,13 @@ class MSSQLDataLoader(ExternalDataLoader):
         # When no database specified, connect to master for catalog browsing
         connect_db = self.database or "master"
 
+        # (database, schema) -> (loaded_at, {table: catalog entry}); and
+        # (database, schema, table) -> (loaded_at, select list).  See
+        # ``_schema_catalog`` / ``_safe_select_list``.
+        self._catalog_cache: dict[tuple[str, str], tuple[float, dict[str, dict[str, Any]]]] = {}
+        self._select_lists: dict[tuple[str, str, str], tuple[float, str]] = {}
+        self._catalog_lock = threading.Lock()
+
         # Build the auth-independent connection string. mssql-python uses
         # Direct Database Connectivity, so no external ODBC driver is needed.
         conn_str = (
@@ -214,33 +223,154 @@ class MSSQLDataLoader(ExternalDataLoader):
     _CX_OTHER_UNSUPPORTED = {'hierarchyid', 'xml', 'sql_variant', 'image', 'timestamp'}
     _CX_UNSUPPORTED_TYPES = _CX_SPATIAL_TYPES | _CX_OTHER_UNSUPPORTED
 
-    def _safe_select_list(self, schema: str, table_name: str) -> str:
-        """Build a SELECT column list that converts unsupported types to text.
+    _CATALOG_TTL = 300  # seconds a schema's introspected catalog / select lists are reused
+
+    def _build_select_list(self, columns: list[tuple[str, str]]) -> str:
+        """SELECT list for ``(column_name, data_type)`` pairs, converting unsupported types to text.
         Uses .STAsText() for spatial types, CAST(... AS NVARCHAR(MAX)) for others.
         Returns '*' if no unsupported columns are found."""
+        if not any(dtype.lower() in self._CX_UNSUPPORTED_TYPES for _, dtype in columns):
+            return "*"
+        parts = []
+        for col, dtype in columns:
+            dtype = dtype.lower()
+            if dtype in self._CX_SPATIAL_TYPES:
+                parts.append(f"[{col}].STAsText() AS [{col}]")
+            elif dtype in self._CX_OTHER_UNSUPPORTED:
+                parts.append(f"CAST([{col}] AS NVARCHAR(MAX)) AS [{col}]")
+            else:
+                parts.append(f"[{col}]")
+        return ', '.join(parts)
+
+    def _db_key(self, db: str | None) -> str:
+        return db or self.database or "master"
+
+    def _cache_select_lists(self, db: str | None, columns_by_table: dict[tuple[str, str], list[tuple[str, str]]]) -> None:
+        """Remember the select lists of tables whose columns were just introspected."""
+        now = time.monotonic()
+        db = self._db_key(db)
+        with self._catalog_lock:
+            for (schema, table), columns in columns_by_table.items():
+                self._select_lists[(db, schema, table)] = (now, self._build_select_list(columns))
+
+    def _safe_select_list(self, schema: str, table_name: str, db: str | None = None) -> str:
+        """Build a SELECT column list that converts unsupported types to text.
+
+        Served from the per-table cache filled by catalog introspection
+        (``_schema_catalog``, ``list_tables``) when fresh; otherwise this
+        table's columns are queried and the result cached.  Returns '*' if
+        no unsupported columns are found or the lookup fails."""
+        key = (self._db_key(db), schema, table_name)
+        with self._catalog_lock:
+            cached = self._select_lists.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._CATALOG_TTL:
+            return cached[1]
+        prefix = f"[{db}]." if db else ""
         try:
             columns_query = f"""
                 SELECT COLUMN_NAME, DATA_TYPE
-                FROM INFORMATION_SCHEMA.COLUMNS
-                WHERE TABLE_SCHEMA = '{schema}' AND TABLE_NAME = '{table_name}'
+                FROM {prefix}INFORMATION_SCHEMA.COLUMNS
+                WHERE TABLE_SCHEMA = '{_esc_str(schema)}' AND TABLE_NAME = '{_esc_str(table_name)}'
                 ORDER BY ORDINAL_POSITION
             """
-            cols_df = self._execute_query_raw(columns_query).to_pandas()
-            has_unsupported = any(r['DATA_TYPE'].lower() in self._CX_UNSUPPORTED_TYPES for _, r in cols_df.iterrows())
-            if not has_unsupported:
-                return "*"
-            parts = []
-            for _, r in cols_df.iterrows():
-                col, dtype = r['COLUMN_NAME'], r['DATA_TYPE'].lower()
-                if dtype in self._CX_SPATIAL_TYPES:
-                    parts.append(f"[{col}].STAsText() AS [{col}]")
-                elif dtype in self._CX_OTHER_UNSUPPORTED:
-                    parts.append(f"CAST([{col}] AS NVARCHAR(MAX)) AS [{col}]")
-                else:
-                    parts.append(f"[{col}]")
-            return ', '.join(parts)
+            rows = self._execute_query_raw(columns_query).to_pylist()
         except Exception:
             return "*"
+        columns = [(r["COLUMN_NAME"], r["DATA_TYPE"]) for r in rows]
+        self._cache_select_lists(db, {(schema, table_name): columns})
+        return self._build_select_list(columns)
+
+    def _invalidate_table_catalog(self, db: str | None, schema: str, table_name: str) -> None:
+        """Forget the cached select list and schema catalog covering a table."""
+        key = self._db_key(db)
+        with self._catalog_lock:
+            self._select_lists.pop((key, schema, table_name), None)
+            self._catalog_cache.pop((key, schema), None)
+
+    def _select_from_table(
+        self,
+        schema: str,
+        table_name: str,
+        db: str | None,
+        build_query: Callable[[str], str],
+    ) -> pa.Table:
+        """Run the query *build_query* makes from the table's select list.
+
+        The select list may be up to ``_CATALOG_TTL`` old and name a column
+        dropped since.  If the query fails, the table's cached catalog is
+        dropped and the query retried once with freshly introspected columns;
+        when those are unchanged the original error is raised.
+        """
+        col_list = self._safe_select_list(schema, table_name, db)
+        try:
+            return self._execute_query(build_query(col_list))
+        except Exception:
+            self._invalidate_table_catalog(db, schema, table_name)
+            fresh = self._safe_select_list(schema, table_name, db)
+            if fresh == col_list:
+                raise
+            log.info("Columns of %s.%s changed since they were cached; retrying", schema, table_name)
+            return self._execute_query(build_query(fresh))
+
+    def _schema_catalog(self, db: str, schema: str) -> dict[str, dict[str, Any]]:
+        """Columns, descriptions and row counts of every table in *schema*.
+
+        One query over ``sys`` views covers the whole schema, so browsing N
+        tables costs the same as browsing one.  Results are cached per
+        ``(database, schema)`` for ``_CATALOG_TTL`` seconds and also fill
+        the select-list cache used by imports.  Each entry has ``columns``
+        (``name``/``type``/``description``), ``description`` and
+        ``row_count`` (from ``sys.partitions``, no table scan; approximate,
+        so ``get_metadata`` reports it with ``row_count_estimated``).
+        """
+        key = (self._db_key(db), schema)
+        with self._catalog_lock:
+            cached = self._catalog_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._CATALOG_TTL:
+            return cached[1]
+
+        rows = self._execute_query(f"""
+            SELECT t.name AS table_name, c.name AS column_name, ty.name AS data_type,
+                   CAST(cep.value AS NVARCHAR(4000)) AS column_description,
+                   CAST(tep.value AS NVARCHAR(4000)) AS table_description,
+                   (SELECT SUM(p.rows) FROM [{db}].sys.partitions p
+                     WHERE p.object_id = t.object_id AND p.index_id IN (0, 1)) AS row_count
+            FROM [{db}].sys.tables t
+            JOIN [{db}].sys.schemas s ON t.schema_id = s.schema_id
+            JOIN [{db}].sys.columns c ON c.object_id = t.object_id
+            JOIN [{db}].sys.types ty ON ty.user_type_id = c.user_type_id
+            LEFT JOIN [{db}].sys.extended_properties cep
+              ON cep.major_id = c.object_id AND cep.minor_id = c.column_id
+                 AND cep.class = 1 AND cep.name = 'MS_Description'
+            LEFT JOIN [{db}].sys.extended_properties tep
+              ON tep.major_id = t.object_id AND tep.minor_id = 0
+                 AND tep.class = 1 AND tep.name = 'MS_Description'
+            WHERE s.name = '{_esc_str(schema)}'
+            ORDER BY t.name, c.column_id
+        """).to_pylist()
+
+        catalog: dict[str, dict[str, Any]] = {}
+        types: dict[tuple[str, str], list[tuple[str, str]]] = {}
+        for r in rows:
+            entry = catalog.get(r["table_name"])
+            if entry is None:
+                description = str(r["table_description"]).strip() if r["table_description"] else ""
+                entry = catalog[r["table_name"]] = {
+                    "columns": [],
+                    "description": description or None,
+                    "row_count": int(r["row_count"]) if r["row_count"] is not None else None,
+                }
+            column: dict[str, Any] = {"name": r["column_name"], "type": r["data_type"]}
+            description = str(r["column_description"]).strip() if r["column_description"] else ""
+            if description:
+                column["description"] = description
+            entry["columns"].append(column)
+            types.setdefault((schema, r["table_name"]), []).append((r["column_name"], r["data_type"]))
+
+        with self._catalog_lock:
+            self._catalog_cache[key] = (time.monotonic(), catalog)
+        self._cache_select_lists(db, types)
+        return catalog
 
     def _read_sql(self, query: str) -> pa.Table:
         """Execute a query and return results as a PyArrow Table (no pandas)."""
@@ -293,22 +423,21 @@ class MSSQLDataLoader(ExternalDataLoader):
             schema = "dbo"
             table = source_table
         
-        col_list = self._safe_select_list(schema.strip('[]'), table.strip('[]'))
-        base_query = f"SELECT {col_list} FROM [{schema}].[{table}]"
-        
         # Add ORDER BY if sort columns specified
         order_by_clause = ""
         if sort_columns and len(sort_columns) > 0:
             order_direction = "DESC" if sort_order == 'desc' else "ASC"
             sanitized_cols = [f'[{col}] {order_direction}' for col in sort_columns]
             order_by_clause = f" ORDER BY {', '.join(sanitized_cols)}"
-        
-        # SQL Server uses TOP instead of LIMIT
-        query = f"SELECT TOP {size} * FROM ({base_query}{order_by_clause}) AS limited"
-        
-        log.info(f"Executing SQL Server query: {query[:200]}...")
-        
-        arrow_table = self._execute_query(query)
+
+        def _build(col_list: str) -> str:
+            base_query = f"SELECT {col_list} FROM [{schema}].[{table}]"
+            # SQL Server uses TOP instead of LIMIT
+            query = f"SELECT TOP {size} * FROM ({base_query}{order_by_clause}) AS limited"
+            log.info(f"Executing SQL Server query: {query[:200]}...")
+            return query
+
+        arrow_table = self._select_from_table(schema.strip('[]'), table.strip('[]'), None, _build)
         log.info(f"Fetched {arrow_table.num_rows} rows from SQL Server")
         
         return arrow_table
@@ -359,12 +488,17 @@ class MSSQLDataLoader(ExternalDataLoader):
             cols_df = self._execute_query(columns_query).to_pandas()
 
             col_map: dict[str, list[dict]] = {}
+            types: dict[tuple[str, str], list[tuple[str, str]]] = {}
             for _, cr in cols_df.iterrows():
                 key = f"{cr['TABLE_SCHEMA']}.{cr['TABLE_NAME']}"
                 col_map.setdefault(key, []).append({
                     "name": cr["COLUMN_NAME"],
                     "type": cr["DATA_TYPE"],
                 })
+                types.setdefault((cr["TABLE_SCHEMA"], cr["TABLE_NAME"]), []).append(
+                    (cr["COLUMN_NAME"], cr["DATA_TYPE"])
+                )
+            self._cache_select_lists(None, types)
 
             # Batch-fetch MS_Description for tables and columns
             table_desc_map: dict[str, str] = {}
@@ -468,12 +602,17 @@ class MSSQLDataLoader(ExternalDataLoader):
         cols_df = self._execute_query(columns_query).to_pandas()
 
         col_map: dict[str, list[dict]] = {}
+        types: dict[tuple[str, str], list[tuple[str, str]]] = {}
         for _, cr in cols_df.iterrows():
             key = f"{cr['TABLE_SCHEMA']}.{cr['TABLE_NAME']}"
             col_map.setdefault(key, []).append({
                 "name": cr["COLUMN_NAME"],
                 "type": cr["DATA_TYPE"],
             })
+            types.setdefault((cr["TABLE_SCHEMA"], cr["TABLE_NAME"]), []).append(
+                (cr["COLUMN_NAME"], cr["DATA_TYPE"])
+            )
+        self._cache_select_lists(db, types)
 
         table_desc_map: dict[str, str] = {}
         col_desc_map: dict[str, str] = {}
@@ -689,62 +828,33 @@ class MSSQLDataLoader(ExternalDataLoader):
             return {}
         table_name = remaining[0]
         try:
-            cols_df = self._execute_query(f"""
-                SELECT COLUMN_NAME, DATA_TYPE
-                FROM [{db}].INFORMATION_SCHEMA.COLUMNS
-                WHERE TABLE_SCHEMA = '{schema}' AND TABLE_NAME = '{table_name}'
-                ORDER BY ORDINAL_POSITION
-            """).to_pandas()
-            columns = [{"name": r["COLUMN_NAME"], "type": r["DATA_TYPE"]} for _, r in cols_df.iterrows()]
-
-            # Column descriptions from MS_Description
-            try:
-                cd_df = self._execute_query(f"""
-                    SELECT c.name AS column_name,
-                           CAST(ep.value AS NVARCHAR(4000)) AS description
-                    FROM [{db}].sys.columns c
-                    JOIN [{db}].sys.tables t ON c.object_id = t.object_id
-                    JOIN [{db}].sys.schemas s ON t.schema_id = s.schema_id
-                    JOIN [{db}].sys.extended_properties ep
-                      ON ep.major_id = c.object_id AND ep.minor_id = c.column_id
-                         AND ep.name = 'MS_Description'
-                    WHERE s.name = '{schema}' AND t.name = '{table_name}'
-                """).to_pandas()
-                col_descs = {r["column_name"]: str(r["description"]).strip()
-                             for _, r in cd_df.iterrows() if r["description"]}
-                for col_entry in columns:
-                    if col_entry["name"] in col_descs:
-                        col_entry["description"] = col_descs[col_entry["name"]]
-            except Exception:
-                pass
-
-            # Table description
-            table_description = None
-            try:
-                td_df = self._execute_query(f"""
-                    SELECT CAST(ep.value AS NVARCHAR(4000)) AS description
-                    FROM [{db}].sys.tables t
-                    JOIN [{db}].sys.schemas s ON t.schema_id = s.schema_id
-                    JOIN [{db}].sys.extended_properties ep
-                      ON ep.major_id = t.object_id AND ep.minor_id = 0
-                         AND ep.name = 'MS_Description'
-                    WHERE s.name = '{schema}' AND t.name = '{table_name}'
-                """).to_pandas()
-                if not td_df.empty and td_df["description"].iloc[0]:
-                    table_description = str(td_df["description"].iloc[0]).strip() or None
-            except Exception:
-                pass
-
-            count_df = self._execute_query(
-                f"SELECT COUNT(*) AS cnt FROM [{db}].[{schema}].[{table_name}]"
-            ).to_pandas()
-            row_count = int(count_df["cnt"].iloc[0])
-            col_list = self._safe_select_list(schema, table_name)
-            sample_df = self._execute_query(
-                f"SELECT TOP 5 {col_list} FROM [{db}].[{schema}].[{table_name}]"
+            entry = self._schema_catalog(db, schema).get(table_name)
+            if entry is None:
+                # Created since the schema was introspected.
+                with self._catalog_lock:
+                    self._catalog_cache.pop((self._db_key(db), schema), None)
+                entry = self._schema_catalog(db, schema).get(table_name)
+            if entry is None:
+                return {}
+            columns = [dict(c) for c in entry["columns"]]
+            table_description = entry["description"]
+
+            row_count = entry["row_count"]
+            estimated = row_count is not None
+            if row_count is None:
+                count_df = self._execute_query(
+                    f"SELECT COUNT(*) AS cnt FROM [{db}].[{schema}].[{table_name}]"
+                ).to_pandas()
+                row_count = int(count_df["cnt"].iloc[0])
+            sample_df = self._select_from_table(
+                schema, table_name, db,
+                lambda col_list: f"SELECT TOP 5 {col_list} FROM [{db}].[{schema}].[{table_name}]",
             ).to_pandas()
             sample_rows = df_to_safe_records(sample_df.fillna(value=None))
             result: dict[str, Any] = {"row_count": row_count, "columns": columns, "sample_rows": sample_rows}
+            if estimated:
+                # sys.partitions row counts are approximate.
+                result["row_count_estimated"] = True
             if table_description:
                 result["description"] = table_description
             return result
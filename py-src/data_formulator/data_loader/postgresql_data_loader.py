@@ -1,7 +1,9 @@
 import json
 import logging
 import os
-from typing import Any
+import threading
+import time
+from typing import Any, Callable
 
 _PG_CLIENT_ENCODING = "UTF8"
 # libpq/psycopg2 can consult this during connection startup, so set it before importing psycopg2.
@@ -70,6 +72,17 @@ class PostgreSQLDataLoader(ExternalDataLoader):
         # for catalog browsing. The user can browse all databases via ls().
         connect_db = self.database or "postgres"
 
+        # Connections to other databases on the server, opened on first use
+        # and reused (see ``_read_sql_on``).
+        self._db_conns: dict[str, Any] = {}
+        # (database, schema) -> (loaded_at, {table: catalog entry}); and
+        # (database, schema, table) -> (loaded_at, select list).  See
+        # ``_schema_catalog`` / ``_safe_select_list``.
+        self._catalog_cache: dict[tuple[str, str], tuple[float, dict[str, dict[str, Any]]]] = {}
+        self._select_lists: dict[tuple[str, str, str], tuple[float, str]] = {}
+        self._catalog_lock = threading.Lock()
+        self._conn_lock = threading.Lock()
+
         try:
             self._conn = psycopg2.connect(**self._connection_kwargs(connect_db))
             self._conn.autocommit = True
@@ -113,6 +126,7 @@ class PostgreSQLDataLoader(ExternalDataLoader):
     _UNSUPPORTED_TYPES = _SPATIAL_TYPES | _OTHER_UNSUPPORTED
 
     _CONNECT_TIMEOUT = 10  # seconds — prevents hangs on unreachable databases
+    _CATALOG_TTL = 300  # seconds a schema's introspected catalog / select lists are reused
 
     def _connection_kwargs(self, dbname: str) -> dict[str, Any]:
         # Use 127.0.0.1 when host is localhost to force IPv4 TCP and avoid IPv6 ::1 connection issues.
@@ -169,10 +183,46 @@ class PostgreSQLDataLoader(ExternalDataLoader):
         finally:
             cur.close()
 
-    def _safe_select_list(self, schema: str, table_name: str, dbname: str | None = None) -> str:
-        """Build a SELECT column list that converts unsupported types to text.
+    def _build_select_list(self, columns: list[tuple[str, str]]) -> str:
+        """SELECT list for ``(column_name, udt_name)`` pairs, converting unsupported types to text.
         Uses ST_AsText() for PostGIS types, ::text for others.
         Returns '*' if no unsupported columns are found."""
+        if not any(udt.lower() in self._UNSUPPORTED_TYPES for _, udt in columns):
+            return "*"
+        parts = []
+        for col, udt in columns:
+            dtype = udt.lower()
+            if dtype in self._SPATIAL_TYPES:
+                parts.append(f'ST_AsText({_esc_id(col, chr(34))}) AS {_esc_id(col, chr(34))}')
+            elif dtype in self._OTHER_UNSUPPORTED:
+                parts.append(f'{_esc_id(col, chr(34))}::text AS {_esc_id(col, chr(34))}')
+            else:
+                parts.append(_esc_id(col, chr(34)))
+        return ', '.join(parts)
+
+    def _db_key(self, dbname: str | None) -> str:
+        return dbname or self.database or "postgres"
+
+    def _cache_select_lists(self, dbname: str | None, columns_by_table: dict[tuple[str, str], list[tuple[str, str]]]) -> None:
+        """Remember the select lists of tables whose columns were just introspected."""
+        now = time.monotonic()
+        db = self._db_key(dbname)
+        with self._catalog_lock:
+            for (schema, table), columns in columns_by_table.items():
+                self._select_lists[(db, schema, table)] = (now, self._build_select_list(columns))
+
+    def _safe_select_list(self, schema: str, table_name: str, dbname: str | None = None) -> str:
+        """Build a SELECT column list that converts unsupported types to text.
+
+        Served from the per-table cache filled by catalog introspection
+        (``_schema_catalog``, ``list_tables``) when fresh; otherwise this
+        table's columns are queried and the result cached.  Returns '*' if
+        no unsupported columns are found or the lookup fails."""
+        key = (self._db_key(dbname), schema, table_name)
+        with self._catalog_lock:
+            cached = self._select_lists.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._CATALOG_TTL:
+            return cached[1]
         try:
             columns_query = f"""
                 SELECT column_name, udt_name
@@ -180,23 +230,110 @@ class PostgreSQLDataLoader(ExternalDataLoader):
                 WHERE table_schema = '{_esc_str(schema)}' AND table_name = '{_esc_str(table_name)}'
                 ORDER BY ordinal_position
             """
-            cols_arrow = self._read_sql_on(columns_query, dbname) if dbname else self._read_sql(columns_query)
-            cols_df = cols_arrow.to_pandas()
-            has_unsupported = any(r['udt_name'].lower() in self._UNSUPPORTED_TYPES for _, r in cols_df.iterrows())
-            if not has_unsupported:
-                return "*"
-            parts = []
-            for _, r in cols_df.iterrows():
-                col, dtype = r['column_name'], r['udt_name'].lower()
-                if dtype in self._SPATIAL_TYPES:
-                    parts.append(f'ST_AsText({_esc_id(col, chr(34))}) AS {_esc_id(col, chr(34))}')
-                elif dtype in self._OTHER_UNSUPPORTED:
-                    parts.append(f'{_esc_id(col, chr(34))}::text AS {_esc_id(col, chr(34))}')
-                else:
-                    parts.append(_esc_id(col, chr(34)))
-            return ', '.join(parts)
+            rows = self._read_sql_on(columns_query, dbname).to_pylist()
         except Exception:
             return "*"
+        columns = [(r["column_name"], r["udt_name"]) for r in rows]
+        self._cache_select_lists(dbname, {(schema, table_name): columns})
+        return self._build_select_list(columns)
+
+    def _invalidate_table_catalog(self, dbname: str | None, schema: str, table_name: str) -> None:
+        """Forget the cached select list and schema catalog covering a table."""
+        db = self._db_key(dbname)
+        with self._catalog_lock:
+            self._select_lists.pop((db, schema, table_name), None)
+            self._catalog_cache.pop((db, schema), None)
+
+    def _select_from_table(
+        self,
+        schema: str,
+        table_name: str,
+        dbname: str | None,
+        build_query: Callable[[str], str],
+        run: Callable[[str], pa.Table],
+    ) -> pa.Table:
+        """Run the query *build_query* makes from the table's select list.
+
+        The select list may be up to ``_CATALOG_TTL`` old and name a column
+        dropped since.  If the query fails, the table's cached catalog is
+        dropped and the query retried once with freshly introspected columns;
+        when those are unchanged the original error is raised.
+        """
+        col_list = self._safe_select_list(schema, table_name, dbname=dbname)
+        try:
+            return run(build_query(col_list))
+        except Exception:
+            self._invalidate_table_catalog(dbname, schema, table_name)
+            fresh = self._safe_select_list(schema, table_name, dbname=dbname)
+            if fresh == col_list:
+                raise
+            logger.info("Columns of %s.%s changed since they were cached; retrying", schema, table_name)
+            return run(build_query(fresh))
+
+    def _schema_catalog(self, dbname: str | None, schema: str) -> dict[str, dict[str, Any]]:
+        """Columns, comments and row estimates of every table in *schema*.
+
+        Two catalog queries cover the whole schema, so browsing N tables
+        costs the same as browsing one.  Results are cached per
+        ``(database, schema)`` for ``_CATALOG_TTL`` seconds and also fill the
+        select-list cache used by imports.  Each entry has ``columns``
+        (``name``/``type``/``description``), ``description`` and
+        ``row_estimate`` (``pg_class.reltuples``; ``None`` if never analyzed).
+        ``get_metadata`` reports such counts with ``row_count_estimated``.
+        """
+        key = (self._db_key(dbname), schema)
+        with self._catalog_lock:
+            cached = self._catalog_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._CATALOG_TTL:
+            return cached[1]
+
+        columns_query = f"""
+            SELECT c.table_name, c.column_name, c.data_type, c.udt_name,
+                   pgd.description AS column_comment
+            FROM information_schema.columns c
+            LEFT JOIN pg_catalog.pg_statio_all_tables st
+              ON st.schemaname = c.table_schema AND st.relname = c.table_name
+            LEFT JOIN pg_catalog.pg_description pgd
+              ON pgd.objoid = st.relid AND pgd.objsubid = c.ordinal_position
+            WHERE c.table_schema = '{_esc_str(schema)}'
+            ORDER BY c.table_name, c.ordinal_position
+        """
+        tables_query = f"""
+            SELECT c.relname AS table_name,
+                   obj_description(c.oid, 'pg_class') AS table_comment,
+                   c.reltuples::bigint AS row_estimate
+            FROM pg_catalog.pg_class c
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = '{_esc_str(schema)}'
+              AND c.relkind IN ('r', 'p')
+        """
+        catalog: dict[str, dict[str, Any]] = {}
+        udts: dict[tuple[str, str], list[tuple[str, str]]] = {}
+        for r in self._read_sql_on(columns_query, dbname).to_pylist():
+            entry = catalog.setdefault(r["table_name"], {
+                "columns": [], "description": None, "row_estimate": None,
+            })
+            column: dict[str, Any] = {"name": r["column_name"], "type": r["data_type"]}
+            comment = r.get("column_comment")
+            if comment and str(comment).strip():
+                column["description"] = str(comment).strip()
+            entry["columns"].append(column)
+            udts.setdefault((schema, r["table_name"]), []).append((r["column_name"], r["udt_name"]))
+        for r in self._read_sql_on(tables_query, dbname).to_pylist():
+            entry = catalog.get(r["table_name"])
+            if entry is None:
+                continue
+            comment = r.get("table_comment")
+            if comment and str(comment).strip():
+                entry["description"] = str(comment).strip()
+            estimate = r.get("row_estimate")
+            # reltuples is -1 (PG 14+) or 0 before the first ANALYZE.
+            entry["row_estimate"] = int(estimate) if estimate is not None and estimate > 0 else None
+
+        with self._catalog_lock:
+            self._catalog_cache[key] = (time.monotonic(), catalog)
+        self._cache_select_lists(dbname, udts)
+        return catalog
 
     def fetch_data_as_arrow(
         self,
@@ -218,16 +355,12 @@ class PostgreSQLDataLoader(ExternalDataLoader):
         
         db, schema, table = self._resolve_source_table(source_table)
 
-        col_list = self._safe_select_list(schema, table, dbname=db)
         qualified = f'{_esc_id(schema, chr(34))}.{_esc_id(table, chr(34))}'
-        base_query = f"SELECT {col_list} FROM {qualified}"
 
         # Add WHERE clause from source filters, falling back to legacy conditions.
         where_clause = build_source_filter_where_clause_inline(
             source_filters, quote_char='"', dialect="postgres"
         ) or build_where_clause_inline(conditions, quote_char='"')
-        if where_clause:
-            base_query = f"{base_query} {where_clause}"
         
         # Add ORDER BY if sort columns specified
         order_by_clause = ""
@@ -235,13 +368,20 @@ class PostgreSQLDataLoader(ExternalDataLoader):
             order_direction = "DESC" if sort_order == 'desc' else "ASC"
             sanitized_cols = [f'{_esc_id(col, chr(34))} {order_direction}' for col in sort_columns]
             order_by_clause = f" ORDER BY {', '.join(sanitized_cols)}"
-        
-        # Build full query with limit
-        query = f"{base_query}{order_by_clause} LIMIT {int(size)}"
-        
-        logger.info(f"Executing PostgreSQL query: {query[:200]}...")
-        
-        arrow_table = self._read_sql_on(query, db) if db else self._read_sql(query)
+
+        def _build(col_list: str) -> str:
+            base_query = f"SELECT {col_list} FROM {qualified}"
+            if where_clause:
+                base_query = f"{base_query} {where_clause}"
+            # Build full query with limit
+            query = f"{base_query}{order_by_clause} LIMIT {int(size)}"
+            logger.info(f"Executing PostgreSQL query: {query[:200]}...")
+            return query
+
+        arrow_table = self._select_from_table(
+            schema, table, db, _build,
+            lambda q: self._read_sql_on(q, db) if db else self._read_sql(q),
+        )
         
         logger.info(f"Fetched {arrow_table.num_rows} rows from PostgreSQL")
         
@@ -313,7 +453,7 @@ class PostgreSQLDataLoader(ExternalDataLoader):
 
             columns_query = f"""
                 SELECT c.table_schema, c.table_name, c.column_name, c.data_type,
-                       pgd.description AS column_comment
+                       c.udt_name, pgd.description AS column_comment
                 FROM information_schema.columns c
                 LEFT JOIN pg_catalog.pg_statio_all_tables st
                   ON st.schemaname = c.table_schema AND st.relname = c.table_name
@@ -326,6 +466,7 @@ class PostgreSQLDataLoader(ExternalDataLoader):
             cols_df = cols_arrow.to_pandas()
 
             col_map: dict[str, list[dict]] = {}
+            udts: dict[tuple[str, str], list[tuple[str, str]]] = {}
             for _, cr in cols_df.iterrows():
                 key = f"{cr['table_schema']}.{cr['table_name']}"
                 entry: dict[str, Any] = {
@@ -336,6 +477,11 @@ class PostgreSQLDataLoader(ExternalDataLoader):
                 if comment and str(comment).strip():
                     entry["description"] = str(comment).strip()
                 col_map.setdefault(key, []).append(entry)
+                if cr.get("udt_name"):
+                    udts.setdefault((cr["table_schema"], cr["table_name"]), []).append(
+                        (cr["column_name"], cr["udt_name"])
+                    )
+            self._cache_select_lists(None, udts)
 
             # Batch-fetch table comments
             table_comments_query = """
@@ -463,7 +609,7 @@ class PostgreSQLDataLoader(ExternalDataLoader):
 
         columns_query = f"""
             SELECT c.table_schema, c.table_name, c.column_name, c.data_type,
-                   pgd.description AS column_comment
+                   c.udt_name, pgd.description AS column_comment
             FROM information_schema.columns c
             LEFT JOIN pg_catalog.pg_statio_all_tables st
               ON st.schemaname = c.table_schema AND st.relname = c.table_name
@@ -475,6 +621,7 @@ class PostgreSQLDataLoader(ExternalDataLoader):
         cols_df = self._read_sql_on(columns_query, db).to_pandas()
 
         col_map: dict[str, list[dict]] = {}
+        udts: dict[tuple[str, str], list[tuple[str, str]]] = {}
         for _, cr in cols_df.iterrows():
             key = f"{cr['table_schema']}.{cr['table_name']}"
             entry: dict[str, Any] = {
@@ -485,6 +632,11 @@ class PostgreSQLDataLoader(ExternalDataLoader):
             if comment and str(comment).strip():
                 entry["description"] = str(comment).strip()
             col_map.setdefault(key, []).append(entry)
+            if cr.get("udt_name"):
+                udts.setdefault((cr["table_schema"], cr["table_name"]), []).append(
+                    (cr["column_name"], cr["udt_name"])
+                )
+        self._cache_select_lists(db, udts)
 
         table_comments_query = """
             SELECT n.nspname AS schemaname,
@@ -658,15 +810,39 @@ class PostgreSQLDataLoader(ExternalDataLoader):
         return conn
 
     def _read_sql_on(self, query: str, dbname: str | None = None) -> pa.Table:
-        """Run a query, optionally on a different database."""
-        if dbname and dbname != (self.database or "postgres"):
-            conn = self._connect_to_db(dbname)
+        """Run a query, optionally on a different database.
+
+        Connections to other databases are opened once and kept for the
+        loader's lifetime, so browsing a database costs no reconnects.
+        """
+        if not dbname or dbname == (self.database or "postgres"):
+            return self._execute_on_conn(self._conn, query)
+        with self._conn_lock:
+            conn = self._db_conns.get(dbname)
+            if conn is None or conn.closed:
+                conn = self._connect_to_db(dbname)
+                self._db_conns[dbname] = conn
+        try:
+            return self._execute_on_conn(conn, query)
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            # The server may have dropped an idle connection; forget it so
+            # the next call reconnects.
+            with self._conn_lock:
+                if self._db_conns.get(dbname) is conn:
+                    del self._db_conns[dbname]
+            conn.close()
+            raise
+
+    def close(self):
+        """Close the primary connection and any per-database connections."""
+        with self._conn_lock:
+            conns = list(self._db_conns.values())
+            self._db_conns.clear()
+        for conn in conns + [self._conn]:
             try:
-                return self._execute_on_conn(conn, query)
-            finally:
                 conn.close()
-        else:
-            return self._execute_on_conn(self._conn, query)
+            except Exception as e:
+                logger.warning(f"Failed to close PostgreSQL connection: {e}")
 
     def ls(
         self,
@@ -801,51 +977,30 @@ class PostgreSQLDataLoader(ExternalDataLoader):
         table_name = remaining[0]
         full_source = f"{db}.{schema}.{table_name}"
         try:
-            cols_query = f"""
-                SELECT c.column_name, c.data_type,
-                       pgd.description AS column_comment
-                FROM information_schema.columns c
-                LEFT JOIN pg_catalog.pg_statio_all_tables st
-                  ON st.schemaname = c.table_schema AND st.relname = c.table_name
-                LEFT JOIN pg_catalog.pg_description pgd
-                  ON pgd.objoid = st.relid AND pgd.objsubid = c.ordinal_position
-                WHERE c.table_schema = '{_esc_str(schema)}'
-                  AND c.table_name = '{_esc_str(table_name)}'
-                ORDER BY c.ordinal_position
-            """
-            cols_df = self._read_sql_on(cols_query, db).to_pandas()
-            columns = []
-            for _, r in cols_df.iterrows():
-                entry: dict[str, Any] = {"name": r["column_name"], "type": r["data_type"]}
-                comment = r.get("column_comment")
-                if comment and str(comment).strip():
-                    entry["description"] = str(comment).strip()
-                columns.append(entry)
-
-            # Table comment
-            table_desc_query = f"""
-                SELECT obj_description(c.oid) AS table_comment
-                FROM pg_catalog.pg_class c
-                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
-                WHERE n.nspname = '{_esc_str(schema)}'
-                  AND c.relname = '{_esc_str(table_name)}'
-                  AND c.relkind = 'r'
-            """
-            table_description = None
-            try:
-                td_df = self._read_sql_on(table_desc_query, db).to_pandas()
-                if not td_df.empty and td_df["table_comment"].iloc[0]:
-                    table_description = str(td_df["table_comment"].iloc[0]).strip() or None
-            except Exception:
-                pass
-
-            count_df = self._read_sql_on(
-                f'SELECT COUNT(*) AS cnt FROM {_esc_id(schema, chr(34))}.{_esc_id(table_name, chr(34))}', db
-            ).to_pandas()
-            row_count = int(count_df["cnt"].iloc[0])
-            col_list = self._safe_select_list(schema, table_name)
-            sample_df = self._read_sql_on(
-                f'SELECT {col_list} FROM {_esc_id(schema, chr(34))}.{_esc_id(table_name, chr(34))} LIMIT 5', db
+            catalog = self._schema_catalog(db, schema)
+            entry = catalog.get(table_name)
+            if entry is None:
+                # Created since the schema was introspected.
+                with self._catalog_lock:
+                    self._catalog_cache.pop((self._db_key(db), schema), None)
+                entry = self._schema_catalog(db, schema).get(table_name)
+            if entry is None:
+                return {}
+            columns = [dict(c) for c in entry["columns"]]
+            table_description = entry["description"]
+
+            qualified = f'{_esc_id(schema, chr(34))}.{_esc_id(table_name, chr(34))}'
+            row_count = entry["row_estimate"]
+            estimated = row_count is not None
+            if row_count is None:
+                count_df = self._read_sql_on(
+                    f'SELECT COUNT(*) AS cnt FROM {qualified}', db
+                ).to_pandas()
+                row_count = int(count_df["cnt"].iloc[0])
+            sample_df = self._select_from_table(
+                schema, table_name, db,
+                lambda col_list: f'SELECT {col_list} FROM {qualified} LIMIT 5',
+                lambda q: self._read_sql_on(q, db),
             ).to_pandas()
             sample_rows = df_to_safe_records(sample_df)
             result: dict[str, Any] = {
@@ -854,6 +1009,9 @@ class PostgreSQLDataLoader(ExternalDataLoader):
                 "columns": columns,
                 "sample_rows": sample_rows,
             }
+            if estimated:
+                # pg_class.reltuples as of the last ANALYZE / VACUUM.
+                result["row_count_estimated"] = True
             if table_description:
                 result["description"] = table_description
             return result
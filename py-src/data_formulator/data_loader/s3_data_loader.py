@@ -1,16 +1,23 @@
 import json
 import logging
-from typing import Any
+from typing import Any, Iterator
 
 import boto3
 import pandas as pd
 import pyarrow as pa
-import pyarrow.csv as pa_csv
 import pyarrow.parquet as pq
 from pyarrow import fs as pa_fs
 
 from data_formulator.data_loader.external_data_loader import ExternalDataLoader, CatalogNode, MAX_IMPORT_ROWS
 from data_formulator.data_loader import probe_utils
+from data_formulator.data_loader.file_scan import (
+    group_partitioned_files,
+    partition_keys,
+    read_text,
+    scan_parquet,
+    scan_text,
+    text_format,
+)
 from data_formulator.datalake.parquet_utils import df_to_safe_records
 
 logger = logging.getLogger(__name__)
@@ -66,12 +73,15 @@ class S3DataLoader(ExternalDataLoader):
         """
         Fetch data from S3 as a PyArrow Table using PyArrow's native S3 filesystem.
         
-        For files (parquet, csv), reads directly using PyArrow.
+        For files (parquet, csv), reads directly using PyArrow.  Parquet
+        reads push ``columns``, ``source_filters`` and ``size`` into the scan
+        (see :mod:`file_scan`); CSV/JSON are streamed with the same options
+        and stop reading the object once ``size`` rows are collected.
+        A key prefix ending in ``/`` is a Hive-partitioned parquet dataset
+        (as listed by :meth:`ls`) and is read as one table.
         """
         opts = import_options or {}
         size = min(opts.get("size", MAX_IMPORT_ROWS), MAX_IMPORT_ROWS)
-        sort_columns = opts.get("sort_columns")
-        sort_order = opts.get("sort_order", "asc")
 
         if not source_table:
             raise ValueError("source_table (S3 URL) must be provided")
@@ -87,33 +97,39 @@ class S3DataLoader(ExternalDataLoader):
         logger.info(f"Reading S3 file via PyArrow: {s3_url}")
         
         # Read based on file extension
-        if s3_url.lower().endswith('.parquet'):
-            arrow_table = pq.read_table(s3_path, filesystem=self.s3_fs)
-        elif s3_url.lower().endswith('.csv'):
-            with self.s3_fs.open_input_file(s3_path) as f:
-                arrow_table = pa_csv.read_csv(f)
-        elif s3_url.lower().endswith('.json') or s3_url.lower().endswith('.jsonl'):
-            import pyarrow.json as pa_json
-            with self.s3_fs.open_input_file(s3_path) as f:
-                arrow_table = pa_json.read_json(f)
+        if s3_url.endswith('/'):
+            arrow_table, _ = scan_parquet(s3_path.rstrip('/'), self.s3_fs, opts, size, partitioning="hive")
+        elif s3_url.lower().endswith('.parquet'):
+            arrow_table, _ = scan_parquet(s3_path, self.s3_fs, opts, size)
+        elif text_format(s3_url) is not None:
+            file_type, parse_options = text_format(s3_url)
+            arrow_table, _ = read_text(
+                lambda: self.s3_fs.open_input_stream(s3_path), file_type, opts, size, parse_options,
+            )
         else:
             raise ValueError(f"Unsupported file type: {s3_url}")
         
-        # Apply sorting if specified
-        if sort_columns and len(sort_columns) > 0:
-            df = arrow_table.to_pandas()
-            ascending = sort_order != 'desc'
-            df = df.sort_values(by=sort_columns, ascending=ascending)
-            arrow_table = pa.Table.from_pandas(df, preserve_index=False)
-        
-        # Apply size limit
-        if arrow_table.num_rows > size:
-            arrow_table = arrow_table.slice(0, size)
-        
         logger.info(f"Fetched {arrow_table.num_rows} rows from S3 [Arrow-native]")
         
         return arrow_table
 
+    def fetch_data_as_batches(
+        self,
+        source_table: str,
+        import_options: dict[str, Any] | None = None,
+    ) -> Iterator[pa.Table] | None:
+        """Stream unsorted CSV/JSON imports block by block (see :func:`scan_text`)."""
+        opts = import_options or {}
+        fmt = text_format(source_table)
+        if fmt is None or opts.get("sort_columns"):
+            return None
+        s3_path = source_table[5:] if source_table.startswith("s3://") else f"{self.bucket}/{source_table}"
+        size = min(opts.get("size", MAX_IMPORT_ROWS), MAX_IMPORT_ROWS)
+        file_type, parse_options = fmt
+        return scan_text(
+            lambda: self.s3_fs.open_input_stream(s3_path), file_type, opts, size, parse_options,
+        )
+
     def probe(self, path: list[str], query: dict[str, Any]) -> dict[str, Any]:
         """Read the file into DuckDB and compute the SPJQ there."""
         return probe_utils.run_probe_on_duckdb(self, path, query, scan_size=MAX_IMPORT_ROWS)
@@ -133,12 +149,7 @@ class S3DataLoader(ExternalDataLoader):
         results = []
         
         if 'Contents' in response:
-            for obj in response['Contents']:
-                key = obj['Key']
-                
-                if key.endswith('/') or not self._is_supported_file(key):
-                    continue
-                
+            for key in self._table_keys(response['Contents']):
                 if table_filter and table_filter.lower() not in key.lower():
                     continue
                 
@@ -177,28 +188,42 @@ class S3DataLoader(ExternalDataLoader):
         """Read sample data using PyArrow S3 filesystem."""
         s3_path = s3_url[5:] if s3_url.startswith("s3://") else s3_url
         
-        if s3_url.lower().endswith('.parquet'):
-            table = pq.read_table(s3_path, filesystem=self.s3_fs)
-        elif s3_url.lower().endswith('.csv'):
-            with self.s3_fs.open_input_file(s3_path) as f:
-                table = pa_csv.read_csv(f)
-        elif s3_url.lower().endswith('.json') or s3_url.lower().endswith('.jsonl'):
-            import pyarrow.json as pa_json
-            with self.s3_fs.open_input_file(s3_path) as f:
-                table = pa_json.read_json(f)
+        if s3_url.endswith('/'):
+            table, _ = scan_parquet(s3_path.rstrip('/'), self.s3_fs, {}, limit, partitioning="hive")
+        elif s3_url.lower().endswith('.parquet'):
+            table, _ = scan_parquet(s3_path, self.s3_fs, {}, limit)
+        elif text_format(s3_url) is not None:
+            file_type, parse_options = text_format(s3_url)
+            table, _ = read_text(
+                lambda: self.s3_fs.open_input_stream(s3_path), file_type, {}, limit, parse_options,
+            )
         else:
             raise ValueError(f"Unsupported file type: {s3_url}")
         
-        return table.slice(0, limit) if table.num_rows > limit else table
+        return table
     
+    def _table_keys(self, objects: list[dict[str, Any]]) -> list[str]:
+        """Table keys from a listing: data files, plus one ``root/`` key per
+        Hive-partitioned parquet dataset in place of its member files."""
+        keys = [
+            obj['Key'] for obj in objects
+            if not obj['Key'].endswith('/') and self._is_supported_file(obj['Key'])
+        ]
+        files, datasets = group_partitioned_files(keys)
+        return files + [f"{root}/" for root in datasets]
+
     def _is_supported_file(self, key: str) -> bool:
         """Check if the file type is supported (CSV, Parquet, JSON)."""
         supported_extensions = [".csv", ".parquet", ".json", ".jsonl"]
         return any(key.lower().endswith(ext) for ext in supported_extensions)
     
-    def _estimate_row_count(self, s3_url: str) -> int:
-        """Estimate the number of rows in a file."""
+    def _estimate_row_count(self, s3_url: str) -> int | None:
+        """Estimate the number of rows in a file; ``None`` for a partitioned dataset."""
         try:
+            # Partitioned datasets would need every file's footer; leave
+            # the count unknown rather than reporting an empty table.
+            if s3_url.endswith('/'):
+                return None
             # For parquet files, use PyArrow metadata for exact count
             if s3_url.lower().endswith('.parquet'):
                 s3_path = s3_url[5:] if s3_url.startswith("s3://") else s3_url
@@ -240,16 +265,25 @@ class S3DataLoader(ExternalDataLoader):
                 region_name=self.region_name,
             )
             resp = s3_client.list_objects_v2(Bucket=self.bucket)
+            objects = resp.get("Contents", [])
+            sizes = {obj["Key"]: obj.get("Size", 0) for obj in objects}
+            _, datasets = group_partitioned_files(sizes)
             nodes = []
-            for obj in resp.get("Contents", []):
-                key = obj["Key"]
-                if key.endswith("/") or not self._is_supported_file(key):
-                    continue
+            for key in self._table_keys(objects):
                 if filter and filter.lower() not in key.lower():
                     continue
+                members = datasets.get(key.rstrip("/"))
+                if members is None:
+                    metadata = {"size_bytes": sizes[key]}
+                else:
+                    metadata = {
+                        "size_bytes": sum(sizes[k] for k in members),
+                        "file_count": len(members),
+                        "partition_keys": partition_keys(members, key),
+                    }
                 nodes.append(CatalogNode(
                     name=key, node_type="table", path=path + [key],
-                    metadata={"size_bytes": obj.get("Size", 0)},
+                    metadata=metadata,
                 ))
             return nodes
 
@@ -1,32 +1,119 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 
-"""Thin wrapper around the Superset public REST API."""
+"""Thin wrapper around the Superset public REST API.
+
+All calls share one keep-alive ``requests.Session`` per client, with a
+connection pool sized for the loader's parallel metadata fetches and
+retries (exponential backoff, ``Retry-After`` honoured) for idempotent
+GETs that hit 429/502/503/504.
+
+Dataset detail/column and dashboard-dataset responses are cached per
+client.  Entries are revalidated with ``If-None-Match`` when Superset sent
+an ``ETag``; dataset entries are also reused without a request while the
+dataset's ``changed_on`` (learned from ``list_datasets``) is unchanged.
+"""
 
 from __future__ import annotations
 
+import copy
 import logging
-from typing import Any
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
 from urllib.parse import quote
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_POOL_SIZE = 8
+DEFAULT_MAX_RETRIES = 3
+_RETRY_STATUSES = (429, 502, 503, 504)
+_CACHE_MAX_ENTRIES = 4096
+
 
 class SupersetClient:
     """Every Superset API call goes through this class so that upstream
     changes only require edits in one place."""
 
-    def __init__(self, base_url: str, timeout: int = 60):
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 60,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
 
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry,
+        )
+        self._session = requests.Session()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # url -> (etag, version, payload); see module docstring.
+        self._cache: OrderedDict[str, tuple[str | None, Any, Any]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._dataset_versions: dict[int, Any] = {}
+        self._column_endpoint_missing = False
+
+    def close(self) -> None:
+        self._session.close()
+
     def _headers(self, access_token: str | None) -> dict:
         if access_token:
             return {"Authorization": f"Bearer {access_token}"}
         return {}
 
+    def _get_cached(
+        self,
+        url: str,
+        access_token: str | None,
+        extract: Callable[[Any], Any],
+        version: Any = None,
+    ) -> Any:
+        """GET *url* through the response cache; returns ``extract(json)``."""
+        with self._cache_lock:
+            entry = self._cache.get(url)
+            if entry is not None:
+                self._cache.move_to_end(url)
+        if entry is not None and version is not None and entry[1] == version:
+            return copy.deepcopy(entry[2])
+
+        headers = self._headers(access_token)
+        if entry is not None and entry[0]:
+            headers["If-None-Match"] = entry[0]
+        resp = self._session.get(url, headers=headers, timeout=self.timeout)
+        if entry is not None and resp.status_code == 304:
+            payload = entry[2]
+            etag = entry[0]
+        else:
+            resp.raise_for_status()
+            payload = extract(resp.json())
+            etag = resp.headers.get("ETag")
+            if not isinstance(etag, str):
+                etag = None
+        if etag or version is not None:
+            with self._cache_lock:
+                self._cache[url] = (etag, version, payload)
+                self._cache.move_to_end(url)
+                while len(self._cache) > _CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+        return copy.deepcopy(payload)
+
     # -- datasets --------------------------------------------------------
 
     def list_datasets(
@@ -35,8 +122,12 @@ class SupersetClient:
         page: int = 0,
         page_size: int = 100,
     ) -> dict:
-        """Return datasets the current user can see (DatasourceFilter)."""
-        resp = requests.get(
+        """Return datasets the current user can see (DatasourceFilter).
+
+        Also records each dataset's ``changed_on`` so that cached detail and
+        column responses for unchanged datasets are served without a request.
+        """
+        resp = self._session.get(
             f"{self.base_url}/api/v1/dataset/",
             headers=self._headers(access_token),
             params={
@@ -45,16 +136,20 @@ class SupersetClient:
             timeout=self.timeout,
         )
         resp.raise_for_status()
-        return resp.json()
+        payload = resp.json()
+        for ds in payload.get("result", []) if isinstance(payload, dict) else []:
+            version = ds.get("changed_on_utc") or ds.get("changed_on")
+            if isinstance(ds.get("id"), int) and version:
+                self._dataset_versions[ds["id"]] = version
+        return payload
 
     def get_dataset_detail(self, access_token: str, dataset_id: int) -> dict:
-        resp = requests.get(
+        return self._get_cached(
             f"{self.base_url}/api/v1/dataset/{dataset_id}",
-            headers=self._headers(access_token),
-            timeout=self.timeout,
+            access_token,
+            lambda body: body.get("result", {}),
+            version=self._dataset_versions.get(dataset_id),
         )
-        resp.raise_for_status()
-        return resp.json().get("result", {})
 
     def get_dataset_columns(
         self, access_token: str, dataset_id: int,
@@ -64,22 +159,24 @@ class SupersetClient:
         Tries the lightweight ``/api/v1/dataset/{pk}/column`` first (Superset
         4.1+).  Falls back to the full ``/api/v1/dataset/{pk}`` detail
         endpoint and extracts ``columns`` from the response if the dedicated
-        endpoint is not available.
+        endpoint is not available (remembered, so later calls skip the probe).
         """
-        try:
-            resp = requests.get(
-                f"{self.base_url}/api/v1/dataset/{dataset_id}/column",
-                headers=self._headers(access_token),
-                timeout=self.timeout,
-            )
-            resp.raise_for_status()
-            return resp.json().get("result", [])
-        except requests.HTTPError:
-            detail = self.get_dataset_detail(access_token, dataset_id)
-            return detail.get("columns", [])
+        if not self._column_endpoint_missing:
+            try:
+                return self._get_cached(
+                    f"{self.base_url}/api/v1/dataset/{dataset_id}/column",
+                    access_token,
+                    lambda body: body.get("result", []),
+                    version=self._dataset_versions.get(dataset_id),
+                )
+            except requests.HTTPError as e:
+                if getattr(e.response, "status_code", None) in (404, 405):
+                    self._column_endpoint_missing = True
+        detail = self.get_dataset_detail(access_token, dataset_id)
+        return detail.get("columns", [])
 
     def get_dataset_distinct_values(self, access_token: str, column_name: str) -> dict:
-        resp = requests.get(
+        resp = self._session.get(
             f"{self.base_url}/api/v1/dataset/distinct/{quote(column_name, safe='')}",
             headers=self._headers(access_token),
             timeout=self.timeout,
@@ -93,7 +190,7 @@ class SupersetClient:
         dataset_id: int,
         column_name: str,
     ) -> dict:
-        resp = requests.get(
+        resp = self._session.get(
             f"{self.base_url}/api/v1/datasource/table/{dataset_id}/column/{quote(column_name, safe='')}/values/",
             headers=self._headers(access_token),
             timeout=self.timeout,
@@ -114,7 +211,7 @@ class SupersetClient:
             f"order_direction:desc,"
             f"page:{page},page_size:{page_size})"
         )
-        resp = requests.get(
+        resp = self._session.get(
             f"{self.base_url}/api/v1/dashboard/?q={rison_q}",
             headers=self._headers(access_token),
             timeout=self.timeout,
@@ -123,16 +220,14 @@ class SupersetClient:
         return resp.json()
 
     def get_dashboard_datasets(self, access_token: str, dashboard_id: int) -> dict:
-        resp = requests.get(
+        return self._get_cached(
             f"{self.base_url}/api/v1/dashboard/{dashboard_id}/datasets",
-            headers=self._headers(access_token),
-            timeout=self.timeout,
+            access_token,
+            lambda body: body,
         )
-        resp.raise_for_status()
-        return resp.json()
 
     def get_dashboard_detail(self, access_token: str, dashboard_id: int) -> dict:
-        resp = requests.get(
+        resp = self._session.get(
             f"{self.base_url}/api/v1/dashboard/{dashboard_id}",
             headers=self._headers(access_token),
             timeout=self.timeout,
@@ -160,7 +255,7 @@ class SupersetClient:
             "queries": queries,
             "result_format": result_format,
         }
-        resp = requests.post(
+        resp = self._session.post(
             f"{self.base_url}/api/v1/chart/data",
             headers=self._headers(access_token),
             json=body,
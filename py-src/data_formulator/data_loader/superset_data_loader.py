@@ -14,10 +14,10 @@ Row-Level Security (RLS).
 
 import json
 import logging
-from datetime import datetime, timezone
 from typing import Any
 
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from data_formulator.data_loader.external_data_loader import (
     CatalogNode,
@@ -28,6 +28,42 @@ from data_formulator.data_loader.superset_auth_bridge import SupersetAuthBridge
 
 logger = logging.getLogger(__name__)
 
+# Largest ``row_limit`` one Chart Data API call returns: Superset silently
+# caps requests at ``SQL_MAX_ROW`` (100k by default).  Only imports above it
+# are paged with ``row_offset``; everything else is a single request.
+CHART_DATA_PAGE_ROWS = 100_000
+
+# Chart Data API coltypes: 0=STRING, 1=NUMERIC, 2=TEMPORAL, 3=BOOLEAN
+_COLTYPE_TEMPORAL = 2
+_MS_PER_DAY = 86_400_000
+
+
+def _chart_rows_to_arrow(rows: list[dict[str, Any]]) -> pa.Table:
+    """Build an Arrow table from chart-data row dicts.
+
+    ``pa.array`` converts the list of dicts to a struct array in one C++
+    pass (column types inferred by Arrow), instead of pivoting the rows into
+    per-column Python lists first.  Rows whose values Arrow cannot unify
+    fall back to per-column conversion, stringifying only the offending
+    columns.
+    """
+    columns = list(rows[0].keys())
+    try:
+        struct = pa.array(rows)
+        table = pa.Table.from_struct_array(struct)
+        return table.select([c for c in columns if c in table.column_names]
+                            + [c for c in table.column_names if c not in columns])
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+    arrays = {}
+    for col in columns:
+        values = [row.get(col) for row in rows]
+        try:
+            arrays[col] = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            arrays[col] = pa.array([None if v is None else str(v) for v in values], pa.string())
+    return pa.table(arrays)
+
 
 # ---------------------------------------------------------------------------
 # SupersetLoader
@@ -44,6 +80,10 @@ class SupersetLoader(ExternalDataLoader):
     DISPLAY_NAME = "Superset"
     DESCRIPTION = "Load datasets exposed by an Apache Superset instance."
 
+    # Chart-data fetches are independent stateless HTTP calls, so a
+    # dashboard's datasets can be imported side by side.
+    max_concurrent_imports = 4
+
     @staticmethod
     def list_params() -> list[dict[str, Any]]:
         return [
@@ -86,6 +126,20 @@ class SupersetLoader(ExternalDataLoader):
             "supports_refresh": True,
         }
 
+    @staticmethod
+    def rate_limit() -> dict | None:
+        """Concurrent API requests per connection (``PLG_SUPERSET_MAX_CONCURRENCY``).
+
+        Sizes both the client's connection pool and the parallel metadata
+        fetches during catalog syncs; 429 responses are retried with backoff.
+        """
+        import os
+        try:
+            limit = int(os.environ.get("PLG_SUPERSET_MAX_CONCURRENCY", "8"))
+        except ValueError:
+            limit = 8
+        return {"max_concurrent_requests": max(1, limit)}
+
     @staticmethod
     def delegated_login_config() -> dict[str, Any] | None:
         """Return popup-based login config if PLG_SUPERSET_URL is set."""
@@ -122,7 +176,9 @@ class SupersetLoader(ExternalDataLoader):
         if not self.url:
             raise ValueError("Superset URL is required")
 
-        self._client = SupersetClient(self.url)
+        self._client = SupersetClient(
+            self.url, pool_size=self.rate_limit()["max_concurrent_requests"],
+        )
         self._bridge = SupersetAuthBridge(self.url)
 
         # Authenticate immediately — priority order:
@@ -258,17 +314,23 @@ class SupersetLoader(ExternalDataLoader):
 
         results: list[dict[str, Any]] = []
 
-        # Walk dashboards → datasets
-        raw = self._client.list_dashboards(token, page=0, page_size=500)
-        dashboards = raw.get("result", [])
-        for dash in dashboards:
-            dash_title = dash.get("dashboard_title", f"Dashboard {dash['id']}")
+        # Walk dashboards → datasets (dashboard lookups fetched in parallel)
+        dashboards = self._fetch_all_dashboards(token)
+
+        def _dashboard_datasets(dash: dict) -> list[dict] | None:
             try:
-                ds_raw = self._client.get_dashboard_datasets(token, dash["id"])
-                dash_datasets = ds_raw.get("result", [])
+                return self._client.get_dashboard_datasets(token, dash["id"]).get("result", [])
             except Exception:
                 logger.debug("Failed to fetch datasets for dashboard %s", dash.get("id"))
+                return None
+
+        with ThreadPoolExecutor(max_workers=self._max_workers()) as pool:
+            dash_results = list(pool.map(_dashboard_datasets, dashboards))
+
+        for dash, dash_datasets in zip(dashboards, dash_results):
+            if dash_datasets is None:
                 continue
+            dash_title = dash.get("dashboard_title", f"Dashboard {dash['id']}")
 
             for ds in dash_datasets:
                 ds_name = ds.get("table_name") or ds.get("name") or f"dataset_{ds.get('id', '?')}"
@@ -308,36 +370,37 @@ class SupersetLoader(ExternalDataLoader):
             else:
                 t.setdefault("table_key", meta.get("_source_name") or t.get("name", ""))
 
-        with ThreadPoolExecutor(max_workers=5) as pool:
-            futures = {}
-            for t in tables:
-                ds_id = (t.get("metadata") or {}).get("dataset_id")
-                if ds_id:
-                    futures[pool.submit(
-                        self._client.get_dataset_columns, token, ds_id,
-                    )] = t
+        # A dataset listed under several dashboards and "All Datasets" is
+        # fetched once and its columns shared by every entry.
+        entries_by_id: dict[Any, list[dict[str, Any]]] = {}
+        for t in tables:
+            ds_id = (t.get("metadata") or {}).get("dataset_id")
+            if ds_id:
+                entries_by_id.setdefault(ds_id, []).append(t)
+
+        with ThreadPoolExecutor(max_workers=self._max_workers()) as pool:
+            futures = {
+                pool.submit(self._client.get_dataset_columns, token, ds_id): ds_id
+                for ds_id in entries_by_id
+            }
 
             for future in as_completed(futures, timeout=120):
-                table_entry = futures[future]
+                ds_id = futures[future]
                 try:
                     columns_raw = future.result()
+                except Exception:
+                    logger.warning("Column fetch failed for dataset %s", ds_id, exc_info=True)
+                    for table_entry in entries_by_id[ds_id]:
+                        table_entry.setdefault("metadata", {})["source_metadata_status"] = "unavailable"
+                    continue
+                for table_entry in entries_by_id[ds_id]:
+                    meta = table_entry.setdefault("metadata", {})
                     if columns_raw:
-                        columns = [
-                            self._build_column_entry(c) for c in columns_raw
-                        ]
-                        table_entry.setdefault("metadata", {})["columns"] = columns
-                        table_entry["metadata"]["source_metadata_status"] = "synced"
+                        meta["columns"] = [self._build_column_entry(c) for c in columns_raw]
+                        meta["source_metadata_status"] = "synced"
                     else:
-                        meta = table_entry.setdefault("metadata", {})
                         meta["columns"] = []
                         meta["source_metadata_status"] = "partial"
-                except Exception:
-                    logger.warning(
-                        "Column fetch failed for dataset %s",
-                        (table_entry.get("metadata") or {}).get("dataset_id"),
-                        exc_info=True,
-                    )
-                    table_entry.setdefault("metadata", {})["source_metadata_status"] = "unavailable"
 
     def search_catalog(self, query: str, limit: int = 100) -> dict:
         """Search Superset datasets and dashboards as a lightweight tree."""
@@ -389,8 +452,7 @@ class SupersetLoader(ExternalDataLoader):
                 "children": dataset_children,
             })
 
-        raw_dashboards = self._client.list_dashboards(token, page=0, page_size=500)
-        for dash in raw_dashboards.get("result", []):
+        for dash in self._fetch_all_dashboards(token):
             dash_title = dash.get("dashboard_title", f"Dashboard {dash['id']}")
             if needle not in dash_title.lower():
                 continue
@@ -433,8 +495,7 @@ class SupersetLoader(ExternalDataLoader):
 
         if len(path) == 0:
             # Root: list dashboards as table_group nodes + "All Datasets" namespace
-            raw = self._client.list_dashboards(token, page=0, page_size=500)
-            dashboards = raw.get("result", [])
+            dashboards = self._fetch_all_dashboards(token)
             nodes = []
             for d in dashboards:
                 title = d.get("dashboard_title", f"Dashboard {d['id']}")
@@ -888,6 +949,18 @@ class SupersetLoader(ExternalDataLoader):
         orderby = self._build_chart_data_orderby(
             opts.get("sort_columns"), opts.get("sort_order", "asc"),
         )
+        if size > CHART_DATA_PAGE_ROWS:
+            # ``row_offset`` pages are only consistent under a stable order;
+            # without one the database may return overlapping pages.
+            key = self._paging_key(token, dataset_id, orderby)
+            if key or orderby:
+                orderby = orderby + key
+            else:
+                logger.warning(
+                    "Superset dataset %s: no column list to order pages by; "
+                    "fetching a single page of %d rows", dataset_id, CHART_DATA_PAGE_ROWS,
+                )
+                size = CHART_DATA_PAGE_ROWS
         if orderby:
             query["orderby"] = orderby
 
@@ -895,60 +968,114 @@ class SupersetLoader(ExternalDataLoader):
             "Superset Chart Data API: dataset_id=%s query=%s",
             dataset_id, query,
         )
-        result = self._client.post_chart_data(token, dataset_id, [query])
 
-        queries_result = result.get("result", [])
-        if not queries_result:
+        # Page through the result so imports above one response's worth of
+        # rows are complete; a short page means the source is exhausted.
+        first_result: dict[str, Any] | None = None
+        pages: list[pa.Table] = []
+        fetched = 0
+        while fetched < size:
+            limit = min(CHART_DATA_PAGE_ROWS, size - fetched)
+            page_query = {**query, "row_limit": limit}
+            if fetched:
+                page_query["row_offset"] = fetched
+            result = self._client.post_chart_data(token, dataset_id, [page_query])
+            queries_result = result.get("result", [])
+            if not queries_result:
+                break
+            query_result = queries_result[0]
+            if first_result is None:
+                first_result = query_result
+            rows = query_result.get("data", []) or []
+            if rows:
+                pages.append(_chart_rows_to_arrow(rows))
+            fetched += len(rows)
+            if len(rows) < limit:
+                break
+
+        if first_result is None:
             return self._empty_arrow_table(token, dataset_id)
 
-        query_result = queries_result[0]
-        rows = query_result.get("data", []) or []
         logger.info(
-            "Superset Chart Data result: dataset_id=%s rows=%d",
-            dataset_id, len(rows),
+            "Superset Chart Data result: dataset_id=%s rows=%d pages=%d",
+            dataset_id, fetched, len(pages),
         )
 
-        if not rows:
-            col_names = query_result.get("colnames") or []
+        if not pages:
+            col_names = first_result.get("colnames") or []
             if not col_names:
                 return self._empty_arrow_table(token, dataset_id)
             return pa.table(
                 {name: pa.array([], type=pa.string()) for name in col_names}
             )
 
-        columns = list(rows[0].keys())
-        col_data = {col: [row.get(col) for row in rows] for col in columns}
+        table = pages[0] if len(pages) == 1 else pa.concat_tables(
+            pages, promote_options="permissive",
+        )
 
         # Detect temporal columns from Chart Data API response metadata
-        # coltypes: 0=STRING, 1=NUMERIC, 2=TEMPORAL, 3=BOOLEAN
-        colnames = query_result.get("colnames") or columns
-        coltypes = query_result.get("coltypes") or []
+        colnames = first_result.get("colnames") or table.column_names
+        coltypes = first_result.get("coltypes") or []
         temporal_cols = {
             colnames[i]
             for i, ct in enumerate(coltypes)
-            if ct == 2 and i < len(colnames)
+            if ct == _COLTYPE_TEMPORAL and i < len(colnames)
         }
 
         if temporal_cols:
-            col_data = self._convert_temporal_columns(
-                col_data, temporal_cols, token, dataset_id,
+            table = self._convert_temporal_columns(
+                table, temporal_cols, token, dataset_id,
             )
 
-        return pa.table(col_data)
+        return table
+
+    def _paging_key(self, token: str, dataset_id: int, orderby: list[list]) -> list[list]:
+        """One ascending ``orderby`` entry to keep ``row_offset`` pages stable.
+
+        Superset does not expose key constraints, so the key is a physical
+        ``id`` column, else the dataset's main temporal column, else its
+        first temporal column.  Ordering by a single (ideally indexed)
+        column keeps the sort cheap; every column would force a full sort
+        and fails on unorderable types.  Returns ``[]`` when *orderby*
+        already sorts by the key or no candidate exists.
+        """
+        try:
+            detail = self._client.get_dataset_detail(token, dataset_id)
+        except Exception:
+            logger.debug("Dataset detail unavailable for paging order", exc_info=True)
+            return []
+        physical = [
+            c for c in (detail.get("columns") or [])
+            if c.get("column_name") and not c.get("expression")
+        ]
+        names = [c["column_name"] for c in physical]
+        candidates = [n for n in names if n.lower() == "id"]
+        if detail.get("main_dttm_col") in names:
+            candidates.append(detail["main_dttm_col"])
+        candidates += [c["column_name"] for c in physical if c.get("is_dttm")]
+        if not candidates:
+            return []
+        key = candidates[0]
+        if any(col == key for col, _ in orderby):
+            return []
+        return [[key, True]]
 
     def _convert_temporal_columns(
         self,
-        col_data: dict[str, list],
+        table: pa.Table,
         temporal_cols: set[str],
         token: str,
         dataset_id: int,
-    ) -> dict[str, list | pa.Array]:
+    ) -> pa.Table:
         """Convert epoch-ms temporal columns to proper Arrow date/timestamp types.
 
         Classification strategy:
         1. Dataset detail raw type: explicit DATE → date32
         2. Value heuristic: all non-null epoch values are exact midnight → date32
         3. Otherwise → timestamp[ms]
+
+        Conversion is vectorized with Arrow compute kernels.  Columns that
+        did not arrive as epoch numbers (e.g. ISO strings) are left as is.
         """
         date_cols: set[str] = set()
         try:
@@ -963,37 +1090,25 @@ class SupersetLoader(ExternalDataLoader):
         except Exception:
             logger.debug("Dataset detail unavailable for temporal type refinement", exc_info=True)
 
-        # Heuristic: if all values are exact midnight, treat as date-only
-        MS_PER_DAY = 86_400_000
         for col_name in temporal_cols:
-            if col_name in date_cols or col_name not in col_data:
+            if col_name not in table.column_names:
                 continue
-            values = col_data[col_name]
-            if all(
-                v is None or (isinstance(v, (int, float)) and int(v) % MS_PER_DAY == 0)
-                for v in values
-            ):
-                date_cols.add(col_name)
-
-        for col_name in temporal_cols:
-            if col_name not in col_data:
+            column = table.column(col_name)
+            if not (pa.types.is_integer(column.type) or pa.types.is_floating(column.type)
+                    or pa.types.is_null(column.type)):
                 continue
-            raw_values = col_data[col_name]
-            if col_name in date_cols:
-                col_data[col_name] = pa.array(
-                    [datetime.fromtimestamp(v / 1000, tz=timezone.utc).date()
-                     if isinstance(v, (int, float)) else v
-                     for v in raw_values],
-                    type=pa.date32(),
-                )
-            else:
-                col_data[col_name] = pa.array(
-                    [int(v) if isinstance(v, (int, float)) else None
-                     for v in raw_values],
-                    type=pa.timestamp('ms'),
-                )
+            epoch_ms = pc.cast(pc.floor(column) if pa.types.is_floating(column.type) else column,
+                               pa.int64(), safe=False)
+            timestamps = pc.cast(epoch_ms, pa.timestamp('ms'))
+
+            # Heuristic: if all values are exact midnight, treat as date-only
+            is_date = col_name in date_cols or pc.all(
+                pc.equal(pc.subtract(epoch_ms, pc.multiply(pc.divide(epoch_ms, _MS_PER_DAY), _MS_PER_DAY)), 0),
+            ).as_py() is not False
+            converted = pc.cast(timestamps, pa.date32(), safe=False) if is_date else timestamps
+            table = table.set_column(table.column_names.index(col_name), col_name, converted)
 
-        return col_data
+        return table
 
     def _empty_arrow_table(self, token: str, dataset_id: int) -> pa.Table:
         """Build a 0-row Arrow table preserving column names from metadata."""
@@ -1072,6 +1187,24 @@ class SupersetLoader(ExternalDataLoader):
 
     # -- helpers -----------------------------------------------------------
 
+    def _max_workers(self) -> int:
+        return self.rate_limit()["max_concurrent_requests"]
+
+    def _fetch_all_dashboards(self, token: str) -> list[dict]:
+        """Paginate through all dashboards (most recently changed first)."""
+        all_results: list[dict] = []
+        page = 0
+        page_size = 100
+        while True:
+            raw = self._client.list_dashboards(token, page=page, page_size=page_size)
+            batch = raw.get("result", [])
+            all_results.extend(batch)
+            total = raw.get("count", len(all_results))
+            if not batch or len(all_results) >= total or len(batch) < page_size:
+                break
+            page += 1
+        return all_results
+
     def _fetch_all_datasets(self, token: str) -> list[dict]:
         """Paginate through all datasets."""
         all_results: list[dict] = []
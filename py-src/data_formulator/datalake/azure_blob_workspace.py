@@ -32,7 +32,7 @@ import zipfile
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Optional, TYPE_CHECKING
+from typing import Any, Callable, Iterable, Optional, TYPE_CHECKING
 
 import pandas as pd
 import pyarrow as pa
@@ -47,12 +47,13 @@ from data_formulator.datalake.workspace_metadata import (
 from werkzeug.utils import secure_filename
 from data_formulator.datalake.parquet_utils import (
     safe_data_filename,
-    sanitize_table_name,
     get_arrow_column_info,
     compute_arrow_table_hash,
+    compute_parquet_file_hash,
     get_column_info,
     compute_dataframe_hash,
     sanitize_dataframe_for_arrow,
+    write_parquet_batches,
     DEFAULT_COMPRESSION,
 )
 from data_formulator.datalake.workspace import Workspace, get_data_formulator_home
@@ -175,14 +176,11 @@ class AzureBlobWorkspace(Workspace):
         # lock to serialise in-process read-modify-write cycles).
         self._metadata_lock = threading.Lock()
 
-        # --- blob data cache -------------------------------------------------
-        # Request-local in-memory cache of downloaded blob bytes keyed by
-        # filename.  Avoids repeated downloads of the same data file within one
-        # request (e.g. analyze_table calls run_parquet_sql once per column).
-        # Backed by the process-global :mod:`blob_disk_cache`, which persists
-        # bytes + ETag across the short-lived per-request workspace instances.
-        # Invalidated per-file on upload/delete, cleared on cleanup.
-        self._blob_data_cache: dict[str, bytes] = {}
+        # --- blob data --------------------------------------------------------
+        # Data blobs are not held in memory per instance.  Reads go through the
+        # process-global :mod:`blob_disk_cache` (ETag-validated, with a short
+        # TTL that absorbs repeated reads within one request) and are served
+        # from the cached file via mmap — see :meth:`_open_buffer`.
 
         # --- metadata --------------------------------------------------------
         # Skip the existence HEAD when the metadata blob is already cached on
@@ -211,6 +209,10 @@ class AzureBlobWorkspace(Workspace):
         """Globally-unique key for the disk cache: container + full blob name."""
         return f"{self._container_name}/{self._blob_name(filename)}"
 
+    def _cache_group(self) -> str:
+        """Disk-cache group for this workspace (used for per-workspace quotas)."""
+        return f"{self._container_name}/{self._prefix}"
+
     def _get_blob(self, filename: str):
         """Return a ``BlobClient`` for *filename*."""
         return self._container.get_blob_client(self._blob_name(filename))
@@ -239,11 +241,9 @@ class AzureBlobWorkspace(Workspace):
         key = self._cache_key(filename)
         etag = resp.get("etag") if isinstance(resp, dict) else None
         if etag:
-            cache.put(key, raw, etag)
+            cache.put(key, raw, etag, group=self._cache_group())
         else:
             cache.invalidate(key)
-        # Invalidate request-local copy of this file
-        self._blob_data_cache.pop(filename, None)
         if hasattr(self, "_temp_file_cache") and filename in self._temp_file_cache:
             self._temp_file_cache.pop(filename).unlink(missing_ok=True)
         return len(raw)
@@ -281,25 +281,29 @@ class AzureBlobWorkspace(Workspace):
                 cache.mark_validated(key)
                 return entry
 
-        # Cold cache or changed blob — full download.
+        # Cold cache or changed blob — full download, streamed to disk.
         stream = blob.download_blob()
-        data = stream.readall()
-        return cache.put(key, data, stream.properties.etag)
+        return cache.put_stream(
+            key, stream.readinto, stream.properties.etag, group=self._cache_group()
+        )
 
     def _download_bytes(self, filename: str) -> bytes:
-        cached = self._blob_data_cache.get(filename)
-        if cached is not None:
-            return cached
-        data = self._ensure_cached(filename).read_bytes()
-        self._blob_data_cache[filename] = data
-        return data
+        """Return the blob's content as ``bytes`` (a copy of the cached file).
+
+        Prefer :meth:`_open_buffer` for data files; this is meant for small
+        blobs such as ``workspace.yaml`` and for callers that need ``bytes``.
+        """
+        return self._ensure_cached(filename).read_bytes()
+
+    def _open_buffer(self, filename: str) -> pa.Buffer:
+        """Return the blob's content as a zero-copy, mmap-backed buffer."""
+        return self._ensure_cached(filename).read_buffer()
 
     def _delete_blob(self, filename: str) -> None:
         from data_formulator.datalake.blob_disk_cache import get_blob_disk_cache
 
         self._get_blob(filename).delete_blob()
         get_blob_disk_cache().invalidate(self._cache_key(filename))
-        self._blob_data_cache.pop(filename, None)
         if hasattr(self, "_temp_file_cache") and filename in self._temp_file_cache:
             self._temp_file_cache.pop(filename).unlink(missing_ok=True)
 
@@ -372,7 +376,7 @@ class AzureBlobWorkspace(Workspace):
         """Force the next get_metadata() to re-read from blob storage."""
         self._metadata_cache = None
 
-    def _atomic_update_metadata(
+    def _commit_metadata_update(
         self,
         updater: Callable[[WorkspaceMetadata], None],
     ) -> WorkspaceMetadata:
@@ -418,6 +422,7 @@ class AzureBlobWorkspace(Workspace):
 
         if self._blob_exists(self._data_blob_key(table.filename)):
             self._delete_blob(self._data_blob_key(table.filename))
+        self._delete_table_parts(table)
 
         removed = [False]
 
@@ -437,6 +442,7 @@ class AzureBlobWorkspace(Workspace):
             for name, table in list(m.tables.items()):
                 if table.source_file == safe_filename or table.filename == safe_filename:
                     blobs_to_delete.append(table.filename)
+                    blobs_to_delete.extend(table.parts or [])
                     m.remove_table(name)
                     deleted.append(name)
 
@@ -465,7 +471,6 @@ class AzureBlobWorkspace(Workspace):
             self._container.delete_blob(blob.name)
             cache.invalidate(f"{self._container_name}/{blob.name}")
         self._metadata_cache = None
-        self._blob_data_cache.clear()
         self._cleanup_temp_files()
         self._cleanup_scratch()
         logger.info("Cleaned up blob workspace %s", self._safe_id)
@@ -483,18 +488,22 @@ class AzureBlobWorkspace(Workspace):
         # Read straight from the ETag-validated disk cache path (no redundant
         # existence HEAD, no full in-memory copy); the download validates
         # existence and raises ResourceNotFoundError if the blob is gone.
+        # Parquet is memory-mapped so Arrow decodes directly from the page
+        # cache instead of buffering the file first.
         try:
             entry = self._ensure_cached(self._data_blob_key(meta.filename))
         except ResourceNotFoundError:
             raise FileNotFoundError(f"Blob not found: {meta.filename}")
 
         readers = {
-            "parquet": lambda p: pd.read_parquet(p),
+            "parquet": lambda p: pd.read_parquet(p, memory_map=True),
             "csv": lambda p: pd.read_csv(p),
             "excel": lambda p: pd.read_excel(p),
             "json": lambda p: pd.read_json(p),
             "txt": lambda p: pd.read_csv(p, sep="\t"),
         }
+        if meta.file_type == "parquet" and meta.parts:
+            return self._read_parquet_table(meta.name).to_pandas()
         reader = readers.get(meta.file_type)
         if reader is None:
             raise ValueError(
@@ -507,14 +516,13 @@ class AzureBlobWorkspace(Workspace):
     # Parquet write
     # ------------------------------------------------------------------
 
-    def write_parquet_from_arrow(
+    def _write_parquet_from_arrow_locked(
         self,
         table: pa.Table,
-        table_name: str,
-        compression: str = DEFAULT_COMPRESSION,
-        source_info: Optional[dict[str, Any]] = None,
+        safe_name: str,
+        compression: str,
+        source_info: Optional[dict[str, Any]],
     ) -> TableMetadata:
-        safe_name = sanitize_table_name(table_name)
         filename = f"{safe_name}.parquet"
 
         # Remove old blob if overwriting
@@ -523,6 +531,7 @@ class AzureBlobWorkspace(Workspace):
             old_fn = ws_meta.tables[safe_name].filename
             if self._blob_exists(self._data_blob_key(old_fn)):
                 self._delete_blob(self._data_blob_key(old_fn))
+            self._delete_table_parts(ws_meta.tables[safe_name])
 
         # Serialise to bytes, upload
         buf = io.BytesIO()
@@ -558,14 +567,66 @@ class AzureBlobWorkspace(Workspace):
         )
         return table_metadata
 
-    def write_parquet(
+    def _write_parquet_from_batches_locked(
+        self,
+        batches: Iterable[pa.Table],
+        safe_name: str,
+        compression: str,
+        source_info: Optional[dict[str, Any]],
+    ) -> TableMetadata:
+        filename = f"{safe_name}.parquet"
+
+        # Spool row groups to a local temp file; only the compressed
+        # parquet bytes are held in memory for the upload.
+        with tempfile.TemporaryDirectory(prefix="df_blob_stream_") as tmp:
+            spool = Path(tmp) / filename
+            schema, num_rows = write_parquet_batches(batches, spool, compression=compression)
+            content_hash = compute_parquet_file_hash(spool)
+            blob_bytes = spool.read_bytes()
+
+        ws_meta = self.get_metadata()
+        if safe_name in ws_meta.tables:
+            old_fn = ws_meta.tables[safe_name].filename
+            if old_fn != filename and self._blob_exists(self._data_blob_key(old_fn)):
+                self._delete_blob(self._data_blob_key(old_fn))
+            self._delete_table_parts(ws_meta.tables[safe_name])
+        self._upload_bytes(self._data_blob_key(filename), blob_bytes)
+
+        now = datetime.now(timezone.utc)
+        table_metadata = TableMetadata(
+            name=safe_name,
+            source_type="data_loader",
+            filename=filename,
+            file_type="parquet",
+            created_at=now,
+            content_hash=content_hash,
+            file_size=len(blob_bytes),
+            row_count=num_rows,
+            columns=get_arrow_column_info(schema.empty_table()),
+            last_synced=now,
+        )
+
+        if source_info:
+            table_metadata.loader_type = source_info.get("loader_type")
+            table_metadata.loader_params = source_info.get("loader_params")
+            table_metadata.source_table = source_info.get("source_table")
+            table_metadata.source_query = source_info.get("source_query")
+            table_metadata.import_options = source_info.get("import_options")
+
+        self.add_table_metadata(table_metadata)
+        logger.info(
+            "Wrote parquet blob %s: %d rows, %d cols (%d bytes) [Arrow stream]",
+            filename, num_rows, len(schema), len(blob_bytes),
+        )
+        return table_metadata
+
+    def _write_parquet_locked(
         self,
         df: pd.DataFrame,
-        table_name: str,
-        compression: str = DEFAULT_COMPRESSION,
-        source_info: Optional[dict[str, Any]] = None,
+        safe_name: str,
+        compression: str,
+        source_info: Optional[dict[str, Any]],
     ) -> TableMetadata:
-        safe_name = sanitize_table_name(table_name)
         filename = f"{safe_name}.parquet"
 
         ws_meta = self.get_metadata()
@@ -573,6 +634,7 @@ class AzureBlobWorkspace(Workspace):
             old_fn = ws_meta.tables[safe_name].filename
             if self._blob_exists(self._data_blob_key(old_fn)):
                 self._delete_blob(self._data_blob_key(old_fn))
+            self._delete_table_parts(ws_meta.tables[safe_name])
 
         sanitized_df = sanitize_dataframe_for_arrow(df)
         arrow_table = pa.Table.from_pandas(sanitized_df)
@@ -614,39 +676,12 @@ class AzureBlobWorkspace(Workspace):
     # Parquet read helpers
     # ------------------------------------------------------------------
 
-    def get_parquet_schema(self, table_name: str) -> dict:
-        from azure.core.exceptions import ResourceNotFoundError
-
-        meta = self.get_table_metadata(table_name)
-        if meta is None:
-            raise FileNotFoundError(f"Table not found: {table_name}")
-        if meta.file_type != "parquet":
-            raise ValueError(f"Table {table_name} is not a parquet file")
-
-        try:
-            entry = self._ensure_cached(self._data_blob_key(meta.filename))
-        except ResourceNotFoundError:
-            raise FileNotFoundError(f"Parquet blob not found: {meta.filename}")
-        pf = pq.ParquetFile(entry.path)
-        schema = pf.schema_arrow
-        return {
-            "table_name": table_name,
-            "filename": meta.filename,
-            "num_rows": pf.metadata.num_rows,
-            "num_columns": len(schema),
-            "columns": [
-                {"name": f.name, "type": str(f.type), "nullable": f.nullable}
-                for f in schema
-            ],
-            "created_at": meta.created_at.isoformat(),
-            "last_synced": (
-                meta.last_synced.isoformat() if meta.last_synced else None
-            ),
-        }
-
     def get_parquet_path(self, table_name: str) -> str:  # type: ignore[override]
         """Return the full blob name for the parquet file.
 
+        As in the base class this is the main file only, without appended
+        parts.
+
         .. warning::
             Unlike the base class this returns a *blob path* (``str``),
             **not** a resolved local ``pathlib.Path``.
@@ -660,35 +695,6 @@ class AzureBlobWorkspace(Workspace):
             raise FileNotFoundError(f"Parquet blob not found: {meta.filename}")
         return self._blob_name(self._data_blob_key(meta.filename))
 
-    def run_parquet_sql(self, table_name: str, sql: str) -> pd.DataFrame:
-        """Run a DuckDB SQL query against a parquet table.
-
-        Downloads the blob to a temporary local file for the duration of
-        the query, so DuckDB can use its native parquet reader.
-        """
-        import duckdb
-        from azure.core.exceptions import ResourceNotFoundError
-
-        meta = self.get_table_metadata(table_name)
-        if meta is None:
-            raise FileNotFoundError(f"Table not found: {table_name}")
-        if meta.file_type != "parquet":
-            raise ValueError(f"Table {table_name} is not a parquet file")
-        if "{parquet}" not in sql:
-            raise ValueError("SQL must contain {parquet} placeholder")
-
-        try:
-            entry = self._ensure_cached(self._data_blob_key(meta.filename))
-        except ResourceNotFoundError:
-            raise FileNotFoundError(f"Parquet blob not found: {meta.filename}")
-        escaped = str(entry.path).replace("\\", "\\\\").replace("'", "''")
-        full_sql = sql.format(parquet=f"read_parquet('{escaped}')")
-        conn = duckdb.connect(":memory:")
-        try:
-            return conn.execute(full_sql).fetchdf()
-        finally:
-            conn.close()
-
     # ------------------------------------------------------------------
     # Local directory materialisation (for sandbox execution)
     # ------------------------------------------------------------------
@@ -698,8 +704,14 @@ class AzureBlobWorkspace(Workspace):
         """Download all workspace files to a temporary local directory.
 
         Yields the path to the temp directory.  The directory and its
-        contents are removed when the context manager exits.
+        contents are removed when the context manager exits.  Tables with
+        appended parts are written out merged, as in the base class.
         """
+        appended = self._appended_tables()
+        skip = {
+            self._data_blob_key(f)
+            for meta in appended.values() for f in [meta.filename, *meta.parts]
+        }
         tmp = tempfile.mkdtemp(prefix="df_blob_ws_")
         tmp_path = Path(tmp)
         try:
@@ -707,12 +719,13 @@ class AzureBlobWorkspace(Workspace):
             for blob in self._container.list_blobs(name_starts_with=self._prefix):
                 # Relative filename within the workspace
                 rel = blob.name[len(self._prefix):]
-                if not rel or rel == METADATA_FILENAME:
-                    continue  # skip the metadata file itself
+                if not rel or rel == METADATA_FILENAME or rel in skip:
+                    continue  # skip the metadata file and appended tables
                 local_file = tmp_path / rel
                 local_file.parent.mkdir(parents=True, exist_ok=True)
-                data = self._container.download_blob(blob.name).readall()
-                local_file.write_bytes(data)
+                with open(local_file, "wb") as fh:
+                    self._container.download_blob(blob.name).readinto(fh)
+            self._write_merged_tables(tmp_path / "data", appended)
             yield tmp_path
         finally:
             shutil.rmtree(tmp, ignore_errors=True)
@@ -729,6 +742,54 @@ class AzureBlobWorkspace(Workspace):
         """Download raw file content from the workspace data blob."""
         return self._download_bytes(self._data_blob_key(safe_data_filename(filename)))
 
+    def _table_lock_owner(self) -> str:
+        return self._cache_group()
+
+    def _open_parquet_source(self, filename: str) -> Any:
+        return pa.BufferReader(self._open_buffer(self._data_blob_key(filename)))
+
+    def _replace_parquet_file(self, filename: str, write: Callable[[Any, Any], None]) -> int:
+        buf = io.BytesIO()
+        write(self._open_parquet_source(filename), buf)
+        blob_bytes = buf.getvalue()
+        self._upload_bytes(self._data_blob_key(filename), blob_bytes)
+        return len(blob_bytes)
+
+    def _local_data_path(self, filename: str) -> Path:
+        """Disk-cache path of data blob *filename* (downloaded or revalidated on demand)."""
+        from azure.core.exceptions import ResourceNotFoundError
+
+        try:
+            return self._ensure_cached(self._data_blob_key(filename)).path
+        except ResourceNotFoundError:
+            raise FileNotFoundError(f"Parquet blob not found: {filename}")
+
+    def _data_file_identity(self, filename: str) -> tuple:
+        """``(filename, etag)`` of data blob *filename*, as validated by the disk cache."""
+        from azure.core.exceptions import ResourceNotFoundError
+
+        try:
+            return (filename, self._ensure_cached(self._data_blob_key(filename)).etag)
+        except ResourceNotFoundError:
+            raise FileNotFoundError(f"Parquet blob not found: {filename}")
+
+    def _write_part_file(self, filename: str, table: pa.Table, compression: str) -> int:
+        buf = io.BytesIO()
+        pq.write_table(table, buf, compression=compression)
+        return self._upload_bytes(self._data_blob_key(filename), buf.getvalue())
+
+    def _delete_data_file(self, filename: str) -> None:
+        if self._blob_exists(self._data_blob_key(filename)):
+            self._delete_blob(self._data_blob_key(filename))
+
+    def open_file_buffer(self, filename: str) -> pa.Buffer:
+        """Zero-copy variant of :meth:`download_file`.
+
+        Returns an mmap-backed ``pa.Buffer`` over the locally cached blob;
+        wrap it in ``pa.BufferReader`` for a seekable file-like object.
+        """
+        return self._open_buffer(self._data_blob_key(safe_data_filename(filename)))
+
     # ------------------------------------------------------------------
     # Workspace snapshot (session save / restore)
     # ------------------------------------------------------------------
@@ -742,8 +803,8 @@ class AzureBlobWorkspace(Workspace):
             dst.mkdir(parents=True, exist_ok=True)
             local_file = dst / rel
             local_file.parent.mkdir(parents=True, exist_ok=True)
-            data = self._container.download_blob(blob.name).readall()
-            local_file.write_bytes(data)
+            with open(local_file, "wb") as fh:
+                self._container.download_blob(blob.name).readinto(fh)
 
     def restore_workspace_snapshot(self, src: Path) -> None:
         """Replace all workspace blobs with files from *src* directory."""
@@ -758,7 +819,6 @@ class AzureBlobWorkspace(Workspace):
             self._init_metadata()
         # Invalidate caches since metadata and data were replaced from snapshot
         self._metadata_cache = None
-        self._blob_data_cache.clear()
         self._cleanup_temp_files()
 
     # ------------------------------------------------------------------
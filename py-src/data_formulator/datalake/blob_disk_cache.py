@@ -13,7 +13,8 @@ worker container), backed by real files on local disk.
 Layout under ``<df_home>/blob_cache/``::
 
     <sha256(key)>.bin        # the blob bytes
-    <sha256(key)>.meta.json  # {"key", "blob_name", "container", "etag", "size", "cached_at"}
+    <sha256(key)>.meta.json  # {"key", "etag", "size", "group", "cached_at"}
+    index.json               # compact snapshot of all entries (see below)
 
 The cache stores ``bytes + etag``.  Freshness (whether a conditional GET is
 needed) is tracked *in memory per process* via a monotonic timestamp, so we
@@ -21,28 +22,73 @@ never write to disk just to record a read.  Callers (the workspace) decide the
 TTL and issue conditional GETs; this module only stores/serves bytes and etags
 and tracks last-validation times.
 
-Eviction is best-effort LRU by total bytes, capped by
-``AZURE_BLOB_CACHE_MAX_BYTES`` (default 2 GiB).
+Eviction
+--------
+Total size is capped by ``AZURE_BLOB_CACHE_MAX_BYTES`` (default 2 GiB).  Which
+entries go first is decided by a pluggable :class:`EvictionPolicy`, selected
+with ``AZURE_BLOB_CACHE_POLICY``:
+
+- ``lru`` (default) — least-recently-used.  Predictable and free of tuning;
+  scan resistance across workspaces comes from the group quota below.
+- ``gdsf`` — Greedy-Dual-Size-Frequency.  Entries are ranked by access
+  frequency relative to size, plus an aging clock, so a one-off scan of a
+  large table cannot push out small, frequently-read blobs.
+
+Entries carry a *group* (the workspace blob prefix).  A group holding more
+than ``AZURE_BLOB_CACHE_GROUP_MAX_BYTES`` (default: half the cache; ``0``
+disables the quota) evicts from its own entries first, so one workspace
+scanning a large table cannot flush everyone else's blobs.
+
+The index is split across lock shards, and each shard keeps its own byte
+counts, hit/miss counters and policy state, so a lookup only ever takes its
+own shard's lock.  Policies keep entries in eviction order (an ordered dict
+for LRU, a heap for GDSF); eviction, serialised by one lock, repeatedly
+removes the lowest-ranked head across the shards instead of sorting the
+whole index.  :meth:`BlobDiskCache.stats` reports hit ratio, byte totals and
+eviction counts.
+
+On startup the index is rebuilt from ``index.json`` plus one directory
+listing; ``.meta.json`` files are only parsed for blobs the snapshot does not
+know about (e.g. written by another worker process since the last flush).
+
+Readers should prefer :meth:`CacheEntry.memory_map` / :meth:`CacheEntry.read_buffer`
+over :meth:`CacheEntry.read_bytes`: they map the ``.bin`` file instead of
+copying it into a Python ``bytes`` object, so pyarrow reads share the OS page
+cache with DuckDB and with other requests touching the same blob.  Writers
+replace files via ``os.replace``, so an existing mapping keeps pointing at the
+old inode and is never observed half-written.
 """
 
 from __future__ import annotations
 
+import atexit
 import hashlib
+import heapq
+import itertools
 import json
 import logging
 import os
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, BinaryIO, Callable, Iterator, Optional
+
+import pyarrow as pa
 
 from data_formulator.datalake.workspace import get_data_formulator_home
 
 logger = logging.getLogger(__name__)
 
 CACHE_DIR_NAME = "blob_cache"
+INDEX_FILENAME = "index.json"
+_INDEX_VERSION = 1
 _DEFAULT_MAX_BYTES = 2 * 1024 * 1024 * 1024  # 2 GiB
+# Share of the cache one group may fill unless AZURE_BLOB_CACHE_GROUP_MAX_BYTES is set.
+_DEFAULT_GROUP_SHARE = 0.5
+_DEFAULT_SHARDS = 16
+_INDEX_FLUSH_INTERVAL_SECONDS = 30.0
 
 
 @dataclass
@@ -53,10 +99,227 @@ class CacheEntry:
     path: Path
     etag: str
     size: int
+    group: str = ""
 
     def read_bytes(self) -> bytes:
+        """Copy the whole file into memory.  Only for small blobs (metadata)."""
         return self.path.read_bytes()
 
+    def memory_map(self) -> pa.MemoryMappedFile:
+        """Open the cached file as a read-only ``pyarrow`` memory map.
+
+        The caller owns the returned file and should close it (it is a
+        context manager).  Reads through it are zero-copy.
+        """
+        return pa.memory_map(str(self.path), "r")
+
+    def read_buffer(self) -> pa.Buffer:
+        """Return the whole file as a zero-copy, mmap-backed ``pa.Buffer``.
+
+        The mapping stays alive for as long as the buffer (or any slice of
+        it) is referenced; wrap it in ``pa.BufferReader`` for file-like
+        access.
+        """
+        with self.memory_map() as mm:
+            return mm.read_buffer()
+
+
+# ----------------------------------------------------------------------
+# Eviction policies
+# ----------------------------------------------------------------------
+
+class EvictionPolicy:
+    """Keeps cache entries in eviction order.
+
+    The cache holds one instance per ``(shard, group)``, created with
+    :meth:`spawn`, and calls the hooks while holding that shard's lock, so
+    implementations need no locking of their own.  Priorities returned by
+    :meth:`peek` must be comparable across instances spawned from the same
+    policy.  ``frequency`` is persisted in the index snapshot so rankings
+    survive restarts.
+    """
+
+    name = "base"
+
+    def spawn(self) -> "EvictionPolicy":
+        """Return an empty policy of the same kind, sharing any cross-shard state."""
+        raise NotImplementedError
+
+    def on_insert(self, key: str, size: int, frequency: int = 1) -> None:
+        raise NotImplementedError
+
+    def on_access(self, key: str, size: int) -> None:
+        raise NotImplementedError
+
+    def on_remove(self, key: str) -> None:
+        raise NotImplementedError
+
+    def on_evict(self, key: str) -> None:
+        """Called instead of :meth:`on_remove` when *key* is evicted."""
+        self.on_remove(key)
+
+    def peek(self, exclude: Optional[str] = None) -> Optional[tuple[float, str]]:
+        """Return ``(priority, key)`` of the first entry to evict, skipping *exclude*."""
+        raise NotImplementedError
+
+    def frequency(self, key: str) -> int:
+        return 1
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evict the least-recently inserted or read entry first."""
+
+    name = "lru"
+
+    def __init__(self, _ticks: Optional[Iterator[int]] = None) -> None:
+        self._ticks = _ticks or itertools.count(1)
+        self._order: OrderedDict[str, int] = OrderedDict()
+
+    def spawn(self) -> "LRUPolicy":
+        return LRUPolicy(self._ticks)
+
+    def _touch(self, key: str) -> None:
+        self._order[key] = next(self._ticks)
+        self._order.move_to_end(key)
+
+    def on_insert(self, key: str, size: int, frequency: int = 1) -> None:
+        self._touch(key)
+
+    def on_access(self, key: str, size: int) -> None:
+        self._touch(key)
+
+    def on_remove(self, key: str) -> None:
+        self._order.pop(key, None)
+
+    def peek(self, exclude: Optional[str] = None) -> Optional[tuple[float, str]]:
+        for key, tick in self._order.items():
+            if key != exclude:
+                return float(tick), key
+        return None
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+
+class _AgingClock:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+
+class GDSFPolicy(EvictionPolicy):
+    """Greedy-Dual-Size-Frequency.
+
+    ``priority = clock + frequency / sqrt(size_kib)``; the lowest priority is
+    evicted and the clock advances to it, which ages out entries that were
+    hot long ago.  Size enters as a square root so a table read a handful of
+    times still outranks a cold small blob, while a single large scan ranks
+    below everything that has been read more than once.
+
+    Priorities live in a heap with lazy invalidation: an update pushes a new
+    record and stale ones are discarded when they reach the top.
+    """
+
+    name = "gdsf"
+
+    def __init__(self, _clock: Optional[_AgingClock] = None) -> None:
+        self._clock = _clock or _AgingClock()
+        self._freq: dict[str, int] = {}
+        self._priority: dict[str, float] = {}
+        self._heap: list[tuple[float, str]] = []
+
+    def spawn(self) -> "GDSFPolicy":
+        return GDSFPolicy(self._clock)
+
+    def _update(self, key: str, size: int) -> None:
+        size_kib = max(size / 1024.0, 1.0)
+        priority = self._clock.value + self._freq[key] / (size_kib ** 0.5)
+        self._priority[key] = priority
+        heapq.heappush(self._heap, (priority, key))
+        if len(self._heap) > 2 * len(self._priority) + 64:
+            self._heap = [(p, k) for k, p in self._priority.items()]
+            heapq.heapify(self._heap)
+
+    def on_insert(self, key: str, size: int, frequency: int = 1) -> None:
+        self._freq[key] = max(frequency, self._freq.get(key, 0) + 1)
+        self._update(key, size)
+
+    def on_access(self, key: str, size: int) -> None:
+        self._freq[key] = self._freq.get(key, 0) + 1
+        self._update(key, size)
+
+    def on_remove(self, key: str) -> None:
+        self._freq.pop(key, None)
+        self._priority.pop(key, None)
+
+    def on_evict(self, key: str) -> None:
+        self._clock.value = max(self._clock.value, self._priority.get(key, 0.0))
+        self.on_remove(key)
+
+    def peek(self, exclude: Optional[str] = None) -> Optional[tuple[float, str]]:
+        heap = self._heap
+        while heap and self._priority.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        if not heap:
+            return None
+        if heap[0][1] != exclude:
+            return heap[0]
+        top = heapq.heappop(heap)
+        try:
+            return self.peek()
+        finally:
+            heapq.heappush(heap, top)
+
+    def frequency(self, key: str) -> int:
+        return self._freq.get(key, 1)
+
+    def __len__(self) -> int:
+        return len(self._priority)
+
+
+_POLICIES: dict[str, Callable[[], EvictionPolicy]] = {
+    LRUPolicy.name: LRUPolicy,
+    GDSFPolicy.name: GDSFPolicy,
+}
+
+
+def make_eviction_policy(name: str) -> EvictionPolicy:
+    """Build a policy by name (``"lru"`` or ``"gdsf"``); unknown names fall back to LRU."""
+    factory = _POLICIES.get((name or "").strip().lower())
+    if factory is None:
+        logger.warning("blob cache: unknown eviction policy %r, using lru", name)
+        factory = LRUPolicy
+    return factory()
+
+
+# ----------------------------------------------------------------------
+# Cache
+# ----------------------------------------------------------------------
+
+class _Shard:
+    """One lock's worth of the index, with its own accounting and policy state."""
+
+    __slots__ = (
+        "lock", "index", "validated_at", "policies", "bytes", "group_bytes",
+        "hits", "misses", "evictions", "evicted_bytes",
+    )
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.index: dict[str, CacheEntry] = {}
+        self.validated_at: dict[str, float] = {}
+        self.policies: dict[str, EvictionPolicy] = {}
+        self.bytes = 0
+        self.group_bytes: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.evicted_bytes = 0
+
 
 class BlobDiskCache:
     """Thread-safe on-disk cache of blob bytes keyed by ``container/blob_name``.
@@ -69,13 +332,25 @@ class BlobDiskCache:
     best-effort and remain correct via ETag validation.
     """
 
-    def __init__(self, root: Path, max_bytes: int = _DEFAULT_MAX_BYTES) -> None:
+    def __init__(
+        self,
+        root: Path,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+        *,
+        policy: Optional[EvictionPolicy] = None,
+        group_max_bytes: int = 0,
+        shards: int = _DEFAULT_SHARDS,
+    ) -> None:
         self._root = root
         self._max_bytes = max_bytes
-        self._lock = threading.RLock()
-        self._index: dict[str, CacheEntry] = {}
-        self._validated_at: dict[str, float] = {}
-        self._total_bytes = 0
+        self._group_max_bytes = group_max_bytes
+        # Prototype only: every (shard, group) gets its own ``spawn()``.
+        self._policy = policy if policy is not None else LRUPolicy()
+        self._shards = [_Shard() for _ in range(max(1, shards))]
+        # Serialises eviction passes; lookups never take it.
+        self._evict_lock = threading.Lock()
+        self._last_index_flush = 0.0
+
         self._root.mkdir(parents=True, exist_ok=True)
         self._load_index()
 
@@ -93,30 +368,84 @@ class BlobDiskCache:
     def _meta_path(self, key: str) -> Path:
         return self._root / f"{self._stem(key)}.meta.json"
 
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
     # ------------------------------------------------------------------
-    # Index bootstrap
+    # Index bootstrap / persistence
     # ------------------------------------------------------------------
 
     def _load_index(self) -> None:
-        """Populate the in-memory index by scanning existing meta files."""
+        """Populate the in-memory index from ``index.json`` and the bin files.
+
+        One directory listing gives the set of live ``.bin`` files and their
+        sizes; the snapshot supplies key/etag/group/frequency for the ones it
+        knows, and per-entry ``.meta.json`` files are read only for the rest.
+        """
         try:
-            meta_files = list(self._root.glob("*.meta.json"))
+            bins = {
+                e.name[: -len(".bin")]: e.stat().st_size
+                for e in os.scandir(self._root)
+                if e.name.endswith(".bin") and e.is_file()
+            }
         except OSError:
             return
-        for meta_file in meta_files:
+
+        snapshot: dict[str, list] = {}
+        index_path = self._root / INDEX_FILENAME
+        if index_path.exists():
             try:
-                meta = json.loads(meta_file.read_text(encoding="utf-8"))
-                key = meta["key"]
-                bin_path = self._bin_path(key)
-                if not bin_path.exists():
-                    continue
-                size = int(meta.get("size", bin_path.stat().st_size))
-                self._index[key] = CacheEntry(
-                    key=key, path=bin_path, etag=meta["etag"], size=size
+                raw = json.loads(index_path.read_text(encoding="utf-8"))
+                if raw.get("version") == _INDEX_VERSION:
+                    snapshot = raw.get("entries") or {}
+            except Exception:
+                logger.debug("blob cache: ignoring unreadable index", exc_info=True)
+
+        for stem, disk_size in bins.items():
+            try:
+                rec = snapshot.get(stem)
+                if rec is not None and int(rec[2]) == disk_size:
+                    key, etag, size, group, freq = rec
+                else:
+                    # Unknown to the snapshot, or replaced by another worker
+                    # since it was written — the meta file is authoritative.
+                    meta_file = self._root / f"{stem}.meta.json"
+                    meta = json.loads(meta_file.read_text(encoding="utf-8"))
+                    key, etag = meta["key"], meta["etag"]
+                    size = int(meta.get("size", disk_size))
+                    group = meta.get("group", "")
+                    freq = rec[4] if rec is not None else 1
+                entry = CacheEntry(
+                    key=key, path=self._root / f"{stem}.bin",
+                    etag=etag, size=int(size), group=group or "",
                 )
-                self._total_bytes += size
+                shard = self._shard(key)
+                with shard.lock:
+                    self._account_insert_locked(shard, entry, frequency=int(freq))
             except Exception:
-                logger.debug("blob cache: skipping bad meta %s", meta_file, exc_info=True)
+                logger.debug("blob cache: skipping bad entry %s", stem, exc_info=True)
+
+    def flush_index(self) -> None:
+        """Write the compact ``index.json`` snapshot (atomic)."""
+        entries: dict[str, list] = {}
+        for shard in self._shards:
+            with shard.lock:
+                for key, e in shard.index.items():
+                    freq = shard.policies[e.group].frequency(key)
+                    entries[self._stem(key)] = [key, e.etag, e.size, e.group, freq]
+        self._last_index_flush = time.monotonic()
+        payload = {"version": _INDEX_VERSION, "policy": self._policy.name, "entries": entries}
+        try:
+            self._atomic_write(
+                self._root / INDEX_FILENAME,
+                json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+            )
+        except OSError:
+            logger.debug("blob cache: failed to write index", exc_info=True)
+
+    def _maybe_flush_index(self) -> None:
+        if time.monotonic() - self._last_index_flush >= _INDEX_FLUSH_INTERVAL_SECONDS:
+            self.flush_index()
 
     # ------------------------------------------------------------------
     # Read side
@@ -124,69 +453,121 @@ class BlobDiskCache:
 
     def get(self, key: str) -> Optional[CacheEntry]:
         """Return the cached entry for *key*, or ``None`` if absent."""
-        with self._lock:
-            entry = self._index.get(key)
-            if entry is not None and entry.path.exists():
-                return entry
-            if entry is not None:
-                # bin vanished underneath us — drop the stale index record
-                self._drop_locked(key)
-            return None
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.index.get(key)
+        if entry is not None and entry.path.exists():
+            with shard.lock:
+                shard.hits += 1
+                if shard.index.get(key) is entry:
+                    shard.policies[entry.group].on_access(key, entry.size)
+            return entry
+        if entry is not None:
+            # bin vanished underneath us — drop the stale index record
+            self._drop(key)
+        with shard.lock:
+            shard.misses += 1
+        return None
 
     def is_fresh(self, key: str, ttl_seconds: float) -> bool:
         """Whether *key* was validated within the last ``ttl_seconds``."""
         if ttl_seconds <= 0:
             return False
-        with self._lock:
-            last = self._validated_at.get(key)
-            return last is not None and (time.monotonic() - last) < ttl_seconds
+        shard = self._shard(key)
+        with shard.lock:
+            last = shard.validated_at.get(key)
+        return last is not None and (time.monotonic() - last) < ttl_seconds
 
     def mark_validated(self, key: str) -> None:
         """Record that *key* was just confirmed up-to-date against Azure."""
-        with self._lock:
-            self._validated_at[key] = time.monotonic()
+        shard = self._shard(key)
+        with shard.lock:
+            shard.validated_at[key] = time.monotonic()
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for monitoring: hit ratio, bytes, evictions, per-group bytes."""
+        totals = dict.fromkeys(
+            ("entries", "total_bytes", "hits", "misses", "evictions", "evicted_bytes"), 0
+        )
+        group_bytes: dict[str, int] = {}
+        for shard in self._shards:
+            with shard.lock:
+                totals["entries"] += len(shard.index)
+                totals["total_bytes"] += shard.bytes
+                totals["hits"] += shard.hits
+                totals["misses"] += shard.misses
+                totals["evictions"] += shard.evictions
+                totals["evicted_bytes"] += shard.evicted_bytes
+                for group, size in shard.group_bytes.items():
+                    group_bytes[group] = group_bytes.get(group, 0) + size
+        lookups = totals["hits"] + totals["misses"]
+        return {
+            "policy": self._policy.name,
+            "entries": totals["entries"],
+            "total_bytes": totals["total_bytes"],
+            "max_bytes": self._max_bytes,
+            "group_max_bytes": self._group_max_bytes,
+            "hits": totals["hits"],
+            "misses": totals["misses"],
+            "hit_ratio": (totals["hits"] / lookups) if lookups else 0.0,
+            "evictions": totals["evictions"],
+            "evicted_bytes": totals["evicted_bytes"],
+            "group_bytes": group_bytes,
+        }
 
     # ------------------------------------------------------------------
     # Write side
     # ------------------------------------------------------------------
 
-    def put(self, key: str, data: bytes, etag: str) -> CacheEntry:
-        """Store *data*/*etag* for *key* and return the resulting entry."""
+    def put(self, key: str, data: bytes, etag: str, *, group: str = "") -> CacheEntry:
+        """Store *data*/*etag* for *key* and return the resulting entry.
+
+        *group* identifies the owner (a workspace prefix) for per-group quotas.
+        """
+        self._atomic_write(self._bin_path(key), data)
+        return self._commit(key, etag, len(data), group)
+
+    def put_stream(
+        self,
+        key: str,
+        readinto: Callable[[BinaryIO], Any],
+        etag: str,
+        *,
+        group: str = "",
+    ) -> CacheEntry:
+        """Store a blob by letting *readinto* write it straight to disk.
+
+        *readinto* receives an open binary file and writes the blob into it
+        (e.g. ``StorageStreamDownloader.readinto``), so large downloads never
+        materialise as one Python ``bytes`` object.
+        """
         bin_path = self._bin_path(key)
-        meta_path = self._meta_path(key)
-        self._atomic_write(bin_path, data)
-        meta = {
-            "key": key,
-            "etag": etag,
-            "size": len(data),
-            "cached_at": time.time(),
-        }
-        self._atomic_write(
-            meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8")
-        )
-        with self._lock:
-            old = self._index.get(key)
-            if old is not None:
-                self._total_bytes -= old.size
-            entry = CacheEntry(key=key, path=bin_path, etag=etag, size=len(data))
-            self._index[key] = entry
-            self._total_bytes += entry.size
-            self._validated_at[key] = time.monotonic()
-            self._evict_if_needed_locked()
-        return entry
+        tmp = self._tmp_path(bin_path)
+        try:
+            with open(tmp, "wb") as fh:
+                readinto(fh)
+            size = tmp.stat().st_size
+            os.replace(tmp, bin_path)
+        finally:
+            if tmp.exists():
+                tmp.unlink(missing_ok=True)
+        return self._commit(key, etag, size, group)
 
     def invalidate(self, key: str) -> None:
         """Remove *key* from the cache (disk + memory)."""
-        with self._lock:
-            self._drop_locked(key)
+        self._drop(key)
 
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _atomic_write(path: Path, data: bytes) -> None:
-        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    def _tmp_path(path: Path) -> Path:
+        return path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+    @classmethod
+    def _atomic_write(cls, path: Path, data: bytes) -> None:
+        tmp = cls._tmp_path(path)
         try:
             tmp.write_bytes(data)
             os.replace(tmp, path)
@@ -194,27 +575,151 @@ class BlobDiskCache:
             if tmp.exists():
                 tmp.unlink(missing_ok=True)
 
-    def _drop_locked(self, key: str) -> None:
-        entry = self._index.pop(key, None)
-        if entry is not None:
-            self._total_bytes -= entry.size
-        self._validated_at.pop(key, None)
-        self._bin_path(key).unlink(missing_ok=True)
-        self._meta_path(key).unlink(missing_ok=True)
+    def _commit(self, key: str, etag: str, size: int, group: str) -> CacheEntry:
+        """Write the meta file for a just-stored ``.bin``, index it, and evict."""
+        meta = {
+            "key": key,
+            "etag": etag,
+            "size": size,
+            "group": group,
+            "cached_at": time.time(),
+        }
+        self._atomic_write(
+            self._meta_path(key), json.dumps(meta, ensure_ascii=False).encode("utf-8")
+        )
+        entry = CacheEntry(key=key, path=self._bin_path(key), etag=etag, size=size, group=group)
+        shard = self._shard(key)
+        with shard.lock:
+            self._account_insert_locked(shard, entry)
+            shard.validated_at[key] = time.monotonic()
+        self._evict_for(entry)
+        self._maybe_flush_index()
+        return entry
 
-    def _evict_if_needed_locked(self) -> None:
-        if self._total_bytes <= self._max_bytes:
+    def _account_insert_locked(self, shard: _Shard, entry: CacheEntry, frequency: int = 1) -> None:
+        """Index *entry* and add it to the shard's totals and policy (shard lock held)."""
+        old = shard.index.get(entry.key)
+        if old is not None:
+            frequency = max(frequency, shard.policies[old.group].frequency(entry.key))
+            self._account_remove_locked(shard, old)
+        shard.index[entry.key] = entry
+        shard.bytes += entry.size
+        shard.group_bytes[entry.group] = shard.group_bytes.get(entry.group, 0) + entry.size
+        policy = shard.policies.get(entry.group)
+        if policy is None:
+            policy = shard.policies[entry.group] = self._policy.spawn()
+        policy.on_insert(entry.key, entry.size, frequency)
+
+    def _account_remove_locked(self, shard: _Shard, entry: CacheEntry, *, evicted: bool = False) -> None:
+        del shard.index[entry.key]
+        shard.bytes -= entry.size
+        remaining = shard.group_bytes.get(entry.group, 0) - entry.size
+        if remaining > 0:
+            shard.group_bytes[entry.group] = remaining
+        else:
+            shard.group_bytes.pop(entry.group, None)
+        policy = shard.policies[entry.group]
+        if evicted:
+            policy.on_evict(entry.key)
+            shard.evictions += 1
+            shard.evicted_bytes += entry.size
+        else:
+            policy.on_remove(entry.key)
+        if not len(policy):
+            del shard.policies[entry.group]
+
+    def _total_bytes(self, group: Optional[str] = None) -> int:
+        # Unlocked reads of per-shard ints: eviction is best-effort anyway.
+        if group is None:
+            return sum(shard.bytes for shard in self._shards)
+        return sum(shard.group_bytes.get(group, 0) for shard in self._shards)
+
+    def _evict_for(self, inserted: CacheEntry) -> None:
+        """Evict until the group quota and the global cap hold again.
+
+        The just-inserted entry is never chosen — its caller is about to read
+        it.  The group quota is enforced first, then the global cap.
+        """
+        group = inserted.group
+        quota = self._group_max_bytes
+        if not (quota > 0 and self._total_bytes(group) > quota) and self._total_bytes() <= self._max_bytes:
             return
-        # Evict least-recently-validated first; entries never validated this
-        # process (timestamp 0) go first.
-        candidates = sorted(
-            self._index.keys(),
-            key=lambda k: self._validated_at.get(k, 0.0),
-        )
-        for key in candidates:
-            if self._total_bytes <= self._max_bytes:
-                break
-            self._drop_locked(key)
+        victims: list[CacheEntry] = []
+        with self._evict_lock:
+            if quota > 0:
+                while self._total_bytes(group) > quota:
+                    victim = self._evict_one(inserted.key, group)
+                    if victim is None:
+                        break
+                    victims.append(victim)
+            while self._total_bytes() > self._max_bytes:
+                victim = self._evict_one(inserted.key, None)
+                if victim is None:
+                    break
+                victims.append(victim)
+        if victims:
+            logger.debug(
+                "blob cache: evicted %d entries (%d bytes) via %s",
+                len(victims), sum(v.size for v in victims), self._policy.name,
+            )
+
+    @staticmethod
+    def _peek_locked(shard: _Shard, exclude: str, group: Optional[str]) -> Optional[tuple[float, str]]:
+        """Lowest-ranked entry in *shard* (within *group* if given), skipping *exclude*."""
+        if group is None:
+            policies = list(shard.policies.values())
+        else:
+            policies = [shard.policies[group]] if group in shard.policies else []
+        best = None
+        for policy in policies:
+            head = policy.peek(exclude)
+            if head is not None and (best is None or head < best):
+                best = head
+        return best
+
+    def _evict_one(self, exclude: str, group: Optional[str]) -> Optional[CacheEntry]:
+        """Remove the lowest-ranked entry across all shards (caller holds the evict lock).
+
+        Each shard only contributes its head, so this is one cheap peek per
+        shard rather than a sort of the whole index.  If the chosen entry is
+        read or replaced before its shard is re-locked, the pick is retried.
+        """
+        while True:
+            best: Optional[tuple[float, str, _Shard]] = None
+            for shard in self._shards:
+                with shard.lock:
+                    head = self._peek_locked(shard, exclude, group)
+                if head is not None and (best is None or head < best[:2]):
+                    best = (head[0], head[1], shard)
+            if best is None:
+                return None
+            priority, key, shard = best
+            with shard.lock:
+                if self._peek_locked(shard, exclude, group) != (priority, key):
+                    continue
+                victim = shard.index[key]
+                self._account_remove_locked(shard, victim, evicted=True)
+                shard.validated_at.pop(key, None)
+                self._bin_path(key).unlink(missing_ok=True)
+                self._meta_path(key).unlink(missing_ok=True)
+            return victim
+
+    def _drop(self, key: str) -> None:
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.index.get(key)
+            if entry is not None:
+                self._account_remove_locked(shard, entry)
+            shard.validated_at.pop(key, None)
+            self._bin_path(key).unlink(missing_ok=True)
+            self._meta_path(key).unlink(missing_ok=True)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
 
 
 _cache_singleton: Optional[BlobDiskCache] = None
@@ -227,12 +732,15 @@ def get_blob_disk_cache() -> BlobDiskCache:
     if _cache_singleton is None:
         with _singleton_lock:
             if _cache_singleton is None:
-                try:
-                    max_bytes = int(
-                        os.getenv("AZURE_BLOB_CACHE_MAX_BYTES", str(_DEFAULT_MAX_BYTES))
-                    )
-                except ValueError:
-                    max_bytes = _DEFAULT_MAX_BYTES
                 root = get_data_formulator_home() / CACHE_DIR_NAME
-                _cache_singleton = BlobDiskCache(root, max_bytes=max_bytes)
+                max_bytes = _env_int("AZURE_BLOB_CACHE_MAX_BYTES", _DEFAULT_MAX_BYTES)
+                _cache_singleton = BlobDiskCache(
+                    root,
+                    max_bytes=max_bytes,
+                    policy=make_eviction_policy(os.getenv("AZURE_BLOB_CACHE_POLICY", "lru")),
+                    group_max_bytes=_env_int(
+                        "AZURE_BLOB_CACHE_GROUP_MAX_BYTES", int(max_bytes * _DEFAULT_GROUP_SHARE),
+                    ),
+                )
+                atexit.register(_cache_singleton.flush_index)
     return _cache_singleton
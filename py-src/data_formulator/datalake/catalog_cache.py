@@ -152,6 +152,33 @@ def delete_catalog(workspace_root: Path | str, source_id: str) -> None:
         )
 
 
+def catalog_signature(workspace_root: Path | str) -> tuple:
+    """Cheap change token for the catalogs cached under *workspace_root*.
+
+    One ``(filename, mtime_ns, size)`` entry per cache file plus the
+    disabled-connectors flag (which changes what :func:`load_catalog`
+    returns), so any save or delete yields a new token.  Lets callers memoize
+    data derived from the catalogs without re-reading the JSON files.
+    """
+    try:
+        from flask import current_app
+        disabled = bool(
+            current_app.config.get('CLI_ARGS', {}).get('disable_data_connectors')
+        )
+    except RuntimeError:
+        disabled = False
+    cache_dir = _cache_dir(workspace_root)
+    entries: list[tuple[str, int, int]] = []
+    if cache_dir.exists():
+        for path in cache_dir.glob("*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((path.name, st.st_mtime_ns, st.st_size))
+    return (disabled, tuple(sorted(entries)))
+
+
 def list_cached_sources(workspace_root: Path | str) -> list[str]:
     """Return the original source IDs that have a cached catalog.
 
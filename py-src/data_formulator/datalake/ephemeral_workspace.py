@@ -15,6 +15,8 @@ Cleanup:
 """
 
 import atexit
+import base64
+import binascii
 import logging
 import shutil
 import tempfile
@@ -24,6 +26,7 @@ from typing import Any, Optional
 
 import pandas as pd
 
+from data_formulator.datalake.parquet_utils import read_columnar_payload
 from data_formulator.datalake.workspace import Workspace
 from werkzeug.utils import secure_filename
 
@@ -81,6 +84,9 @@ def construct_scratch_workspace(
         workspace_id: Workspace ID from X-Workspace-Id header.
         workspace_tables: ``[{"name": str, "rows": list[dict]}, ...]``
             — the full table data sent by the frontend from IndexedDB.
+            Instead of ``rows`` an entry may carry ``"arrow"``: a base64
+            Arrow IPC stream/file or parquet blob, which is written
+            without building a DataFrame.
 
     Returns:
         A :class:`Workspace` with all tables materialized as parquet files.
@@ -101,8 +107,19 @@ def construct_scratch_workspace(
 
     for table in workspace_tables:
         name = table.get("name")
+        if not name:
+            continue
+        encoded = table.get("arrow")
+        if encoded:
+            try:
+                arrow_table = read_columnar_payload(base64.b64decode(encoded))
+            except (binascii.Error, ValueError):
+                logger.warning(f"Skipping ephemeral table '{name}': invalid Arrow payload")
+                continue
+            ws.write_parquet_from_arrow(arrow_table, name)
+            continue
         rows = table.get("rows")
-        if not name or rows is None:
+        if rows is None:
             continue
         df = pd.DataFrame(rows) if rows else pd.DataFrame()
         ws.write_parquet(df, name)
@@ -276,6 +276,8 @@ def save_uploaded_file(
     # Atomically ensure unique name + add metadata in one lock acquisition.
     # This prevents the lost-update race where two concurrent uploads both
     # read the same (stale) metadata and the second save overwrites the first.
+    # ``immediate`` keeps that guarantee inside a metadata batch, whose
+    # deferred commit would otherwise replay the name chosen here blindly.
     def _add_unique(metadata):
         name = table_metadata.name
         if not overwrite and name in metadata.tables:
@@ -286,7 +288,7 @@ def save_uploaded_file(
             table_metadata.name = f"{base}_{counter}"
         metadata.add_table(table_metadata)
 
-    workspace._atomic_update_metadata(_add_unique)
+    workspace._atomic_update_metadata(_add_unique, immediate=not overwrite)
 
     logger.info(
         f"Saved uploaded file {actual_filename} as table {table_metadata.name} "
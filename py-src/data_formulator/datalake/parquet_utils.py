@@ -9,15 +9,18 @@ name sanitisation.  These utilities have **no dependency on Workspace** and
 are consumed by Workspace methods that handle metadata bookkeeping.
 """
 
+import gzip
 import hashlib
 import json
 import logging
 import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.ipc as ipc
 import pyarrow.parquet as pq
 
 from data_formulator.datalake.workspace_metadata import ColumnInfo, make_json_safe
@@ -172,32 +175,62 @@ def get_column_info(df: pd.DataFrame) -> list[ColumnInfo]:
 # Hashing
 # ---------------------------------------------------------------------------
 
+def _hash_sample_indices(num_rows: int, sample_rows: int) -> list[int]:
+    """Row positions hashed for a table of *num_rows*: head, first quartile and tail."""
+    n = sample_rows // 3
+    return (
+        list(range(n))
+        + list(range(num_rows // 4, num_rows // 4 + n))
+        + list(range(num_rows - n, num_rows))
+    )
+
+
+def _hash_table_sample(num_rows: int, column_names: list[str], sample: pa.Table | None) -> str:
+    hash_parts = [
+        f"rows:{num_rows}",
+        f"cols:{','.join(column_names)}",
+    ]
+    if sample is not None:
+        hash_parts.append(f"data:{sample.to_string()}")
+    content = '|'.join(hash_parts)
+    return hashlib.md5(content.encode()).hexdigest()
+
+
 def compute_arrow_table_hash(table: pa.Table, sample_rows: int = 100) -> str:
     """
     Compute an MD5 hash representing the Arrow Table content.
 
     Uses row count, column names, and sampled rows for efficiency.
     """
-    hash_parts = [
-        f"rows:{table.num_rows}",
-        f"cols:{','.join(table.column_names)}",
-    ]
-
+    sample = None
     if table.num_rows > 0:
         if table.num_rows <= sample_rows:
             sample = table
         else:
-            n = sample_rows // 3
-            indices = (
-                list(range(n))
-                + list(range(table.num_rows // 4, table.num_rows // 4 + n))
-                + list(range(table.num_rows - n, table.num_rows))
-            )
-            sample = table.take(indices)
-        hash_parts.append(f"data:{sample.to_string()}")
+            sample = table.take(_hash_sample_indices(table.num_rows, sample_rows))
+    return _hash_table_sample(table.num_rows, table.column_names, sample)
 
-    content = '|'.join(hash_parts)
-    return hashlib.md5(content.encode()).hexdigest()
+
+def compute_parquet_file_hash(source: Any, sample_rows: int = 100) -> str:
+    """Same hash as :func:`compute_arrow_table_hash` for a written parquet file.
+
+    Only the row groups holding sampled rows are read.
+    """
+    pf = pq.ParquetFile(source)
+    num_rows = pf.metadata.num_rows
+    if num_rows <= sample_rows:
+        return compute_arrow_table_hash(pf.read(), sample_rows)
+
+    indices = _hash_sample_indices(num_rows, sample_rows)
+    parts = []
+    start = 0
+    for i in range(pf.metadata.num_row_groups):
+        group_rows = pf.metadata.row_group(i).num_rows
+        local = [j - start for j in indices if start <= j < start + group_rows]
+        if local:
+            parts.append(pf.read_row_group(i).take(local))
+        start += group_rows
+    return _hash_table_sample(num_rows, pf.schema_arrow.names, pa.concat_tables(parts))
 
 
 def sanitize_dataframe_for_arrow(df: pd.DataFrame) -> pd.DataFrame:
@@ -254,3 +287,372 @@ def compute_dataframe_hash(df: pd.DataFrame, sample_rows: int = 100) -> str:
 
     content = '|'.join(hash_parts)
     return hashlib.md5(content.encode()).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Columnar request payloads
+# ---------------------------------------------------------------------------
+
+ARROW_STREAM_MIME_TYPE = "application/vnd.apache.arrow.stream"
+ARROW_FILE_MIME_TYPE = "application/vnd.apache.arrow.file"
+PARQUET_MIME_TYPE = "application/vnd.apache.parquet"
+
+COLUMNAR_MIME_TYPES = frozenset({
+    ARROW_STREAM_MIME_TYPE,
+    ARROW_FILE_MIME_TYPE,
+    PARQUET_MIME_TYPE,
+    "application/x-parquet",
+})
+
+_PARQUET_MAGIC = b"PAR1"
+_ARROW_FILE_MAGIC = b"ARROW1"
+_ARROW_STREAM_CONTINUATION = b"\xff\xff\xff\xff"
+
+
+def is_columnar_mime_type(content_type: str | None) -> bool:
+    """True if *content_type* names an Arrow IPC or parquet body."""
+    if not content_type:
+        return False
+    return content_type.split(";", 1)[0].strip().lower() in COLUMNAR_MIME_TYPES
+
+
+def is_columnar_payload(data: bytes, content_type: str | None = None) -> bool:
+    """True if *data* is (or is declared as) an Arrow IPC or parquet payload.
+
+    The magic bytes are checked as well as *content_type*, so a client that
+    uploads a ``Blob`` without setting its type is still recognised.
+    """
+    if is_columnar_mime_type(content_type):
+        return True
+    head = data[:6]
+    return (
+        head[:4] in (_PARQUET_MAGIC, _ARROW_STREAM_CONTINUATION)
+        or head == _ARROW_FILE_MAGIC
+    )
+
+
+def read_columnar_payload(data: bytes, content_type: str | None = None) -> pa.Table:
+    """Decode an Arrow IPC (stream or file) or parquet request body.
+
+    Gzip-compressed bodies are detected by their magic bytes, matching the
+    JSON upload paths.  The format is sniffed from the payload itself;
+    *content_type* only decides between the two Arrow IPC formats when the
+    bytes are ambiguous.  Raises ``ValueError`` if *data* cannot be decoded.
+    """
+    if data[:2] == b"\x1f\x8b":
+        data = gzip.decompress(data)
+    mime = (content_type or "").split(";", 1)[0].strip().lower()
+    try:
+        if data[:4] == _PARQUET_MAGIC or mime in (PARQUET_MIME_TYPE, "application/x-parquet"):
+            return pq.read_table(pa.BufferReader(data))
+        if data[:6] == _ARROW_FILE_MAGIC or mime == ARROW_FILE_MIME_TYPE:
+            return ipc.open_file(pa.BufferReader(data)).read_all()
+        return ipc.open_stream(pa.BufferReader(data)).read_all()
+    except (pa.ArrowInvalid, OSError) as e:
+        raise ValueError(f"Invalid Arrow/parquet payload: {e}") from e
+
+
+# ---------------------------------------------------------------------------
+# Incremental (delta) writes
+# ---------------------------------------------------------------------------
+
+# Target rows per row group when compacting a file that has accumulated
+# many small appended row groups.
+COMPACTION_ROW_GROUP_ROWS = 128 * 1024
+
+
+def parquet_column_max(pf: pq.ParquetFile, column: str) -> Any:
+    """Return the max of *column* from row-group statistics (no data scan).
+
+    Falls back to reading just that column when a row group lacks
+    statistics.  Returns ``None`` for an empty or all-null column.
+    """
+    idx = pf.schema_arrow.get_field_index(column)
+    if idx < 0:
+        raise KeyError(column)
+    best = None
+    for i in range(pf.metadata.num_row_groups):
+        stats = pf.metadata.row_group(i).column(idx).statistics
+        if stats is not None and stats.has_min_max:
+            value = stats.max
+        else:
+            col = pf.read_row_group(i, columns=[column]).column(0)
+            value = pc.max(col).as_py()
+        if value is not None and (best is None or value > best):
+            best = value
+    return best
+
+
+def _key_array(table: pa.Table, key_columns: list[str]) -> pa.Array:
+    """Single comparable key per row (composite keys joined as strings)."""
+    if len(key_columns) == 1:
+        return table.column(key_columns[0]).combine_chunks()
+    parts = [pc.cast(table.column(c), pa.string()).fill_null("") for c in key_columns]
+    return pc.binary_join_element_wise(*parts, "\x1f").combine_chunks()
+
+
+def prepare_parquet_delta(
+    sources: list[Any],
+    delta: pa.Table,
+    *,
+    watermark_column: str | None = None,
+    key_columns: list[str] | None = None,
+) -> tuple[pa.Table, Any]:
+    """Validate *delta* against an existing parquet table and apply the watermark.
+
+    *sources* are the table's parquet files (the main file first, then any
+    appended part files).  *delta* must have the same columns as the main
+    file (in any order) and be castable to its schema; otherwise
+    ``ValueError`` is raised and the caller should fall back to a full
+    rewrite.
+
+    In append mode (no *key_columns*), rows whose ``watermark_column`` is
+    not greater than the table's current max are dropped, so a retried
+    tick is idempotent.  The current max is read from row-group statistics.
+
+    Returns ``(delta, watermark)`` where *watermark* is the new max (or
+    ``None`` when no watermark column is given / the column is all null).
+    """
+    files = [pq.ParquetFile(source) for source in sources]
+    schema = files[0].schema_arrow
+    if delta.num_rows == 0:
+        # An empty delta (e.g. ``rows: []``) carries no usable schema.
+        delta = schema.empty_table()
+    if set(delta.column_names) != set(schema.names):
+        raise ValueError("Delta columns do not match the existing table")
+    try:
+        delta = delta.select(schema.names).cast(schema)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+        raise ValueError(f"Delta rows are not compatible with the table schema: {e}") from e
+    missing = [c for c in key_columns or [] if c not in schema.names]
+    if missing:
+        raise ValueError(f"Unknown key column(s): {', '.join(missing)}")
+
+    if not watermark_column:
+        return delta, None
+    if watermark_column not in schema.names:
+        raise ValueError(f"Unknown watermark column '{watermark_column}'")
+    watermark = None
+    for pf in files:
+        value = parquet_column_max(pf, watermark_column)
+        if value is not None and (watermark is None or value > watermark):
+            watermark = value
+    if watermark is not None and not key_columns:
+        delta = delta.filter(pc.greater(
+            delta.column(watermark_column),
+            pa.scalar(watermark, schema.field(watermark_column).type),
+        ))
+    if delta.num_rows:
+        delta_max = pc.max(delta.column(watermark_column)).as_py()
+        if delta_max is not None and (watermark is None or delta_max > watermark):
+            watermark = delta_max
+    return delta, make_json_safe(watermark)
+
+
+def _iter_row_groups(sources: list[Any]) -> Iterator[pa.Table]:
+    for source in sources:
+        pf = pq.ParquetFile(source)
+        for i in range(pf.metadata.num_row_groups):
+            yield pf.read_row_group(i)
+
+
+def append_arrow_to_parquet(
+    sources: list[Any],
+    sink: Any,
+    delta: pa.Table,
+    *,
+    key_columns: list[str] | None = None,
+    compression: str = DEFAULT_COMPRESSION,
+) -> dict[str, Any]:
+    """Write the row groups of *sources* plus *delta* (as a new row group) to *sink*.
+
+    Used for upserts, which must drop replaced rows from the existing
+    files; plain appends are written as separate part files instead.
+    Existing row groups are copied as Arrow tables — no pandas conversion,
+    no JSON — so callers only pay decoding cost for the new rows.  *delta*
+    must already match the file schema (see ``prepare_parquet_delta``).
+    With *key_columns* (upsert), existing rows whose key appears in *delta*
+    are dropped before the delta is appended.
+
+    Returns ``rows_appended``, ``rows_replaced``, ``num_rows`` and
+    ``num_row_groups``.
+    """
+    schema = pq.ParquetFile(sources[0]).schema_arrow
+    delta_keys = _key_array(delta, key_columns) if key_columns and delta.num_rows else None
+
+    rows_replaced = 0
+    num_rows = 0
+    num_row_groups = 0
+    writer = pq.ParquetWriter(sink, schema, compression=compression)
+    try:
+        for rg in _iter_row_groups(sources):
+            if delta_keys is not None:
+                kept = rg.filter(pc.invert(pc.is_in(_key_array(rg, key_columns), value_set=delta_keys)))
+                rows_replaced += rg.num_rows - kept.num_rows
+                rg = kept
+            if rg.num_rows:
+                writer.write_table(rg.cast(schema))
+                num_rows += rg.num_rows
+                num_row_groups += 1
+        if delta.num_rows:
+            writer.write_table(delta)
+            num_rows += delta.num_rows
+            num_row_groups += 1
+    finally:
+        writer.close()
+
+    return {
+        "rows_appended": delta.num_rows,
+        "rows_replaced": rows_replaced,
+        "num_rows": num_rows,
+        "num_row_groups": num_row_groups,
+    }
+
+
+def compact_parquet(
+    sources: list[Any],
+    sink: Any,
+    *,
+    row_group_rows: int = COMPACTION_ROW_GROUP_ROWS,
+    compression: str = DEFAULT_COMPRESSION,
+) -> int:
+    """Rewrite *sources* (main file, then part files) into *sink* as one file.
+
+    Row groups are ~*row_group_rows* rows; content and row order are
+    unchanged.  Returns the number of row groups written.
+    """
+    schema = pq.ParquetFile(sources[0]).schema_arrow
+    writer = pq.ParquetWriter(sink, schema, compression=compression)
+    groups = 0
+    pending: list[pa.RecordBatch] = []
+    pending_rows = 0
+    try:
+        # Batches never span row groups or files, so small appended groups
+        # are accumulated until a full target-size group can be written.
+        for source in sources:
+            for batch in pq.ParquetFile(source).iter_batches(batch_size=row_group_rows):
+                pending.append(pa.RecordBatch.from_arrays(batch.columns, schema=schema))
+                pending_rows += batch.num_rows
+                if pending_rows >= row_group_rows:
+                    writer.write_table(pa.Table.from_batches(pending), row_group_size=row_group_rows)
+                    groups += -(-pending_rows // row_group_rows)
+                    pending, pending_rows = [], 0
+        if pending:
+            writer.write_table(pa.Table.from_batches(pending), row_group_size=row_group_rows)
+            groups += 1
+    finally:
+        writer.close()
+    return groups
+
+
+# ---------------------------------------------------------------------------
+# Streaming writes
+# ---------------------------------------------------------------------------
+
+def _widen_type(current: pa.DataType, incoming: pa.DataType) -> pa.DataType:
+    if current.equals(incoming) or pa.types.is_null(incoming):
+        return current
+    if pa.types.is_null(current):
+        return incoming
+    numeric = (pa.types.is_integer, pa.types.is_floating)
+    if any(check(current) for check in numeric) and any(check(incoming) for check in numeric):
+        both_int = pa.types.is_integer(current) and pa.types.is_integer(incoming)
+        return pa.int64() if both_int else pa.float64()
+    try:
+        return pa.unify_schemas(
+            [pa.schema([("f", current)]), pa.schema([("f", incoming)])],
+            promote_options="permissive",
+        ).field("f").type
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return pa.string()
+
+
+def widen_schema(current: pa.Schema, incoming: pa.Schema) -> pa.Schema:
+    """Smallest schema both *current* and *incoming* batches fit into.
+
+    Columns keep *current*'s order with new columns appended.  Types widen
+    null → anything, int → int64 → float64, and to string when nothing
+    else holds both.
+    """
+    fields = {f.name: f.type for f in current}
+    for field in incoming:
+        fields[field.name] = _widen_type(fields.get(field.name, pa.null()), field.type)
+    return pa.schema(list(fields.items()))
+
+
+def conform_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Reorder, null-fill and cast *table* to *schema* (a :func:`widen_schema` result)."""
+    columns = []
+    for field in schema:
+        if field.name not in table.column_names:
+            columns.append(pa.nulls(table.num_rows, field.type))
+            continue
+        column = table.column(field.name)
+        try:
+            columns.append(column.cast(field.type))
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # e.g. struct → string, which Arrow has no cast for.
+            columns.append(pa.array(
+                [None if v is None else str(v) for v in column.to_pylist()], field.type,
+            ))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def write_parquet_batches(
+    batches: Iterable[pa.Table],
+    path: str | Path,
+    *,
+    compression: str = DEFAULT_COMPRESSION,
+) -> tuple[pa.Schema, int]:
+    """Stream *batches* into a parquet file at *path*, one batch at a time.
+
+    Only the batch in hand is held in memory.  If a later batch does not
+    fit the schema written so far (a CSV column that turned out to hold
+    floats, a JSON field first seen late), the schema is widened with
+    :func:`widen_schema` and the row groups already on disk are rewritten
+    to it once.  Returns the final schema and row count.
+    """
+    path = Path(path)
+    schema: pa.Schema | None = None
+    writer: pq.ParquetWriter | None = None
+    num_rows = 0
+    try:
+        for batch in batches:
+            if schema is None:
+                schema = batch.schema
+                writer = pq.ParquetWriter(path, schema, compression=compression)
+            elif not batch.schema.equals(schema):
+                widened = widen_schema(schema, batch.schema)
+                if not widened.equals(schema):
+                    logger.info("Widening streamed parquet schema of %s", path.name)
+                    writer.close()
+                    writer = _rewrite_parquet(path, widened, compression)
+                    schema = widened
+                batch = conform_table(batch, schema)
+            if batch.num_rows:
+                writer.write_table(batch, row_group_size=COMPACTION_ROW_GROUP_ROWS)
+                num_rows += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    if schema is None:
+        schema = pa.schema([])
+        pq.write_table(schema.empty_table(), path, compression=compression)
+    return schema, num_rows
+
+
+def _rewrite_parquet(path: Path, schema: pa.Schema, compression: str) -> pq.ParquetWriter:
+    """Copy *path* into a new file with *schema*; return the open writer."""
+    previous = path.with_name(path.name + ".widen")
+    path.replace(previous)
+    writer = pq.ParquetWriter(path, schema, compression=compression)
+    try:
+        with pq.ParquetFile(previous) as pf:
+            for i in range(pf.metadata.num_row_groups):
+                writer.write_table(conform_table(pf.read_row_group(i), schema))
+    except BaseException:
+        writer.close()
+        raise
+    finally:
+        previous.unlink()
+    return writer
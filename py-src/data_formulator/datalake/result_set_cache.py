@@ -0,0 +1,186 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+"""Process-wide cache of row counts and sorted result sets for table paging.
+
+The data grid scrolls a large parquet table by calling ``/sample-table``
+with a growing ``offset``.  Without caching every page re-runs the full
+filter + sort + ``LIMIT/OFFSET`` query and a separate ``COUNT(*)``, so deep
+scrolling costs O(N log N) per page.
+
+This module keeps two things, both keyed by a caller-supplied *query
+shape* that includes the table's data identity — workspace storage, table
+name and file size/mtime or ETag (``Workspace.table_data_identity``) — so
+any rewrite of the table misses and tables in different workspaces never
+share an entry:
+
+* **Counts** — small in-memory LRU; the count is computed once per shape.
+* **Sorted result sets** — the filtered + sorted rows are written once to a
+  parquet file with a dense ``#pos`` column and small row groups.  Later
+  pages read ``WHERE "#pos" BETWEEN …`` from that file, which DuckDB
+  answers from row-group statistics in O(page) instead of re-sorting.
+
+Result-set files live in a per-process temporary directory that is removed
+at exit; the number of files kept is bounded (LRU).
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Hashable
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+POSITION_COLUMN = "#pos"
+
+# Row-group size for materialised result sets: small enough that a page read
+# touches one or two row groups, large enough to keep per-group overhead low.
+RESULT_SET_ROW_GROUP_SIZE = 10_000
+
+
+def _sql_literal(path: Path) -> str:
+    return "'" + str(path).replace("\\", "\\\\").replace("'", "''") + "'"
+
+
+class ResultSetCache:
+    """Bounded LRU of query-shape counts and materialised sorted result sets."""
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        *,
+        max_result_sets: int = 16,
+        max_counts: int = 1024,
+    ) -> None:
+        self._root = root
+        self._max_result_sets = max_result_sets
+        self._max_counts = max_counts
+        self._lock = threading.Lock()
+        self._counts: OrderedDict[Hashable, int] = OrderedDict()
+        self._result_sets: OrderedDict[Hashable, Path] = OrderedDict()
+        # Single-flight: concurrent requests for the same shape wait for
+        # one materialisation instead of each sorting the table.
+        self._building: dict[Hashable, threading.Lock] = {}
+
+    # -- counts -------------------------------------------------------------
+
+    def get_count(self, key: Hashable, compute: Callable[[], int]) -> int:
+        with self._lock:
+            if key in self._counts:
+                self._counts.move_to_end(key)
+                return self._counts[key]
+        value = int(compute())
+        with self._lock:
+            self._counts[key] = value
+            while len(self._counts) > self._max_counts:
+                self._counts.popitem(last=False)
+        return value
+
+    # -- result sets --------------------------------------------------------
+
+    def has_result_set(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._result_sets
+
+    def get_page(
+        self,
+        key: Hashable,
+        materialize: Callable[[str], None],
+        offset: int,
+        limit: int,
+    ) -> pd.DataFrame:
+        """Return rows ``[offset, offset + limit)`` of the result set for *key*.
+
+        *materialize* is called at most once per key with a SQL string
+        literal naming the target file; it must write a parquet file with a
+        dense, ascending ``#pos`` column (see ``RESULT_SET_ROW_GROUP_SIZE``).
+        The ``#pos`` column is dropped from the returned frame.
+        """
+        path = self._ensure_result_set(key, materialize)
+        import duckdb
+
+        lo, hi = max(offset, 0), max(offset, 0) + max(limit, 0)
+        sql = (
+            f'SELECT * EXCLUDE ("{POSITION_COLUMN}") FROM read_parquet({_sql_literal(path)}) '
+            f'WHERE "{POSITION_COLUMN}" >= {lo} AND "{POSITION_COLUMN}" < {hi} '
+            f'ORDER BY "{POSITION_COLUMN}"'
+        )
+        conn = duckdb.connect(":memory:")
+        try:
+            return conn.execute(sql).fetchdf()
+        finally:
+            conn.close()
+
+    def _ensure_result_set(self, key: Hashable, materialize: Callable[[str], None]) -> Path:
+        with self._lock:
+            path = self._result_sets.get(key)
+            if path is not None and path.exists():
+                self._result_sets.move_to_end(key)
+                return path
+            build_lock = self._building.setdefault(key, threading.Lock())
+
+        with build_lock:
+            with self._lock:
+                path = self._result_sets.get(key)
+                if path is not None and path.exists():
+                    return path
+            root = self._ensure_root()
+            final = root / f"{uuid.uuid4().hex}.parquet"
+            tmp = root / f".{final.name}.tmp"
+            try:
+                materialize(_sql_literal(tmp))
+                os.replace(tmp, final)
+            except Exception:
+                tmp.unlink(missing_ok=True)
+                with self._lock:
+                    self._building.pop(key, None)
+                raise
+            # Publish before retiring the build entry and releasing the build
+            # lock, so a waiter always finds either the result or the build.
+            with self._lock:
+                self._result_sets[key] = final
+                self._building.pop(key, None)
+                while len(self._result_sets) > self._max_result_sets:
+                    _, evicted = self._result_sets.popitem(last=False)
+                    evicted.unlink(missing_ok=True)
+        return final
+
+    def _ensure_root(self) -> Path:
+        with self._lock:
+            if self._root is None:
+                self._root = Path(tempfile.mkdtemp(prefix="df-result-sets-"))
+                atexit.register(shutil.rmtree, self._root, True)
+            self._root.mkdir(parents=True, exist_ok=True)
+            return self._root
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            paths = list(self._result_sets.values())
+            self._result_sets.clear()
+        for path in paths:
+            path.unlink(missing_ok=True)
+
+
+_result_set_cache: ResultSetCache | None = None
+_result_set_cache_lock = threading.Lock()
+
+
+def get_result_set_cache() -> ResultSetCache:
+    """Return the process-wide ``ResultSetCache``."""
+    global _result_set_cache
+    if _result_set_cache is None:
+        with _result_set_cache_lock:
+            if _result_set_cache is None:
+                _result_set_cache = ResultSetCache()
+    return _result_set_cache
@@ -9,6 +9,7 @@ The workspace contains all their data files (uploaded and ingested)
 plus a workspace.yaml metadata file.
 """
 
+import hashlib
 import io
 import json
 import os
@@ -16,12 +17,15 @@ import re
 import shutil
 import logging
 import tempfile
+import threading
 import time
+import uuid
 import zipfile
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional
 
 import pandas as pd
 import pyarrow as pa
@@ -40,9 +44,14 @@ from data_formulator.datalake.parquet_utils import (
     sanitize_table_name,
     get_arrow_column_info,
     compute_arrow_table_hash,
+    compute_parquet_file_hash,
     get_column_info,
     compute_dataframe_hash,
     sanitize_dataframe_for_arrow,
+    prepare_parquet_delta,
+    append_arrow_to_parquet,
+    compact_parquet,
+    write_parquet_batches,
     DEFAULT_COMPRESSION,
 )
 from data_formulator.security.path_safety import ConfinedDir
@@ -51,6 +60,126 @@ from werkzeug.utils import secure_filename
 logger = logging.getLogger(__name__)
 
 
+def _table_changes(
+    metadata: WorkspaceMetadata, updater: Callable[[WorkspaceMetadata], None],
+) -> dict[str, Optional[TableMetadata]]:
+    """Run *updater* on *metadata* and return the tables it changed (``None`` = removed)."""
+    tables = metadata.tables
+    before = {name: t.to_dict() for name, t in tables.items()}
+    updater(metadata)
+    changes: dict[str, Optional[TableMetadata]] = {
+        name: None for name in before.keys() - tables.keys()
+    }
+    for name, table in tables.items():
+        if before.get(name) != table.to_dict():
+            changes[name] = table
+    return changes
+
+
+class _MetadataBatch:
+    """Pending table-level metadata changes for :meth:`Workspace.metadata_batch`.
+
+    Updaters run immediately against an in-memory working copy (so reads
+    inside the batch see them) and the resulting per-table diff is
+    recorded.  The commit replays only that diff — upserts and removals by
+    table name — onto freshly-read metadata, so concurrent changes to other
+    tables made outside the batch are preserved.
+    """
+
+    def __init__(self, working: WorkspaceMetadata) -> None:
+        self.lock = threading.RLock()
+        self.depth = 0
+        self.working = working
+        # table name -> new TableMetadata, or None for a removal
+        self.pending: dict[str, Optional[TableMetadata]] = {}
+
+    def apply(self, updater: Callable[[WorkspaceMetadata], None]) -> WorkspaceMetadata:
+        with self.lock:
+            self.pending.update(_table_changes(self.working, updater))
+            return self.working
+
+    def absorb(self, changes: dict[str, Optional[TableMetadata]]) -> WorkspaceMetadata:
+        """Mirror *changes* already committed outside the batch into the working copy.
+
+        They supersede any pending change to the same tables, so those are
+        dropped rather than replayed over the committed state.
+        """
+        with self.lock:
+            for name, table in changes.items():
+                self.pending.pop(name, None)
+                if table is None:
+                    self.working.remove_table(name)
+                else:
+                    self.working.add_table(table)
+            return self.working
+
+    def replay(self, metadata: WorkspaceMetadata) -> None:
+        for name, table in self.pending.items():
+            if table is None:
+                metadata.remove_table(name)
+            else:
+                metadata.add_table(table)
+
+
+# A table that has accumulated more appended part files than this is
+# compacted in the background.
+COMPACTION_PART_THRESHOLD = 32
+
+# Serialises writes to one table's parquet files — full writes, delta
+# appends and compaction — across Workspace instances.  Reads of a table
+# with appended parts hold it too, so compaction never runs mid-read.
+_TABLE_FILE_LOCKS: dict[tuple[str, str], threading.RLock] = {}
+_TABLE_FILE_LOCKS_GUARD = threading.Lock()
+
+_compaction_executor: ThreadPoolExecutor | None = None
+_compaction_pending: set[tuple[str, str]] = set()
+_compaction_guard = threading.Lock()
+
+
+def _table_file_lock(owner: str, table_name: str) -> threading.RLock:
+    with _TABLE_FILE_LOCKS_GUARD:
+        return _TABLE_FILE_LOCKS.setdefault((owner, table_name), threading.RLock())
+
+
+def _schedule_compaction(workspace: "Workspace", table_name: str) -> None:
+    """Compact *table_name* on the background compaction thread (deduplicated)."""
+    global _compaction_executor
+    key = (workspace._table_lock_owner(), table_name)
+    with _compaction_guard:
+        if key in _compaction_pending:
+            return
+        _compaction_pending.add(key)
+        if _compaction_executor is None:
+            _compaction_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="parquet-compact")
+
+    def _run() -> None:
+        try:
+            workspace.compact_table(table_name)
+        except Exception:
+            logger.warning("Background compaction of %s failed", table_name, exc_info=True)
+        finally:
+            with _compaction_guard:
+                _compaction_pending.discard(key)
+
+    _compaction_executor.submit(_run)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard-link *src* to *dst*, copying when linking is not possible (e.g. across filesystems)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _duckdb_read_parquet(paths: list) -> str:
+    """``read_parquet(...)`` SQL over one or more local parquet files."""
+    literals = ["'" + str(p).replace("\\", "\\\\").replace("'", "''") + "'" for p in paths]
+    if len(literals) == 1:
+        return f"read_parquet({literals[0]})"
+    return f"read_parquet([{', '.join(literals)}])"
+
+
 def get_data_formulator_home() -> Path:
     """
     Get the Data Formulator home directory.
@@ -397,6 +526,7 @@ class Workspace:
         file_path = self.get_file_path(table.filename)
         if file_path.exists():
             file_path.unlink()
+        self._delete_table_parts(table)
         
         removed = [False]
 
@@ -413,9 +543,44 @@ class Workspace:
     def _atomic_update_metadata(
         self,
         updater: "Callable[[WorkspaceMetadata], None]",
+        *,
+        immediate: bool = False,
     ) -> WorkspaceMetadata:
         """Atomically read → update → write workspace metadata.
 
+        Inside :meth:`metadata_batch` the update is applied in memory and
+        deferred to the batch commit; otherwise it is written immediately
+        via :meth:`_commit_metadata_update`.
+
+        Pass ``immediate=True`` for updaters whose result depends on the
+        persisted state at write time (e.g. picking a unique table name):
+        the batch commit replays changes by table name, so such a decision
+        made against the in-memory copy could collide with a concurrent
+        request.  They are committed right away, under the same lock as any
+        other commit, and mirrored into the open batch.
+        """
+        batch = getattr(self, "_metadata_batch", None)
+        if batch is None:
+            return self._commit_metadata_update(updater)
+        if not immediate:
+            self._metadata_cache = batch.apply(updater)
+            return self._metadata_cache
+        changes: dict[str, Optional[TableMetadata]] = {}
+
+        def _tracked(metadata: WorkspaceMetadata) -> None:
+            changes.clear()
+            changes.update(_table_changes(metadata, updater))
+
+        self._commit_metadata_update(_tracked)
+        self._metadata_cache = batch.absorb(changes)
+        return self._metadata_cache
+
+    def _commit_metadata_update(
+        self,
+        updater: "Callable[[WorkspaceMetadata], None]",
+    ) -> WorkspaceMetadata:
+        """Run one read → update → write cycle against persisted metadata.
+
         Uses :func:`update_metadata` which holds a **single** file lock
         across the entire read-modify-write cycle, preventing lost updates
         when multiple requests modify metadata concurrently.
@@ -426,6 +591,52 @@ class Workspace:
         self._metadata_cache = update_metadata(self._path, updater)
         return self._metadata_cache
 
+    @contextmanager
+    def metadata_batch(self):
+        """Group the metadata changes of one logical operation into one write.
+
+        Every table add, update and removal made on this workspace inside the
+        block (including from other threads sharing the instance) is applied
+        to an in-memory copy and committed with a single
+        :meth:`_commit_metadata_update` on exit.  Nested blocks join the
+        outermost one.  Pending changes are committed even if the block
+        raises, since the data files they describe have already been
+        written.
+
+        Usage::
+
+            with workspace.metadata_batch():
+                for t in tables:
+                    workspace.write_parquet_from_arrow(t, t_name)
+        """
+        if not hasattr(self, "_metadata_batch_lock"):
+            self._metadata_batch_lock = threading.Lock()
+        with self._metadata_batch_lock:
+            batch = getattr(self, "_metadata_batch", None)
+            if batch is None:
+                self.invalidate_metadata_cache()
+                batch = _MetadataBatch(self.get_metadata())
+                self._metadata_batch = batch
+            batch.depth += 1
+        try:
+            yield batch.working
+        finally:
+            with self._metadata_batch_lock:
+                batch.depth -= 1
+                outermost = batch.depth == 0
+                if outermost:
+                    self._metadata_batch = None
+            if outermost and batch.pending:
+                try:
+                    self._commit_metadata_update(batch.replay)
+                except Exception:
+                    self.invalidate_metadata_cache()
+                    raise
+                logger.debug(
+                    "Committed %d batched metadata change(s) for workspace %s",
+                    len(batch.pending), self._safe_id,
+                )
+
     def get_metadata(self) -> WorkspaceMetadata:
         if self._metadata_cache is not None:
             return self._metadata_cache
@@ -504,6 +715,7 @@ class Workspace:
             for name, table in list(metadata.tables.items()):
                 if table.source_file == safe_filename or table.filename == safe_filename:
                     files_to_delete.append(table.filename)
+                    files_to_delete.extend(table.parts or [])
                     metadata.remove_table(name)
                     deleted.append(name)
 
@@ -580,6 +792,8 @@ class Workspace:
 
         file_type = metadata.file_type
 
+        if file_type == "parquet" and metadata.parts:
+            return self._read_parquet_table(metadata.name).to_pandas()
         if file_type == "parquet":
             return pd.read_parquet(file_path)
         elif file_type == "csv":
@@ -613,6 +827,18 @@ class Workspace:
         This is the preferred path because it avoids pandas conversion.
         """
         safe_name = sanitize_table_name(table_name)
+        with _table_file_lock(self._table_lock_owner(), safe_name):
+            return self._write_parquet_from_arrow_locked(
+                table, safe_name, compression, source_info,
+            )
+
+    def _write_parquet_from_arrow_locked(
+        self,
+        table: pa.Table,
+        safe_name: str,
+        compression: str,
+        source_info: Optional[dict[str, Any]],
+    ) -> TableMetadata:
         filename = f"{safe_name}.parquet"
 
         # Overwrite existing file if present
@@ -621,6 +847,7 @@ class Workspace:
             old_file = self.get_file_path(metadata.tables[safe_name].filename)
             if old_file.exists():
                 old_file.unlink()
+            self._delete_table_parts(metadata.tables[safe_name])
 
         file_path = self.get_file_path(filename)
         pq.write_table(table, file_path, compression=compression)
@@ -654,6 +881,81 @@ class Workspace:
 
         return table_metadata
 
+    def write_parquet_from_batches(
+        self,
+        batches: Iterable[pa.Table],
+        table_name: str,
+        compression: str = DEFAULT_COMPRESSION,
+        source_info: Optional[dict[str, Any]] = None,
+    ) -> TableMetadata:
+        """
+        Write a stream of PyArrow Tables to parquet, one row group at a time.
+
+        Used for imports too large to hold as one table; only the batch in
+        hand is in memory.  Batches whose schema drifts are widened (see
+        ``write_parquet_batches``).
+        """
+        safe_name = sanitize_table_name(table_name)
+        with _table_file_lock(self._table_lock_owner(), safe_name):
+            return self._write_parquet_from_batches_locked(
+                batches, safe_name, compression, source_info,
+            )
+
+    def _write_parquet_from_batches_locked(
+        self,
+        batches: Iterable[pa.Table],
+        safe_name: str,
+        compression: str,
+        source_info: Optional[dict[str, Any]],
+    ) -> TableMetadata:
+        filename = f"{safe_name}.parquet"
+        file_path = self.get_file_path(filename)
+        # Stream into a side file so a failed or cancelled import leaves
+        # the previous version of the table intact.
+        partial_path = file_path.with_name(f".{filename}.partial")
+        try:
+            schema, num_rows = write_parquet_batches(batches, partial_path, compression=compression)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+
+        metadata = self.get_metadata()
+        if safe_name in metadata.tables:
+            old_file = self.get_file_path(metadata.tables[safe_name].filename)
+            if old_file.exists() and old_file != file_path:
+                old_file.unlink()
+            self._delete_table_parts(metadata.tables[safe_name])
+        partial_path.replace(file_path)
+
+        now = datetime.now(timezone.utc)
+        table_metadata = TableMetadata(
+            name=safe_name,
+            source_type="data_loader",
+            filename=filename,
+            file_type="parquet",
+            created_at=now,
+            content_hash=compute_parquet_file_hash(file_path),
+            file_size=file_path.stat().st_size,
+            row_count=num_rows,
+            columns=get_arrow_column_info(schema.empty_table()),
+            last_synced=now,
+        )
+
+        if source_info:
+            table_metadata.loader_type = source_info.get('loader_type')
+            table_metadata.loader_params = source_info.get('loader_params')
+            table_metadata.source_table = source_info.get('source_table')
+            table_metadata.source_query = source_info.get('source_query')
+            table_metadata.import_options = source_info.get('import_options')
+
+        self.add_table_metadata(table_metadata)
+        logger.info(
+            f"Wrote parquet {filename}: {num_rows} rows, "
+            f"{len(schema)} cols ({table_metadata.file_size} bytes) [Arrow stream]"
+        )
+
+        return table_metadata
+
     def write_parquet(
         self,
         df: pd.DataFrame,
@@ -663,6 +965,16 @@ class Workspace:
     ) -> TableMetadata:
         """Write a pandas DataFrame to parquet."""
         safe_name = sanitize_table_name(table_name)
+        with _table_file_lock(self._table_lock_owner(), safe_name):
+            return self._write_parquet_locked(df, safe_name, compression, source_info)
+
+    def _write_parquet_locked(
+        self,
+        df: pd.DataFrame,
+        safe_name: str,
+        compression: str,
+        source_info: Optional[dict[str, Any]],
+    ) -> TableMetadata:
         filename = f"{safe_name}.parquet"
 
         metadata = self.get_metadata()
@@ -670,6 +982,7 @@ class Workspace:
             old_file = self.get_file_path(metadata.tables[safe_name].filename)
             if old_file.exists():
                 old_file.unlink()
+            self._delete_table_parts(metadata.tables[safe_name])
 
         file_path = self.get_file_path(filename)
         # Sanitize DataFrame to handle mixed types in object columns
@@ -706,23 +1019,225 @@ class Workspace:
 
         return table_metadata
 
-    def get_parquet_schema(self, table_name: str) -> dict:
-        """Get schema information for a parquet table without reading all data."""
+    def append_parquet(
+        self,
+        df: pd.DataFrame | pa.Table,
+        table_name: str,
+        *,
+        watermark_column: Optional[str] = None,
+        key_columns: Optional[list[str]] = None,
+        compression: str = DEFAULT_COMPRESSION,
+    ) -> tuple[TableMetadata, dict[str, Any]]:
+        """Append (or, with *key_columns*, upsert) rows to an existing parquet table.
+
+        *df* may be a DataFrame or an Arrow table; only *df* is converted.
+        An append writes *df* as a new part file next to the table's main
+        file (recorded in ``TableMetadata.parts``), so a tick costs
+        O(delta) and the existing data is neither read nor rewritten.  Once
+        more than ``COMPACTION_PART_THRESHOLD`` parts accumulate they are
+        folded into the main file in the background.  An upsert has to drop
+        replaced rows, so it rewrites the table (folding any parts).  With
+        *watermark_column*, rows at or below the table's current max are
+        skipped (append mode), making retried deltas idempotent.
+
+        Returns ``(metadata, info)`` where *info* has ``rows_appended``,
+        ``rows_replaced`` and ``watermark``.  Raises ``FileNotFoundError``
+        for unknown tables and ``ValueError`` when *df* does not match the
+        table schema (callers should fall back to ``write_parquet``).
+        """
+        safe_name = sanitize_table_name(table_name)
+        if isinstance(df, pa.Table):
+            delta = df
+        else:
+            delta = pa.Table.from_pandas(sanitize_dataframe_for_arrow(df), preserve_index=False)
+        with _table_file_lock(self._table_lock_owner(), safe_name):
+            meta = self.get_table_metadata(safe_name)
+            if meta is None:
+                raise FileNotFoundError(f"Table not found: {table_name}")
+            if meta.file_type != "parquet":
+                raise ValueError(f"Table {table_name} is not a parquet file")
+
+            old_parts = list(meta.parts or [])
+            sources = [self._open_parquet_source(f) for f in [meta.filename, *old_parts]]
+            delta, watermark = prepare_parquet_delta(
+                sources, delta, watermark_column=watermark_column, key_columns=key_columns,
+            )
+            info: dict[str, Any] = {"rows_appended": 0, "rows_replaced": 0, "watermark": watermark}
+            if not delta.num_rows:
+                return meta, info
+
+            if key_columns:
+                result: dict[str, Any] = {}
+
+                def _write(source: Any, sink: Any) -> None:
+                    result.update(append_arrow_to_parquet(
+                        [source, *sources[1:]], sink, delta,
+                        key_columns=key_columns, compression=compression,
+                    ))
+
+                meta.file_size = self._replace_parquet_file(meta.filename, _write)
+                meta.parts = None
+                meta.row_count = result["num_rows"]
+                info["rows_replaced"] = result["rows_replaced"]
+            else:
+                part = f".{meta.filename}.part-{uuid.uuid4().hex[:12]}.parquet"
+                part_size = self._write_part_file(part, delta, compression)
+                meta.parts = [*old_parts, part]
+                meta.file_size = (meta.file_size or 0) + part_size
+                meta.row_count = (meta.row_count or 0) + delta.num_rows
+            info["rows_appended"] = delta.num_rows
+            # The content hash is sampled, so chain it with the delta's hash
+            # to guarantee it changes on every append.
+            meta.content_hash = hashlib.md5(
+                f"{meta.content_hash}|{compute_arrow_table_hash(delta)}|rows:{meta.row_count}".encode()
+            ).hexdigest()
+            meta.last_synced = datetime.now(timezone.utc)
+            try:
+                self.add_table_metadata(meta)
+            except BaseException:
+                if not key_columns:
+                    self._delete_data_file(meta.parts[-1])
+                raise
+            if key_columns:
+                self._delete_data_files(old_parts)
+
+        if len(meta.parts or []) > COMPACTION_PART_THRESHOLD:
+            _schedule_compaction(self, safe_name)
+        return meta, info
+
+    def compact_table(self, table_name: str) -> bool:
+        """Fold a parquet table's appended part files into its main file.
+
+        Content, row order and the content hash are unchanged.  Returns
+        True if the table had parts and was rewritten.
+        """
+        safe_name = sanitize_table_name(table_name)
+        with _table_file_lock(self._table_lock_owner(), safe_name):
+            meta = self.get_table_metadata(safe_name)
+            if meta is None or meta.file_type != "parquet" or not meta.parts:
+                return False
+            parts = list(meta.parts)
+            part_sources = [self._open_parquet_source(f) for f in parts]
+            meta.file_size = self._replace_parquet_file(
+                meta.filename,
+                lambda source, sink: compact_parquet([source, *part_sources], sink),
+            )
+            meta.parts = None
+            self.add_table_metadata(meta)
+            self._delete_data_files(parts)
+        logger.info(f"Compacted parquet {meta.filename} ({len(parts)} parts, {meta.file_size} bytes)")
+        return True
+
+    def _appended_tables(self) -> dict[str, TableMetadata]:
+        """Parquet tables that currently have appended part files, by name."""
+        return {
+            name: meta for name, meta in self.get_metadata().tables.items()
+            if meta.parts and meta.file_type == "parquet"
+        }
+
+    def _write_merged_tables(self, data_dir: Path, tables: Iterable[str]) -> None:
+        """Write each of *tables* (main file plus parts) into *data_dir* as one file.
+
+        Used to hand appended tables to code that opens ``<filename>``
+        directly; the stored files are left as they are.
+        """
+        data_dir.mkdir(parents=True, exist_ok=True)
+        for name in tables:
+            with self._parquet_files(name) as (meta, paths):
+                compact_parquet(paths, str(data_dir / meta.filename))
+
+    def _table_lock_owner(self) -> str:
+        """Process-wide identity of this workspace's storage (for table write locks)."""
+        return str(self._path)
+
+    def _open_parquet_source(self, filename: str) -> Any:
+        """Return something ``pq.ParquetFile`` can read for *filename*."""
+        return self.get_file_path(filename)
+
+    def _local_data_path(self, filename: str) -> Path:
+        """Local filesystem path of data file *filename* (for DuckDB / pyarrow)."""
+        path = self.get_file_path(filename)
+        if not path.exists():
+            raise FileNotFoundError(f"Parquet file not found: {path}")
+        return path
+
+    def _replace_parquet_file(self, filename: str, write: Callable[[Any, Any], None]) -> int:
+        """Atomically rewrite *filename* via ``write(source, sink)``; return the new size."""
+        path = self.get_file_path(filename)
+        tmp = path.with_name(f".{path.name}.tmp")
+        try:
+            write(path, tmp)
+            os.replace(tmp, path)
+        except Exception:
+            tmp.unlink(missing_ok=True)
+            raise
+        return path.stat().st_size
+
+    def _write_part_file(self, filename: str, table: pa.Table, compression: str) -> int:
+        """Write *table* as the new data file *filename*; return its size."""
+        path = self.get_file_path(filename)
+        pq.write_table(table, path, compression=compression)
+        return path.stat().st_size
+
+    def _delete_data_file(self, filename: str) -> None:
+        self.get_file_path(filename).unlink(missing_ok=True)
+
+    def _delete_data_files(self, filenames: list[str]) -> None:
+        for filename in filenames:
+            try:
+                self._delete_data_file(filename)
+            except Exception as e:
+                logger.warning(f"Failed to delete file {filename}: {e}")
+
+    def _delete_table_parts(self, meta: TableMetadata) -> None:
+        """Remove the appended part files of a table that is being replaced or deleted."""
+        self._delete_data_files(list(meta.parts or []))
+
+    def parquet_files(self, table_name: str):
+        """Context manager yielding ``(meta, paths)`` for a parquet table.
+
+        The public form of :meth:`_parquet_files`, for readers outside the
+        datalake that need every file of a table (main file plus appended
+        parts) rather than :meth:`get_parquet_path`.
+        """
+        return self._parquet_files(table_name)
+
+    @contextmanager
+    def _parquet_files(self, table_name: str):
+        """Yield ``(meta, paths)``: local paths of a parquet table's files.
+
+        *paths* is the main file followed by any appended part files.  For
+        a table with parts the table lock is held while the caller reads,
+        so a concurrent compaction cannot fold the parts in mid-read.
+        """
         meta = self.get_table_metadata(table_name)
         if meta is None:
             raise FileNotFoundError(f"Table not found: {table_name}")
         if meta.file_type != "parquet":
             raise ValueError(f"Table {table_name} is not a parquet file")
-        path = self.get_file_path(meta.filename)
-        if not path.exists():
-            raise FileNotFoundError(f"Parquet file not found: {path}")
+        if not meta.parts:
+            yield meta, [self._local_data_path(meta.filename)]
+            return
+        with _table_file_lock(self._table_lock_owner(), meta.name):
+            meta = self.get_table_metadata(meta.name) or meta
+            yield meta, [self._local_data_path(f) for f in [meta.filename, *(meta.parts or [])]]
+
+    def _read_parquet_table(self, table_name: str) -> pa.Table:
+        """Read a parquet table (main file plus appended parts) as one Arrow table."""
+        with self._parquet_files(table_name) as (_meta, paths):
+            tables = [pq.read_table(p) for p in paths]
+        schema = tables[0].schema
+        return pa.concat_tables([tables[0], *(t.cast(schema) for t in tables[1:])])
 
-        pf = pq.ParquetFile(path)
-        schema = pf.schema_arrow
+    def get_parquet_schema(self, table_name: str) -> dict:
+        """Get schema information for a parquet table without reading all data."""
+        with self._parquet_files(table_name) as (meta, paths):
+            files = [pq.ParquetFile(p) for p in paths]
+        schema = files[0].schema_arrow
         return {
             "table_name": table_name,
             "filename": meta.filename,
-            "num_rows": pf.metadata.num_rows,
+            "num_rows": sum(pf.metadata.num_rows for pf in files),
             "num_columns": len(schema),
             "columns": [
                 {"name": f.name, "type": str(f.type), "nullable": f.nullable}
@@ -732,8 +1247,37 @@ class Workspace:
             "last_synced": meta.last_synced.isoformat() if meta.last_synced else None,
         }
 
+    def table_data_identity(self, table_name: str) -> Optional[tuple]:
+        """Identity of a table's current data, for process-wide caches.
+
+        Returns ``(workspace storage, table name, files)`` where *files*
+        identifies the main file and every appended part by size and mtime
+        (ETag on blob storage).  Unlike ``content_hash`` — a sampled digest —
+        this changes whenever the stored bytes do and never collides across
+        workspaces.  Returns ``None`` for unknown tables or files that cannot
+        be inspected; callers should then skip caching.
+        """
+        meta = self.get_table_metadata(table_name)
+        if meta is None:
+            return None
+        try:
+            files = tuple(self._data_file_identity(f) for f in [meta.filename, *(meta.parts or [])])
+        except OSError:
+            return None
+        return (self._table_lock_owner(), meta.name, files)
+
+    def _data_file_identity(self, filename: str) -> tuple:
+        """``(filename, size, mtime_ns)`` of data file *filename*."""
+        st = self.get_file_path(filename).stat()
+        return (filename, st.st_size, st.st_mtime_ns)
+
     def get_parquet_path(self, table_name: str) -> Path:
-        """Return the resolved filesystem path of the parquet file for *table_name*."""
+        """Return the resolved filesystem path of the parquet file for *table_name*.
+
+        This is the table's main file only: rows appended since the last
+        compaction live in part files.  Read whole tables through
+        :meth:`parquet_files` or :meth:`run_parquet_sql`.
+        """
         meta = self.get_table_metadata(table_name)
         if meta is None:
             raise FileNotFoundError(f"Table not found: {table_name}")
@@ -749,7 +1293,8 @@ class Workspace:
         Run a DuckDB SQL query against a parquet table.
 
         The *sql* string must contain a ``{parquet}`` placeholder which will
-        be replaced with ``read_parquet('<path>')``.
+        be replaced with ``read_parquet(...)`` over the table's file (and
+        any appended part files).
         Example:  ``SELECT * FROM {parquet} AS t LIMIT 10``
 
         This gives efficient column-pruned / row-group-skipped reads on
@@ -757,16 +1302,15 @@ class Workspace:
         """
         import duckdb
 
-        path = self.get_parquet_path(table_name)
-        path_escaped = str(path).replace("\\", "\\\\").replace("'", "''")
         if "{parquet}" not in sql:
             raise ValueError("SQL must contain {parquet} placeholder")
-        full_sql = sql.format(parquet=f"read_parquet('{path_escaped}')")
-        conn = duckdb.connect(":memory:")
-        try:
-            return conn.execute(full_sql).fetchdf()
-        finally:
-            conn.close()
+        with self._parquet_files(table_name) as (_meta, paths):
+            full_sql = sql.format(parquet=_duckdb_read_parquet(paths))
+            conn = duckdb.connect(":memory:")
+            try:
+                return conn.execute(full_sql).fetchdf()
+            finally:
+                conn.close()
 
     def refresh_parquet_from_arrow(
         self,
@@ -829,8 +1373,29 @@ class Workspace:
 
             with workspace.local_dir() as wd:
                 subprocess.run(["python", "script.py"], cwd=wd)
+
+        When tables have appended parquet parts, code reading
+        ``data/<table>.parquet`` must still see every row, so the yielded
+        directory is then a temporary copy of the workspace — files are
+        hard-linked where possible — in which only those tables are written
+        out merged.  Stored files are never rewritten here.
         """
-        yield self._path
+        appended = self._appended_tables()
+        if not appended:
+            yield self._path
+            return
+        skip = {f for meta in appended.values() for f in [meta.filename, *meta.parts]}
+        data_dir = self._path / "data"
+        tmp = Path(tempfile.mkdtemp(prefix="df_ws_"))
+        try:
+            shutil.copytree(
+                self._path, tmp, dirs_exist_ok=True, copy_function=_link_or_copy,
+                ignore=lambda d, names: [n for n in names if n in skip] if Path(d) == data_dir else [],
+            )
+            self._write_merged_tables(tmp / "data", appended)
+            yield tmp
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
 
     def save_workspace_snapshot(self, dst: Path) -> None:
         """Copy all workspace files (including metadata) to *dst* directory.
@@ -96,10 +96,17 @@ class WorkspaceLock:
     Context manager for acquiring an exclusive lock on workspace metadata.
     Prevents race conditions when multiple processes/threads modify metadata concurrently.
     Uses LockFileEx on Windows and fcntl.flock on Unix — both provide whole-file locking.
+    ``lock_filename`` lets other per-directory state (e.g. the job table) use
+    its own lock file.
     """
 
-    def __init__(self, workspace_path: Path, timeout: float = MAX_LOCK_WAIT_SECONDS):
-        self.lock_file = workspace_path / LOCK_FILENAME
+    def __init__(
+        self,
+        workspace_path: Path,
+        timeout: float = MAX_LOCK_WAIT_SECONDS,
+        lock_filename: str = LOCK_FILENAME,
+    ):
+        self.lock_file = workspace_path / lock_filename
         self.timeout = timeout
         self.lock_fd = None
 
@@ -225,6 +232,9 @@ class TableMetadata:
     original_name: str | None = None
     source_file: str | None = None
     description: str | None = None
+    # Parquet files holding appended deltas, in append order; read together
+    # with ``filename`` until compaction folds them in.
+    parts: list[str] | None = None
 
     def to_dict(self) -> dict:
         """Convert to dictionary for YAML serialization."""
@@ -261,6 +271,8 @@ class TableMetadata:
             result["source_file"] = self.source_file
         if self.description is not None:
             result["description"] = self.description
+        if self.parts:
+            result["parts"] = list(self.parts)
         
         return result
 
@@ -298,6 +310,7 @@ class TableMetadata:
             original_name=data.get("original_name"),
             source_file=data.get("source_file"),
             description=data.get("description"),
+            parts=data.get("parts"),
         )
 
 
@@ -0,0 +1,625 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+"""In-process background job queue for long-running data operations.
+
+Large connector imports/refreshes and ``/sync-table-data`` writes used to
+run inside the Flask request, tying up a server worker for minutes and
+tripping proxy timeouts.  Routes that support ``"async": true`` now hand
+the work to this module and immediately return a job handle::
+
+    {"job_id": "…", "status": "queued"}
+
+The frontend polls ``/api/jobs/get-job`` (same pattern as
+``/api/connectors/get-catalog-progress``) until the job reaches a terminal
+status, and may ``cancel`` or ``retry`` it.
+
+Design notes:
+
+* One process-wide ``ThreadPoolExecutor`` (size ``DF_JOB_WORKERS``,
+  default 4) runs every job, so a burst of big imports queues up instead
+  of starving the request workers.
+* Each user has a job table persisted to ``<user_home>/jobs.json``.  Server
+  worker processes share it: every read and status transition re-reads the
+  file under a file lock (``.jobs.lock``) and writes it back before the
+  lock is released, so a job submitted through one worker can be polled,
+  listed and cancelled through any other.  Progress messages are written
+  at most once per ``_SYNC_SECONDS``.
+* Each manager holds a liveness lock in ``<user_home>/.job_owners/`` and
+  stamps it on the jobs it runs.  Queued or running jobs whose owner no
+  longer holds its lock (the process exited) are reported as failed; their
+  work function is gone, so they cannot be retried.  Only the worker that
+  ran a job can retry it.
+* Cancellation is cooperative: a queued job is dropped before it starts,
+  a running job stops at its next ``JobContext.raise_if_cancelled()``
+  checkpoint.  Work already committed before the checkpoint is kept.  A
+  cancel received by another worker is recorded in the job table and
+  picked up by the owner within ``_SYNC_SECONDS``.
+* Job functions run without a request context — everything that depends
+  on the request (identity, workspace, loader) must be resolved by the
+  route before ``submit``.  The Flask app context is re-pushed so helpers
+  that read ``current_app.config`` keep working.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from data_formulator.errors import AppError, ErrorCode
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+TERMINAL_STATUSES = frozenset({JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED})
+
+JOBS_FILENAME = "jobs.json"
+JOBS_LOCK_FILENAME = ".jobs.lock"
+JOB_OWNERS_DIRNAME = ".job_owners"
+
+# How often a running job publishes its progress message and checks for a
+# cancel requested through another worker.
+_SYNC_SECONDS = 1.0
+
+# Finished jobs kept per user in the persisted table; older ones are pruned.
+_MAX_FINISHED_JOBS = 100
+
+# Failed / cancelled jobs per user whose function is kept for ``retry``.  A
+# job function closes over the workspace, the loader and often the data
+# being imported, so older ones are released.
+_MAX_RETRYABLE_JOBS = 5
+
+
+class JobCancelled(Exception):
+    """Raised from a job checkpoint once cancellation has been requested."""
+
+
+@dataclass
+class Job:
+    """One row of the per-user job table."""
+
+    job_id: str
+    kind: str
+    status: str = JOB_QUEUED
+    message: str = ""
+    params: dict[str, Any] = field(default_factory=dict)
+    result: dict[str, Any] | None = None
+    error: dict[str, Any] | None = None
+    attempts: int = 0
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    # Token of the ``JobManager`` that runs the job (see ``JOB_OWNERS_DIRNAME``).
+    owner: str = ""
+    cancel_requested: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Job":
+        known = {k: data[k] for k in cls.__dataclass_fields__ if k in data}
+        return cls(**known)
+
+
+class JobContext:
+    """Handle passed to a job function for progress and cancellation."""
+
+    def __init__(self, manager: "JobManager", identity_id: str, job_id: str,
+                 cancel_event: threading.Event) -> None:
+        self._manager = manager
+        self._identity_id = identity_id
+        self.job_id = job_id
+        self._cancel_event = cancel_event
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def report(self, message: str) -> None:
+        """Publish a progress message for pollers."""
+        self._manager._set_message(self._identity_id, self.job_id, message)
+
+    def raise_if_cancelled(self) -> None:
+        if not self._cancel_event.is_set():
+            self._manager._sync_running(self._identity_id, self.job_id)
+        if self._cancel_event.is_set():
+            raise JobCancelled(self.job_id)
+
+
+JobFunction = Callable[[JobContext], dict[str, Any]]
+ErrorClassifier = Callable[[Exception], dict[str, Any]]
+
+
+@dataclass
+class _Runner:
+    """In-memory state for a job submitted by this process."""
+
+    fn: JobFunction
+    classify_error: ErrorClassifier | None
+    app: Any
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    future: Future | None = None
+    synced_at: float = 0.0
+    message_dirty: bool = False
+
+
+class JobManager:
+    """Thread pool plus per-user persisted job tables."""
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="df-job",
+        )
+        self._lock = threading.RLock()
+        self._owner = uuid.uuid4().hex
+        # identity_id -> {job_id: Job}, as last read from / written to disk
+        self._jobs: dict[str, dict[str, Job]] = {}
+        # identity_id -> path of that user's jobs.json
+        self._table_paths: dict[str, Path] = {}
+        # identity_id -> (inode, mtime_ns, size) of jobs.json when last synced
+        self._table_stats: dict[str, tuple[int, int, int]] = {}
+        # user home -> held liveness lock (see ``_claim_owner``)
+        self._owner_locks: dict[Path, Any] = {}
+        self._runners: dict[str, _Runner] = {}
+
+    # -- public API ---------------------------------------------------------
+
+    def submit(
+        self,
+        identity_id: str,
+        kind: str,
+        fn: JobFunction,
+        *,
+        params: dict[str, Any] | None = None,
+        classify_error: ErrorClassifier | None = None,
+    ) -> Job:
+        """Queue *fn* and return its job record.
+
+        *params* is persisted with the job for display only — it must not
+        contain credentials.  *classify_error* turns a non-``AppError``
+        exception into the ``error`` dict stored on the job.
+        """
+        job = Job(
+            job_id=uuid.uuid4().hex, kind=kind, params=dict(params or {}), owner=self._owner,
+        )
+        runner = _Runner(fn=fn, classify_error=classify_error, app=_current_app())
+        with self._locked_table(identity_id) as table:
+            table[job.job_id] = job
+            self._runners[job.job_id] = runner
+            self._persist_locked(identity_id)
+            handle = Job.from_dict(job.to_dict())
+        self._start(identity_id, job, runner)
+        return handle
+
+    def get(self, identity_id: str, job_id: str) -> Job:
+        with self._locked_table(identity_id) as table:
+            job = table.get(job_id)
+            if job is None:
+                raise AppError(ErrorCode.INVALID_REQUEST, f"Job '{job_id}' not found")
+            return Job.from_dict(job.to_dict())
+
+    def list_jobs(self, identity_id: str) -> list[Job]:
+        """Return the user's jobs, newest first."""
+        with self._locked_table(identity_id) as table:
+            jobs = [Job.from_dict(j.to_dict()) for j in table.values()]
+        return sorted(jobs, key=lambda j: j.created_at, reverse=True)
+
+    def cancel(self, identity_id: str, job_id: str) -> Job:
+        """Request cancellation; a no-op for jobs that already finished."""
+        with self._locked_table(identity_id) as table:
+            job = table.get(job_id)
+            if job is None:
+                raise AppError(ErrorCode.INVALID_REQUEST, f"Job '{job_id}' not found")
+            if job.status in TERMINAL_STATUSES:
+                return Job.from_dict(job.to_dict())
+            runner = self._runners.get(job_id)
+            if runner is not None:
+                runner.cancel_event.set()
+            if (job.status == JOB_QUEUED and runner is not None
+                    and runner.future is not None and runner.future.cancel()):
+                self._finish_locked(identity_id, job_id, JOB_CANCELLED, message="Cancelled")
+            else:
+                # Running here, or in another worker that reads the flag at
+                # its next checkpoint.
+                job.cancel_requested = True
+                job.message = "Cancelling…"
+                job.updated_at = time.time()
+                self._persist_locked(identity_id)
+            return Job.from_dict(table[job_id].to_dict())
+
+    def retry(self, identity_id: str, job_id: str) -> Job:
+        """Re-run a failed or cancelled job under the same id."""
+        with self._locked_table(identity_id) as table:
+            job = table.get(job_id)
+            if job is None:
+                raise AppError(ErrorCode.INVALID_REQUEST, f"Job '{job_id}' not found")
+            if job.status not in (JOB_FAILED, JOB_CANCELLED):
+                raise AppError(
+                    ErrorCode.INVALID_REQUEST,
+                    f"Only failed or cancelled jobs can be retried (status: {job.status})",
+                )
+            old = self._runners.get(job_id)
+            if old is None:
+                raise AppError(
+                    ErrorCode.INVALID_REQUEST,
+                    "This job can no longer be retried (the server restarted, it ran in "
+                    "another server worker, or newer jobs failed since); please start the "
+                    "operation again",
+                )
+            runner = _Runner(fn=old.fn, classify_error=old.classify_error, app=old.app)
+            self._runners[job_id] = runner
+            job.status = JOB_QUEUED
+            job.message = ""
+            job.result = None
+            job.error = None
+            job.cancel_requested = False
+            job.updated_at = time.time()
+            self._persist_locked(identity_id)
+            handle = Job.from_dict(job.to_dict())
+        self._start(identity_id, job, runner)
+        return handle
+
+    def wait(self, identity_id: str, job_id: str, timeout: float | None = None) -> Job:
+        """Block until the job's current run finishes (used by tests and CLI tools)."""
+        with self._lock:
+            runner = self._runners.get(job_id)
+        if runner is not None and runner.future is not None:
+            try:
+                runner.future.result(timeout=timeout)
+            except Exception:
+                pass  # outcome is recorded on the job
+        return self.get(identity_id, job_id)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        if wait:
+            with self._lock:
+                for lock in self._owner_locks.values():
+                    lock.__exit__(None, None, None)
+                self._owner_locks.clear()
+
+    # -- execution ----------------------------------------------------------
+
+    def _start(self, identity_id: str, job: Job, runner: _Runner) -> None:
+        runner.future = self._executor.submit(self._run, identity_id, job.job_id, runner)
+
+    def _run(self, identity_id: str, job_id: str, runner: _Runner) -> None:
+        with self._locked_table(identity_id) as table:
+            job = table.get(job_id)
+            if job is None or job.status != JOB_QUEUED:
+                return
+            if runner.cancel_event.is_set() or job.cancel_requested:
+                self._finish_locked(identity_id, job_id, JOB_CANCELLED, message="Cancelled")
+                return
+            job.status = JOB_RUNNING
+            job.attempts += 1
+            job.updated_at = time.time()
+            self._persist_locked(identity_id)
+            kind = job.kind
+            runner.synced_at = time.time()
+
+        ctx = JobContext(self, identity_id, job_id, runner.cancel_event)
+        try:
+            if runner.app is not None:
+                with runner.app.app_context():
+                    result = runner.fn(ctx)
+            else:
+                result = runner.fn(ctx)
+        except JobCancelled:
+            with self._locked_table(identity_id):
+                self._finish_locked(identity_id, job_id, JOB_CANCELLED, message="Cancelled")
+            return
+        except Exception as e:
+            logger.warning("Job %s (%s) failed: %s", job_id, kind, type(e).__name__)
+            with self._locked_table(identity_id):
+                self._finish_locked(
+                    identity_id, job_id, JOB_FAILED, error=_error_dict(e, runner.classify_error),
+                )
+            return
+
+        with self._locked_table(identity_id):
+            self._finish_locked(identity_id, job_id, JOB_SUCCEEDED, result=result or {})
+
+    def _set_message(self, identity_id: str, job_id: str, message: str) -> None:
+        with self._lock:
+            job = self._jobs.get(identity_id, {}).get(job_id)
+            runner = self._runners.get(job_id)
+            if job is None or runner is None or job.status != JOB_RUNNING:
+                return
+            job.message = message
+            job.updated_at = time.time()
+            runner.message_dirty = True
+        self._sync_running(identity_id, job_id)
+
+    def _sync_running(self, identity_id: str, job_id: str) -> None:
+        """Publish a running job's progress and pick up a cancel from another worker.
+
+        Throttled to once per ``_SYNC_SECONDS`` so checkpoints in tight
+        loops stay cheap.
+        """
+        with self._lock:
+            runner = self._runners.get(job_id)
+            now = time.time()
+            if runner is None or now - runner.synced_at < _SYNC_SECONDS:
+                return
+            runner.synced_at = now
+            with self._locked_table(identity_id) as table:
+                job = table.get(job_id)
+                if job is None or job.status != JOB_RUNNING:
+                    return
+                if job.cancel_requested:
+                    runner.cancel_event.set()
+                if runner.message_dirty:
+                    runner.message_dirty = False
+                    self._persist_locked(identity_id)
+
+    def _finish_locked(
+        self,
+        identity_id: str,
+        job_id: str,
+        status: str,
+        *,
+        message: str = "",
+        result: dict[str, Any] | None = None,
+        error: dict[str, Any] | None = None,
+    ) -> None:
+        """Record a terminal status.  **Caller must be inside ``_locked_table``.**"""
+        job = self._jobs.get(identity_id, {}).get(job_id)
+        if job is None:
+            return
+        job.status = status
+        job.message = message
+        job.result = result
+        job.error = error
+        job.updated_at = time.time()
+        self._prune_locked(identity_id)
+        self._release_runners_locked(identity_id)
+        self._persist_locked(identity_id)
+
+    def _release_runners_locked(self, identity_id: str) -> None:
+        """Drop the runners (and the closures they hold) of jobs that will not run again.
+
+        Succeeded jobs cannot be retried; failed and cancelled ones keep
+        their runner only while among the newest ``_MAX_RETRYABLE_JOBS``.
+        """
+        table = self._jobs.get(identity_id, {})
+        retryable = sorted(
+            (j for j in table.values()
+             if j.status in (JOB_FAILED, JOB_CANCELLED) and j.job_id in self._runners),
+            key=lambda j: j.updated_at,
+            reverse=True,
+        )
+        for job in table.values():
+            if job.status == JOB_SUCCEEDED:
+                self._runners.pop(job.job_id, None)
+        for job in retryable[_MAX_RETRYABLE_JOBS:]:
+            self._runners.pop(job.job_id, None)
+
+    # -- persistence --------------------------------------------------------
+
+    @contextmanager
+    def _locked_table(self, identity_id: str) -> Iterator[dict[str, Job]]:
+        """Hold ``self._lock`` and the user's job-file lock; yield the current table.
+
+        Mutations made inside the block must be written back with
+        :meth:`_persist_locked` before it exits, so other workers never see
+        (or overwrite) a stale table.
+        """
+        from data_formulator.datalake.workspace_metadata import WorkspaceLock
+
+        with self._lock:
+            path = self._table_path(identity_id)
+            with WorkspaceLock(path.parent, lock_filename=JOBS_LOCK_FILENAME):
+                yield self._table(identity_id)
+
+    def _table_path(self, identity_id: str) -> Path:
+        """Return the path of the user's ``jobs.json``.
+
+        The path is resolved the first time a user is seen — always from a
+        request thread — because ``get_user_home`` honours the
+        ``--data-dir`` app config.
+        """
+        path = self._table_paths.get(identity_id)
+        if path is None:
+            from data_formulator.datalake.workspace import get_user_home
+
+            path = get_user_home(identity_id) / JOBS_FILENAME
+            self._table_paths[identity_id] = path
+        return path
+
+    def _table(self, identity_id: str) -> dict[str, Job]:
+        """Return the user's job table as currently on disk.
+
+        **Caller must be inside ``_locked_table``.**  The file is re-read
+        when another worker changed it, or when another worker's job is
+        unfinished (to notice that worker exiting); otherwise the table
+        from the last sync is reused.  Progress messages of this manager's
+        running jobs that are not yet written are carried over.
+        """
+        path = self._table_path(identity_id)
+        self._claim_owner(path.parent)
+        cached = self._jobs.get(identity_id)
+        stat = _file_stat(path)
+        if (
+            cached is not None
+            and stat == self._table_stats.get(identity_id)
+            and all(j.owner == self._owner or j.status in TERMINAL_STATUSES for j in cached.values())
+        ):
+            return cached
+
+        table, orphaned = _load_job_table(path, lambda owner: self._owner_alive(path.parent, owner))
+        for job_id, job in table.items():
+            mine = (cached or {}).get(job_id)
+            if (
+                mine is not None and job.owner == self._owner
+                and job.status == mine.status == JOB_RUNNING
+                and mine.updated_at > job.updated_at
+            ):
+                job.message = mine.message
+                job.updated_at = mine.updated_at
+        self._jobs[identity_id] = table
+        self._table_stats[identity_id] = stat
+        if orphaned:
+            self._persist_locked(identity_id)
+        return table
+
+    def _claim_owner(self, user_home: Path) -> None:
+        """Hold this manager's liveness lock in *user_home* while the process lives."""
+        if user_home in self._owner_locks:
+            return
+        from data_formulator.datalake.workspace_metadata import WorkspaceLock
+
+        lock = WorkspaceLock(user_home / JOB_OWNERS_DIRNAME, lock_filename=f"{self._owner}.lock")
+        lock.__enter__()
+        self._owner_locks[user_home] = lock
+
+    def _owner_alive(self, user_home: Path, owner: str) -> bool:
+        """Whether the manager that stamped *owner* on a job still holds its lock."""
+        if owner == self._owner:
+            return True
+        if not owner.isalnum():
+            return False  # jobs written before owners were recorded
+        lock_path = user_home / JOB_OWNERS_DIRNAME / f"{owner}.lock"
+        if not lock_path.exists():
+            return False
+        from data_formulator.datalake.workspace_metadata import WorkspaceLock
+
+        try:
+            with WorkspaceLock(lock_path.parent, timeout=0, lock_filename=lock_path.name):
+                pass
+        except TimeoutError:
+            return True
+        try:
+            lock_path.unlink()
+        except OSError:
+            pass
+        return False
+
+    def _prune_locked(self, identity_id: str) -> None:
+        table = self._jobs.get(identity_id, {})
+        finished = sorted(
+            (j for j in table.values() if j.status in TERMINAL_STATUSES),
+            key=lambda j: j.updated_at,
+        )
+        for job in finished[:-_MAX_FINISHED_JOBS]:
+            table.pop(job.job_id, None)
+            self._runners.pop(job.job_id, None)
+
+    def _persist_locked(self, identity_id: str) -> None:
+        """Write the user's table.  **Caller must be inside ``_locked_table``.**"""
+        path = self._table_paths.get(identity_id)
+        if path is None:
+            return
+        payload = {"jobs": [j.to_dict() for j in self._jobs.get(identity_id, {}).values()]}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".jobs_", suffix=".json.tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, ensure_ascii=False, default=str)
+                os.replace(tmp, path)
+                self._table_stats[identity_id] = _file_stat(path)
+            except Exception:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                raise
+        except OSError:
+            logger.warning("Failed to persist job table", exc_info=True)
+
+
+def _file_stat(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _load_job_table(path: Path, owner_alive: Callable[[str], bool]) -> tuple[dict[str, Job], bool]:
+    """Load a persisted job table, failing jobs whose owner has exited.
+
+    Returns the table and whether any job was failed that way.
+    """
+    if not path.exists():
+        return {}, False
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        logger.warning("Ignoring unreadable job table %s", path.name)
+        return {}, False
+    table: dict[str, Job] = {}
+    orphaned = False
+    for item in raw.get("jobs", []):
+        try:
+            job = Job.from_dict(item)
+        except TypeError:
+            continue
+        if job.status not in TERMINAL_STATUSES and not owner_alive(job.owner):
+            orphaned = True
+            job.status = JOB_FAILED
+            job.message = ""
+            job.error = AppError(
+                ErrorCode.SERVICE_UNAVAILABLE,
+                "The server restarted before this job finished",
+            ).to_dict()
+            job.updated_at = time.time()
+        table[job.job_id] = job
+    return table, orphaned
+
+
+def _error_dict(e: Exception, classify_error: ErrorClassifier | None) -> dict[str, Any]:
+    if isinstance(e, AppError):
+        return e.to_dict()
+    if classify_error is not None:
+        try:
+            return classify_error(e)
+        except Exception:
+            logger.debug("Job error classifier raised", exc_info=True)
+    return AppError(ErrorCode.INTERNAL_ERROR, "The background job failed unexpectedly").to_dict()
+
+
+def _current_app() -> Any:
+    try:
+        from flask import current_app
+        return current_app._get_current_object()
+    except (RuntimeError, ImportError):
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Process-wide singleton
+# ---------------------------------------------------------------------------
+
+_job_manager: JobManager | None = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """Return the process-wide ``JobManager``, creating it on first use."""
+    global _job_manager
+    if _job_manager is None:
+        with _job_manager_lock:
+            if _job_manager is None:
+                try:
+                    workers = int(os.environ.get("DF_JOB_WORKERS", "4"))
+                except ValueError:
+                    workers = 4
+                _job_manager = JobManager(max_workers=workers)
+    return _job_manager
@@ -29,7 +29,8 @@ from data_formulator.workspace_factory import get_workspace
 from data_formulator.agents.agent_data_load import DataLoadAgent
 from data_formulator.agents.agent_data_loading_chat import DataLoadingAgent
 from data_formulator.agents.agent_code_explanation import CodeExplanationAgent
-from data_formulator.agents.client_utils import Client
+from data_formulator.agents.async_drive import ASYNC_IO_ENVIRON_KEY, AwaitIO
+from data_formulator.agents.client_utils import get_shared_client
 from data_formulator.model_registry import model_registry
 from data_formulator.knowledge.store import KnowledgeStore
 
@@ -121,7 +122,7 @@ def get_client(model_config):
         from data_formulator.security.url_allowlist import validate_api_base
         validate_api_base(model_config.get("api_base"))
 
-    client = Client(
+    client = get_shared_client(
         model_config["endpoint"],
         model_config["model"],
         model_config.get("api_key") or None,
@@ -281,7 +282,10 @@ def sort_data_request():
         client = get_client(content['model'])
 
         language_instruction = get_language_instruction(mode="compact")
-        agent = SortDataAgent(client=client, language_instruction=language_instruction)
+        agent = SortDataAgent(
+            client=client, language_instruction=language_instruction,
+            bypass_cache=bool(content.get('bypass_cache', False)),
+        )
         candidates = agent.run(content['field'], content['items'])
 
         candidates = candidates if candidates != None else []
@@ -309,7 +313,10 @@ def derive_starter_questions_request():
 
         n = content.get('n', 2)
         language_instruction = get_language_instruction(mode="compact")
-        agent = StarterQuestionsAgent(client=client, language_instruction=language_instruction)
+        agent = StarterQuestionsAgent(
+            client=client, language_instruction=language_instruction,
+            bypass_cache=bool(content.get('bypass_cache', False)),
+        )
         questions = agent.run(content.get('input_tables', []), primary_table=content.get('primary_table'), n=n)
 
         questions = questions if questions is not None else []
@@ -354,6 +361,8 @@ def analyst_streaming():
     # "mini" swaps in the single-decision MiniAnalystAgent (one visualize/explain
     # per run) for small/local models; anything else uses the standard agent.
     agent_mode = content.get("agent_mode", "standard")
+    # Opt-in: run batched inspection tool calls concurrently (standard agent only).
+    parallel_inspection = bool(content.get("parallel_inspection", False))
     agent_exploration_rules = content.get("agent_exploration_rules", "")
     agent_coding_rules = content.get("agent_coding_rules", "")
     focused_thread = content.get("focused_thread", None)
@@ -378,6 +387,7 @@ def analyst_streaming():
         logger.info(f"== attached_images ===> {len(attached_images)} image(s), sizes: {[len(img) for img in attached_images]}")
 
     language_instruction = get_language_instruction(mode="full")
+    async_io = bool(request.environ.get(ASYNC_IO_ENVIRON_KEY))
 
     def generate():
         try:
@@ -403,6 +413,8 @@ def analyst_streaming():
                     max_iterations=max_iterations,
                     max_repair_attempts=max_repair_attempts,
                     identity_id=identity_id,
+                    async_io=async_io,
+                    parallel_inspection=parallel_inspection,
                 )
 
             trajectory = None
@@ -430,6 +442,9 @@ def analyst_streaming():
                 charts=charts,
                 scratch_files=scratch_files,
             ):
+                if isinstance(event, AwaitIO):
+                    yield event  # resolved by the ASGI bridge
+                    continue
                 yield json.dumps(event, ensure_ascii=False) + '\n'
 
                 if event.get("type") in ("completion", "interact"):
@@ -465,7 +480,10 @@ def request_code_expl():
     language_instruction = get_language_instruction()
 
     try:
-        code_expl_agent = CodeExplanationAgent(client=client, workspace=workspace, language_instruction=language_instruction)
+        code_expl_agent = CodeExplanationAgent(
+            client=client, workspace=workspace, language_instruction=language_instruction,
+            bypass_cache=bool(content.get('bypass_cache', False)),
+        )
         candidates = code_expl_agent.run(input_tables, code)
 
         if candidates and len(candidates) > 0:
@@ -671,7 +689,7 @@ def nl_to_filter():
             raise AppError(ErrorCode.INVALID_REQUEST, "No model configured")
 
         client = get_client(model_config)
-        agent = SimpleAgents(client=client)
+        agent = SimpleAgents(client=client, bypass_cache=bool(content.get('bypass_cache', False)))
         result = agent.nl_to_filter(columns=columns, instruction=instruction)
 
         return json_ok(result)
@@ -716,7 +734,7 @@ def classify_chart_intent():
             raise AppError(ErrorCode.INVALID_REQUEST, "No model configured")
 
         client = get_client(model_config)
-        agent = SimpleAgents(client=client)
+        agent = SimpleAgents(client=client, bypass_cache=bool(content.get('bypass_cache', False)))
         intent = agent.classify_chart_intent(instruction=instruction)
         return json_ok({"intent": intent})
 
@@ -881,6 +899,7 @@ def data_loading_chat():
 
     language_instruction = get_language_instruction()
     knowledge_store = _get_knowledge_store(identity_id)
+    async_io = bool(request.environ.get(ASYNC_IO_ENVIRON_KEY))
 
     def generate():
         try:
@@ -891,9 +910,13 @@ def data_loading_chat():
                 language_instruction=language_instruction,
                 knowledge_store=knowledge_store,
                 row_limit=content.get("row_limit"),
+                async_io=async_io,
             )
 
             for event in agent.stream(messages):
+                if isinstance(event, AwaitIO):
+                    yield event  # resolved by the ASGI bridge
+                    continue
                 raw = json.dumps(event, ensure_ascii=False, default=str)
                 raw = raw.replace(': NaN,', ': null,').replace(': NaN}', ': null}').replace(':NaN,', ':null,').replace(':NaN}', ':null}')
                 yield raw + "\n"
@@ -28,7 +28,7 @@ import requests
 import io
 import csv
 import math
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from flask import Blueprint, Response, request, jsonify
 from typing import Any
 from collections import deque
@@ -109,6 +109,33 @@ def make_csv_response(rows: list, filename: str = "data.csv") -> Response:
 # Recommended refresh: 60 seconds
 # ============================================================================
 
+def _parse_since(since_str: str | None) -> datetime | None:
+    """Parse a ``since`` watermark (ISO timestamp, optional ``Z``) as naive UTC."""
+    if not since_str:
+        return None
+    try:
+        parsed = datetime.fromisoformat(since_str.replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _rows_after(rows: list[dict], since: datetime | None) -> list[dict]:
+    """Rows whose ``timestamp`` is after *since*.
+
+    Rows whose timestamp cannot be parsed are kept: an appending client can
+    live with a duplicate, but a row dropped here would never be fetched.
+    """
+    if since is None:
+        return rows
+    return [
+        r for r in rows
+        if (ts := _parse_since(r.get("timestamp"))) is None or ts > since
+    ]
+
+
 @demo_stream_bp.route('/earthquakes', methods=['GET'])
 @limiter.limit(EARTHQUAKE_RATE_LIMIT)
 def get_earthquakes():
@@ -877,12 +904,14 @@ def get_yfinance_recent():
     
     Query params:
         - symbols: comma-separated stock symbols (default: AAPL,MSFT,GOOGL,AMZN,META,NVDA,TSLA)
+        - since: ISO timestamp - only return bars after this time (UTC)
     
     Example:
         /api/demo-stream/yfinance/recent?symbols=AAPL,MSFT,GOOGL
     
     Recommended refresh: 300 seconds (5 minutes) during market hours
     """
+    since = _parse_since(request.args.get('since'))
     symbols_param = request.args.get('symbols', ','.join(DEFAULT_SYMBOLS))
     symbols = [s.strip().upper() for s in symbols_param.split(',') if s.strip()][:10]
     
@@ -916,6 +945,8 @@ def get_yfinance_recent():
         except Exception as e:
             logger.warning(f"Failed to fetch recent data for {symbol}: {e}")
     
+    rows = _rows_after(rows, since)
+    
     # Sort by symbol, then timestamp
     rows.sort(key=lambda x: (x["symbol"], x["timestamp"]))
     
@@ -1054,6 +1085,8 @@ def get_live_sales():
     
     Query params:
         - limit: Maximum number of records to return (default: 1000, max: 1000)
+        - since: ISO timestamp - only return transactions after this time, so a
+          client syncing with ``mode: "append"`` fetches just the new rows
     
     Recommended refresh: 1-5 seconds
     """
@@ -1061,6 +1094,7 @@ def get_live_sales():
     
     now = datetime.utcnow()
     limit = min(1000, max(1, int(request.args.get('limit', 1000))))
+    since = _parse_since(request.args.get('since'))
     
     # Generate new transactions if enough time has passed (at least 1 second)
     with _sales_lock:
@@ -1091,6 +1125,8 @@ def get_live_sales():
         # Return all accumulated records (up to limit)
         rows = list(_sales_history)[-limit:]
     
+    rows = _rows_after(rows, since)
+    
     # Sort by timestamp descending (most recent first)
     rows.sort(key=lambda x: x["timestamp"], reverse=True)
     
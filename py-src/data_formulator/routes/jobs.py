@@ -0,0 +1,62 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+"""
+Background job routes.
+
+Long-running operations started with ``"async": true`` (connector
+import/refresh, ``/api/tables/sync-table-data``) return a ``job_id``
+immediately; see ``data_formulator.job_queue``.  The frontend polls these
+endpoints for status and progress.
+
+Routes:
+  POST /api/jobs/get-job  — status, progress message, result / error
+  POST /api/jobs/list     — the current user's jobs, newest first
+  POST /api/jobs/cancel   — request cancellation
+  POST /api/jobs/retry    — re-run a failed or cancelled job
+"""
+
+import logging
+
+from flask import Blueprint, request
+
+from data_formulator.auth.identity import get_identity_id
+from data_formulator.error_handler import json_ok
+from data_formulator.errors import AppError, ErrorCode
+from data_formulator.job_queue import get_job_manager
+
+logger = logging.getLogger(__name__)
+
+jobs_bp = Blueprint("jobs", __name__, url_prefix="/api/jobs")
+
+
+def _require_job_id() -> str:
+    data = request.get_json(silent=True) or {}
+    job_id = data.get("job_id")
+    if not job_id:
+        raise AppError(ErrorCode.INVALID_REQUEST, "job_id is required")
+    return job_id
+
+
+@jobs_bp.route("/get-job", methods=["POST"])
+def get_job():
+    job_id = _require_job_id()
+    return json_ok(get_job_manager().get(get_identity_id(), job_id).to_dict())
+
+
+@jobs_bp.route("/list", methods=["POST"])
+def list_jobs():
+    jobs = get_job_manager().list_jobs(get_identity_id())
+    return json_ok({"jobs": [j.to_dict() for j in jobs]})
+
+
+@jobs_bp.route("/cancel", methods=["POST"])
+def cancel_job():
+    job_id = _require_job_id()
+    return json_ok(get_job_manager().cancel(get_identity_id(), job_id).to_dict())
+
+
+@jobs_bp.route("/retry", methods=["POST"])
+def retry_job():
+    job_id = _require_job_id()
+    return json_ok(get_job_manager().retry(get_identity_id(), job_id).to_dict())
@@ -10,18 +10,24 @@ mimetypes.add_type('application/javascript', '.js')
 mimetypes.add_type('application/javascript', '.mjs')
 import json
 import gzip
+from typing import Any
 from flask import request, Blueprint, Response, stream_with_context
 from data_formulator.error_handler import json_ok
 from data_formulator.errors import AppError, ErrorCode
+from data_formulator.job_queue import get_job_manager
 import pandas as pd
+import pyarrow as pa
 from pathlib import Path
 from data_formulator.auth.identity import get_identity_id
 from data_formulator.datalake.workspace import Workspace
 from data_formulator.workspace_factory import get_workspace as _create_workspace
-from data_formulator.datalake.parquet_utils import sanitize_table_name as parquet_sanitize_table_name, safe_data_filename, normalize_dtype_to_app_type, df_to_safe_records
+from data_formulator.datalake.parquet_utils import sanitize_table_name as parquet_sanitize_table_name, safe_data_filename, normalize_dtype_to_app_type, df_to_safe_records, is_columnar_payload, read_columnar_payload
 from data_formulator.datalake.file_manager import save_uploaded_file, is_supported_file, get_file_type, normalize_text_encoding
 from data_formulator.datalake.workspace_metadata import TableMetadata as DatalakeTableMetadata, ColumnInfo
+from data_formulator.datalake.result_set_cache import POSITION_COLUMN, RESULT_SET_ROW_GROUP_SIZE, get_result_set_cache
 import re
+import threading
+from collections import OrderedDict
 
 # Get logger for this module (logging config done in app.py)
 logger = logging.getLogger(__name__)
@@ -363,9 +369,11 @@ def _build_parquet_sample_sql(
     if method == "random":
         order_by = " ORDER BY RANDOM()"
     elif method == "head" and valid_order:
-        order_by = " ORDER BY " + ", ".join(f"t.{_quote_duckdb(c)} ASC" for c in valid_order)
+        # "#rowId" breaks ties exactly as in _build_parquet_sorted_result_sql,
+        # so page 0 and the materialised later pages agree on row order.
+        order_by = " ORDER BY " + ", ".join(f"t.{_quote_duckdb(c)} ASC" for c in valid_order) + ', t."#rowId" ASC'
     elif method == "bottom" and valid_order:
-        order_by = " ORDER BY " + ", ".join(f"t.{_quote_duckdb(c)} DESC" for c in valid_order)
+        order_by = " ORDER BY " + ", ".join(f"t.{_quote_duckdb(c)} DESC" for c in valid_order) + ', t."#rowId" ASC'
     else:
         order_by = ""
     offset_clause = f" OFFSET {offset}" if offset > 0 else ""
@@ -377,6 +385,51 @@ def _build_parquet_sample_sql(
     return main_sql, count_sql
 
 
+def _build_parquet_sorted_result_sql(
+    columns: list[str],
+    aggregate_fields_and_functions: list,
+    select_fields: list,
+    method: str,
+    order_by_fields: list,
+    filters: list | None = None,
+    column_types: dict[str, str] | None = None,
+    search: str | None = None,
+) -> str | None:
+    """Build SQL for the *whole* sorted result of a head/bottom sample.
+
+    Rows match what ``_build_parquet_sample_sql`` would page through, plus
+    a dense ``#pos`` column (0-based, in sort order) so the result can be
+    materialised once and paged by position.  ``#rowId`` is appended as a
+    final tie-breaker, which keeps pages stable across requests.  Returns
+    ``None`` for shapes that are not worth materialising (aggregates,
+    random / unsorted sampling).
+    """
+    if any(f is None or f in columns for (f, _fn) in aggregate_fields_and_functions):
+        return None
+    valid_order = [f for f in order_by_fields if f in columns]
+    if method not in ("head", "bottom") or not valid_order:
+        return None
+    valid_select = _dedup_list([f for f in select_fields if f in columns])
+    where_clause = _build_filter_where_duckdb(filters, columns, column_types, alias="t", search=search)
+
+    direction = "ASC" if method == "head" else "DESC"
+    order = ", ".join(f"t.{_quote_duckdb(c)} {direction}" for c in valid_order) + ', t."#rowId" ASC'
+    base = f"(SELECT ROW_NUMBER() OVER () AS \"#rowId\", t.* FROM {{parquet}} AS t{where_clause}) AS t"
+    if valid_select:
+        select_list = "t.\"#rowId\", " + ", ".join(f"t.{_quote_duckdb(c)}" for c in valid_select)
+    else:
+        select_list = "t.*"
+    return (
+        f"SELECT ROW_NUMBER() OVER (ORDER BY {order}) - 1 AS \"{POSITION_COLUMN}\", {select_list} "
+        f"FROM {base} ORDER BY \"{POSITION_COLUMN}\""
+    )
+
+
+def _sample_query_shape(**parts) -> str:
+    """Canonical JSON for a sample-table query shape (cache key component)."""
+    return json.dumps(parts, sort_keys=True, default=str)
+
+
 def _table_metadata_to_source_metadata(meta: DatalakeTableMetadata) -> dict | None:
     """Convert workspace TableMetadata to API source_metadata dict (for refresh)."""
     if meta.loader_type is None and meta.loader_params is None:
@@ -579,21 +632,6 @@ def _apply_aggregation_and_sample(
 _COLUMN_STATS_LEVELS_LIMIT = 100
 
 
-def _fetch_column_levels_duckdb(workspace, table_name: str, column: str) -> tuple[list, list[int]]:
-    """Top-N value/count pairs (count-desc) for a single low-card column."""
-    qc = _quote_duckdb(column)
-    sql = (
-        f"SELECT {qc} AS value, COUNT(*) AS count "
-        f"FROM {{parquet}} AS t WHERE {qc} IS NOT NULL "
-        f"GROUP BY {qc} ORDER BY count DESC, value ASC "
-        f"LIMIT {_COLUMN_STATS_LEVELS_LIMIT}"
-    )
-    df = workspace.run_parquet_sql(table_name, sql)
-    levels = df["value"].tolist()
-    level_counts = [int(c) for c in df["count"].tolist()]
-    return levels, level_counts
-
-
 def _safe_levels(levels: list) -> list:
     """Run levels (which may contain pandas/numpy scalars) through df_to_safe_records."""
     if not levels:
@@ -604,7 +642,12 @@ def _safe_levels(levels: list) -> list:
 
 @tables_bp.route('/sample-table', methods=['POST'])
 def sample_table():
-    """Sample a table from the workspace. Uses DuckDB for parquet (no full load)."""
+    """Sample a table from the workspace. Uses DuckDB for parquet (no full load).
+
+    On the DuckDB path the total row count is cached per query shape, and
+    sorted (``head`` / ``bottom``) scrolling past the first page is served
+    from a materialised result set (see ``datalake.result_set_cache``).
+    """
     try:
         data = request.get_json()
         table_id = data.get('table')
@@ -634,8 +677,55 @@ def sample_table():
                 column_types=column_types,
                 search=search,
             )
-            total_row_count = int(workspace.run_parquet_sql(table_id, count_sql).iloc[0, 0])
-            result_df = workspace.run_parquet_sql(table_id, main_sql)
+            sorted_sql = _build_parquet_sorted_result_sql(
+                columns,
+                aggregate_fields_and_functions,
+                select_fields,
+                method,
+                order_by_fields,
+                filters=filters,
+                column_types=column_types,
+                search=search,
+            )
+            data_identity = workspace.table_data_identity(table_id)
+
+            def _count() -> int:
+                return int(workspace.run_parquet_sql(table_id, count_sql).iloc[0, 0])
+
+            if data_identity is None:
+                total_row_count = _count()
+                result_df = workspace.run_parquet_sql(table_id, main_sql)
+            else:
+                # The count depends only on filters/search (and the grouping
+                # when aggregating), so it is computed once per shape.
+                cache = get_result_set_cache()
+                count_key = ("count", data_identity, _sample_query_shape(
+                    filters=filters, search=search,
+                    aggregate=aggregate_fields_and_functions,
+                    group_by=select_fields if aggregate_fields_and_functions else None,
+                ))
+                total_row_count = cache.get_count(count_key, _count)
+
+                rows_key = ("rows", data_identity, _sample_query_shape(
+                    filters=filters, search=search, method=method,
+                    order_by=order_by_fields, select=select_fields,
+                ))
+                # The first page of a sort is a cheap top-N query; once the
+                # grid scrolls past it, materialise the sorted rows and page
+                # by position from then on.
+                if sorted_sql is not None and (offset > 0 or cache.has_result_set(rows_key)):
+                    result_df = cache.get_page(
+                        rows_key,
+                        lambda target: workspace.run_parquet_sql(
+                            table_id,
+                            f"COPY ({sorted_sql}) TO {target} "
+                            f"(FORMAT PARQUET, ROW_GROUP_SIZE {RESULT_SET_ROW_GROUP_SIZE})",
+                        ),
+                        offset,
+                        sample_size,
+                    )
+                else:
+                    result_df = workspace.run_parquet_sql(table_id, main_sql)
         else:
             df = workspace.read_data_as_df(table_id)
             result_df, total_row_count = _apply_aggregation_and_sample(
@@ -779,9 +869,35 @@ def _resolve_excel_sheet(
     return 0
 
 
+def _read_columnar_upload(data: bytes, content_type: str | None):
+    """Decode an Arrow IPC / parquet upload, or return None for JSON bodies.
+
+    Gzip is unwrapped first so that compressed JSON still falls through to
+    the JSON path.
+    """
+    unwrapped = gzip.decompress(data) if data[:2] == b'\x1f\x8b' else data
+    if not is_columnar_payload(unwrapped, content_type):
+        return None
+    try:
+        return read_columnar_payload(unwrapped, content_type)
+    except ValueError as e:
+        logger.warning("Invalid columnar upload", exc_info=True)
+        raise AppError(
+            ErrorCode.VALIDATION_ERROR,
+            "Invalid Arrow/parquet data",
+            detail=str(e),
+        ) from e
+
+
 @tables_bp.route('/create-table', methods=['POST'])
 def create_table():
-    """Create a new table from uploaded file or raw data in the workspace."""
+    """Create a new table from uploaded file or raw data in the workspace.
+
+    ``raw_data`` is a JSON array of row objects (optionally gzipped), or an
+    Arrow IPC stream/file or parquet blob — detected from the part's
+    content type or magic bytes — which is written without building a
+    DataFrame.
+    """
     try:
         has_file = 'file' in request.files
         has_raw_data = 'raw_data' in request.files or 'raw_data' in request.form
@@ -796,62 +912,74 @@ def create_table():
         sanitized_table_name = parquet_sanitize_table_name(table_name)
         replace_source = request.form.get('replace_source', '').lower() == 'true'
 
-        if has_file:
-            file = request.files['file']
-            if not file.filename or not is_supported_file(file.filename):
-                raise AppError(ErrorCode.INVALID_REQUEST, "Unsupported file format")
-            try:
-                safe_name = safe_data_filename(file.filename)
-            except ValueError:
-                raise AppError(ErrorCode.INVALID_REQUEST, "Invalid filename")
-
-            if replace_source:
-                workspace.delete_tables_by_source_file(safe_name)
-
-            file_type = get_file_type(safe_name)
-            content = file.stream.read()
-            content = normalize_text_encoding(content, file_type)
-
-            sheet_hint = request.form.get('sheet_name') or None
-            df = _read_upload_to_df(
-                content, file_type,
-                table_name=sanitized_table_name,
-                sheet_hint=sheet_hint,
-            )
+        # Source replacement, the parquet write and the metadata touch-ups
+        # below are one logical change — commit workspace.yaml once.
+        with workspace.metadata_batch():
+            if has_file:
+                file = request.files['file']
+                if not file.filename or not is_supported_file(file.filename):
+                    raise AppError(ErrorCode.INVALID_REQUEST, "Unsupported file format")
+                try:
+                    safe_name = safe_data_filename(file.filename)
+                except ValueError:
+                    raise AppError(ErrorCode.INVALID_REQUEST, "Invalid filename")
+
+                if replace_source:
+                    workspace.delete_tables_by_source_file(safe_name)
+
+                file_type = get_file_type(safe_name)
+                content = file.stream.read()
+                content = normalize_text_encoding(content, file_type)
+
+                sheet_hint = request.form.get('sheet_name') or None
+                df = _read_upload_to_df(
+                    content, file_type,
+                    table_name=sanitized_table_name,
+                    sheet_hint=sheet_hint,
+                )
 
-            meta = workspace.write_parquet(df, sanitized_table_name)
-            meta.source_type = "upload"
-            meta.source_file = safe_name
-            meta.original_name = table_name
-            workspace.add_table_metadata(meta)
+                meta = workspace.write_parquet(df, sanitized_table_name)
+                meta.source_type = "upload"
+                meta.source_file = safe_name
+                meta.original_name = table_name
+                workspace.add_table_metadata(meta)
 
-            sanitized_table_name = meta.name
-            row_count = meta.row_count
-            columns = [c.name for c in (meta.columns or [])]
-        else:
-            # raw_data can come as a file upload (Blob) or as a form field
-            if 'raw_data' in request.files:
-                raw_bytes = request.files['raw_data'].read()
-                # Auto-detect gzip (magic bytes 0x1f 0x8b)
-                if raw_bytes[:2] == b'\x1f\x8b':
-                    raw_data = gzip.decompress(raw_bytes).decode('utf-8')
-                else:
-                    raw_data = raw_bytes.decode('utf-8')
+                sanitized_table_name = meta.name
+                row_count = meta.row_count
+                columns = [c.name for c in (meta.columns or [])]
             else:
-                raw_data = request.form.get('raw_data')
-            try:
-                df = pd.DataFrame(json.loads(raw_data))
-            except Exception as e:
-                logger.warning("Invalid JSON in raw_data", exc_info=True)
-                raise AppError(ErrorCode.VALIDATION_ERROR, "Invalid JSON data — it must be a JSON array of objects")
-            workspace.write_parquet(df, sanitized_table_name)
-            row_count = len(df)
-            columns = list(df.columns)
+                # raw_data can come as a file upload (Blob) or as a form field
+                arrow_table = None
+                if 'raw_data' in request.files:
+                    raw_file = request.files['raw_data']
+                    raw_bytes = raw_file.read()
+                    arrow_table = _read_columnar_upload(raw_bytes, raw_file.mimetype)
+                    if arrow_table is None:
+                        # Auto-detect gzip (magic bytes 0x1f 0x8b)
+                        if raw_bytes[:2] == b'\x1f\x8b':
+                            raw_data = gzip.decompress(raw_bytes).decode('utf-8')
+                        else:
+                            raw_data = raw_bytes.decode('utf-8')
+                else:
+                    raw_data = request.form.get('raw_data')
+                if arrow_table is not None:
+                    workspace.write_parquet_from_arrow(arrow_table, sanitized_table_name)
+                    row_count = arrow_table.num_rows
+                    columns = list(arrow_table.column_names)
+                else:
+                    try:
+                        df = pd.DataFrame(json.loads(raw_data))
+                    except Exception as e:
+                        logger.warning("Invalid JSON in raw_data", exc_info=True)
+                        raise AppError(ErrorCode.VALIDATION_ERROR, "Invalid JSON data — it must be a JSON array of objects")
+                    workspace.write_parquet(df, sanitized_table_name)
+                    row_count = len(df)
+                    columns = list(df.columns)
 
-        meta = workspace.get_table_metadata(sanitized_table_name)
-        if meta is not None and meta.original_name is None:
-            meta.original_name = table_name
-            workspace.add_table_metadata(meta)
+            meta = workspace.get_table_metadata(sanitized_table_name)
+            if meta is not None and meta.original_name is None:
+                meta.original_name = table_name
+                workspace.add_table_metadata(meta)
 
         return json_ok({
             "table_name": sanitized_table_name,
@@ -920,40 +1048,136 @@ def parse_file():
         raise AppError(ErrorCode.FILE_PARSE_ERROR, "Failed to parse the uploaded file")
 
 
+def _read_sync_request() -> tuple[dict, Any]:
+    """Return ``(params, rows)`` for ``/sync-table-data``.
+
+    ``rows`` is a ``pa.Table`` for a columnar ``rows`` file part and the
+    JSON row list otherwise.
+    """
+    if request.mimetype == 'multipart/form-data':
+        params: dict[str, Any] = dict(request.form)
+        if params.get('key_columns'):
+            try:
+                params['key_columns'] = json.loads(params['key_columns'])
+            except ValueError:
+                raise AppError(ErrorCode.INVALID_REQUEST, "key_columns must be a JSON array")
+        params['async'] = str(params.get('async', '')).lower() == 'true'
+        rows_file = request.files.get('rows')
+        if rows_file is None:
+            return params, None
+        raw_bytes = rows_file.read()
+        table = _read_columnar_upload(raw_bytes, rows_file.mimetype)
+        if table is not None:
+            return params, table
+        if raw_bytes[:2] == b'\x1f\x8b':
+            raw_bytes = gzip.decompress(raw_bytes)
+        try:
+            return params, json.loads(raw_bytes.decode('utf-8'))
+        except ValueError:
+            raise AppError(ErrorCode.VALIDATION_ERROR, "Invalid JSON data — it must be a JSON array of objects")
+
+    # Auto-detect gzip-compressed request body
+    raw_bytes = request.get_data()
+    if raw_bytes[:2] == b'\x1f\x8b':
+        data = json.loads(gzip.decompress(raw_bytes).decode('utf-8'))
+    else:
+        data = request.get_json()
+    return data, data.get('rows')
+
+
 @tables_bp.route('/sync-table-data', methods=['POST'])
 def sync_table_data():
     """Update an existing workspace table's parquet with new row data.
     
     Used when the frontend has fresher data than the workspace (e.g., from stream refresh)
     and needs to sync it so sandbox code reads the latest data.
+
+    With ``"async": true`` the parquet write runs on the background job
+    queue and the response is a job handle (``job_id``, ``status``).
+
+    ``mode`` selects how ``rows`` are applied:
+
+    * ``"replace"`` (default) — ``rows`` is the full table.
+    * ``"append"`` — ``rows`` are new rows only; with ``watermark_column``,
+      rows at or below the table's current max are skipped.
+    * ``"upsert"`` — rows replace existing rows with the same
+      ``key_columns`` values, other rows are appended.
+
+    Delta modes respond with ``rows_appended``, ``rows_replaced`` and the
+    new ``watermark`` so the client can send only rows past it next tick.
+    A delta whose columns do not match the table is rejected with
+    ``INVALID_REQUEST``; the client should resend in ``replace`` mode.
+
+    Besides the JSON body, the request may be ``multipart/form-data`` with
+    the parameters as form fields (``key_columns`` as a JSON array) and
+    ``rows`` as an Arrow IPC or parquet file part, which is written without
+    building per-row Python objects.
     """
     try:
-        # Auto-detect gzip-compressed request body
-        raw_bytes = request.get_data()
-        if raw_bytes[:2] == b'\x1f\x8b':
-            data = json.loads(gzip.decompress(raw_bytes).decode('utf-8'))
-        else:
-            data = request.get_json()
+        data, rows = _read_sync_request()
         table_name = data.get('table_name')
-        rows = data.get('rows')
+        mode = data.get('mode') or 'replace'
+        watermark_column = data.get('watermark_column') or None
+        key_columns = data.get('key_columns') or None
 
         if not table_name:
             raise AppError(ErrorCode.INVALID_REQUEST, "table_name is required")
         if rows is None:
             raise AppError(ErrorCode.INVALID_REQUEST, "rows is required")
+        if mode not in ('replace', 'append', 'upsert'):
+            raise AppError(ErrorCode.INVALID_REQUEST, f"Unsupported sync mode '{mode}'")
+        if mode == 'upsert' and not key_columns:
+            raise AppError(ErrorCode.INVALID_REQUEST, "key_columns is required for upsert")
 
         workspace = _get_workspace()
 
         if table_name not in workspace.list_tables():
             raise AppError(ErrorCode.TABLE_NOT_FOUND, f"Table '{table_name}' not found in workspace")
 
-        df = pd.DataFrame(rows) if rows else pd.DataFrame()
-        workspace.write_parquet(df, table_name)
-
-        return json_ok({
-            "table_name": table_name,
-            "row_count": len(df),
-        })
+        if isinstance(rows, pa.Table):
+            df = rows
+        else:
+            df = pd.DataFrame(rows) if rows else pd.DataFrame()
+
+        def run_sync(ctx=None) -> dict:
+            if ctx is not None:
+                ctx.raise_if_cancelled()
+                ctx.report(f"Writing {len(df)} rows…")
+            if mode == 'replace':
+                if isinstance(df, pa.Table):
+                    workspace.write_parquet_from_arrow(df, table_name)
+                else:
+                    workspace.write_parquet(df, table_name)
+                return {
+                    "table_name": table_name,
+                    "row_count": len(df),
+                }
+            try:
+                meta, info = workspace.append_parquet(
+                    df, table_name,
+                    watermark_column=watermark_column,
+                    key_columns=key_columns if mode == 'upsert' else None,
+                )
+            except ValueError as e:
+                raise AppError(
+                    ErrorCode.INVALID_REQUEST,
+                    "Rows do not match the table schema; resend the full table with mode 'replace'",
+                    detail=str(e),
+                ) from e
+            return {
+                "table_name": table_name,
+                "row_count": meta.row_count,
+                **info,
+            }
+
+        if data.get('async'):
+            job = get_job_manager().submit(
+                get_identity_id(), "sync_table", run_sync,
+                params={"table_name": table_name},
+                classify_error=_db_error_dict,
+            )
+            return json_ok({"job_id": job.job_id, "status": job.status})
+        return json_ok(run_sync())
     except AppError:
         raise
     except Exception as e:
@@ -1002,24 +1226,25 @@ def _stream_csv_from_duckdb(workspace, table_name: str, delimiter: str):
     import duckdb
     import tempfile
 
-    parquet_path = workspace.get_parquet_path(table_name)
-    path_escaped = str(parquet_path).replace("\\", "\\\\").replace("'", "''")
-
     tmp_fd, tmp_path = tempfile.mkstemp(suffix=".csv")
     os.close(tmp_fd)
     try:
         conn = duckdb.connect(":memory:")
         try:
-            cols = conn.execute(
-                f"SELECT column_name FROM parquet_schema('{path_escaped}')"
-            ).fetchall()
-            has_row_id = any(c[0] == "#rowId" for c in cols)
-            exclude = ' EXCLUDE ("#rowId")' if has_row_id else ""
-            select_sql = f"SELECT *{exclude} FROM read_parquet('{path_escaped}')"
-
-            copy_opts = f"HEADER, DELIMITER '{delimiter}'"
-            tmp_escaped = tmp_path.replace("\\", "\\\\").replace("'", "''")
-            conn.execute(f"COPY ({select_sql}) TO '{tmp_escaped}' ({copy_opts})")
+            # Main file plus any appended parts, held until the copy is done.
+            with workspace.parquet_files(table_name) as (_meta, paths):
+                escaped = [str(p).replace("\\", "\\\\").replace("'", "''") for p in paths]
+                cols = conn.execute(
+                    f"SELECT column_name FROM parquet_schema('{escaped[0]}')"
+                ).fetchall()
+                has_row_id = any(c[0] == "#rowId" for c in cols)
+                exclude = ' EXCLUDE ("#rowId")' if has_row_id else ""
+                sources = ", ".join(f"'{p}'" for p in escaped)
+                select_sql = f"SELECT *{exclude} FROM read_parquet([{sources}])"
+
+                copy_opts = f"HEADER, DELIMITER '{delimiter}'"
+                tmp_escaped = tmp_path.replace("\\", "\\\\").replace("'", "''")
+                conn.execute(f"COPY ({select_sql}) TO '{tmp_escaped}' ({copy_opts})")
         finally:
             conn.close()
 
@@ -1117,6 +1342,116 @@ def _is_numeric_duckdb_type(col_type: str) -> bool:
     )
 
 
+# Columns whose approximate distinct count is at most LIMIT * SLACK get an
+# exact levels pass.  DuckDB's HyperLogLog estimate can be off by ~25% at
+# this scale, so the slack is generous: a false candidate only costs a few
+# extra grouped rows, a missed one loses its checklist filter.
+_LEVEL_CANDIDATE_SLACK = 1.5
+
+# Column statistics keyed by (Workspace.table_data_identity, schema).  Stats
+# depend only on table content, so an unchanged table never rescans its
+# parquet file; the identity (workspace, table, file size/mtime or ETag)
+# keeps tables in different workspaces from sharing entries.
+_COLUMN_STATS_CACHE: "OrderedDict[tuple, list[dict]]" = OrderedDict()
+_COLUMN_STATS_CACHE_MAX_ENTRIES = 256
+_COLUMN_STATS_CACHE_LOCK = threading.Lock()
+
+
+def _float_or_none(value) -> float | None:
+    return None if value is None or pd.isna(value) else float(value)
+
+
+def _column_stats_duckdb(workspace, table_name: str, col_infos: list[dict]) -> list[dict]:
+    """Compute ``/analyze`` statistics for every column of a parquet table.
+
+    Pass 1 is a single aggregate scan: non-null counts, approximate
+    distinct counts (``approx_count_distinct``) and min/max/avg for numeric
+    columns.  Pass 2 — only when some column looks low-cardinality — is a
+    single ``GROUPING SETS`` scan that returns exact value counts for all of
+    those columns at once, so ``levels`` / ``level_counts`` and their
+    ``unique_count`` stay exact.  Two scans total instead of two per column.
+    """
+    data_identity = workspace.table_data_identity(table_name)
+    cache_key = None
+    if data_identity is not None:
+        cache_key = (
+            data_identity,
+            tuple((c["name"], c.get("type", "")) for c in col_infos),
+        )
+        with _COLUMN_STATS_CACHE_LOCK:
+            cached = _COLUMN_STATS_CACHE.get(cache_key)
+            if cached is not None:
+                _COLUMN_STATS_CACHE.move_to_end(cache_key)
+                return cached
+
+    numeric = [_is_numeric_duckdb_type(c.get("type", "")) for c in col_infos]
+    select = ["COUNT(*) AS n"]
+    for i, col_info in enumerate(col_infos):
+        q = _quote_duckdb(col_info["name"])
+        select.append(f"COUNT(t.{q}) AS c{i}_nonnull")
+        select.append(f"approx_count_distinct(t.{q}) AS c{i}_unique")
+        if numeric[i]:
+            select.append(f"MIN(t.{q}) AS c{i}_min")
+            select.append(f"MAX(t.{q}) AS c{i}_max")
+            select.append(f"AVG(t.{q}) AS c{i}_avg")
+    row = workspace.run_parquet_sql(
+        table_name, f"SELECT {', '.join(select)} FROM {{parquet}} AS t",
+    ).iloc[0]
+
+    total = int(row["n"])
+    stats = []
+    for i, col_info in enumerate(col_infos):
+        stats_dict = {
+            "count": total,
+            "unique_count": int(row[f"c{i}_unique"]),
+            "null_count": total - int(row[f"c{i}_nonnull"]),
+        }
+        if numeric[i]:
+            stats_dict["min"] = _float_or_none(row[f"c{i}_min"])
+            stats_dict["max"] = _float_or_none(row[f"c{i}_max"])
+            stats_dict["avg"] = _float_or_none(row[f"c{i}_avg"])
+        stats.append({"column": col_info["name"], "type": col_info.get("type", ""), "statistics": stats_dict})
+
+    candidates = [
+        i for i, entry in enumerate(stats)
+        if 0 < entry["statistics"]["unique_count"] <= _COLUMN_STATS_LEVELS_LIMIT * _LEVEL_CANDIDATE_SLACK
+    ]
+    if candidates:
+        try:
+            _fill_column_levels_duckdb(workspace, table_name, stats, candidates)
+        except Exception as e:
+            logger.warning("analyze: levels pass failed for %s", table_name, exc_info=e)
+
+    if cache_key is not None:
+        with _COLUMN_STATS_CACHE_LOCK:
+            _COLUMN_STATS_CACHE[cache_key] = stats
+            while len(_COLUMN_STATS_CACHE) > _COLUMN_STATS_CACHE_MAX_ENTRIES:
+                _COLUMN_STATS_CACHE.popitem(last=False)
+    return stats
+
+
+def _fill_column_levels_duckdb(workspace, table_name: str, stats: list[dict], candidates: list[int]) -> None:
+    """Exact value counts for all *candidates* columns in one grouped scan."""
+    quoted = [_quote_duckdb(stats[i]["column"]) for i in candidates]
+    select = [f"GROUPING(t.{q}) AS g{k}" for k, q in enumerate(quoted)]
+    select += [f"t.{q} AS v{k}" for k, q in enumerate(quoted)]
+    grouping_sets = ", ".join(f"(t.{q})" for q in quoted)
+    df = workspace.run_parquet_sql(
+        table_name,
+        f"SELECT {', '.join(select)}, COUNT(*) AS cnt FROM {{parquet}} AS t "
+        f"GROUP BY GROUPING SETS ({grouping_sets})",
+    )
+    for k, i in enumerate(candidates):
+        part = df.loc[(df[f"g{k}"] == 0) & df[f"v{k}"].notna(), [f"v{k}", "cnt"]]
+        stats_dict = stats[i]["statistics"]
+        stats_dict["unique_count"] = len(part)
+        if len(part) > _COLUMN_STATS_LEVELS_LIMIT:
+            continue
+        part = part.sort_values(by=["cnt", f"v{k}"], ascending=[False, True])
+        stats_dict["levels"] = _safe_levels(part[f"v{k}"].tolist())
+        stats_dict["level_counts"] = [int(c) for c in part["cnt"].tolist()]
+
+
 @tables_bp.route('/analyze', methods=['POST'])
 def analyze_table():
     """Get basic statistics about a table in the workspace. Uses DuckDB for parquet (no full load).
@@ -1125,6 +1460,12 @@ def analyze_table():
     also returns ``levels`` and parallel ``level_counts`` arrays so the data-
     grid column filter popover (design-doc 31) can render a checklist
     synchronously without a follow-up fetch.
+
+    On the DuckDB path ``unique_count`` is approximate (HyperLogLog) for
+    high-cardinality columns and exact wherever ``levels`` are returned;
+    results are cached per :meth:`Workspace.table_data_identity` (workspace,
+    table name and the name, size and mtime / ETag of every data and part
+    file) together with the column schema.
     """
     try:
         data = request.get_json()
@@ -1135,56 +1476,7 @@ def analyze_table():
         workspace = _get_workspace()
         if _should_use_duckdb(workspace, table_name):
             schema_info = workspace.get_parquet_schema(table_name)
-            col_infos = schema_info.get("columns", [])
-            stats = []
-            for col_info in col_infos:
-                col_name = col_info["name"]
-                col_type = col_info.get("type", "")
-                q = _quote_duckdb(col_name)
-                if _is_numeric_duckdb_type(col_type):
-                    sql = (
-                        f"SELECT COUNT(*) AS count, COUNT(DISTINCT t.{q}) AS unique_count, "
-                        f"COUNT(*) - COUNT(t.{q}) AS null_count, "
-                        f"MIN(t.{q}) AS min_val, MAX(t.{q}) AS max_val, AVG(t.{q}) AS avg_val "
-                        f"FROM {{parquet}} AS t"
-                    )
-                    df = workspace.run_parquet_sql(table_name, sql)
-                    row = df.iloc[0]
-                    stats_dict = {
-                        "count": int(row["count"]),
-                        "unique_count": int(row["unique_count"]),
-                        "null_count": int(row["null_count"]),
-                        "min": float(row["min_val"]) if row["min_val"] is not None else None,
-                        "max": float(row["max_val"]) if row["max_val"] is not None else None,
-                        "avg": float(row["avg_val"]) if row["avg_val"] is not None else None,
-                    }
-                else:
-                    sql = (
-                        f"SELECT COUNT(*) AS count, COUNT(DISTINCT t.{q}) AS unique_count, "
-                        f"COUNT(*) - COUNT(t.{q}) AS null_count FROM {{parquet}} AS t"
-                    )
-                    df = workspace.run_parquet_sql(table_name, sql)
-                    row = df.iloc[0]
-                    stats_dict = {
-                        "count": int(row["count"]),
-                        "unique_count": int(row["unique_count"]),
-                        "null_count": int(row["null_count"]),
-                    }
-                # Low-cardinality value list for the filter popover checklist.
-                uc = stats_dict["unique_count"]
-                if 0 < uc <= _COLUMN_STATS_LEVELS_LIMIT:
-                    try:
-                        levels, level_counts = _fetch_column_levels_duckdb(
-                            workspace, table_name, col_name
-                        )
-                        stats_dict["levels"] = _safe_levels(levels)
-                        stats_dict["level_counts"] = level_counts
-                    except Exception as e:
-                        logger.warning(
-                            "analyze: levels pass failed for %s.%s",
-                            table_name, col_name, exc_info=e,
-                        )
-                stats.append({"column": col_name, "type": col_type, "statistics": stats_dict})
+            stats = _column_stats_duckdb(workspace, table_name, schema_info.get("columns", []))
         else:
             df = workspace.read_data_as_df(table_name)
             stats = []
@@ -1257,6 +1549,15 @@ def classify_and_raise_db_error(error: Exception) -> None:
     raise AppError(ErrorCode.INTERNAL_ERROR, "An unexpected error occurred", detail=error_msg) from error
 
 
+def _db_error_dict(error: Exception) -> dict:
+    """Like ``classify_and_raise_db_error`` but return the error dict (for background jobs)."""
+    try:
+        classify_and_raise_db_error(error)
+    except AppError as app_error:
+        return app_error.to_dict()
+    return {}
+
+
 def sanitize_db_error_message(error: Exception) -> tuple[str, int]:
     """Legacy wrapper — prefer ``classify_and_raise_db_error`` for new code."""
     from data_formulator.errors import AppError
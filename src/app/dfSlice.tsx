@@ -606,10 +606,12 @@ export const fetchFieldSemanticType = createAsyncThunk(
  * Dispatches `startStarterQuestions` up front, then `setStarterQuestions` /
  * `setStarterQuestionsError`. Results are only applied if the signature is
  * still current (guards against stale responses when data changed mid-flight).
+ * `bypassCache` asks the server for a fresh answer instead of the one it
+ * cached for the same prompt (the "refresh suggestions" button).
  */
 export const generateStarterQuestions = createAsyncThunk(
     "dataFormulatorSlice/generateStarterQuestions",
-    async (arg: { tableId: string; signature: string; tableIds: string[] }, { getState, dispatch }) => {
+    async (arg: { tableId: string; signature: string; tableIds: string[]; bypassCache?: boolean }, { getState, dispatch }) => {
         const state = getState() as DataFormulatorState;
 
         dispatch(dfActions.startStarterQuestions({ tableId: arg.tableId, signature: arg.signature }));
@@ -638,6 +640,7 @@ export const generateStarterQuestions = createAsyncThunk(
                     primary_table: arg.tableId,
                     model: dfSelectors.getActiveModel(state),
                     n: 2,
+                    bypass_cache: !!arg.bypassCache,
                 }),
             });
             const questions: string[] = Array.isArray(data?.result)
@@ -38,6 +38,7 @@ import ArrowUpwardRoundedIcon from '@mui/icons-material/ArrowUpwardRounded';
 import AddIcon from '@mui/icons-material/Add';
 import TipsAndUpdatesIcon from '@mui/icons-material/TipsAndUpdates';
 import BoltIcon from '@mui/icons-material/Bolt';
+import RefreshIcon from '@mui/icons-material/Refresh';
 import EditOutlinedIcon from '@mui/icons-material/EditOutlined';
 import StopIcon from '@mui/icons-material/Stop';
 
@@ -2413,6 +2414,26 @@ export const SimpleChartRecBox: FC<{ onInputFocus?: () => void }> = function ({
                         />
                     ))
                 }
+                {!starterLoading && focusedRootTableId && (
+                    <Tooltip title={t('chartRec.refreshStarters', { defaultValue: 'New suggestions' })}>
+                        <IconButton
+                            size="small"
+                            onClick={() => dispatch(generateStarterQuestions({
+                                tableId: focusedRootTableId,
+                                signature: rootTableSignature,
+                                tableIds: rootTableSignature.split('|'),
+                                bypassCache: true,
+                            }))}
+                            sx={{
+                                flexShrink: 0,
+                                p: 0.5, borderRadius: '6px', color: 'text.disabled',
+                                '&:hover': { color: 'text.secondary', backgroundColor: alpha(theme.palette.text.primary, 0.06) },
+                            }}
+                        >
+                            <RefreshIcon sx={{ fontSize: 14 }} />
+                        </IconButton>
+                    </Tooltip>
+                )}
             </Collapse>
         </Box>
     ) : null;
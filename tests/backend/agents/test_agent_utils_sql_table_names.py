@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
+
 import pandas as pd
 import pytest
 
@@ -33,9 +35,9 @@ def test_create_duckdb_views_supports_unicode_view_names(tmp_path) -> None:
     df.to_parquet(parquet_path, index=False)
 
     class FakeWorkspace:
-        def get_parquet_path(self, name: str):
+        def parquet_files(self, name: str):
             assert name == table_name
-            return parquet_path
+            return nullcontext((None, [parquet_path]))
 
     conn = create_duckdb_conn_with_parquet_views(
         FakeWorkspace(),
@@ -0,0 +1,99 @@
+"""Process-wide LLM client registry.
+
+Background
+----------
+``routes/agents.get_client`` used to build a new ``Client`` per request.
+For Azure without an API key that meant a fresh ``DefaultAzureCredential``
+(and credential-chain probe) every time, and new SDK clients that could
+not reuse open connections. ``get_shared_client`` now hands out one client
+per model configuration, Azure shares one token provider per process, and
+LiteLLM gets a shared keep-alive HTTP pool.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from unittest.mock import MagicMock, patch
+
+import litellm
+import pytest
+
+from data_formulator.agents import client_utils
+from data_formulator.agents.client_utils import get_shared_client
+
+pytestmark = [pytest.mark.backend]
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry(monkeypatch):
+    monkeypatch.setattr(client_utils, "_client_registry", OrderedDict())
+    monkeypatch.setattr(client_utils, "_azure_token_provider", None)
+    # Keep the real litellm session untouched by these tests.
+    monkeypatch.setattr(client_utils, "_http_pool_configured", True)
+
+
+class TestClientRegistry:
+
+    def test_same_config_shares_one_client(self) -> None:
+        a = get_shared_client("openai", "gpt-x", "key-1")
+        assert get_shared_client("openai", "gpt-x", "key-1") is a
+        assert get_shared_client("openai", "gpt-x", "key-2") is not a
+        assert get_shared_client("openai", "gpt-y", "key-1") is not a
+
+    def test_api_key_is_not_a_registry_key(self) -> None:
+        get_shared_client("openai", "gpt-x", "sk-secret")
+        keys = list(client_utils._client_registry)
+        assert all("sk-secret" not in map(str, k) for k in keys)
+
+    def test_registry_is_bounded(self, monkeypatch) -> None:
+        monkeypatch.setattr(client_utils, "_CLIENT_REGISTRY_MAX", 3)
+        first = get_shared_client("openai", "m0", "k")
+        for i in range(1, 5):
+            get_shared_client("openai", f"m{i}", "k")
+        assert len(client_utils._client_registry) == 3
+        assert get_shared_client("openai", "m0", "k") is not first
+
+    def test_concurrent_lookups_get_one_instance(self) -> None:
+        seen: list = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            seen.append(get_shared_client("anthropic", "claude-x", "k"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len({id(c) for c in seen}) == 1
+
+    def test_azure_credential_is_built_once(self) -> None:
+        with patch.object(client_utils, "DefaultAzureCredential") as cred, \
+             patch.object(client_utils, "get_bearer_token_provider", return_value=MagicMock()) as provider:
+            a = get_shared_client("azure", "gpt-4o", None, "https://x.openai.azure.com")
+            b = get_shared_client("azure", "gpt-4o-mini", None, "https://x.openai.azure.com")
+        assert a is not b
+        assert cred.call_count == 1
+        assert provider.call_count == 1
+        assert a.params["azure_ad_token_provider"] is b.params["azure_ad_token_provider"]
+
+
+class TestHttpPool:
+
+    def test_shared_session_is_installed_once(self, monkeypatch) -> None:
+        monkeypatch.setattr(client_utils, "_http_pool_configured", False)
+        monkeypatch.setattr(litellm, "client_session", None)
+        client_utils._configure_http_pool()
+        session = litellm.client_session
+        assert session is not None
+        client_utils._configure_http_pool()
+        assert litellm.client_session is session
+        session.close()
+
+    def test_existing_session_is_respected(self, monkeypatch) -> None:
+        custom = object()
+        monkeypatch.setattr(client_utils, "_http_pool_configured", False)
+        monkeypatch.setattr(litellm, "client_session", custom)
+        client_utils._configure_http_pool()
+        assert litellm.client_session is custom
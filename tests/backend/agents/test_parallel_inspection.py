@@ -0,0 +1,147 @@
+"""Opt-in concurrent execution of batched inspection tool calls.
+
+Background
+----------
+``AnalystAgent`` used to force ``parallel_tool_calls=False`` and run every
+inspection call of a round one after another, so a turn with several explore
+scripts paid the sum of their sandbox round-trips. With
+``parallel_inspection=True`` the model may batch inspection calls and the
+shell runs them concurrently, while results, events and tool messages keep
+the serial (request-order) shape and committing actions still go through
+the one-action-per-turn guard.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from data_formulator.analyst.agent import AnalystAgent
+
+pytestmark = [pytest.mark.backend]
+
+
+def _tc(call_id: str, tool: str, **args) -> SimpleNamespace:
+    return SimpleNamespace(id=call_id, function=SimpleNamespace(name=tool, arguments=json.dumps(args)))
+
+
+def _response(tool_calls=None, content: str = "") -> SimpleNamespace:
+    message = SimpleNamespace(content=content, tool_calls=tool_calls, reasoning_content=None)
+    return SimpleNamespace(choices=[SimpleNamespace(
+        message=message, finish_reason="tool_calls" if tool_calls else "stop",
+    )])
+
+
+def _agent(parallel: bool) -> AnalystAgent:
+    ws = MagicMock()
+    ws.user_home = None
+    agent = AnalystAgent(client=MagicMock(model="m"), workspace=ws, parallel_inspection=parallel)
+    agent._loaded_skills = {"core"}
+    agent._run_payload = {}
+    agent._explore_session = None
+    return agent
+
+
+def _run_loop(agent: AnalystAgent, responses: list) -> tuple[list[dict], list[dict]]:
+    pending = iter(responses)
+
+    def fake_stream(messages, tools):
+        return next(pending)
+        yield  # pragma: no cover - makes this a generator
+
+    agent._stream_llm = fake_stream
+    messages: list[dict] = [{"role": "user", "content": "go"}]
+    events = list(agent._tool_loop(messages, 4, 1, 0, 0, MagicMock(), [{"name": "t"}], 0))
+    return events, messages
+
+
+class TestParallelInspection:
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_batched_scripts_run_concurrently_only_when_opted_in(self, parallel) -> None:
+        agent = _agent(parallel)
+        threads: set[int] = set()
+
+        def slow_explore(code, input_tables, session=None):
+            threads.add(threading.get_ident())
+            time.sleep(0.3)
+            return {"status": "ok", "stdout": f"ran {code}"}
+
+        agent._run_explore_code = slow_explore
+        calls = [_tc(f"c{i}", "execute_python_script", code=f"s{i}") for i in range(3)]
+
+        t0 = time.time()
+        events, messages = _run_loop(agent, [_response(calls), _response(content="done")])
+        elapsed = time.time() - t0
+
+        if parallel:
+            assert elapsed < 0.8
+            assert len(threads) == 3
+        else:
+            assert elapsed >= 0.9
+        # Results land in request order whichever mode ran them.
+        tool_msgs = [m for m in messages if m["role"] == "tool"]
+        assert [(m["tool_call_id"], m["content"]) for m in tool_msgs] == [
+            ("c0", "ran s0"), ("c1", "ran s1"), ("c2", "ran s2"),
+        ]
+        kinds = [e["type"] for e in events if e["type"] in ("tool_start", "tool_result")]
+        assert kinds == ["tool_start", "tool_result"] * 3
+        assert events[-1]["reason"] == "done"
+
+    def test_mixed_batch_keeps_load_skill_inline(self, monkeypatch) -> None:
+        agent = _agent(True)
+        agent._run_explore_code = lambda code, tables, session=None: {"status": "ok", "stdout": "x"}
+        monkeypatch.setattr(
+            "data_formulator.analyst.agent.handle_inspect_source_data",
+            lambda names, tables, ws: f"summary of {names}",
+        )
+        calls = [
+            _tc("a", "inspect_source_data", table_names=["t"]),
+            _tc("b", "execute_python_script", code="1"),
+            _tc("c", "load_skill", name="no_such_skill"),
+        ]
+        _, messages = _run_loop(agent, [_response(calls), _response(content="done")])
+        tool_msgs = {m["tool_call_id"]: m["content"] for m in messages if m["role"] == "tool"}
+        assert tool_msgs["a"] == "summary of ['t']"
+        assert tool_msgs["b"] == "x"
+        assert "c" in tool_msgs
+
+    def test_stream_flag_follows_the_option(self) -> None:
+        for parallel in (False, True):
+            agent = _agent(parallel)
+            agent._open_stream([{"role": "user", "content": "x"}], [])
+            kwargs = agent.client.get_completion_with_tools.call_args.kwargs
+            assert kwargs["parallel_tool_calls"] is parallel
+
+    def test_prompt_mentions_batching_only_when_enabled(self) -> None:
+        assert "run concurrently" not in _agent(False)._build_system_prompt()
+        assert "run concurrently" in _agent(True)._build_system_prompt()
+
+    def test_side_scripts_see_the_session_namespace(self, tmp_path) -> None:
+        from contextlib import nullcontext
+
+        from data_formulator.sandbox.local_sandbox import SandboxSession
+
+        agent = _agent(True)
+        agent.workspace.confined_scratch.root = tmp_path / "scratch"
+        agent.workspace.local_dir = lambda: nullcontext(tmp_path)
+        with SandboxSession() as session:
+            agent._explore_session = session
+            session.execute("x = 41\n_pack = None", {"_pack": None}, str(tmp_path))
+            calls = [
+                _tc("a", "execute_python_script", code="y = x + 1\nprint(y)"),
+                _tc("b", "execute_python_script", code="z = x + 2\nprint(z)"),
+            ]
+            _, messages = _run_loop(agent, [_response(calls), _response(content="done")])
+            tool_msgs = {m["tool_call_id"]: m["content"].strip() for m in messages if m["role"] == "tool"}
+            assert tool_msgs == {"a": "42", "b": "43"}
+            # Only the first script ran on the turn's session.
+            probe = session.execute(
+                "_pack = {'y': 'y' in globals(), 'z': 'z' in globals()}",
+                {"_pack": None}, str(tmp_path),
+            )
+            assert probe["allowed_objects"]["_pack"] == {"y": True, "z": False}
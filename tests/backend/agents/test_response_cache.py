@@ -0,0 +1,194 @@
+"""Persistent response cache for the helper agents.
+
+Background
+----------
+Sort-data, starter questions, code explanation, workspace naming, NL →
+filter and chart-intent classification are asked the same questions again
+whenever a workspace is re-opened or a chart re-rendered, and each time
+paid a full LLM round-trip. ``cached_completion`` now keeps their answers
+on disk in the data home, keyed by model, normalized prompt and (for code
+explanation) the input tables' content hashes, with a TTL, a size bound
+and an explicit ``bypass_cache`` flag for "regenerate". An answer is only
+stored once the agent has parsed it (``commit``), so a malformed reply is
+not replayed.
+"""
+from __future__ import annotations
+
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from data_formulator.agents import response_cache
+from data_formulator.agents.agent_code_explanation import CodeExplanationAgent
+from data_formulator.agents.agent_simple import SimpleAgents
+from data_formulator.agents.agent_sort_data import SortDataAgent
+from data_formulator.agents.response_cache import ResponseCache, cached_completion
+from data_formulator.datalake.workspace import Workspace
+
+pytestmark = [pytest.mark.backend]
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATA_FORMULATOR_HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("LLM_RESPONSE_CACHE", "on")
+    monkeypatch.setattr(response_cache, "_caches", {})
+    return tmp_path / "home" / response_cache.CACHE_DIR_NAME
+
+
+def _client(*replies: str, model: str = "gpt-x") -> MagicMock:
+    client = MagicMock()
+    client.model = model
+    client.endpoint = "openai"
+    client.params = {}
+    client.get_completion.side_effect = [
+        SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(role="assistant", content=r))])
+        for r in replies
+    ]
+    return client
+
+
+MSGS = [{"role": "system", "content": "s"}, {"role": "user", "content": "sort these"}]
+
+
+def _ask(client, messages=MSGS, **kwargs) -> str:
+    """Call through the cache and commit, as an agent does after a good parse."""
+    response, commit = cached_completion(client, messages, **kwargs)
+    commit()
+    return response.choices[0].message.content
+
+
+class TestCachedCompletion:
+
+    def test_second_call_is_replayed_from_disk(self, cache_home) -> None:
+        client = _client("first", "second")
+        assert _ask(client) == "first"
+        replay, _ = cached_completion(client, MSGS)
+        assert replay.choices[0].message.content == "first"
+        assert replay.choices[0].message.role == "assistant"
+        assert client.get_completion.call_count == 1
+        assert len(list(cache_home.glob("*/*.json"))) == 1
+
+    def test_whitespace_only_prompt_changes_still_hit(self) -> None:
+        client = _client("first")
+        _ask(client)
+        _ask(client, [MSGS[0], {"role": "user", "content": "sort these  \r\n"}])
+        assert client.get_completion.call_count == 1
+
+    def test_key_covers_model_prompt_params_and_tables(self) -> None:
+        client = _client("a", "b", "c", "d", "e")
+        _ask(client)
+        _ask(client, [MSGS[0], {"role": "user", "content": "sort those"}])
+        _ask(client, reasoning_effort="high")
+        _ask(client, table_hashes={"t": "h1"})
+        client.model = "gpt-y"
+        _ask(client)
+        assert client.get_completion.call_count == 5
+
+    def test_bypass_refreshes_the_entry(self) -> None:
+        client = _client("stale", "fresh")
+        _ask(client)
+        assert _ask(client, bypass=True) == "fresh"
+        assert _ask(client) == "fresh"
+        assert client.get_completion.call_count == 2
+
+    def test_disabled_by_env(self, monkeypatch, cache_home) -> None:
+        monkeypatch.setenv("LLM_RESPONSE_CACHE", "off")
+        client = _client("a", "b")
+        _ask(client)
+        _ask(client)
+        assert client.get_completion.call_count == 2
+        assert not cache_home.exists()
+
+    def test_empty_replies_are_not_cached(self) -> None:
+        client = _client("", "real")
+        _ask(client)
+        assert _ask(client) == "real"
+
+    def test_uncommitted_replies_are_not_stored(self, cache_home) -> None:
+        client = _client("garbled", "good")
+        cached_completion(client, MSGS)  # the agent failed to parse it
+        assert _ask(client) == "good"
+        assert _ask(client) == "good"
+        assert client.get_completion.call_count == 2
+
+
+class TestResponseCacheStore:
+
+    def test_expired_entries_miss(self, tmp_path) -> None:
+        cache = ResponseCache(tmp_path, ttl_seconds=60, max_bytes=1 << 20)
+        cache.put("ab" * 32, [{"role": "assistant", "content": "x"}])
+        assert cache.get("ab" * 32)
+        cache.ttl_seconds = -1
+        assert cache.get("ab" * 32) is None
+        assert not list(tmp_path.glob("*/*.json"))
+
+    def test_size_bound_evicts_least_recently_used(self, tmp_path) -> None:
+        cache = ResponseCache(tmp_path, ttl_seconds=60, max_bytes=600)
+        keys = [f"{i:02d}" * 32 for i in range(4)]
+        for i, key in enumerate(keys[:3]):
+            cache.put(key, [{"role": "assistant", "content": "x" * 100}])
+            os.utime(cache._path(key), (time.time() - 100 + i, time.time() - 100 + i))
+        assert cache.get(keys[0])  # touch: now the most recently used
+        cache.put(keys[3], [{"role": "assistant", "content": "x" * 100}])
+        assert cache.get(keys[0]) and cache.get(keys[3])
+        assert cache.get(keys[1]) is None
+        assert sum(p.stat().st_size for p in tmp_path.glob("*/*.json")) <= 600
+
+
+    def test_overwrite_counts_only_the_new_bytes(self, tmp_path) -> None:
+        cache = ResponseCache(tmp_path, ttl_seconds=60, max_bytes=1 << 20)
+        cache.put("ab" * 32, [{"role": "assistant", "content": "x"}])
+        for _ in range(3):
+            cache.put("ab" * 32, [{"role": "assistant", "content": "y" * 50}])
+        assert cache._size == cache._path("ab" * 32).stat().st_size
+
+
+class TestHelperAgents:
+
+    def test_sort_agent_replays_and_honours_bypass(self) -> None:
+        reply = '{"name": "m", "sorted_values": ["Jan", "Feb"], "reason": "months"}'
+        client = _client(reply, reply)
+        first = SortDataAgent(client=client).run("m", ["Feb", "Jan"])
+        again = SortDataAgent(client=client).run("m", ["Feb", "Jan"])
+        assert again == first
+        assert client.get_completion.call_count == 1
+        SortDataAgent(client=client, bypass_cache=True).run("m", ["Feb", "Jan"])
+        assert client.get_completion.call_count == 2
+
+    def test_malformed_reply_is_not_replayed(self) -> None:
+        good = '{"name": "m", "sorted_values": ["Jan", "Feb"], "reason": "months"}'
+        client = _client("Sorry, I cannot help with that.", good)
+        assert SortDataAgent(client=client).run("m", ["Feb", "Jan"])[0]["status"] != "ok"
+        assert SortDataAgent(client=client).run("m", ["Feb", "Jan"])[0]["status"] == "ok"
+        assert client.get_completion.call_count == 2
+
+    def test_simple_agents_share_the_cache(self) -> None:
+        client = _client("STYLE", "Sales Review")
+        agent = SimpleAgents(client=client)
+        assert agent.classify_chart_intent("make bars red") == "style"
+        assert agent.classify_chart_intent("make bars red") == "style"
+        assert agent.workspace_name(["sales"]) == "Sales Review"
+        assert client.get_completion.call_count == 2
+
+    def test_code_explanation_keys_on_table_content(self, tmp_path) -> None:
+        ws = Workspace("expl-user", root_dir=tmp_path)
+        ws.write_parquet(pd.DataFrame({"a": [1, 2]}), "t")
+        reply = '```json\n[{"field": "b", "explanation": "a doubled"}]\n```'
+        client = _client(reply, reply)
+        tables = [{"name": "t"}]
+        agent = CodeExplanationAgent(client=client, workspace=ws)
+        agent.run(tables, "df['b'] = df['a'] * 2")
+        agent.run(tables, "df['b'] = df['a'] * 2")
+        assert client.get_completion.call_count == 1
+        ws.write_parquet(pd.DataFrame({"a": [1, 2]}), "t")  # same sample, new content hash
+        meta = ws.get_table_metadata("t")
+        ws._atomic_update_metadata(
+            lambda m: setattr(m.tables["t"], "content_hash", f"{meta.content_hash}-v2"),
+        )
+        agent.run(tables, "df['b'] = df['a'] * 2")
+        assert client.get_completion.call_count == 2
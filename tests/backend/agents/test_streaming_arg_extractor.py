@@ -0,0 +1,128 @@
+"""Incremental extraction of a streamed tool-call argument.
+
+Background
+----------
+``_StreamingArgExtractor`` pulls the decoded value of one top-level string
+key (``write_report``'s ``content``) out of a tool call's ``arguments`` as the
+provider streams it.  It used to be handed the whole accumulated fragment on
+every delta and re-scan / re-decode it, which is quadratic for long reports.
+It is now fed only each new chunk and keeps its parse state, so these tests
+check that any chunking yields exactly the value ``json.loads`` would.
+"""
+from __future__ import annotations
+
+import json
+import random
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import MagicMock
+
+from data_formulator.analyst.agent import AnalystAgent, _StreamingArgExtractor
+
+pytestmark = [pytest.mark.backend]
+
+
+CONTENT = (
+    'Line one\nTab\there "quoted" back\\slash / slash\r\n'
+    "unicode: café 中文 emoji \U0001F600 and   separator"
+)
+
+
+def _extract(chunks: list[str], field: str = "content") -> str:
+    ex = _StreamingArgExtractor(field)
+    return "".join(ex.feed(c) for c in chunks)
+
+
+def _chunk(text: str, sizes: list[int]) -> list[str]:
+    chunks, pos, i = [], 0, 0
+    while pos < len(text):
+        size = sizes[i % len(sizes)]
+        chunks.append(text[pos:pos + size])
+        pos += size
+        i += 1
+    return chunks
+
+
+class TestStreamingArgExtractor:
+
+    @pytest.mark.parametrize("ensure_ascii", [True, False])
+    @pytest.mark.parametrize("sizes", [[1], [2], [3, 7], [5, 1, 11], [10_000]])
+    def test_any_chunking_matches_json_loads(self, ensure_ascii, sizes) -> None:
+        args = json.dumps({"title": "T", "content": CONTENT, "after": 1},
+                          ensure_ascii=ensure_ascii)
+        assert _extract(_chunk(args, sizes)) == CONTENT
+
+    def test_random_chunking(self) -> None:
+        rng = random.Random(0)
+        args = json.dumps({"content": CONTENT * 20})
+        for _ in range(20):
+            sizes = [rng.randint(1, 9) for _ in range(17)]
+            assert _extract(_chunk(args, sizes)) == CONTENT * 20
+
+    def test_partial_escape_is_held_back(self) -> None:
+        ex = _StreamingArgExtractor("content")
+        assert ex.feed('{"content": "a\\') == "a"
+        assert ex.feed("u00") == ""
+        assert ex.feed("e9b") == "éb"
+
+    def test_surrogate_pair_is_never_split(self) -> None:
+        ex = _StreamingArgExtractor("content")
+        assert ex.feed('{"content": "\\ud83d') == ""
+        assert ex.feed("\\ude00!") == "\U0001F600!"
+
+    def test_stops_at_closing_quote(self) -> None:
+        ex = _StreamingArgExtractor("content")
+        assert ex.feed('{"content": "done", ') == "done"
+        assert ex.feed('"content": "again"}') == ""
+
+    def test_only_top_level_key_matches(self) -> None:
+        args = json.dumps({"meta": {"content": "nested"}, "note": "\"content\": \"x",
+                           "content": "top"})
+        assert _extract(_chunk(args, [4])) == "top"
+
+    def test_non_string_value_is_skipped(self) -> None:
+        args = '{"content": null, "other": "content"}'
+        assert _extract(_chunk(args, [3])) == ""
+
+
+class TestStreamLlmArguments:
+
+    def test_streamed_report_is_forwarded_and_reassembled(self) -> None:
+        ws = MagicMock()
+        ws.user_home = None
+        agent = AnalystAgent(client=None, workspace=ws)
+        agent.registry = MagicMock()
+        agent.registry.action_stream_spec.side_effect = (
+            lambda name: ("content", "report") if name == "write_report" else None
+        )
+        agent._streamed_channels = {}
+
+        args = json.dumps({"title": "T", "content": CONTENT})
+        streamer = {}
+        events = []
+        slot = {"id": "call_1", "name": "write_report", "arguments": []}
+        for part in _chunk(args, [5]):
+            slot["arguments"].append(part)
+            events.extend(agent._forward_stream_delta(slot, streamer))
+
+        assert events[0] == {"type": "action", "action": "write_report"}
+        text = "".join(e["content"] for e in events if e["type"] == "text_delta")
+        assert text == CONTENT
+        assert json.loads("".join(slot["arguments"]))["content"] == CONTENT
+        assert agent._streamed_channels == {"call_1": "report"}
+
+    def test_chunks_before_name_are_caught_up(self) -> None:
+        ws = MagicMock()
+        ws.user_home = None
+        agent = AnalystAgent(client=None, workspace=ws)
+        agent.registry = SimpleNamespace(action_stream_spec=lambda name: ("content", "report"))
+        agent._streamed_channels = {}
+
+        streamer = {}
+        slot = {"id": "c", "name": "", "arguments": ['{"content": "ab']}
+        assert list(agent._forward_stream_delta(slot, streamer)) == []
+        slot["name"] = "write_report"
+        slot["arguments"].append('c"}')
+        events = list(agent._forward_stream_delta(slot, streamer))
+        assert events[-1]["content"] == "abc"
@@ -0,0 +1,119 @@
+"""Memoized table-context blocks and catalog overlays for agent prompts.
+
+Background
+----------
+Every analyst run rebuilt ``build_lightweight_table_context`` from scratch —
+reading each table, re-summarising its fields and re-parsing every cached
+catalog — even when nothing in the workspace had changed. Rendered
+per-table blocks are now memoized by the table's data identity (workspace,
+table name, file size/mtime) and metadata overlays, and catalog overlays by the catalog files' signature, so
+follow-up questions skip that work and produce a byte-identical prefix for
+provider-side prompt caching. Any change to the data, the metadata or a
+catalog must still show up in the next prompt.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from data_formulator.agents.agent_utils import build_catalog_metadata_lookups
+from data_formulator.agents.client_utils import Client
+from data_formulator.agents.context import build_lightweight_table_context
+from data_formulator.datalake.catalog_cache import save_catalog
+from data_formulator.datalake.workspace import Workspace
+
+pytestmark = [pytest.mark.backend]
+
+
+@pytest.fixture()
+def workspace(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATA_FORMULATOR_HOME", str(tmp_path / "home"))
+    monkeypatch.setattr("data_formulator.agents.context._table_section_cache", OrderedDict())
+    monkeypatch.setattr("data_formulator.agents.agent_utils._catalog_lookups_memo", OrderedDict())
+    ws = Workspace("ctx-user", root_dir=tmp_path)
+    ws.write_parquet(pd.DataFrame({"region": ["n", "s"], "sales": [1, 2]}), "orders")
+    return ws
+
+
+def _context(ws) -> str:
+    return build_lightweight_table_context([{"name": "orders"}], ws)
+
+
+class TestTableContextCache:
+
+    def test_unchanged_table_is_not_reread(self, workspace) -> None:
+        first = _context(workspace)
+        with patch.object(workspace, "read_data_as_df", side_effect=AssertionError("re-read")):
+            assert _context(workspace) == first
+
+    def test_data_change_invalidates(self, workspace) -> None:
+        assert "max=2" in _context(workspace)
+        workspace.write_parquet(pd.DataFrame({"region": ["n"], "sales": [99]}), "orders")
+        assert "max=99" in _context(workspace)
+
+    def test_other_workspace_with_same_content_is_not_shared(self, workspace, tmp_path) -> None:
+        _context(workspace)
+        other = Workspace("other-user", root_dir=tmp_path / "other")
+        other.write_parquet(pd.DataFrame({"region": ["n", "s"], "sales": [1, 2]}), "orders")
+        with patch.object(other, "read_data_as_df", wraps=other.read_data_as_df) as spy:
+            _context(other)
+        assert spy.call_count >= 1
+
+    def test_description_change_invalidates(self, workspace) -> None:
+        _context(workspace)
+
+        def describe(meta):
+            meta.tables["orders"].description = "Quarterly orders"
+
+        workspace._atomic_update_metadata(describe)
+        assert "Description: Quarterly orders" in _context(workspace)
+
+    def test_unreadable_table_is_not_cached(self, workspace) -> None:
+        with patch.object(workspace, "read_data_as_df", side_effect=OSError("boom")):
+            assert "(error reading schema)" in _context(workspace)
+        assert "(error reading schema)" not in _context(workspace)
+
+
+class TestCatalogLookupMemo:
+
+    def _catalog(self, ws, description: str) -> None:
+        save_catalog(ws.user_home, "pg", [{
+            "name": "orders", "table_key": "orders",
+            "metadata": {"description": description, "columns": []},
+        }])
+
+    def test_catalog_is_parsed_once_until_it_changes(self, workspace) -> None:
+        def link(meta):
+            meta.tables["orders"].source_table = "orders"
+
+        workspace._atomic_update_metadata(link)
+        self._catalog(workspace, "From the warehouse")
+        assert build_catalog_metadata_lookups(workspace)[0] == {"orders": "From the warehouse"}
+
+        with patch("data_formulator.datalake.catalog_cache.load_catalog",
+                   side_effect=AssertionError("re-parsed")):
+            descs = build_catalog_metadata_lookups(workspace)[0]
+        assert descs == {"orders": "From the warehouse"}
+        descs["orders"] = "mutated by caller"
+
+        self._catalog(workspace, "Re-synced description that is longer")
+        assert build_catalog_metadata_lookups(workspace)[0] == {
+            "orders": "Re-synced description that is longer",
+        }
+
+
+class TestAnthropicPromptCaching:
+
+    def test_system_prompt_breakpoint_only_for_anthropic(self) -> None:
+        msgs = [{"role": "system", "content": "s"}, {"role": "user", "content": "u"}]
+        anthropic = Client("anthropic", "claude-x", api_key="k")._call_kwargs(
+            messages=msgs, stream=False, params={})
+        assert anthropic["cache_control_injection_points"] == [
+            {"location": "message", "role": "system"},
+        ]
+        openai = Client("openai", "gpt-x", api_key="k")._call_kwargs(
+            messages=msgs, stream=False, params={})
+        assert "cache_control_injection_points" not in openai
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+"""
+Benchmark live ``write_report`` argument streaming.
+
+Simulates a provider streaming a long report as tool-call ``arguments``
+deltas and times extracting the ``content`` value two ways:
+
+  * rescan       -- the previous approach: accumulate the fragment by string
+                    concatenation and re-scan + ``json.loads`` the whole
+                    decoded prefix on every delta (quadratic).
+  * incremental  -- ``_StreamingArgExtractor`` fed only each new chunk.
+
+Usage:
+    python tests/backend/benchmarks/benchmark_stream_arg_extractor.py
+    python tests/backend/benchmarks/benchmark_stream_arg_extractor.py --chars 10000 50000 --chunk 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+_project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(_project_root / "py-src"))
+
+from data_formulator.analyst.agent import _StreamingArgExtractor
+
+
+class _RescanExtractor:
+    """The pre-incremental extractor, kept here only as the baseline."""
+
+    def __init__(self, field: str):
+        self._open_re = re.compile(r'"' + re.escape(field) + r'"\s*:\s*"')
+        self._emitted = 0
+
+    def feed(self, args_so_far: str) -> str:
+        m = self._open_re.search(args_so_far)
+        if not m:
+            return ""
+        rest = args_so_far[m.end():]
+        out: list[str] = []
+        i, n = 0, len(rest)
+        while i < n:
+            ch = rest[i]
+            if ch == "\\":
+                if i + 1 >= n:
+                    break
+                out.append(rest[i:i + 2])
+                i += 2
+                continue
+            if ch == '"':
+                break
+            out.append(ch)
+            i += 1
+        try:
+            decoded = json.loads('"' + "".join(out) + '"')
+        except ValueError:
+            return ""
+        new = decoded[self._emitted:]
+        self._emitted = len(decoded)
+        return new
+
+
+def _report(chars: int) -> str:
+    para = (
+        "## Findings\n\nRevenue grew **12%** quarter over quarter, driven by the "
+        '"Enterprise" segment (see chart 3). Café sales in 东京 were flat.\n\n'
+    )
+    return (para * (chars // len(para) + 1))[:chars]
+
+
+def _chunks(args: str, size: int) -> list[str]:
+    return [args[i:i + size] for i in range(0, len(args), size)]
+
+
+def run_rescan(chunks: list[str]) -> str:
+    ex = _RescanExtractor("content")
+    acc, out = "", []
+    for c in chunks:
+        acc += c
+        out.append(ex.feed(acc))
+    return "".join(out)
+
+
+def run_incremental(chunks: list[str]) -> str:
+    ex = _StreamingArgExtractor("content")
+    return "".join(ex.feed(c) for c in chunks)
+
+
+def _time(fn, chunks: list[str], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(chunks)
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chars", type=int, nargs="+", default=[2_000, 5_000, 20_000],
+                        help="report lengths to stream (characters)")
+    parser.add_argument("--chunk", type=int, default=12, help="characters per streamed delta")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'chars':>8} {'deltas':>7} {'rescan (ms)':>12} {'incremental (ms)':>17} {'speedup':>8}")
+    for chars in args.chars:
+        report = _report(chars)
+        chunks = _chunks(json.dumps({"title": "Q3 review", "content": report}), args.chunk)
+        assert run_incremental(chunks) == report
+        assert run_rescan(chunks) == report
+        rescan = _time(run_rescan, chunks, args.repeat)
+        incremental = _time(run_incremental, chunks, args.repeat)
+        print(f"{chars:>8} {len(chunks):>7} {rescan * 1000:>12.1f} "
+              f"{incremental * 1000:>17.2f} {rescan / incremental:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
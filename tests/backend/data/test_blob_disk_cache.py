@@ -0,0 +1,230 @@
+"""Unit tests for the process-global Azure blob disk cache.
+
+Background
+----------
+Azure-backed workspaces used to copy every downloaded blob into an
+instance-level ``bytes`` dict, so memory grew with every table touched.
+Cache entries now expose mmap-backed zero-copy reads and downloads are
+streamed straight to disk via ``put_stream``.  Lookups take only their own
+shard's lock, and eviction policies keep entries in order (ordered dict for
+LRU, heap for GDSF) rather than sorting the index on every insert.
+"""
+from __future__ import annotations
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from data_formulator.datalake import blob_disk_cache
+from data_formulator.datalake.blob_disk_cache import (
+    BlobDiskCache,
+    GDSFPolicy,
+    LRUPolicy,
+    make_eviction_policy,
+)
+
+pytestmark = [pytest.mark.backend]
+
+
+@pytest.fixture()
+def cache(tmp_path) -> BlobDiskCache:
+    return BlobDiskCache(tmp_path / "blob_cache")
+
+
+def _parquet_bytes(n: int = 100) -> bytes:
+    buf = io.BytesIO()
+    pq.write_table(pa.table({"x": list(range(n))}), buf)
+    return buf.getvalue()
+
+
+class TestZeroCopyReads:
+
+    def test_read_buffer_matches_stored_bytes(self, cache) -> None:
+        entry = cache.put("c/ws/data/a.bin", b"hello world", "etag-1")
+        buf = entry.read_buffer()
+        assert isinstance(buf, pa.Buffer)
+        assert buf.to_pybytes() == b"hello world"
+
+    def test_read_buffer_is_parquet_readable(self, cache) -> None:
+        entry = cache.put("c/ws/data/t.parquet", _parquet_bytes(), "etag-1")
+        table = pq.read_table(pa.BufferReader(entry.read_buffer()))
+        assert table.num_rows == 100
+
+    def test_buffer_survives_replacement(self, cache) -> None:
+        entry = cache.put("k", b"old-content", "etag-1")
+        buf = entry.read_buffer()
+        cache.put("k", b"new-content", "etag-2")
+        assert buf.to_pybytes() == b"old-content"
+        assert cache.get("k").read_buffer().to_pybytes() == b"new-content"
+
+    def test_memory_map_is_closeable(self, cache) -> None:
+        entry = cache.put("k", b"abc", "etag-1")
+        with entry.memory_map() as mm:
+            assert mm.read() == b"abc"
+        assert mm.closed
+
+
+class TestPutStream:
+
+    def test_put_stream_writes_file_and_indexes(self, cache) -> None:
+        payload = b"x" * 10_000
+        entry = cache.put_stream("k", lambda fh: fh.write(payload), "etag-1")
+        assert entry.size == len(payload)
+        assert entry.path.read_bytes() == payload
+        assert cache.get("k").etag == "etag-1"
+
+    def test_put_stream_failure_leaves_no_entry(self, cache) -> None:
+        def _boom(fh):
+            fh.write(b"partial")
+            raise IOError("connection reset")
+
+        with pytest.raises(IOError):
+            cache.put_stream("k", _boom, "etag-1")
+        assert cache.get("k") is None
+        assert not list(cache._root.glob("*.tmp"))
+
+    def test_index_reloads_streamed_entry(self, tmp_path) -> None:
+        root = tmp_path / "blob_cache"
+        BlobDiskCache(root).put_stream("k", lambda fh: fh.write(b"abc"), "e")
+        reloaded = BlobDiskCache(root)
+        assert reloaded.get("k").read_bytes() == b"abc"
+
+
+class TestEvictionPolicies:
+
+    def test_lru_evicts_least_recently_read(self, tmp_path) -> None:
+        cache = BlobDiskCache(tmp_path, max_bytes=250, policy=LRUPolicy())
+        cache.put("a", b"a" * 100, "e")
+        cache.put("b", b"b" * 100, "e")
+        cache.get("a")
+        cache.put("c", b"c" * 100, "e")
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+
+    def test_gdsf_keeps_hot_entry_over_one_off_scan(self, tmp_path) -> None:
+        cache = BlobDiskCache(tmp_path, max_bytes=5_000, policy=GDSFPolicy())
+        cache.put("hot", b"h" * 2_000, "e")
+        for _ in range(5):
+            cache.get("hot")
+        cache.put("scan-1", b"s" * 2_000, "e")
+        cache.put("scan-2", b"s" * 2_000, "e")
+        assert cache.get("hot") is not None
+        assert cache.get("scan-1") is None
+
+    def test_just_inserted_entry_is_never_evicted(self, tmp_path) -> None:
+        cache = BlobDiskCache(tmp_path, max_bytes=10)
+        entry = cache.put("big", b"x" * 100, "e")
+        assert entry.path.exists()
+        assert cache.get("big") is not None
+
+    @pytest.mark.parametrize("name,cls", [
+        ("lru", LRUPolicy),
+        ("GDSF", GDSFPolicy),
+        ("bogus", LRUPolicy),
+    ])
+    def test_make_eviction_policy(self, name: str, cls: type) -> None:
+        assert isinstance(make_eviction_policy(name), cls)
+
+    def test_default_policy_is_lru(self, cache) -> None:
+        assert cache.stats()["policy"] == "lru"
+
+    def test_gdsf_peek_skips_stale_and_excluded_records(self) -> None:
+        policy = GDSFPolicy()
+        policy.on_insert("a", 1024)
+        policy.on_insert("b", 1024)
+        policy.on_access("a", 1024)  # leaves a stale heap record for "a"
+        assert policy.peek() == (1.0, "b")
+        assert policy.peek(exclude="b") == (2.0, "a")
+        policy.on_remove("b")
+        assert policy.peek() == (2.0, "a")
+
+    def test_eviction_picks_oldest_across_shards(self, tmp_path) -> None:
+        cache = BlobDiskCache(tmp_path, max_bytes=350, shards=4)
+        for key in ("a", "b", "c"):
+            cache.put(key, b"x" * 100, "e")
+        cache.get("a")
+        cache.put("d", b"x" * 100, "e")
+        assert cache.get("b") is None
+        assert all(cache.get(k) is not None for k in ("a", "c", "d"))
+        assert cache.stats()["evictions"] == 1
+
+
+class TestGroupQuota:
+
+    def test_group_over_quota_evicts_own_entries(self, tmp_path) -> None:
+        cache = BlobDiskCache(tmp_path, max_bytes=10_000, group_max_bytes=250)
+        cache.put("other/1", b"o" * 100, "e", group="other")
+        cache.put("ws/1", b"w" * 100, "e", group="ws")
+        cache.put("ws/2", b"w" * 100, "e", group="ws")
+        cache.put("ws/3", b"w" * 100, "e", group="ws")
+        assert cache.get("other/1") is not None
+        assert cache.stats()["group_bytes"]["ws"] <= 250
+
+    def test_default_cache_caps_each_workspace(self, tmp_path, monkeypatch) -> None:
+        # Only the size is configured; policy and quota are the shipped defaults.
+        monkeypatch.setenv("DATA_FORMULATOR_HOME", str(tmp_path))
+        monkeypatch.setenv("AZURE_BLOB_CACHE_MAX_BYTES", "1000")
+        monkeypatch.delenv("AZURE_BLOB_CACHE_POLICY", raising=False)
+        monkeypatch.delenv("AZURE_BLOB_CACHE_GROUP_MAX_BYTES", raising=False)
+        monkeypatch.setattr(blob_disk_cache, "_cache_singleton", None)
+        cache = blob_disk_cache.get_blob_disk_cache()
+        assert cache.stats()["policy"] == "lru"
+        assert cache.stats()["group_max_bytes"] == 500
+
+        for i in range(2):
+            cache.put(f"hot/{i}", b"h" * 200, "e", group="hot")
+        # A one-off scan of another workspace's large table.
+        for i in range(6):
+            cache.put(f"scan/{i}", b"s" * 200, "e", group="scan")
+        assert all(cache.get(f"hot/{i}") is not None for i in range(2))
+        assert cache.stats()["group_bytes"]["scan"] <= 500
+
+
+class TestStatsAndIndex:
+
+    def test_stats_report_hits_misses_and_bytes(self, cache) -> None:
+        cache.put("k", b"abc", "e")
+        cache.get("k")
+        cache.get("missing")
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
+        assert stats["total_bytes"] == 3
+
+    def test_hit_takes_only_its_own_shard_lock(self, tmp_path) -> None:
+        cache = BlobDiskCache(tmp_path, shards=4)
+        cache.put("k", b"abc", "e")
+        others = [s for s in cache._shards if s is not cache._shard("k")]
+        for shard in others:
+            shard.lock.acquire()
+        try:
+            with ThreadPoolExecutor(1) as pool:
+                assert pool.submit(cache.get, "k").result(timeout=5) is not None
+        finally:
+            for shard in others:
+                shard.lock.release()
+        assert cache.stats()["hits"] == 1
+
+    def test_invalidate_updates_accounting(self, cache) -> None:
+        cache.put("k", b"abc", "e", group="ws")
+        cache.invalidate("k")
+        stats = cache.stats()
+        assert stats["total_bytes"] == 0
+        assert stats["group_bytes"] == {}
+
+    def test_flushed_index_restores_entries(self, tmp_path) -> None:
+        root = tmp_path / "blob_cache"
+        first = BlobDiskCache(root)
+        first.put("k", b"abc", "etag-1", group="ws")
+        first.flush_index()
+        # Meta files are only a fallback once the snapshot covers the entry.
+        for meta in root.glob("*.meta.json"):
+            meta.unlink()
+        reloaded = BlobDiskCache(root)
+        entry = reloaded.get("k")
+        assert entry.etag == "etag-1"
+        assert entry.group == "ws"
@@ -766,6 +766,72 @@ class TestDataRoutes:
         assert resp.status_code == 200
 
 
+# ==================================================================
+# Tests: Group import
+# ==================================================================
+
+class TestImportGroup:
+
+    TABLES = [
+        {"dataset_id": "users", "name": "users"},
+        {"dataset_id": "missing", "name": "missing"},
+        {"dataset_id": "orders", "name": "orders"},
+    ]
+
+    @pytest.fixture
+    def workspace(self, tmp_path):
+        from data_formulator.datalake.workspace import Workspace
+        return Workspace("test-user", root_dir=tmp_path)
+
+    def _post(self, client, workspace, **body):
+        with patch.object(DataConnector, "_get_identity", return_value="test-user"), \
+             patch("data_formulator.auth.identity.get_identity_id", return_value="test-user"), \
+             patch("data_formulator.workspace_factory.get_workspace", return_value=workspace), \
+             patch.object(MockLoader, "max_concurrent_imports", 3), \
+             patch.object(workspace, "_commit_metadata_update",
+                          wraps=workspace._commit_metadata_update) as commits:
+            resp = client.post("/api/connectors/import-group", json={
+                "connector_id": "mock_db",
+                "tables": self.TABLES,
+                **body,
+            })
+            body_bytes = resp.get_data()
+        return resp, body_bytes, commits.call_count
+
+    def test_results_keep_request_order(self, connected_client, workspace):
+        resp, _, _ = self._post(connected_client, workspace)
+        results = resp.get_json()["data"]["results"]
+        assert [r["dataset_id"] for r in results] == ["users", "missing", "orders"]
+        assert [r["status"] for r in results] == ["success", "error", "success"]
+
+    def test_group_commits_metadata_once(self, connected_client, workspace):
+        _, _, commits = self._post(connected_client, workspace)
+        assert commits == 1
+        assert sorted(workspace.list_tables()) == ["orders", "users"]
+
+    def test_stream_emits_per_table_events_then_done(self, connected_client, workspace):
+        resp, raw, _ = self._post(connected_client, workspace, stream=True)
+        assert resp.mimetype == "application/x-ndjson"
+        events = [json.loads(line) for line in raw.decode().splitlines() if line]
+        table_events = [e for e in events if e["type"] == "table_result"]
+        assert sorted(e["index"] for e in table_events) == [0, 1, 2]
+        assert events[-1]["type"] == "done"
+        assert len(events[-1]["results"]) == 3
+
+    def test_tables_run_concurrently(self, connected_client, workspace):
+        import threading
+        seen: set[str] = set()
+        original = MockLoader.fetch_data_as_arrow
+
+        def _record(self, source_table, import_options=None):
+            seen.add(threading.current_thread().name)
+            return original(self, source_table, import_options)
+
+        with patch.object(MockLoader, "fetch_data_as_arrow", _record):
+            self._post(connected_client, workspace)
+        assert all(name.startswith("import-group") for name in seen)
+
+
 # ==================================================================
 # Tests: Error Handling
 # ==================================================================
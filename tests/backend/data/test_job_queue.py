@@ -0,0 +1,298 @@
+"""Unit tests for the in-process background job queue.
+
+Background
+----------
+Connector imports/refreshes and ``/sync-table-data`` used to run inside the
+Flask request, so a multi-million-row import held a server worker until
+proxies timed out.  With ``"async": true`` those routes submit the work to
+``JobManager`` and return a job handle that the frontend polls.  Server
+worker processes share each user's ``jobs.json`` under a file lock, so a
+job can be polled and cancelled through any worker.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from flask import Flask
+
+from data_formulator.datalake.workspace import Workspace, get_user_home
+from data_formulator import job_queue
+from data_formulator.errors import AppError
+from data_formulator.job_queue import (
+    JOB_CANCELLED,
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    JOBS_FILENAME,
+    JobManager,
+    _MAX_RETRYABLE_JOBS,
+)
+
+pytestmark = [pytest.mark.backend]
+
+USER = "test-user"
+
+
+@pytest.fixture(autouse=True)
+def df_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATA_FORMULATOR_HOME", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture()
+def manager():
+    m = JobManager(max_workers=2)
+    yield m
+    m.shutdown()
+
+
+def _persisted(identity_id: str = USER) -> dict:
+    path = get_user_home(identity_id) / JOBS_FILENAME
+    return {j["job_id"]: j for j in json.loads(path.read_text())["jobs"]}
+
+
+class TestJobLifecycle:
+
+    def test_success_records_result_and_persists(self, manager) -> None:
+        job = manager.submit(USER, "import", lambda ctx: {"row_count": 3})
+        assert job.status == JOB_QUEUED
+        done = manager.wait(USER, job.job_id, timeout=5)
+        assert done.status == JOB_SUCCEEDED
+        assert done.result == {"row_count": 3}
+        assert done.attempts == 1
+        assert _persisted()[job.job_id]["status"] == JOB_SUCCEEDED
+
+    def test_progress_message_is_visible_while_running(self, manager) -> None:
+        reported, release = threading.Event(), threading.Event()
+
+        def work(ctx):
+            ctx.report("Fetching rows 1-1000")
+            reported.set()
+            release.wait(5)
+            return {}
+
+        job = manager.submit(USER, "import", work)
+        assert reported.wait(5)
+        assert manager.get(USER, job.job_id).message == "Fetching rows 1-1000"
+        release.set()
+        assert manager.wait(USER, job.job_id, timeout=5).message == ""
+
+    def test_app_error_is_stored_as_error_dict(self, manager) -> None:
+        def work(ctx):
+            raise AppError("DATA_LOAD_ERROR", "Source table is empty")
+
+        job = manager.submit(USER, "import", work)
+        done = manager.wait(USER, job.job_id, timeout=5)
+        assert done.status == JOB_FAILED
+        assert done.error["code"] == "DATA_LOAD_ERROR"
+
+    def test_other_errors_use_classifier_and_hide_details(self, manager) -> None:
+        def work(ctx):
+            raise RuntimeError("password=hunter2")
+
+        job = manager.submit(
+            USER, "import", work,
+            classify_error=lambda e: {"code": "CONNECTOR_ERROR", "message": "failed"},
+        )
+        done = manager.wait(USER, job.job_id, timeout=5)
+        assert done.error == {"code": "CONNECTOR_ERROR", "message": "failed"}
+        assert "hunter2" not in json.dumps(_persisted())
+
+    def test_jobs_are_scoped_per_identity(self, manager) -> None:
+        job = manager.submit(USER, "import", lambda ctx: {})
+        manager.wait(USER, job.job_id, timeout=5)
+        with pytest.raises(AppError):
+            manager.get("someone-else", job.job_id)
+        assert manager.list_jobs("someone-else") == []
+
+
+class TestCancelAndRetry:
+
+    def test_cancel_running_job_stops_at_checkpoint(self, manager) -> None:
+        started, release = threading.Event(), threading.Event()
+        committed = []
+
+        def work(ctx):
+            started.set()
+            release.wait(5)
+            ctx.raise_if_cancelled()
+            committed.append(True)
+            return {}
+
+        job = manager.submit(USER, "refresh", work)
+        assert started.wait(5)
+        manager.cancel(USER, job.job_id)
+        release.set()
+        assert manager.wait(USER, job.job_id, timeout=5).status == JOB_CANCELLED
+        assert committed == []
+
+    def test_cancel_queued_job_never_runs(self) -> None:
+        manager = JobManager(max_workers=1)
+        release = threading.Event()
+        ran = []
+        try:
+            blocker = manager.submit(USER, "import", lambda ctx: release.wait(5) and {})
+            queued = manager.submit(USER, "import", lambda ctx: ran.append(1) or {})
+            assert manager.cancel(USER, queued.job_id).status == JOB_CANCELLED
+            release.set()
+            manager.wait(USER, blocker.job_id, timeout=5)
+        finally:
+            manager.shutdown()
+        assert ran == []
+
+    def test_retry_reruns_failed_job(self, manager) -> None:
+        calls = []
+
+        def flaky(ctx):
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("transient")
+            return {"ok": True}
+
+        job = manager.submit(USER, "import", flaky)
+        assert manager.wait(USER, job.job_id, timeout=5).status == JOB_FAILED
+        manager.retry(USER, job.job_id)
+        done = manager.wait(USER, job.job_id, timeout=5)
+        assert done.status == JOB_SUCCEEDED
+        assert done.attempts == 2
+
+    def test_retry_rejects_succeeded_job(self, manager) -> None:
+        job = manager.submit(USER, "import", lambda ctx: {})
+        manager.wait(USER, job.job_id, timeout=5)
+        with pytest.raises(AppError):
+            manager.retry(USER, job.job_id)
+
+
+class TestRunnerRelease:
+
+    def test_succeeded_job_drops_its_function(self, manager) -> None:
+        job = manager.submit(USER, "import", lambda ctx: {})
+        manager.wait(USER, job.job_id, timeout=5)
+        assert job.job_id not in manager._runners
+
+    def test_only_recent_failures_stay_retryable(self, manager) -> None:
+        def fail(ctx):
+            raise RuntimeError("boom")
+
+        jobs = []
+        for _ in range(_MAX_RETRYABLE_JOBS + 2):
+            jobs.append(manager.submit(USER, "import", fail))
+            manager.wait(USER, jobs[-1].job_id, timeout=5)
+        assert [j.job_id in manager._runners for j in jobs] == [False] * 2 + [True] * _MAX_RETRYABLE_JOBS
+        with pytest.raises(AppError):
+            manager.retry(USER, jobs[0].job_id)
+        manager.retry(USER, jobs[-1].job_id)
+
+
+class TestPersistence:
+
+    def test_unfinished_jobs_fail_after_restart(self) -> None:
+        first = JobManager(max_workers=1)
+        release = threading.Event()
+        try:
+            job = first.submit(USER, "import", lambda ctx: release.wait(5) and {})
+            # Simulate a crash while the job is still in flight: the OS drops
+            # a dead process's liveness lock.
+            for lock in first._owner_locks.values():
+                lock.__exit__(None, None, None)
+            second = JobManager(max_workers=1)
+            restored = second.get(USER, job.job_id)
+            assert restored.status == JOB_FAILED
+            assert restored.error["code"] == "SERVICE_UNAVAILABLE"
+            with pytest.raises(AppError):
+                second.retry(USER, job.job_id)
+            second.shutdown()
+        finally:
+            release.set()
+            first.shutdown()
+
+
+class TestMultipleWorkers:
+    """Two managers stand in for two server worker processes sharing a user home."""
+
+    @pytest.fixture()
+    def workers(self):
+        a, b = JobManager(max_workers=1), JobManager(max_workers=1)
+        yield a, b
+        a.shutdown()
+        b.shutdown()
+
+    def test_job_submitted_in_one_worker_is_visible_in_another(self, workers) -> None:
+        a, b = workers
+        started, release = threading.Event(), threading.Event()
+
+        def work(ctx):
+            started.set()
+            release.wait(5)
+            return {"row_count": 1}
+
+        job = a.submit(USER, "import", work)
+        assert started.wait(5)
+        # A live owner's job is not mistaken for an orphan.
+        assert b.get(USER, job.job_id).status == JOB_RUNNING
+        release.set()
+        a.wait(USER, job.job_id, timeout=5)
+        assert b.get(USER, job.job_id).result == {"row_count": 1}
+
+    def test_workers_do_not_overwrite_each_others_jobs(self, workers) -> None:
+        a, b = workers
+        first = a.submit(USER, "import", lambda ctx: {})
+        a.wait(USER, first.job_id, timeout=5)
+        second = b.submit(USER, "import", lambda ctx: {})
+        b.wait(USER, second.job_id, timeout=5)
+        third = a.submit(USER, "import", lambda ctx: {})
+        a.wait(USER, third.job_id, timeout=5)
+        assert set(_persisted()) == {first.job_id, second.job_id, third.job_id}
+        assert {j.job_id for j in b.list_jobs(USER)} == set(_persisted())
+
+    def test_cancel_through_another_worker_reaches_the_owner(self, workers, monkeypatch) -> None:
+        monkeypatch.setattr(job_queue, "_SYNC_SECONDS", 0.0)
+        a, b = workers
+        started, cancelled = threading.Event(), threading.Event()
+
+        def work(ctx):
+            started.set()
+            while not cancelled.is_set():
+                ctx.raise_if_cancelled()
+                time.sleep(0.01)
+            return {}
+
+        job = a.submit(USER, "import", work)
+        assert started.wait(5)
+        assert b.cancel(USER, job.job_id).message == "Cancelling…"
+        done = a.wait(USER, job.job_id, timeout=5)
+        cancelled.set()
+        assert done.status == JOB_CANCELLED
+        assert b.get(USER, job.job_id).status == JOB_CANCELLED
+
+
+class TestSyncTableDataAsync:
+
+    def test_async_sync_returns_job_handle(self, manager, tmp_path) -> None:
+        from data_formulator.error_handler import register_error_handlers
+        from data_formulator.routes.tables import tables_bp
+
+        ws = Workspace(USER, root_dir=tmp_path / "ws")
+        ws.write_parquet(pd.DataFrame({"x": [1]}), "t")
+
+        app = Flask(__name__)
+        app.register_blueprint(tables_bp)
+        register_error_handlers(app)
+        with patch("data_formulator.routes.tables._get_workspace", return_value=ws), \
+             patch("data_formulator.routes.tables.get_identity_id", return_value=USER), \
+             patch("data_formulator.routes.tables.get_job_manager", return_value=manager):
+            resp = app.test_client().post("/api/tables/sync-table-data", json={
+                "table_name": "t", "rows": [{"x": 1}, {"x": 2}], "async": True,
+            })
+        body = resp.get_json()
+        job_id = body["data"]["job_id"]
+        done = manager.wait(USER, job_id, timeout=5)
+        assert done.status == JOB_SUCCEEDED
+        assert done.result["row_count"] == 2
+        assert len(ws.read_data_as_df("t")) == 2
@@ -0,0 +1,129 @@
+"""Unit tests for ``Workspace.metadata_batch``.
+
+Background
+----------
+Multi-table operations (group imports, source-file replacement, ingest +
+metadata enrichment) used to rewrite ``workspace.yaml`` once per table
+change.  ``metadata_batch`` collects those changes and commits them in a
+single read-modify-write cycle.  Updaters that pick a unique table name
+commit immediately instead, since a deferred replay by name could collide
+with a table another request added meanwhile.
+"""
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from data_formulator.datalake.file_manager import save_uploaded_file
+from data_formulator.datalake.workspace import Workspace
+from data_formulator.datalake.workspace_metadata import TableMetadata, load_metadata
+
+pytestmark = [pytest.mark.backend]
+
+
+def _table(name: str, source_file: str | None = None) -> TableMetadata:
+    return TableMetadata(
+        name=name,
+        source_type="upload",
+        filename=f"{name}.csv",
+        file_type="csv",
+        created_at=datetime.now(timezone.utc),
+        source_file=source_file,
+    )
+
+
+@pytest.fixture()
+def ws(tmp_path) -> Workspace:
+    return Workspace("test-user", root_dir=tmp_path)
+
+
+def _count_commits(ws: Workspace):
+    return patch.object(
+        ws, "_commit_metadata_update", wraps=ws._commit_metadata_update,
+    )
+
+
+class TestMetadataBatch:
+
+    def test_many_writes_commit_once(self, ws) -> None:
+        with _count_commits(ws) as spy:
+            with ws.metadata_batch():
+                for i in range(5):
+                    ws.write_parquet(pd.DataFrame({"x": [i]}), f"t{i}")
+        assert spy.call_count == 1
+        assert sorted(load_metadata(ws._path).tables) == [f"t{i}" for i in range(5)]
+
+    def test_reads_inside_batch_see_pending_changes(self, ws) -> None:
+        with ws.metadata_batch():
+            ws.add_table_metadata(_table("a"))
+            assert ws.get_table_metadata("a") is not None
+            assert "a" not in load_metadata(ws._path).tables
+        assert "a" in load_metadata(ws._path).tables
+
+    def test_removals_are_committed(self, ws) -> None:
+        ws.add_table_metadata(_table("a", source_file="f.csv"))
+        ws.add_table_metadata(_table("b"))
+        with ws.metadata_batch():
+            assert ws.delete_tables_by_source_file("f.csv") == ["a"]
+            ws.add_table_metadata(_table("c"))
+        assert sorted(load_metadata(ws._path).tables) == ["b", "c"]
+
+    def test_nested_batches_commit_at_outermost_exit(self, ws) -> None:
+        with _count_commits(ws) as spy:
+            with ws.metadata_batch():
+                with ws.metadata_batch():
+                    ws.add_table_metadata(_table("a"))
+                assert spy.call_count == 0
+                ws.add_table_metadata(_table("b"))
+        assert spy.call_count == 1
+
+    def test_concurrent_outside_change_is_preserved(self, ws, tmp_path) -> None:
+        other = Workspace("test-user", root_dir=tmp_path)
+        with ws.metadata_batch():
+            ws.add_table_metadata(_table("mine"))
+            other.add_table_metadata(_table("theirs"))
+        assert sorted(load_metadata(ws._path).tables) == ["mine", "theirs"]
+
+    def test_pending_changes_committed_when_block_raises(self, ws) -> None:
+        with pytest.raises(RuntimeError):
+            with ws.metadata_batch():
+                ws.add_table_metadata(_table("a"))
+                raise RuntimeError("boom")
+        assert "a" in load_metadata(ws._path).tables
+
+    def test_threads_share_one_batch(self, ws) -> None:
+        with _count_commits(ws) as spy:
+            with ws.metadata_batch():
+                threads = [
+                    threading.Thread(target=ws.add_table_metadata, args=(_table(f"t{i}"),))
+                    for i in range(8)
+                ]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+        assert spy.call_count == 1
+        assert len(load_metadata(ws._path).tables) == 8
+
+    def test_empty_batch_does_not_write(self, ws) -> None:
+        with _count_commits(ws) as spy:
+            with ws.metadata_batch():
+                ws.list_tables()
+        assert spy.call_count == 0
+
+    def test_unique_name_is_resolved_against_committed_metadata(self, ws, tmp_path) -> None:
+        other = Workspace("test-user", root_dir=tmp_path)
+        with ws.metadata_batch():
+            ws.get_metadata()  # the batch's working copy predates "sales"
+            other.add_table_metadata(_table("sales", source_file="theirs.csv"))
+            saved = save_uploaded_file(ws, b"a,b\n1,2\n", "sales.csv")
+            assert saved.name == "sales_1"
+            ws.add_table_metadata(_table("later"))
+            assert ws.get_table_metadata("sales_1") is not None
+        tables = load_metadata(ws._path).tables
+        assert sorted(tables) == ["later", "sales", "sales_1"]
+        assert tables["sales"].source_file == "theirs.csv"
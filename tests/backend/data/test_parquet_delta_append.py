@@ -0,0 +1,219 @@
+"""Unit tests for delta (append / upsert) writes to workspace parquet tables.
+
+Background
+----------
+Auto-refreshing tables used to send their whole accumulated history to
+``/sync-table-data`` on every tick, which rebuilt the parquet file through
+``pd.DataFrame(rows)`` + ``write_parquet``.  Clients can now send only new
+rows: ``Workspace.append_parquet`` writes them as a new part file next to
+the table's main parquet file (optionally de-duplicated by a watermark
+column), so a tick costs O(delta).  Readers see the main file plus its
+parts; once too many parts accumulate they are folded into the main file
+in the background.  Upserts by key rewrite the table.
+"""
+from __future__ import annotations
+
+import json
+import shutil
+from unittest.mock import patch
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+from flask import Flask
+
+from data_formulator.datalake import workspace as workspace_module
+from data_formulator.datalake.workspace import Workspace
+
+pytestmark = [pytest.mark.backend]
+
+
+@pytest.fixture()
+def ws(tmp_path):
+    ws = Workspace("test-user", root_dir=tmp_path)
+    ws.write_parquet(pd.DataFrame({"ts": ["2026-01-01T00:00:01", "2026-01-01T00:00:02"],
+                                   "id": [1, 2], "v": [10.0, 20.0]}), "feed")
+    yield ws
+    shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+def _num_row_groups(ws: Workspace, table: str) -> int:
+    return pq.ParquetFile(ws.get_parquet_path(table)).metadata.num_row_groups
+
+
+def _append(ws: Workspace, i: int) -> None:
+    ws.append_parquet(pd.DataFrame({"ts": [f"2026-01-01T00:00:{i:02d}"], "id": [i], "v": [0.0]}), "feed")
+
+
+class TestAppendParquet:
+
+    def test_append_writes_a_part_file_and_leaves_the_main_file_alone(self, ws) -> None:
+        before = ws.get_table_metadata("feed").content_hash
+        main = ws.get_file_path("feed.parquet")
+        main_stat = main.stat()
+        meta, info = ws.append_parquet(
+            pd.DataFrame({"ts": ["2026-01-01T00:00:03"], "id": [3], "v": [30.0]}), "feed",
+        )
+        assert info["rows_appended"] == 1
+        assert meta.row_count == 3
+        assert meta.content_hash != before
+        assert len(meta.parts) == 1 and ws.get_file_path(meta.parts[0]).exists()
+        assert (main.stat().st_mtime_ns, main.stat().st_size) == (main_stat.st_mtime_ns, main_stat.st_size)
+
+        assert ws.read_data_as_df("feed")["id"].tolist() == [1, 2, 3]
+        assert ws.get_parquet_schema("feed")["num_rows"] == 3
+        assert ws.run_parquet_sql("feed", "SELECT SUM(id) AS s FROM {parquet}").iloc[0, 0] == 6
+
+    def test_path_getters_do_not_rewrite_storage(self, ws) -> None:
+        _append(ws, 3)
+        path = ws.get_parquet_path("feed")
+        parts = ws.get_table_metadata("feed").parts
+        assert len(parts) == 1
+        assert pq.read_table(path).column("id").to_pylist() == [1, 2]
+
+        with ws.parquet_files("feed") as (_meta, paths):
+            assert len(paths) == 2
+            assert sum(len(pq.read_table(p)) for p in paths) == 3
+
+        _append(ws, 4)
+        with ws.local_dir() as wd:
+            # The sandbox copy sees the merged table ...
+            assert len(pq.read_table(wd / "data" / "feed.parquet")) == 4
+        # ... while the workspace keeps its parts untouched.
+        assert len(ws.get_table_metadata("feed").parts) == 2
+        assert len(ws.read_data_as_df("feed")) == 4
+
+    def test_overwrite_deletes_parts(self, ws) -> None:
+        _append(ws, 3)
+        part = ws.get_file_path(ws.get_table_metadata("feed").parts[0])
+        ws.write_parquet(pd.DataFrame({"ts": ["x"], "id": [9], "v": [1.0]}), "feed")
+        assert not part.exists()
+        assert ws.read_data_as_df("feed")["id"].tolist() == [9]
+
+    def test_watermark_skips_already_synced_rows(self, ws) -> None:
+        delta = pd.DataFrame({"ts": ["2026-01-01T00:00:02", "2026-01-01T00:00:03"],
+                              "id": [2, 3], "v": [20.0, 30.0]})
+        _, info = ws.append_parquet(delta, "feed", watermark_column="ts")
+        assert info["rows_appended"] == 1
+        assert info["watermark"] == "2026-01-01T00:00:03"
+        # A retried tick is a no-op.
+        _, info = ws.append_parquet(delta, "feed", watermark_column="ts")
+        assert info["rows_appended"] == 0
+        assert len(ws.read_data_as_df("feed")) == 3
+        assert len(ws.get_table_metadata("feed").parts) == 1
+
+    def test_upsert_replaces_rows_by_key(self, ws) -> None:
+        _append(ws, 3)
+        part = ws.get_file_path(ws.get_table_metadata("feed").parts[0])
+        delta = pd.DataFrame({"ts": ["2026-01-01T00:00:09", "2026-01-01T00:00:09"],
+                              "id": [3, 4], "v": [99.0, 40.0]})
+        meta, info = ws.append_parquet(delta, "feed", key_columns=["id"])
+        assert (info["rows_appended"], info["rows_replaced"]) == (2, 1)
+        df = ws.read_data_as_df("feed").set_index("id")
+        assert meta.row_count == 4
+        assert df.loc[3, "v"] == 99.0
+        # The rewrite folds earlier parts into the main file.
+        assert meta.parts is None and not part.exists()
+
+    def test_column_mismatch_raises_value_error(self, ws) -> None:
+        with pytest.raises(ValueError):
+            ws.append_parquet(pd.DataFrame({"other": [1]}), "feed")
+        assert ws.get_table_metadata("feed").row_count == 2
+
+    def test_empty_delta_does_not_rewrite(self, ws) -> None:
+        before = ws.get_table_metadata("feed").content_hash
+        _, info = ws.append_parquet(pd.DataFrame(), "feed", watermark_column="ts")
+        assert info == {"rows_appended": 0, "rows_replaced": 0, "watermark": "2026-01-01T00:00:02"}
+        assert ws.get_table_metadata("feed").content_hash == before
+
+
+class TestCompaction:
+
+    def test_compact_table_folds_parts_and_keeps_hash(self, ws) -> None:
+        for i in range(3, 8):
+            _append(ws, i)
+        meta = ws.get_table_metadata("feed")
+        content_hash = meta.content_hash
+        parts = [ws.get_file_path(p) for p in meta.parts]
+        assert len(parts) == 5
+        assert ws.compact_table("feed")
+        meta = ws.get_table_metadata("feed")
+        assert meta.parts is None
+        assert not any(p.exists() for p in parts)
+        assert _num_row_groups(ws, "feed") == 1
+        assert meta.content_hash == content_hash
+        assert ws.read_data_as_df("feed")["id"].tolist() == list(range(1, 8))
+
+    def test_compaction_without_parts_is_a_no_op(self, ws) -> None:
+        assert not ws.compact_table("feed")
+
+    def test_threshold_schedules_background_compaction(self, ws, monkeypatch) -> None:
+        monkeypatch.setattr(workspace_module, "COMPACTION_PART_THRESHOLD", 1)
+        with patch.object(workspace_module, "_schedule_compaction") as schedule:
+            _append(ws, 3)
+            schedule.assert_not_called()
+            _append(ws, 4)
+        schedule.assert_called_once()
+
+
+class TestSyncTableDataDeltaModes:
+
+    @pytest.fixture()
+    def client(self, ws):
+        from data_formulator.error_handler import register_error_handlers
+        from data_formulator.routes.tables import tables_bp
+
+        app = Flask(__name__)
+        app.register_blueprint(tables_bp)
+        register_error_handlers(app)
+        with patch("data_formulator.routes.tables._get_workspace", return_value=ws):
+            with app.test_client() as c:
+                yield c
+
+    def _sync(self, client, **payload) -> dict:
+        resp = client.post("/api/tables/sync-table-data", data=json.dumps(payload),
+                           content_type="application/json")
+        return resp.get_json()
+
+    def test_append_mode_returns_watermark(self, client, ws) -> None:
+        body = self._sync(client, table_name="feed", mode="append", watermark_column="ts",
+                          rows=[{"ts": "2026-01-01T00:00:05", "id": 5, "v": 1.0}])
+        assert body["status"] == "success"
+        assert body["data"]["row_count"] == 3
+        assert body["data"]["watermark"] == "2026-01-01T00:00:05"
+
+    def test_schema_mismatch_is_invalid_request(self, client) -> None:
+        body = self._sync(client, table_name="feed", mode="append", rows=[{"nope": 1}])
+        assert body["status"] == "error"
+        assert body["error"]["code"] == "INVALID_REQUEST"
+
+    def test_upsert_requires_key_columns(self, client) -> None:
+        body = self._sync(client, table_name="feed", mode="upsert", rows=[])
+        assert body["error"]["code"] == "INVALID_REQUEST"
+
+
+class TestDemoStreamSince:
+
+    def test_offsets_are_converted_to_utc(self) -> None:
+        from datetime import datetime
+
+        from data_formulator.routes.demo_stream import _parse_since
+
+        assert _parse_since("2026-01-01T02:00:00+02:00") == datetime(2026, 1, 1, 0, 0)
+        assert _parse_since("2026-01-01T00:00:00Z") == datetime(2026, 1, 1, 0, 0)
+        assert _parse_since("2026-01-01T00:00:00") == datetime(2026, 1, 1, 0, 0)
+        assert _parse_since("not a time") is None
+
+    def test_rows_with_unparseable_timestamps_are_kept(self) -> None:
+        from datetime import datetime
+
+        from data_formulator.routes.demo_stream import _rows_after
+
+        rows = [
+            {"timestamp": "2026-01-01T00:00:00Z"},
+            {"timestamp": "2026-01-02T00:00:00Z"},
+            {"timestamp": "garbled"},
+        ]
+        kept = _rows_after(rows, datetime(2026, 1, 1, 12, 0))
+        assert [r["timestamp"] for r in kept] == ["2026-01-02T00:00:00Z", "garbled"]
+        assert _rows_after(rows, None) == rows
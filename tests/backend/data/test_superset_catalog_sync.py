@@ -62,7 +62,7 @@ def _make_mock_loader(datasets=None, columns_by_id=None, dashboards=None):
 
 class TestGetDatasetColumns:
     def test_calls_correct_endpoint(self):
-        with patch("data_formulator.data_loader.superset_client.requests.get") as mock_get:
+        with patch("data_formulator.data_loader.superset_client.requests.Session.get") as mock_get:
             mock_resp = MagicMock()
             mock_resp.json.return_value = {
                 "result": [
@@ -86,7 +86,7 @@ class TestGetDatasetColumns:
             assert result[1]["is_dttm"] is True
 
     def test_returns_empty_on_empty_result(self):
-        with patch("data_formulator.data_loader.superset_client.requests.get") as mock_get:
+        with patch("data_formulator.data_loader.superset_client.requests.Session.get") as mock_get:
             mock_resp = MagicMock()
             mock_resp.json.return_value = {"result": []}
             mock_resp.raise_for_status = MagicMock()
@@ -118,7 +118,7 @@ class TestGetDatasetColumns:
                 }
             return resp
 
-        with patch("data_formulator.data_loader.superset_client.requests.get", side_effect=_mock_get):
+        with patch("data_formulator.data_loader.superset_client.requests.Session.get", side_effect=_mock_get):
             client = SupersetClient("https://superset.example.com")
             result = client.get_dataset_columns("test-token", 42)
 
@@ -129,7 +129,7 @@ class TestGetDatasetColumns:
     def test_propagates_error_when_both_endpoints_fail(self):
         import requests
 
-        with patch("data_formulator.data_loader.superset_client.requests.get") as mock_get:
+        with patch("data_formulator.data_loader.superset_client.requests.Session.get") as mock_get:
             mock_resp = MagicMock()
             mock_resp.raise_for_status.side_effect = requests.HTTPError("404")
             mock_get.return_value = mock_resp
@@ -0,0 +1,157 @@
+"""Pooled session, pagination and metadata response cache for Superset.
+
+Background
+----
+- ``SupersetClient`` made a bare ``requests.get`` per call, so every
+  dataset-column and dashboard-dataset lookup paid fresh TCP/TLS setup. It
+  now shares one keep-alive session with a sized pool and GET retries.
+- Dataset detail/columns are cached per client and reused while the
+  dataset's ``changed_on`` (from ``list_datasets``) is unchanged;
+  ETag-bearing responses are revalidated with ``If-None-Match``.
+- ``SupersetLoader`` pages through all dashboards instead of a fixed
+  ``page_size=500`` and fetches each dataset's columns once per sync.
+"""
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from data_formulator.data_loader.superset_client import SupersetClient
+from data_formulator.data_loader.superset_data_loader import SupersetLoader
+
+pytestmark = [pytest.mark.backend, pytest.mark.plugin]
+
+BASE = "https://superset.example.com"
+
+
+class _Resp:
+    def __init__(self, body=None, status: int = 200, etag: str | None = None):
+        self._body = body
+        self.status_code = status
+        self.headers = {"ETag": etag} if etag else {}
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(str(self.status_code), response=self)
+
+
+class _FakeSession:
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls: list[tuple[str, dict]] = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.calls.append((url, dict(headers or {})))
+        return self.routes(url, headers or {})
+
+
+def _client(routes) -> tuple[SupersetClient, _FakeSession]:
+    client = SupersetClient(BASE)
+    session = _FakeSession(routes)
+    client._session = session
+    return client, session
+
+
+class TestSupersetClientSession:
+
+    def test_one_pooled_session_with_get_retries(self) -> None:
+        client = SupersetClient(BASE, pool_size=12, max_retries=2)
+        adapter = client._session.get_adapter(f"{BASE}/api/v1/dataset/")
+        assert adapter._pool_maxsize == 12
+        assert adapter.max_retries.total == 2
+        assert 429 in adapter.max_retries.status_forcelist
+        assert "POST" not in adapter.max_retries.allowed_methods
+        assert adapter.max_retries.respect_retry_after_header
+
+    def test_columns_reused_while_changed_on_is_unchanged(self) -> None:
+        listing = {"result": [{"id": 7, "changed_on_utc": "2024-01-01T00:00:00"}], "count": 1}
+
+        def routes(url, headers):
+            if url.endswith("/dataset/"):
+                return _Resp(listing)
+            return _Resp({"result": [{"column_name": "a"}]})
+
+        client, session = _client(routes)
+        client.list_datasets("tok")
+        first = client.get_dataset_columns("tok", 7)
+        first[0]["column_name"] = "mutated by caller"
+        assert client.get_dataset_columns("tok", 7) == [{"column_name": "a"}]
+        assert sum("/column" in u for u, _ in session.calls) == 1
+
+        listing["result"][0]["changed_on_utc"] = "2024-02-01T00:00:00"
+        client.list_datasets("tok")
+        client.get_dataset_columns("tok", 7)
+        assert sum("/column" in u for u, _ in session.calls) == 2
+
+    def test_etag_revalidation_serves_cached_body_on_304(self) -> None:
+        def routes(url, headers):
+            if headers.get("If-None-Match") == '"v1"':
+                return _Resp(status=304)
+            return _Resp({"result": [{"id": 1, "table_name": "orders"}]}, etag='"v1"')
+
+        client, session = _client(routes)
+        assert client.get_dashboard_datasets("tok", 3)["result"][0]["table_name"] == "orders"
+        assert client.get_dashboard_datasets("tok", 3)["result"][0]["table_name"] == "orders"
+        assert session.calls[1][1]["If-None-Match"] == '"v1"'
+
+    def test_missing_column_endpoint_is_probed_once(self) -> None:
+        def routes(url, headers):
+            if url.endswith("/column"):
+                return _Resp({"message": "Not found"}, status=404)
+            return _Resp({"result": {"columns": [{"column_name": "a"}]}})
+
+        client, session = _client(routes)
+        assert client.get_dataset_columns("tok", 1) == [{"column_name": "a"}]
+        assert client.get_dataset_columns("tok", 2) == [{"column_name": "a"}]
+        assert [u.rsplit("/api/v1/", 1)[1] for u, _ in session.calls] == [
+            "dataset/1/column", "dataset/1", "dataset/2",
+        ]
+
+
+def _loader(client) -> SupersetLoader:
+    with patch.object(SupersetLoader, "__init__", lambda self, params: None):
+        loader = SupersetLoader.__new__(SupersetLoader)
+    loader.params = {"url": BASE}
+    loader.url = BASE
+    loader._access_token = "fake-token"
+    loader._refresh_token = None
+    loader.username = ""
+    loader.password = ""
+    loader._is_token_expired = staticmethod(lambda token, buffer_seconds=60: False)
+    loader._client = client
+    return loader
+
+
+class TestSupersetLoaderSync:
+
+    def test_all_dashboard_pages_are_fetched(self) -> None:
+        dashboards = [{"id": i, "dashboard_title": f"D{i}"} for i in range(250)]
+        client = MagicMock()
+        client.list_dashboards.side_effect = lambda token, page=0, page_size=100: {
+            "result": dashboards[page * page_size:(page + 1) * page_size],
+            "count": len(dashboards),
+        }
+        assert len(_loader(client)._fetch_all_dashboards("tok")) == 250
+        assert client.list_dashboards.call_count == 3
+
+    def test_columns_fetched_once_per_dataset(self, monkeypatch) -> None:
+        monkeypatch.setenv("PLG_SUPERSET_MAX_CONCURRENCY", "3")
+        ds = {"id": 5, "table_name": "orders"}
+        client = MagicMock()
+        client.list_datasets.return_value = {"result": [ds], "count": 1}
+        client.list_dashboards.return_value = {
+            "result": [{"id": 1, "dashboard_title": "A"}, {"id": 2, "dashboard_title": "B"}],
+        }
+        client.get_dashboard_datasets.return_value = {"result": [ds]}
+        client.get_dataset_columns.return_value = [{"column_name": "id", "type": "INT"}]
+
+        tables = _loader(client).list_tables()
+        assert len(tables) == 3
+        assert client.get_dataset_columns.call_count == 1
+        assert all(t["metadata"]["columns"][0]["name"] == "id" for t in tables)
+        assert SupersetLoader.rate_limit() == {"max_concurrent_requests": 3}
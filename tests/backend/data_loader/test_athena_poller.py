@@ -0,0 +1,204 @@
+"""Shared completion poller for Athena queries.
+
+Background
+----------
+``AthenaDataLoader._execute_query`` used to sleep in a per-request loop on
+``get_query_execution`` with backoff up to 10 s, so completions were
+noticed late and every waiting import held a sleeping thread that polled
+on its own. One background poller now checks all in-flight queries with
+batched ``batch_get_query_execution`` calls and resolves a future per
+query. Waiters still stop their query on timeout, and also when the
+surrounding import job is cancelled. A batch call refused for a
+non-throttling reason falls back to ``get_query_execution`` per query, and
+a status that cannot be read at all fails the waiter instead of timing out.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+import botocore.exceptions
+import pytest
+
+from data_formulator.data_loader import athena_data_loader
+from data_formulator.data_loader.athena_data_loader import AthenaDataLoader, _AthenaQueryPoller
+from data_formulator.data_loader.external_data_loader import cancellation_scope
+
+pytestmark = [pytest.mark.backend]
+
+
+class _FakeAthena:
+    """Queries finish when the test says so; batch calls are recorded."""
+
+    def __init__(self) -> None:
+        self.states: dict[str, str] = {}
+        self.batches: list[list[str]] = []
+        self.stopped: list[str] = []
+        self._lock = threading.Lock()
+        self._n = 0
+
+    def start_query_execution(self, **_):
+        with self._lock:
+            self._n += 1
+            qid = f"q{self._n}"
+            self.states[qid] = "RUNNING"
+        return {"QueryExecutionId": qid}
+
+    def batch_get_query_execution(self, QueryExecutionIds):
+        self.batches.append(list(QueryExecutionIds))
+        return {"QueryExecutions": [{
+            "QueryExecutionId": qid,
+            "Status": {"State": self.states[qid], "StateChangeReason": "bad SQL"},
+            "ResultConfiguration": {"OutputLocation": f"s3://bucket/{qid}.csv"},
+        } for qid in QueryExecutionIds]}
+
+    def stop_query_execution(self, QueryExecutionId):
+        self.stopped.append(QueryExecutionId)
+        self.states[QueryExecutionId] = "CANCELLED"
+
+
+def _client_error(code: str, status: int, operation: str) -> botocore.exceptions.ClientError:
+    return botocore.exceptions.ClientError(
+        {"Error": {"Code": code, "Message": code}, "ResponseMetadata": {"HTTPStatusCode": status}},
+        operation,
+    )
+
+
+class _NoBatchAthena(_FakeAthena):
+    """A principal without ``athena:BatchGetQueryExecution``."""
+
+    def __init__(self, allow_single: bool = True) -> None:
+        super().__init__()
+        self.allow_single = allow_single
+
+    def batch_get_query_execution(self, QueryExecutionIds):
+        raise _client_error("AccessDeniedException", 400, "BatchGetQueryExecution")
+
+    def get_query_execution(self, QueryExecutionId):
+        if not self.allow_single:
+            raise _client_error("AccessDeniedException", 400, "GetQueryExecution")
+        return {"QueryExecution": {
+            "QueryExecutionId": QueryExecutionId,
+            "Status": {"State": self.states[QueryExecutionId]},
+            "ResultConfiguration": {"OutputLocation": f"s3://bucket/{QueryExecutionId}.csv"},
+        }}
+
+
+@pytest.fixture()
+def athena(monkeypatch):
+    monkeypatch.setattr(athena_data_loader, "_query_poller", _AthenaQueryPoller(0.02))
+    monkeypatch.setattr(athena_data_loader, "CANCEL_CHECK_INTERVAL", 0.02)
+    return _FakeAthena()
+
+
+def _loader(fake: _FakeAthena, timeout: int = 300) -> AthenaDataLoader:
+    loader = AthenaDataLoader({
+        "aws_access_key_id": "AKIA", "aws_secret_access_key": "secret",
+        "output_location": "s3://bucket/", "query_timeout": timeout,
+    })
+    loader.athena_client = fake
+    return loader
+
+
+def _finish_later(fake: _FakeAthena, qid: str, state: str, delay: float) -> None:
+    def finish():
+        time.sleep(delay)
+        fake.states[qid] = state
+    threading.Thread(target=finish, daemon=True).start()
+
+
+class TestAthenaQueryPoller:
+
+    def test_concurrent_queries_share_batched_status_calls(self, athena) -> None:
+        loader = _loader(athena)
+        results: dict[int, str] = {}
+
+        def run(i):
+            results[i] = loader._execute_query(f"SELECT {i}")
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(5)]
+        for t in threads:
+            t.start()
+        time.sleep(0.1)
+        for qid in list(athena.states):
+            athena.states[qid] = "SUCCEEDED"
+        t0 = time.time()
+        for t in threads:
+            t.join(timeout=5)
+        assert time.time() - t0 < 0.5
+        assert sorted(results.values()) == [f"s3://bucket/q{i}.csv" for i in range(1, 6)]
+        assert any(len(batch) == 5 for batch in athena.batches)
+
+    def test_failed_query_raises_its_reason(self, athena) -> None:
+        loader = _loader(athena)
+        _finish_later(athena, "q1", "FAILED", 0.05)
+        with pytest.raises(RuntimeError, match="bad SQL"):
+            loader._execute_query("SELECT 1")
+
+    def test_timeout_stops_the_query(self, athena) -> None:
+        loader = _loader(athena, timeout=1)
+        with pytest.raises(TimeoutError):
+            loader._execute_query("SELECT 1")
+        assert athena.stopped == ["q1"]
+        assert "q1" not in athena_data_loader._query_poller._pending
+
+    def test_cancelled_import_stops_the_query(self, athena) -> None:
+        loader = _loader(athena)
+        cancelled = threading.Event()
+
+        def checkpoint():
+            if cancelled.is_set():
+                raise InterruptedError("job cancelled")
+
+        threading.Timer(0.1, cancelled.set).start()
+        t0 = time.time()
+        with cancellation_scope(checkpoint), pytest.raises(InterruptedError):
+            loader._execute_query("SELECT 1")
+        assert time.time() - t0 < 1
+        assert athena.stopped == ["q1"]
+
+    def test_idle_poller_thread_exits(self) -> None:
+        poller = _AthenaQueryPoller(0.01, idle_timeout=0.05)
+        fake = _FakeAthena()
+        fake.states["q1"] = "SUCCEEDED"
+        assert poller.watch(fake, "q1").result(timeout=2)["QueryExecutionId"] == "q1"
+        deadline = time.time() + 2
+        while poller._thread is not None and time.time() < deadline:
+            time.sleep(0.01)
+        assert poller._thread is None
+        fake.states["q2"] = "SUCCEEDED"
+        assert poller.watch(fake, "q2").result(timeout=2)["QueryExecutionId"] == "q2"
+
+    def test_denied_batch_call_falls_back_to_single_lookups(self, athena) -> None:
+        fake = _NoBatchAthena()
+        loader = _loader(fake)
+        _finish_later(fake, "q1", "SUCCEEDED", 0.05)
+        t0 = time.time()
+        assert loader._execute_query("SELECT 1") == "s3://bucket/q1.csv"
+        assert time.time() - t0 < 1
+
+    def test_unreadable_status_fails_fast(self, athena) -> None:
+        fake = _NoBatchAthena(allow_single=False)
+        loader = _loader(fake)
+        t0 = time.time()
+        with pytest.raises(botocore.exceptions.ClientError, match="AccessDenied"):
+            loader._execute_query("SELECT 1")
+        assert time.time() - t0 < 1
+        assert fake.stopped == ["q1"]
+
+    def test_throttling_is_retried(self) -> None:
+        poller = _AthenaQueryPoller(0.01)
+        fake = _FakeAthena()
+        fake.states["q1"] = "SUCCEEDED"
+        real = fake.batch_get_query_execution
+        calls = []
+
+        def flaky(QueryExecutionIds):
+            calls.append(1)
+            if len(calls) == 1:
+                raise _client_error("ThrottlingException", 400, "BatchGetQueryExecution")
+            return real(QueryExecutionIds)
+
+        fake.batch_get_query_execution = flaky
+        assert poller.watch(fake, "q1").result(timeout=2)["QueryExecutionId"] == "q1"
+        assert len(calls) == 2
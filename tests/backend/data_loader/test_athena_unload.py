@@ -0,0 +1,132 @@
+"""Athena imports via UNLOAD to parquet.
+
+Background
+----------
+``AthenaDataLoader.fetch_data_as_arrow`` ran a ``SELECT ... LIMIT`` and
+parsed the single CSV result file, re-inferring every type from text over
+one S3 stream. With ``result_format='parquet'`` the query is wrapped in
+``UNLOAD ... WITH (format = 'PARQUET')`` and the typed parts are read
+concurrently through the loader's PyArrow S3 filesystem. Athena and S3
+are simulated here with a mocked client and a local sub-tree filesystem.
+"""
+from __future__ import annotations
+
+import re
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import pytest
+from pyarrow import fs as pa_fs
+
+from data_formulator.data_loader import athena_data_loader
+from data_formulator.data_loader.athena_data_loader import AthenaDataLoader
+
+pytestmark = [pytest.mark.backend]
+
+
+@pytest.fixture(autouse=True)
+def fast_poller(monkeypatch):
+    monkeypatch.setattr(athena_data_loader, "_query_poller", athena_data_loader._AthenaQueryPoller(0.01))
+
+
+def _loader(tmp_path, parts: list[pa.Table], **params) -> AthenaDataLoader:
+    loader = AthenaDataLoader({
+        "aws_access_key_id": "AKIA", "aws_secret_access_key": "secret",
+        "output_location": "s3://results-bucket/athena/", **params,
+    })
+    loader.s3_fs = pa_fs.SubTreeFileSystem(str(tmp_path), pa_fs.LocalFileSystem())
+    loader.queries = []
+    client = MagicMock()
+
+    def start(QueryString, **_):
+        loader.queries.append(QueryString)
+        unload = re.match(r"UNLOAD \((.*)\) TO 's3://([^']+)'", QueryString)
+        if unload:
+            target = tmp_path / unload.group(2)
+            target.mkdir(parents=True)
+            for i, part in enumerate(parts):
+                pq.write_table(part, target / f"part-{i:03d}")
+            return {"QueryExecutionId": "q-unload"}
+        out = tmp_path / "results-bucket" / "athena" / "q-csv.csv"
+        out.parent.mkdir(parents=True, exist_ok=True)
+        pa_csv.write_csv(pa.table({"id": pa.array([], pa.int64())}), out)
+        return {"QueryExecutionId": "q-csv"}
+
+    def batch_get(QueryExecutionIds):
+        return {"QueryExecutions": [{
+            "QueryExecutionId": qid,
+            "Status": {"State": "SUCCEEDED"},
+            "ResultConfiguration": {"OutputLocation": f"s3://results-bucket/athena/{qid}.csv"},
+        } for qid in QueryExecutionIds]}
+
+    client.start_query_execution.side_effect = start
+    client.batch_get_query_execution.side_effect = batch_get
+    loader.athena_client = client
+    return loader
+
+
+class TestAthenaUnload:
+
+    def test_csv_remains_the_default(self, tmp_path) -> None:
+        loader = _loader(tmp_path, [])
+        loader.fetch_data_as_arrow("db.t", {"size": 10})
+        assert loader.queries == ["SELECT * FROM db.t LIMIT 10"]
+
+    def test_parquet_parts_are_read_with_their_types(self, tmp_path) -> None:
+        parts = [
+            pa.table({"id": pa.array([i * 2, i * 2 + 1], pa.int32()),
+                      "ts": pa.array([None, 1], pa.timestamp("ms"))})
+            for i in range(3)
+        ]
+        loader = _loader(tmp_path, parts, result_format="parquet")
+        table = loader.fetch_data_as_arrow("db.t", {"size": 100})
+
+        assert loader.queries[0].startswith("UNLOAD (SELECT * FROM db.t LIMIT 100) TO 's3://results-bucket/athena/unload/")
+        assert "format = 'PARQUET'" in loader.queries[0]
+        assert table.schema.field("id").type == pa.int32()
+        assert table.schema.field("ts").type == pa.timestamp("ms")
+        assert sorted(table.column("id").to_pylist()) == list(range(6))
+        # The transient UNLOAD prefix is cleaned up after the read.
+        assert not list((tmp_path / "results-bucket" / "athena" / "unload").iterdir())
+
+    def test_parts_are_read_concurrently(self, tmp_path, monkeypatch) -> None:
+        parts = [pa.table({"id": [i]}) for i in range(4)]
+        loader = _loader(tmp_path, parts, result_format="parquet")
+        threads: set[int] = set()
+        real_read = pq.read_table
+
+        def slow_read(path, **kwargs):
+            threads.add(threading.get_ident())
+            time.sleep(0.2)
+            return real_read(path, **kwargs)
+
+        monkeypatch.setattr(athena_data_loader.pq, "read_table", slow_read)
+        t0 = time.time()
+        table = loader.fetch_data_as_arrow("db.t")
+        assert time.time() - t0 < 0.6
+        assert len(threads) == 4
+        assert table.column("id").to_pylist() == [0, 1, 2, 3]
+
+    def test_sort_order_is_restored_across_parts(self, tmp_path) -> None:
+        parts = [pa.table({"v": [5, 1]}), pa.table({"v": [9, 3]})]
+        loader = _loader(tmp_path, parts)
+        table = loader.fetch_data_as_arrow(
+            "db.t", {"result_format": "parquet", "sort_columns": ["v"], "sort_order": "desc"},
+        )
+        assert 'ORDER BY "v" DESC' in loader.queries[0]
+        assert table.column("v").to_pylist() == [9, 5, 3, 1]
+
+    def test_empty_unload_falls_back_to_csv_for_the_schema(self, tmp_path) -> None:
+        loader = _loader(tmp_path, [], result_format="parquet")
+        table = loader.fetch_data_as_arrow("db.t")
+        assert loader.queries[0].startswith("UNLOAD")
+        assert loader.queries[1].startswith("SELECT")
+        assert table.column_names == ["id"]
+
+    def test_invalid_result_format_is_rejected(self, tmp_path) -> None:
+        with pytest.raises(ValueError, match="result_format"):
+            _loader(tmp_path, [], result_format="orc")
@@ -0,0 +1,258 @@
+"""Batched catalog introspection for the PostgreSQL and SQL Server loaders.
+
+Background
+----------
+``get_metadata`` ran about six queries per table (columns, column comments,
+table comment, ``COUNT(*)``, select-list types, sample), and the PostgreSQL
+loader opened a fresh connection for every query against a non-default
+database. Both loaders now introspect a whole schema at once
+(``_schema_catalog``) and cache it per ``(database, schema)`` for
+``_CATALOG_TTL`` seconds. Row counts come from catalog statistics
+(``pg_class.reltuples`` / ``sys.partitions``) instead of a table scan. The
+per-table select lists that cast unsupported types to text are cached too,
+and listing a database warms that cache. PostgreSQL keeps one connection
+per database for the loader's lifetime.
+
+Catalog row counts are approximate, so ``get_metadata`` flags them with
+``row_count_estimated``.  A query built from a cached select list that
+fails (e.g. a column was dropped) drops that cache entry and is retried
+once with freshly introspected columns.
+"""
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytestmark = [pytest.mark.backend]
+
+
+class _FakeCursor:
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.description = None
+        self._rows: list[tuple] = []
+
+    def execute(self, query: str) -> None:
+        self._conn.queries.append(query)
+        rows = self._conn.respond(query)
+        if rows is None:
+            self.description = None
+            self._rows = []
+            return
+        columns = list(rows[0]) if rows else ["x"]
+        self.description = [(c,) for c in columns]
+        self._rows = [tuple(r[c] for c in columns) for r in rows]
+
+    def fetchall(self) -> list[tuple]:
+        return self._rows
+
+    def close(self) -> None:
+        pass
+
+
+class _FakeConn:
+
+    def __init__(self, respond, dbname: str = ""):
+        self.respond = respond
+        self.dbname = dbname
+        self.queries: list[str] = []
+        self.closed = False
+        self.autocommit = False
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+# ── PostgreSQL ─────────────────────────────────────────────────────────
+
+def _pg_respond(query: str):
+    if "FROM information_schema.columns c" in query:
+        return [
+            {"table_name": "orders", "column_name": "id", "data_type": "integer",
+             "udt_name": "int4", "column_comment": "Order id"},
+            {"table_name": "orders", "column_name": "shape", "data_type": "USER-DEFINED",
+             "udt_name": "geometry", "column_comment": None},
+            {"table_name": "users", "column_name": "name", "data_type": "text",
+             "udt_name": "text", "column_comment": None},
+        ]
+    if "FROM pg_catalog.pg_class c" in query:
+        return [
+            {"table_name": "orders", "table_comment": "All orders", "row_estimate": 1200},
+            {"table_name": "users", "table_comment": None, "row_estimate": -1},
+        ]
+    if "COUNT(*)" in query:
+        return [{"cnt": 7}]
+    if query.lstrip().startswith("SELECT") and "LIMIT 5" in query:
+        return [{"id": 1}]
+    return []
+
+
+class TestPostgreSQLCatalogBatching:
+
+    @pytest.fixture()
+    def conns(self):
+        opened: list[_FakeConn] = []
+
+        def connect(**kwargs):
+            opened.append(_FakeConn(_pg_respond, kwargs.get("dbname", "")))
+            return opened[-1]
+
+        with patch("psycopg2.connect", side_effect=connect):
+            yield opened
+
+    def _loader(self):
+        from data_formulator.data_loader.postgresql_data_loader import PostgreSQLDataLoader
+        return PostgreSQLDataLoader({"host": "h", "user": "u", "password": "p", "database": ""})
+
+    def test_tables_in_one_schema_share_the_catalog_queries(self, conns) -> None:
+        loader = self._loader()
+        orders = loader.get_metadata(["shop", "public", "orders"])
+        users = loader.get_metadata(["shop", "public", "users"])
+
+        assert len(conns) == 2  # primary + one reused connection to "shop"
+        shop = conns[1].queries
+        assert sum("information_schema.columns c" in q for q in shop) == 1
+        assert sum("pg_catalog.pg_class c" in q for q in shop) == 1
+
+        assert orders["row_count"] == 1200
+        assert orders["row_count_estimated"] is True
+        assert orders["description"] == "All orders"
+        assert orders["columns"][0] == {"name": "id", "type": "integer", "description": "Order id"}
+        # Never analyzed: fall back to an exact count.
+        assert users["row_count"] == 7
+        assert "row_count_estimated" not in users
+        assert any("COUNT(*)" in q and '"users"' in q for q in shop)
+
+    def test_select_list_comes_from_the_catalog(self, conns) -> None:
+        loader = self._loader()
+        loader.get_metadata(["shop", "public", "orders"])
+        sample = next(q for q in conns[1].queries if "LIMIT 5" in q)
+        assert 'ST_AsText("shape") AS "shape"' in sample
+        before = len(conns[1].queries)
+        assert loader._safe_select_list("public", "orders", dbname="shop").startswith('"id", ST_AsText')
+        assert len(conns[1].queries) == before
+
+    def test_stale_select_list_is_refreshed_after_a_failed_query(self, conns) -> None:
+        loader = self._loader()
+
+        def respond(query: str):
+            if '"gone"' in query:
+                raise RuntimeError('column "gone" does not exist')
+            if "FROM information_schema.columns" in query and "c.table_name" not in query:
+                return [{"column_name": "id", "udt_name": "int4"}, {"column_name": "shape", "udt_name": "geometry"}]
+            if "LIMIT" in query:
+                return [{"id": 1, "shape": "POINT(0 0)"}]
+            return _pg_respond(query)
+
+        loader.get_metadata(["shop", "public", "orders"])  # opens the "shop" connection
+        conns[1].respond = respond
+        loader._cache_select_lists("shop", {("public", "orders"): [("id", "int4"), ("gone", "geometry")]})
+        table = loader.fetch_data_as_arrow("shop.public.orders")
+        assert table.num_rows == 1
+        assert 'ST_AsText("shape")' in conns[1].queries[-1]
+        assert loader._safe_select_list("public", "orders", dbname="shop").endswith('AS "shape"')
+
+    def test_failure_with_current_columns_is_raised(self, conns) -> None:
+        loader = self._loader()
+        loader.get_metadata(["shop", "public", "orders"])
+
+        def respond(query: str):
+            if "LIMIT 10" in query:
+                raise RuntimeError("permission denied")
+            return _pg_respond(query)
+
+        conns[1].respond = respond
+        with pytest.raises(RuntimeError, match="permission denied"):
+            loader.fetch_data_as_arrow("shop.public.orders", {"size": 10})
+
+    def test_close_closes_every_connection(self, conns) -> None:
+        loader = self._loader()
+        loader.get_metadata(["shop", "public", "orders"])
+        loader.close()
+        assert all(c.closed for c in conns)
+
+
+# ── SQL Server ─────────────────────────────────────────────────────────
+
+def _mssql_respond(query: str):
+    if "sys.tables t" in query:
+        return [
+            {"table_name": "orders", "column_name": "id", "data_type": "int",
+             "column_description": "Order id", "table_description": "All orders", "row_count": 1200},
+            {"table_name": "orders", "column_name": "shape", "data_type": "geometry",
+             "column_description": None, "table_description": "All orders", "row_count": 1200},
+            {"table_name": "users", "column_name": "name", "data_type": "nvarchar",
+             "column_description": None, "table_description": None, "row_count": 3},
+        ]
+    if query.lstrip().startswith("SELECT TOP 5"):
+        return [{"id": 1}]
+    return []
+
+
+class TestMSSQLCatalogBatching:
+
+    @pytest.fixture()
+    def conn(self):
+        fake = _FakeConn(_mssql_respond)
+        with patch("mssql_python.connect", return_value=fake):
+            yield fake
+
+    def _loader(self):
+        from data_formulator.data_loader.mssql_data_loader import MSSQLDataLoader
+        return MSSQLDataLoader({"server": "s", "user": "u", "password": "p", "database": ""})
+
+    def test_tables_in_one_schema_share_one_catalog_query(self, conn) -> None:
+        loader = self._loader()
+        orders = loader.get_metadata(["shop", "dbo", "orders"])
+        users = loader.get_metadata(["shop", "dbo", "users"])
+
+        assert sum("sys.tables t" in q for q in conn.queries) == 1
+        assert not any("COUNT(*)" in q for q in conn.queries)
+        assert orders["row_count"] == 1200
+        assert orders["row_count_estimated"] is True
+        assert orders["description"] == "All orders"
+        assert orders["columns"][0] == {"name": "id", "type": "int", "description": "Order id"}
+        assert users["row_count"] == 3
+        assert "description" not in users
+
+        sample = next(q for q in conn.queries if "TOP 5" in q and "[orders]" in q)
+        assert "[shape].STAsText() AS [shape]" in sample
+        assert not any("INFORMATION_SCHEMA.COLUMNS" in q for q in conn.queries)
+
+    def test_catalog_is_reloaded_for_unknown_tables(self, conn) -> None:
+        loader = self._loader()
+        assert loader.get_metadata(["shop", "dbo", "orders"])
+        assert loader.get_metadata(["shop", "dbo", "missing"]) == {}
+        assert sum("sys.tables t" in q for q in conn.queries) == 2
+
+    def test_listing_warms_the_select_list_cache(self, conn) -> None:
+        loader = self._loader()
+        loader._cache_select_lists("shop", {("dbo", "orders"): [("id", "int"), ("doc", "xml")]})
+        before = len(conn.queries)
+        assert loader._safe_select_list("dbo", "orders", "shop") == (
+            "[id], CAST([doc] AS NVARCHAR(MAX)) AS [doc]"
+        )
+        assert len(conn.queries) == before
+
+    def test_stale_select_list_is_refreshed_after_a_failed_query(self, conn) -> None:
+        loader = self._loader()
+        loader._cache_select_lists(None, {("dbo", "orders"): [("id", "int"), ("gone", "xml")]})
+
+        def respond(query: str):
+            if "[gone]" in query:
+                raise RuntimeError("Invalid column name 'gone'")
+            if "INFORMATION_SCHEMA.COLUMNS" in query:
+                return [{"COLUMN_NAME": "id", "DATA_TYPE": "int"}, {"COLUMN_NAME": "doc", "DATA_TYPE": "xml"}]
+            if "TOP" in query:
+                return [{"id": 1, "doc": "<a/>"}]
+            return []
+
+        conn.respond = respond
+        table = loader.fetch_data_as_arrow("dbo.orders")
+        assert table.num_rows == 1
+        assert "CAST([doc] AS NVARCHAR(MAX))" in conn.queries[-1]
@@ -0,0 +1,135 @@
+"""Batched document → Arrow conversion for MongoDB and Cosmos DB.
+
+Background
+----------
+Both document loaders materialised the whole cursor with ``list(...)``,
+flattened every document into a dict, built a pandas DataFrame and only
+then converted to Arrow — three full copies of the import in Python
+objects, and an outright failure when a field held numbers in some
+documents and strings in others. Documents are now pulled in cursor
+batches, flattened with the loaders' existing ``_flatten_document`` /
+``_convert_special_types`` rules and converted to Arrow one batch at a
+time; schema drift across batches is reconciled when the batches are
+concatenated.
+"""
+from __future__ import annotations
+
+import datetime as dt
+from unittest.mock import MagicMock
+
+import pyarrow as pa
+import pytest
+from bson import ObjectId
+
+from data_formulator.data_loader import document_arrow
+from data_formulator.data_loader.cosmosdb_data_loader import CosmosDBDataLoader
+from data_formulator.data_loader.document_arrow import documents_to_arrow, iter_document_batches
+from data_formulator.data_loader.external_data_loader import cancellation_scope
+from data_formulator.data_loader.mongodb_data_loader import MongoDBDataLoader
+
+pytestmark = [pytest.mark.backend]
+
+
+class _Cursor:
+    """Minimal pymongo cursor: chained modifiers, lazy iteration."""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.calls: dict[str, object] = {}
+        self.consumed = 0
+
+    def sort(self, spec):
+        self.calls["sort"] = spec
+        return self
+
+    def limit(self, n):
+        self.calls["limit"] = n
+        return self
+
+    def batch_size(self, n):
+        self.calls["batch_size"] = n
+        return self
+
+    def __iter__(self):
+        for doc in self.docs[: self.calls.get("limit")]:
+            self.consumed += 1
+            yield doc
+
+
+def _mongo(docs) -> tuple[MongoDBDataLoader, _Cursor]:
+    loader = object.__new__(MongoDBDataLoader)
+    cursor = _Cursor(docs)
+    collection = MagicMock()
+    collection.find.side_effect = lambda *a, **kw: iter(docs)
+    collection.aggregate.side_effect = lambda pipeline, **kw: cursor.calls.update(
+        pipeline=pipeline, **kw) or cursor
+    loader.db = {"orders": collection}
+    return loader, cursor
+
+
+class TestDocumentBatches:
+
+    def test_batches_are_built_lazily(self) -> None:
+        cursor = _Cursor([{"i": i} for i in range(7)])
+        batches = iter_document_batches(cursor, dict, batch_size=3)
+        first = next(batches)
+        assert first.num_rows == 3 and cursor.consumed == 3
+        assert [b.num_rows for b in batches] == [3, 1]
+
+    def test_schema_drift_across_batches_is_reconciled(self) -> None:
+        docs = [{"id": 1, "v": 1}, {"id": 2, "v": 2.5}, {"id": 3, "code": 7}, {"id": 4, "code": "A-7"}]
+        table = documents_to_arrow(docs, dict, batch_size=1)
+        assert table.column_names == ["id", "v", "code"]
+        assert table.schema.field("id").type == pa.int64()
+        assert table.schema.field("v").type == pa.float64()
+        assert table.column("v").to_pylist() == [1.0, 2.5, None, None]
+        assert table.column("code").to_pylist() == [None, None, "7", "A-7"]
+
+    def test_mixed_values_within_a_batch_stringify_only_that_column(self) -> None:
+        table = documents_to_arrow([{"id": 1, "x": 1}, {"id": 2, "x": "b"}], dict)
+        assert table.schema.field("id").type == pa.int64()
+        assert table.column("x").to_pylist() == ["1", "b"]
+
+    def test_cancellation_is_checked_between_batches(self) -> None:
+        def checkpoint():
+            raise InterruptedError("job cancelled")
+
+        with cancellation_scope(checkpoint), pytest.raises(InterruptedError):
+            documents_to_arrow([{"i": i} for i in range(5)], dict, batch_size=2)
+
+
+class TestDocumentLoaders:
+
+    def test_mongo_fetch_flattens_batches_with_existing_rules(self) -> None:
+        oid = ObjectId()
+        docs = [
+            {"_id": oid, "at": dt.datetime(2024, 1, 2, 3, 4), "addr": {"city": "Oslo"}, "tags": ["a", "b"]},
+            {"_id": oid, "addr": {"city": "Rome", "zip": "00100"}, "tags": []},
+            {"_id": oid, "n": 3},
+        ]
+        loader, cursor = _mongo(docs)
+        table = loader.fetch_data_as_arrow("db.orders", {"size": 10, "sort_columns": ["n"]})
+        assert cursor.calls["pipeline"] == [{"$sort": {"n": 1}}, {"$limit": 10}]
+        assert cursor.calls["batchSize"] == document_arrow.DOCUMENT_BATCH_SIZE
+        assert table.num_rows == 3
+        assert table.column_names == ["_id", "at", "addr_city", "tags_1", "tags_2", "addr_zip", "tags", "n"]
+        assert table.column("_id").to_pylist() == [str(oid)] * 3
+        assert table.column("at").to_pylist() == ["2024-01-02T03:04:00", None, None]
+        assert table.column("addr_zip").to_pylist() == [None, "00100", None]
+
+    def test_mongo_empty_collection_returns_empty_table(self) -> None:
+        loader, _ = _mongo([])
+        assert loader.fetch_data_as_arrow("orders").num_columns == 0
+
+    def test_cosmos_pages_items_and_drops_system_fields(self) -> None:
+        loader = object.__new__(CosmosDBDataLoader)
+        container = MagicMock()
+        container.query_items.return_value = iter([
+            {"id": "1", "qty": 2, "_rid": "r", "_etag": "e", "_ts": 1},
+            {"id": "2", "qty": 3, "meta": {"src": "web"}, "_rid": "r", "_etag": "e", "_ts": 2},
+        ])
+        loader.db = MagicMock(get_container_client=MagicMock(return_value=container))
+        table = loader.fetch_data_as_arrow("orders", {"size": 5})
+        assert container.query_items.call_args.kwargs["max_item_count"] == document_arrow.DOCUMENT_BATCH_SIZE
+        assert table.column_names == ["id", "qty", "meta_src"]
+        assert table.column("qty").to_pylist() == [2, 3]
@@ -0,0 +1,166 @@
+"""Server-side pushdown of filters, projections and sort for Mongo/Cosmos imports.
+
+Background
+----------
+``MongoDBDataLoader.fetch_data_as_arrow`` ran ``collection.find()`` with no
+filter or projection, and the Cosmos loader only knew ``TOP`` and
+``ORDER BY``, so ``source_filters`` and ``columns`` in ``import_options``
+were silently ignored and every document was transferred. Mongo imports
+now go through the probe compiler (``_compile_probe_pipeline``) as a
+``$match / $project / $sort / $limit`` pipeline, and Cosmos imports
+compile to a parameterized ``SELECT TOP n ... WHERE ... ORDER BY``.
+Flattened column names (``addr_city``, ``tags_1``) are mapped back to
+document paths from a small sample first.  Both loaders also override
+``fetch_data_as_batches``, so ``ingest_to_workspace`` writes one row group
+per cursor batch instead of joining the import into one in-memory table.
+"""
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pyarrow.parquet as pq
+import pytest
+
+from data_formulator.data_loader.cosmosdb_data_loader import CosmosDBDataLoader
+from data_formulator.data_loader.document_arrow import DOCUMENT_BATCH_SIZE, flattened_field_paths
+from data_formulator.data_loader.mongodb_data_loader import MongoDBDataLoader
+from data_formulator.datalake.workspace import Workspace
+
+pytestmark = [pytest.mark.backend]
+
+SAMPLE = [
+    {"_id": 1, "name": "a", "addr": {"city": "Oslo", "zip": "0150"}, "tags": ["x", "y"], "qty": 3},
+    {"_id": 2, "name": "b", "addr": {"city": "Rome"}, "tags": [], "qty": 5},
+]
+
+
+def _mongo(result_docs):
+    loader = object.__new__(MongoDBDataLoader)
+    collection = MagicMock()
+    collection.find.side_effect = lambda *a, **kw: iter(SAMPLE)
+    collection.aggregate.side_effect = lambda pipeline, **kw: iter(result_docs)
+    loader.db = {"orders": collection}
+    return loader, collection
+
+
+def _cosmos(result_docs):
+    loader = object.__new__(CosmosDBDataLoader)
+    container = MagicMock()
+
+    def query_items(query, parameters=None, **kw):
+        if query.startswith("SELECT TOP 200 * FROM c"):
+            return iter([{**d, "_rid": "r", "_ts": 1} for d in SAMPLE])
+        return iter(result_docs)
+
+    container.query_items.side_effect = query_items
+    loader.db = MagicMock(get_container_client=MagicMock(return_value=container))
+    return loader, container
+
+
+class TestFlattenedFieldPaths:
+
+    def test_paths_follow_flatten_rules(self) -> None:
+        paths = flattened_field_paths(
+            [{"a": {"b": 1}, "l": [{"k": 1}, 2], "e": [], "_ts": 9}], skip_keys={"_ts"},
+        )
+        assert paths == {"a_b": ("a", "b"), "l_1_k": ("l", 0, "k"), "l_2": ("l", 1), "e": ("e",)}
+
+
+class TestMongoImportPushdown:
+
+    def test_filters_projection_and_sort_become_a_pipeline(self) -> None:
+        loader, collection = _mongo([{"name": "a", "addr": {"city": "Oslo"}, "tags": ["x"], "qty": 3}])
+        table = loader.fetch_data_as_arrow("orders", {
+            "size": 50,
+            "columns": ["addr_city", "tags_1", "name"],
+            "source_filters": [
+                {"column": "addr_city", "operator": "EQ", "value": "Oslo"},
+                {"column": "qty", "operator": "GTE", "value": 2},
+            ],
+            "sort_columns": ["qty"],
+            "sort_order": "desc",
+        })
+        pipeline = collection.aggregate.call_args.args[0]
+        assert pipeline == [
+            {"$match": {"$and": [{"addr.city": {"$eq": "Oslo"}}, {"qty": {"$gte": 2}}]}},
+            {"$project": {"_id": 0, "addr.city": 1, "tags": 1, "name": 1, "qty": 1}},
+            {"$sort": {"qty": -1}},
+            {"$limit": 50},
+        ]
+        assert collection.aggregate.call_args.kwargs["allowDiskUse"] is True
+        # Extra projected fields (sort key, whole arrays) are trimmed locally.
+        assert table.column_names == ["addr_city", "tags_1", "name"]
+        assert table.to_pylist() == [{"addr_city": "Oslo", "tags_1": "x", "name": "a"}]
+
+    def test_plain_import_skips_the_path_sample(self) -> None:
+        loader, collection = _mongo(SAMPLE)
+        loader.fetch_data_as_arrow("orders", {"size": 10})
+        assert collection.aggregate.call_args.args[0] == [{"$limit": 10}]
+        collection.find.assert_not_called()
+
+    def test_nested_projection_paths_do_not_collide(self) -> None:
+        assert MongoDBDataLoader._non_colliding_paths(["addr.city", "addr", "qty", "addr"]) == ["addr", "qty"]
+
+
+class TestCosmosImportPushdown:
+
+    def test_filters_projection_and_sort_become_parameterized_sql(self) -> None:
+        loader, container = _cosmos([{"name": "a", "addr": {"city": "Oslo"}, "qty": 3}])
+        table = loader.fetch_data_as_arrow("orders", {
+            "size": 50,
+            "columns": ["name", "addr_city"],
+            "source_filters": [
+                {"column": "addr_city", "operator": "ILIKE", "value": "os"},
+                {"column": "tags_1", "operator": "IN", "value": ["x", "z"]},
+                {"column": "qty", "operator": "BETWEEN", "value": [1, 4]},
+                {"column": "note", "operator": "IS_NULL"},
+            ],
+            "sort_columns": ["qty"],
+        })
+        call = container.query_items.call_args
+        assert call.kwargs["query"] == (
+            'SELECT TOP 50 c["name"], c["addr"], c["qty"] FROM c'
+            ' WHERE CONTAINS(c["addr"]["city"], @p0, true)'
+            ' AND ARRAY_CONTAINS(@p1, c["tags"][0])'
+            ' AND c["qty"] >= @p2 AND c["qty"] <= @p3'
+            ' AND (NOT IS_DEFINED(c["note"]) OR IS_NULL(c["note"]))'
+            ' ORDER BY c["qty"] ASC'
+        )
+        assert [p["value"] for p in call.kwargs["parameters"]] == ["os", ["x", "z"], 1, 4]
+        assert table.column_names == ["name", "addr_city"]
+
+    def test_column_names_cannot_inject_sql(self) -> None:
+        loader, container = _cosmos([])
+        loader.fetch_data_as_arrow("orders", {
+            "source_filters": [{"column": 'x"] OR 1=1 --', "operator": "EQ", "value": 1}],
+        })
+        query = container.query_items.call_args.kwargs["query"]
+        assert query.endswith('WHERE c["x\\"] OR 1=1 --"] = @p0')
+
+
+class TestDocumentImportStreaming:
+
+    @staticmethod
+    def _docs(n):
+        # A field first seen in the last batch must be widened in, not dropped.
+        return [{"_id": i, "qty": i, **({"late": "x"} if i == n - 1 else {})} for i in range(n)]
+
+    @pytest.mark.parametrize("make_loader", [_mongo, _cosmos], ids=["mongodb", "cosmosdb"])
+    def test_ingest_writes_one_row_group_per_batch(self, make_loader, tmp_path) -> None:
+        n = 2 * DOCUMENT_BATCH_SIZE + 1
+        loader, _ = make_loader(self._docs(n))
+        loader.params = {}
+        ws = Workspace("test-user", root_dir=tmp_path)
+        with patch.object(type(loader), "fetch_data_as_arrow", side_effect=AssertionError("materialised")):
+            meta = loader.ingest_to_workspace(ws, "orders", "orders", {"size": n}, source_metadata={})
+        assert meta.row_count == n
+        parquet = pq.ParquetFile(ws.get_parquet_path("orders"))
+        assert parquet.metadata.num_row_groups == 3
+        late = parquet.read(columns=["late"]).column("late").to_pylist()
+        assert late[-1] == "x" and late.count(None) == n - 1
+
+    @pytest.mark.parametrize("make_loader", [_mongo, _cosmos], ids=["mongodb", "cosmosdb"])
+    def test_batches_keep_only_requested_columns(self, make_loader) -> None:
+        loader, _ = make_loader([{"name": "a", "qty": 3, "extra": 1}])
+        batches = list(loader.fetch_data_as_batches("orders", {"columns": ["qty", "name"]}))
+        assert [b.column_names for b in batches] == [["qty", "name"]]
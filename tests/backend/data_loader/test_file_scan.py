@@ -0,0 +1,136 @@
+"""Projection and predicate pushdown for parquet in the file-based loaders.
+
+Background
+----------
+``LocalFolderDataLoader``, ``S3DataLoader`` and ``AzureBlobDataLoader``
+called ``pq.read_table`` on the whole file and then sliced, ignoring the
+``columns`` and ``source_filters`` import options. Parquet reads now go
+through ``file_scan.scan_parquet``: only projected columns are decoded,
+row groups are pruned with their min/max statistics, and unsorted reads
+stop after ``size`` rows. CSV/JSON reads get the same options applied in
+memory.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import pytest
+
+from data_formulator.data_loader import file_scan
+from data_formulator.data_loader.file_scan import apply_import_options, scan_parquet
+from data_formulator.data_loader.local_folder_data_loader import LocalFolderDataLoader
+
+pytestmark = [pytest.mark.backend]
+
+ROWS = 1_000
+
+
+@pytest.fixture()
+def parquet_path(tmp_path: Path) -> str:
+    path = tmp_path / "events.parquet"
+    pq.write_table(pa.table({
+        "id": pa.array(range(ROWS), pa.int64()),
+        "kind": pa.array(["click" if i % 2 else "View" for i in range(ROWS)]),
+        "score": pa.array([float(i % 7) for i in range(ROWS)]),
+    }), path, row_group_size=100)
+    return str(path)
+
+
+@pytest.fixture()
+def read_row_groups(monkeypatch) -> list:
+    seen: list = []
+    real = file_scan._row_groups
+
+    def counting(dataset, expr):
+        for row_group in real(dataset, expr):
+            seen.append(row_group)
+            yield row_group
+
+    monkeypatch.setattr(file_scan, "_row_groups", counting)
+    return seen
+
+
+class TestScanParquet:
+
+    def test_unsorted_read_stops_after_size_rows(self, parquet_path, read_row_groups) -> None:
+        table, total = scan_parquet(parquet_path, None, {}, 150)
+        assert table.column("id").to_pylist() == list(range(150))
+        assert len(read_row_groups) == 2
+        assert total == ROWS
+
+    def test_row_groups_pruned_by_statistics(self, parquet_path, read_row_groups) -> None:
+        table, total = scan_parquet(parquet_path, None, {
+            "source_filters": [{"column": "id", "operator": "BETWEEN", "value": [905, 910]}],
+        }, 100)
+        assert table.column("id").to_pylist() == list(range(905, 911))
+        assert len(read_row_groups) == 1
+        assert total is None
+
+    def test_projection_and_filters(self, parquet_path) -> None:
+        table, _ = scan_parquet(parquet_path, None, {
+            "columns": ["id", "missing"],
+            "source_filters": [
+                {"column": "kind", "operator": "ILIKE", "value": "vie"},
+                {"column": "id", "operator": "IN", "value": ["4", 5, 6]},
+                {"column": "nope", "operator": "EQ", "value": 1},
+            ],
+        }, 100)
+        assert table.column_names == ["id"]
+        assert table.column("id").to_pylist() == [4, 6]
+
+    def test_sorted_read_orders_the_whole_filtered_file(self, parquet_path) -> None:
+        table, total = scan_parquet(parquet_path, None, {
+            "columns": ["id"],
+            "source_filters": [{"column": "score", "operator": "EQ", "value": 6}],
+            "sort_columns": ["id"], "sort_order": "desc",
+        }, 3)
+        assert table.column_names == ["id"]
+        assert table.column("id").to_pylist() == [993, 986, 979]
+        assert total == len(range(6, ROWS, 7))
+
+    def test_no_matching_rows_keeps_the_projected_schema(self, parquet_path) -> None:
+        table, _ = scan_parquet(parquet_path, None, {
+            "columns": ["kind"],
+            "source_filters": [{"column": "id", "operator": "LT", "value": 0}],
+        }, 10)
+        assert table.num_rows == 0
+        assert table.schema == pa.schema([("kind", pa.string())])
+
+    def test_number_that_does_not_fit_the_column_type_still_compares(self, parquet_path) -> None:
+        table, _ = scan_parquet(parquet_path, None, {
+            "source_filters": [{"column": "id", "operator": "LT", "value": 2.5}],
+        }, ROWS)
+        assert table.column("id").to_pylist() == [0, 1, 2]
+
+    def test_uncastable_filter_value_raises_a_clear_error(self, parquet_path) -> None:
+        with pytest.raises(ValueError, match="'abc'.*'id'"):
+            scan_parquet(parquet_path, None, {
+                "source_filters": [{"column": "id", "operator": "GT", "value": "abc"}],
+            }, ROWS)
+
+
+class TestFileLoaders:
+
+    def test_local_parquet_import_uses_pushdown(self, parquet_path, read_row_groups) -> None:
+        loader = LocalFolderDataLoader({"root_dir": str(Path(parquet_path).parent)})
+        table = loader.fetch_data_as_arrow("events.parquet", {"size": 10, "columns": ["kind"]})
+        assert table.column_names == ["kind"] and table.num_rows == 10
+        assert len(read_row_groups) == 1
+        assert loader._last_total_rows == ROWS
+
+    def test_csv_import_applies_the_same_options(self, tmp_path) -> None:
+        pa_csv.write_csv(pa.table({"a": [3, 1, 2], "b": ["x", "y", "z"]}), tmp_path / "t.csv")
+        loader = LocalFolderDataLoader({"root_dir": str(tmp_path)})
+        table = loader.fetch_data_as_arrow("t.csv", {
+            "columns": ["b"],
+            "source_filters": [{"column": "a", "operator": "NEQ", "value": 2}],
+            "sort_columns": ["a"],
+        })
+        assert table.to_pylist() == [{"b": "y"}, {"b": "x"}]
+
+    def test_in_memory_options_cap_size(self) -> None:
+        table = apply_import_options(pa.table({"a": list(range(10))}), {}, 4)
+        assert table.num_rows == 4
@@ -0,0 +1,139 @@
+"""Hive-partitioned parquet datasets as single tables in the file loaders.
+
+Background
+----------
+The local folder, S3 and Azure Blob loaders listed every file as its own
+table, so a partitioned lake layout (``sales/year=2024/month=01/part-0.parquet``)
+surfaced as thousands of tiny catalog entries and could not be imported as
+one table. Parquet files under ``key=value`` directories are now grouped
+under their dataset root, which is read through ``pyarrow.dataset`` with
+Hive partitioning: partition keys become columns, ``source_filters`` on
+them prune directories before any file is opened, and the remaining files
+are read in parallel. Their row count is reported as unknown (``None``)
+rather than opening every file's footer.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from pyarrow import fs as pa_fs
+
+from data_formulator.data_loader import file_scan, s3_data_loader
+from data_formulator.data_loader.file_scan import group_partitioned_files, partition_keys
+from data_formulator.data_loader.local_folder_data_loader import LocalFolderDataLoader
+from data_formulator.data_loader.s3_data_loader import S3DataLoader
+
+pytestmark = [pytest.mark.backend]
+
+PARTITIONS = [(2023, "01"), (2023, "02"), (2024, "01"), (2024, "02")]
+
+
+def _write_dataset(root: Path, corrupt: tuple[int, str] | None = None) -> None:
+    for year, month in PARTITIONS:
+        part_dir = root / f"year={year}" / f"month={month}"
+        part_dir.mkdir(parents=True)
+        if (year, month) == corrupt:
+            (part_dir / "part-0.parquet").write_bytes(b"not a parquet file")
+            continue
+        pq.write_table(
+            pa.table({"v": [year * 100 + int(month), year * 100 + int(month) + 50]}),
+            part_dir / "part-0.parquet",
+        )
+    (root / "_SUCCESS").write_bytes(b"")
+
+
+@pytest.fixture()
+def lake(tmp_path: Path) -> Path:
+    _write_dataset(tmp_path / "sales")
+    pq.write_table(pa.table({"a": [1]}), tmp_path / "lookup.parquet")
+    return tmp_path
+
+
+class TestPartitionGrouping:
+
+    def test_files_under_partition_dirs_group_by_root(self) -> None:
+        files, datasets = group_partitioned_files([
+            "lake/sales/year=2024/month=01/part-0.parquet",
+            "lake/sales/year=2024/month=02/part-0.parquet",
+            "lake/readme.csv",
+            "year=2024/top.parquet",
+            "logs/date=2024-01-01/events.csv",
+        ])
+        assert datasets == {"lake/sales": [
+            "lake/sales/year=2024/month=01/part-0.parquet",
+            "lake/sales/year=2024/month=02/part-0.parquet",
+        ]}
+        assert files == ["lake/readme.csv", "year=2024/top.parquet", "logs/date=2024-01-01/events.csv"]
+        assert partition_keys(datasets["lake/sales"], "lake/sales/") == ["year", "month"]
+
+
+class TestLocalFolderDatasets:
+
+    def test_dataset_folder_is_one_table(self, lake) -> None:
+        loader = LocalFolderDataLoader({"root_dir": str(lake)})
+        assert [(t["name"], t["path"]) for t in loader.list_tables()] == [
+            ("lookup.parquet", ["lookup.parquet"]), ("sales", ["sales"]),
+        ]
+        node = next(n for n in loader.ls([]) if n.name == "sales")
+        assert node.node_type == "table"
+        assert node.metadata["file_count"] == 4
+        assert node.metadata["partition_keys"] == ["year", "month"]
+        assert [c["name"] for c in node.metadata["columns"]] == ["v", "year", "month"]
+
+    def test_import_adds_partition_columns(self, lake) -> None:
+        loader = LocalFolderDataLoader({"root_dir": str(lake)})
+        table = loader.fetch_data_as_arrow("sales", {"sort_columns": ["v"]})
+        assert table.num_rows == 8
+        assert table.slice(0, 1).to_pylist() == [{"v": 202301, "year": 2023, "month": 1}]
+
+    def test_partition_filters_prune_before_files_are_opened(self, tmp_path) -> None:
+        _write_dataset(tmp_path / "sales", corrupt=(2024, 2))
+        loader = LocalFolderDataLoader({"root_dir": str(tmp_path)})
+        table = loader.fetch_data_as_arrow("sales", {
+            "source_filters": [{"column": "year", "operator": "EQ", "value": "2023"}],
+        })
+        assert sorted(table.column("v").to_pylist()) == [202301, 202302, 202351, 202352]
+
+    def test_parallel_reads_stop_once_size_is_reached(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr(file_scan, "DATASET_READ_WORKERS", 2)
+        _write_dataset(tmp_path / "sales", corrupt=(2024, 2))
+        loader = LocalFolderDataLoader({"root_dir": str(tmp_path)})
+        table = loader.fetch_data_as_arrow("sales", {"size": 3})
+        assert table.num_rows == 3
+
+    def test_plain_folder_is_not_importable(self, lake) -> None:
+        (lake / "misc").mkdir()
+        loader = LocalFolderDataLoader({"root_dir": str(lake)})
+        with pytest.raises(ValueError, match="partitioned"):
+            loader.fetch_data_as_arrow("misc")
+
+
+class TestS3Datasets:
+
+    def test_prefix_listed_and_read_as_one_table(self, tmp_path, monkeypatch) -> None:
+        _write_dataset(tmp_path / "bucket" / "sales")
+        keys = sorted(
+            p.relative_to(tmp_path / "bucket").as_posix()
+            for p in (tmp_path / "bucket").rglob("*") if p.is_file()
+        )
+        client = MagicMock()
+        client.list_objects_v2.return_value = {"Contents": [{"Key": k, "Size": 10} for k in keys]}
+        monkeypatch.setattr(s3_data_loader.boto3, "client", lambda *a, **kw: client)
+
+        loader = S3DataLoader({"aws_access_key_id": "AKIA", "aws_secret_access_key": "s", "bucket": "bucket"})
+        loader.s3_fs = pa_fs.SubTreeFileSystem(str(tmp_path), pa_fs.LocalFileSystem())
+        nodes = loader.ls([])
+        assert [(n.name, n.metadata["file_count"]) for n in nodes] == [("sales/", 4)]
+        # Counting would open every footer: unknown, not zero.
+        assert loader.get_metadata(["sales/"])["row_count"] is None
+
+        table = loader.fetch_data_as_arrow("sales/", {
+            "columns": ["v", "month"],
+            "source_filters": [{"column": "month", "operator": "EQ", "value": 2}],
+        })
+        assert table.column_names == ["v", "month"]
+        assert sorted(table.column("v").to_pylist()) == [202302, 202352, 202402, 202452]
@@ -0,0 +1,200 @@
+"""Streaming CSV/JSON reads and incremental parquet writes for file imports.
+
+Background
+----------
+``LocalFolderDataLoader``, ``S3DataLoader`` and ``AzureBlobDataLoader`` read
+CSV with ``pa_csv.read_csv`` and JSON with ``pa_json.read_json`` in one shot,
+so a multi-GB file had to fit in memory as Arrow and again as the parquet
+being written. ``file_scan.scan_text`` now parses the file a block at a
+time, applies ``source_filters``/``columns`` per block and stops at
+``size``; ``ingest_to_workspace`` hands the blocks to
+``Workspace.write_parquet_from_batches``, which writes one row group per
+block. Types come from the first block; a later value that does not fit
+widens its column (null → int64 → float64 → string) instead of failing.
+"""
+from __future__ import annotations
+
+import io
+import json
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from data_formulator.data_loader import file_scan
+from data_formulator.data_loader.file_scan import read_text, scan_text
+from data_formulator.data_loader.local_folder_data_loader import LocalFolderDataLoader
+from data_formulator.datalake.parquet_utils import (
+    compute_arrow_table_hash,
+    compute_parquet_file_hash,
+    write_parquet_batches,
+)
+from data_formulator.datalake.workspace import Workspace
+
+pytestmark = [pytest.mark.backend]
+
+BLOCK = 4096
+
+
+@pytest.fixture(autouse=True)
+def small_blocks(monkeypatch) -> None:
+    monkeypatch.setattr(file_scan, "TEXT_BLOCK_SIZE", BLOCK)
+
+
+class _CountingStream(io.BytesIO):
+    """In-memory source that records how many bytes were read."""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def _csv(rows: int, tail: str = "") -> bytes:
+    return ("id,v\n" + "".join(f"{i},{i % 10}\n" for i in range(rows)) + tail).encode()
+
+
+class TestScanText:
+
+    def test_stops_reading_once_size_rows_are_collected(self) -> None:
+        data = _csv(100_000)
+        streams: list[_CountingStream] = []
+
+        def open_source():
+            streams.append(_CountingStream(data))
+            return streams[-1]
+
+        table, total = read_text(open_source, "csv", {}, 10)
+        assert table.column("id").to_pylist() == list(range(10))
+        assert total is None
+        # The CSV reader reads a bounded number of blocks ahead, not the file.
+        assert streams[0].bytes_read < len(data) // 4
+
+    def test_filters_and_projection_apply_per_block(self) -> None:
+        data = _csv(5_000)
+        table, total = read_text(lambda: io.BytesIO(data), "csv", {
+            "columns": ["id"],
+            "source_filters": [{"column": "v", "operator": "EQ", "value": 3}],
+        }, 1_000_000)
+        assert table.column_names == ["id"]
+        assert table.column("id").to_pylist() == list(range(3, 5_000, 10))
+        assert total == 500
+
+    def test_late_values_widen_the_column(self) -> None:
+        data = _csv(5_000, tail="5000,2.5\n5001,abc\n")
+        table, _ = read_text(lambda: io.BytesIO(data), "csv", {}, 1_000_000)
+        assert table.num_rows == 5_002
+        assert table.schema.field("id").type == pa.int64()
+        assert table.schema.field("v").type == pa.string()
+        assert table.column("v").to_pylist()[-3:] == ["9", "2.5", "abc"]
+
+    def test_sorted_read_orders_every_matching_row(self) -> None:
+        data = _csv(5_000)
+        table, total = read_text(lambda: io.BytesIO(data), "csv", {
+            "columns": ["v"], "sort_columns": ["id"], "sort_order": "desc",
+        }, 3)
+        assert table.to_pylist() == [{"v": 9}, {"v": 8}, {"v": 7}]
+        assert total == 5_000
+
+    def test_json_chunks_reconcile_kinds_and_late_fields(self) -> None:
+        lines = [json.dumps({"a": i}) for i in range(2_000)]
+        lines.append(json.dumps({"a": "x", "extra": True}))
+        data = ("\n".join(lines) + "\n").encode()
+        batches = list(scan_text(lambda: io.BytesIO(data), "json", {}, 1_000_000))
+        assert len(batches) > 1
+        table, total = read_text(lambda: io.BytesIO(data), "json", {}, 1_000_000)
+        assert total == 2_001
+        assert table.column("a").to_pylist()[-2:] == ["1999", "x"]
+        assert table.column("extra").to_pylist()[-2:] == [None, True]
+
+    def test_json_chunk_without_the_filtered_field_does_not_match(self) -> None:
+        lines = [json.dumps({"a": i}) for i in range(2_000)]
+        lines += [json.dumps({"a": i, "tag": "keep" if i % 2 else "drop"}) for i in range(4)]
+        data = ("\n".join(lines) + "\n").encode()
+        table, total = read_text(lambda: io.BytesIO(data), "json", {
+            "source_filters": [{"column": "tag", "operator": "NEQ", "value": "drop"}],
+        }, 1_000_000)
+        assert table.to_pylist() == [{"a": 1, "tag": "keep"}, {"a": 3, "tag": "keep"}]
+        assert total == 2
+        _, nulls = read_text(lambda: io.BytesIO(data), "json", {
+            "source_filters": [{"column": "tag", "operator": "IS_NULL"}],
+        }, 1_000_000)
+        assert nulls == 2_000
+
+    def test_count_all_keeps_counting_past_size(self) -> None:
+        data = _csv(5_000)
+        table, total = read_text(lambda: io.BytesIO(data), "csv", {
+            "source_filters": [{"column": "v", "operator": "EQ", "value": 3}],
+        }, 10, count_all=True)
+        assert table.column("id").to_pylist() == list(range(3, 100, 10))
+        assert total == 500
+
+
+class TestLocalPreviewTotals:
+
+    def test_csv_preview_reports_the_file_row_count(self, tmp_path) -> None:
+        (tmp_path / "t.csv").write_bytes(_csv(500))
+        loader = LocalFolderDataLoader({"root_dir": str(tmp_path)})
+        assert loader.fetch_data_as_arrow("t.csv", {"size": 10}).num_rows == 10
+        assert loader._last_total_rows == 500
+
+    def test_filtered_parquet_preview_counts_matching_rows(self, tmp_path) -> None:
+        pq.write_table(pa.table({"v": [i % 10 for i in range(500)]}), tmp_path / "t.parquet")
+        loader = LocalFolderDataLoader({"root_dir": str(tmp_path)})
+        table = loader.fetch_data_as_arrow("t.parquet", {
+            "size": 10, "source_filters": [{"column": "v", "operator": "LT", "value": 5}],
+        })
+        assert table.num_rows == 10
+        assert loader._last_total_rows == 250
+
+
+class TestWriteParquetBatches:
+
+    def test_schema_widening_rewrites_written_row_groups(self, tmp_path) -> None:
+        path = tmp_path / "t.parquet"
+        batches = [
+            pa.table({"a": [1, 2]}),
+            pa.table({"a": [3.5], "b": ["x"]}),
+            pa.table({"a": [None], "b": [None]}),
+        ]
+        schema, rows = write_parquet_batches(iter(batches), path)
+        assert rows == 4
+        assert schema == pa.schema([("a", pa.float64()), ("b", pa.string())])
+        assert pq.read_table(path).to_pylist() == [
+            {"a": 1.0, "b": None}, {"a": 2.0, "b": None}, {"a": 3.5, "b": "x"}, {"a": None, "b": None},
+        ]
+
+    def test_file_hash_matches_the_in_memory_hash(self, tmp_path) -> None:
+        table = pa.table({"a": list(range(1_000))})
+        path = tmp_path / "t.parquet"
+        pq.write_table(table, path, row_group_size=64)
+        assert compute_parquet_file_hash(path) == compute_arrow_table_hash(table)
+
+
+class TestStreamingIngest:
+
+    def test_csv_import_is_written_block_by_block(self, tmp_path, monkeypatch) -> None:
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "big.csv").write_bytes(_csv(20_000))
+        loader = LocalFolderDataLoader({"root_dir": str(src)})
+        monkeypatch.setattr(loader, "fetch_data_as_arrow", None)
+        workspace = Workspace("stream-user", root_dir=tmp_path / "ws")
+
+        meta = loader.ingest_to_workspace(workspace, "big", "big.csv", {"size": 15_000})
+
+        assert meta.row_count == 15_000
+        pf = pq.ParquetFile(workspace.get_file_path(meta.filename))
+        assert pf.metadata.num_rows == 15_000
+        assert pf.metadata.num_row_groups > 1
+        assert meta.content_hash == compute_arrow_table_hash(pf.read())
+
+    def test_sorted_import_falls_back_to_a_single_table(self, tmp_path) -> None:
+        (tmp_path / "t.csv").write_bytes(_csv(10))
+        loader = LocalFolderDataLoader({"root_dir": str(tmp_path)})
+        assert loader.fetch_data_as_batches("t.csv", {"sort_columns": ["id"]}) is None
+        assert loader.fetch_data_as_batches("t.csv") is not None
@@ -0,0 +1,122 @@
+"""Tests for the DuckDB statistics engine behind ``/api/tables/analyze``.
+
+Background
+----------
+The DuckDB branch of ``analyze_table`` used to run one aggregate query per
+column plus one levels query per low-cardinality column, each rescanning
+the parquet file.  Statistics are now computed in at most two scans for
+the whole table and cached per data identity (workspace, table name and
+file size/mtime), not the sampled content hash.
+"""
+from __future__ import annotations
+
+import json
+import shutil
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from flask import Flask
+
+from data_formulator.datalake.workspace import Workspace
+from data_formulator.routes import tables as tables_module
+from data_formulator.routes.tables import tables_bp
+
+pytestmark = [pytest.mark.backend]
+
+
+@pytest.fixture()
+def tmp_workspace(tmp_path):
+    ws = Workspace("test-user", root_dir=tmp_path)
+    yield ws
+    shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+@pytest.fixture()
+def client(tmp_workspace):
+    from data_formulator.error_handler import register_error_handlers
+
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    app.register_blueprint(tables_bp)
+    register_error_handlers(app)
+    tables_module._COLUMN_STATS_CACHE.clear()
+    # Force the DuckDB path regardless of table size.
+    with patch("data_formulator.routes.tables._get_workspace", return_value=tmp_workspace), \
+         patch("data_formulator.routes.tables._should_use_duckdb", return_value=True):
+        with app.test_client() as c:
+            yield c
+
+
+@pytest.fixture()
+def seeded_table(tmp_workspace):
+    df = pd.DataFrame({
+        "id": list(range(1000)),
+        "category": ["a", "b", "b", "c"] * 250,
+        "score": [float(i % 10) if i % 5 else None for i in range(1000)],
+        "label": [f"item_{i}" for i in range(1000)],
+    })
+    tmp_workspace.write_parquet(df, "stats_data")
+    return "stats_data"
+
+
+def _analyze(client, table: str) -> dict:
+    resp = client.post(
+        "/api/tables/analyze",
+        data=json.dumps({"table_name": table}),
+        content_type="application/json",
+    )
+    assert resp.status_code == 200
+    body = resp.get_json()
+    return {s["column"]: s["statistics"] for s in body["data"]["statistics"]}
+
+
+class TestAnalyzeColumnStats:
+
+    def test_counts_and_numeric_aggregates(self, client, seeded_table) -> None:
+        stats = _analyze(client, seeded_table)
+        assert stats["id"]["count"] == 1000
+        assert stats["id"]["min"] == 0.0
+        assert stats["id"]["max"] == 999.0
+        assert stats["id"]["avg"] == pytest.approx(499.5)
+        assert stats["score"]["null_count"] == 200
+        assert "min" not in stats["category"]
+
+    def test_low_cardinality_levels_are_exact(self, client, seeded_table) -> None:
+        stats = _analyze(client, seeded_table)
+        assert stats["category"]["unique_count"] == 3
+        assert stats["category"]["levels"] == ["b", "a", "c"]
+        assert stats["category"]["level_counts"] == [500, 250, 250]
+        assert stats["score"]["unique_count"] == 8
+        assert sum(stats["score"]["level_counts"]) == 800
+
+    def test_high_cardinality_has_approx_count_and_no_levels(self, client, seeded_table) -> None:
+        stats = _analyze(client, seeded_table)
+        assert "levels" not in stats["label"]
+        assert stats["label"]["unique_count"] == pytest.approx(1000, rel=0.5)
+
+    def test_whole_table_uses_at_most_two_scans(self, client, tmp_workspace, seeded_table) -> None:
+        with patch.object(tmp_workspace, "run_parquet_sql", wraps=tmp_workspace.run_parquet_sql) as spy:
+            _analyze(client, seeded_table)
+        assert spy.call_count == 2
+
+    def test_unchanged_table_is_served_from_cache(self, client, tmp_workspace, seeded_table) -> None:
+        first = _analyze(client, seeded_table)
+        with patch.object(tmp_workspace, "run_parquet_sql", wraps=tmp_workspace.run_parquet_sql) as spy:
+            assert _analyze(client, seeded_table) == first
+        assert spy.call_count == 0
+
+    def test_rewritten_table_is_recomputed(self, client, tmp_workspace, seeded_table) -> None:
+        _analyze(client, seeded_table)
+        tmp_workspace.write_parquet(pd.DataFrame({"category": ["z"] * 10}), seeded_table)
+        stats = _analyze(client, seeded_table)
+        assert stats["category"]["levels"] == ["z"]
+
+    def test_other_workspace_with_same_content_is_not_shared(self, client, tmp_path, tmp_workspace, seeded_table) -> None:
+        _analyze(client, seeded_table)
+        other = Workspace("other-user", root_dir=tmp_path / "other")
+        other.write_parquet(tmp_workspace.read_data_as_df(seeded_table), seeded_table)
+        with patch("data_formulator.routes.tables._get_workspace", return_value=other), \
+             patch.object(other, "run_parquet_sql", wraps=other.run_parquet_sql) as spy:
+            _analyze(client, seeded_table)
+        assert spy.call_count == 2
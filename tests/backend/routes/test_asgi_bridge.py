@@ -0,0 +1,306 @@
+"""ASGI serving mode: event-loop driven agent streams.
+
+Background
+----------
+Under WSGI a streaming agent request pins a worker thread for the whole
+run, mostly blocked on LLM token streaming.  ``data_formulator.asgi``
+serves the Flask app from an event loop: agents built with
+``async_io=True`` yield ``AwaitIO`` markers for their LLM I/O, and
+``drive_async`` awaits those on the loop while running the synchronous
+steps in between on a bounded thread pool.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask, Response, request, stream_with_context
+
+from data_formulator.agents.async_drive import (
+    ASYNC_IO_ENVIRON_KEY,
+    await_io,
+    drive_async,
+)
+from data_formulator.analyst.agent import AnalystAgent
+from data_formulator.asgi import WsgiBridge
+
+pytestmark = [pytest.mark.backend]
+
+
+@pytest.fixture()
+def executor():
+    pool = ThreadPoolExecutor(max_workers=2)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+async def _collect(agen) -> list:
+    return [item async for item in agen]
+
+
+def _chunk(content=None, tool_calls=None, finish_reason=None):
+    return SimpleNamespace(choices=[SimpleNamespace(
+        delta=SimpleNamespace(content=content, tool_calls=tool_calls, reasoning_content=None),
+        finish_reason=finish_reason,
+    )])
+
+
+class TestDriveAsync:
+
+    def test_markers_are_awaited_and_results_returned(self, executor) -> None:
+        async def slow(value):
+            await asyncio.sleep(0.01)
+            return value
+
+        async def fail():
+            raise ValueError("boom")
+
+        def gen():
+            a = yield from await_io(lambda: slow(1))
+            yield {"a": a}
+            try:
+                yield from await_io(fail)
+            except ValueError as e:
+                yield {"error": str(e)}
+
+        events = asyncio.run(_collect(drive_async(gen(), executor)))
+        assert events == [{"a": 1}, {"error": "boom"}]
+
+    def test_context_survives_thread_hops(self, executor) -> None:
+        var: contextvars.ContextVar[str] = contextvars.ContextVar("var", default="unset")
+
+        def gen():
+            var.set("set-in-step-1")
+            yield threading.get_ident()
+            yield from await_io(lambda: asyncio.sleep(0))
+            yield var.get()
+
+        events = asyncio.run(_collect(drive_async(gen(), executor)))
+        assert events[-1] == "set-in-step-1"
+
+    def test_closing_the_driver_closes_the_generator(self, executor) -> None:
+        closed = threading.Event()
+
+        def gen():
+            try:
+                while True:
+                    yield from await_io(lambda: asyncio.sleep(0))
+                    yield "tick"
+            finally:
+                closed.set()
+
+        async def main():
+            agen = drive_async(gen(), executor)
+            assert await agen.__anext__() == "tick"
+            await agen.aclose()
+
+        asyncio.run(main())
+        assert closed.is_set()
+
+    def test_many_sessions_share_a_small_pool(self, executor) -> None:
+        def session(i):
+            for _ in range(3):
+                yield from await_io(lambda: asyncio.sleep(0.05))
+            yield i
+
+        async def main():
+            return await asyncio.gather(*[
+                _collect(drive_async(session(i), executor)) for i in range(50)
+            ])
+
+        t0 = time.time()
+        results = asyncio.run(main())
+        # 50 sessions x 150ms of LLM wait on 2 threads: concurrent, not serial.
+        assert time.time() - t0 < 2.0
+        assert sorted(r[0] for r in results) == list(range(50))
+
+
+class TestAnalystAgentAsyncStream:
+
+    def test_async_stream_matches_sync_stream(self, executor) -> None:
+        chunks = [
+            _chunk(content="Looking at the data. "),
+            _chunk(tool_calls=[SimpleNamespace(index=0, id="c1", function=SimpleNamespace(
+                name="execute_python_script", arguments='{"code": "print(1)"}'))]),
+            _chunk(finish_reason="tool_calls"),
+        ]
+
+        async def astream():
+            for c in chunks:
+                await asyncio.sleep(0)
+                yield c
+
+        client = MagicMock()
+        client.model = "test-model"
+        client.get_completion_with_tools.side_effect = lambda *a, **k: iter(chunks)
+
+        async def aget(*a, **k):
+            return astream()
+
+        client.aget_completion_with_tools.side_effect = aget
+        ws = MagicMock()
+        ws.user_home = None
+
+        def run(agent, out):
+            response = yield from agent._stream_llm([{"role": "user", "content": "hi"}], [])
+            out.append(response)
+
+        sync_out: list = []
+        sync_agent = AnalystAgent(client=client, workspace=ws)
+        assert list(run(sync_agent, sync_out)) == []
+
+        async_out: list = []
+        async_agent = AnalystAgent(client=client, workspace=ws, async_io=True)
+        events = asyncio.run(_collect(drive_async(run(async_agent, async_out), executor)))
+        assert events == []
+
+        for resp in (sync_out[0], async_out[0]):
+            msg = resp.choices[0].message
+            assert msg.content == "Looking at the data. "
+            assert msg.tool_calls[0].function.arguments == '{"code": "print(1)"}'
+        client.aget_completion_with_tools.assert_called_once()
+
+    def test_run_end_to_end_in_async_mode(self, executor, tmp_path) -> None:
+        chunks = [_chunk(content="All done."), _chunk(finish_reason="stop")]
+
+        async def astream():
+            for c in chunks:
+                await asyncio.sleep(0)
+                yield c
+
+        async def aget(*a, **k):
+            return astream()
+
+        client = MagicMock()
+        client.model = "test-model"
+        client.aget_completion_with_tools.side_effect = aget
+        ws = MagicMock()
+        ws.user_home = tmp_path
+        ws.confined_scratch.root = tmp_path / "scratch"
+
+        agent = AnalystAgent(client=client, workspace=ws, async_io=True)
+        events = asyncio.run(_collect(drive_async(agent.run(
+            input_tables=[], user_question="hi",
+            trajectory=[{"role": "system", "content": "s"}, {"role": "user", "content": "hi"}],
+        ), executor)))
+
+        assert events[-1]["type"] == "completion"
+        assert events[-1]["content"]["summary"] == "All done."
+        client.aget_completion_with_tools.assert_called_once()
+        client.get_completion_with_tools.assert_not_called()
+
+
+def _asgi_request(bridge, method, path, body=b"", headers=(), query=b"", disconnect_after=None):
+    sent: list[dict] = []
+
+    async def main():
+        body_sent = False
+
+        async def receive():
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            if disconnect_after is not None:
+                await asyncio.sleep(disconnect_after)
+                return {"type": "http.disconnect"}
+            await asyncio.Event().wait()
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            "type": "http", "method": method, "path": path, "root_path": "",
+            "query_string": query, "headers": list(headers), "scheme": "http",
+            "server": ("testserver", 80), "client": ("127.0.0.1", 5000),
+            "http_version": "1.1",
+        }
+        await bridge(scope, receive, send)
+
+    asyncio.run(main())
+    start = next(m for m in sent if m["type"] == "http.response.start")
+    data = b"".join(m.get("body", b"") for m in sent if m["type"] == "http.response.body")
+    return start, data, sent
+
+
+class TestWsgiBridge:
+
+    @pytest.fixture()
+    def flask_app(self):
+        app = Flask(__name__)
+        state = {"closed": threading.Event()}
+        app.config["STATE"] = state
+
+        @app.route("/echo", methods=["POST"])
+        def echo():
+            return {
+                "json": request.get_json(),
+                "q": request.args.get("q"),
+                "async_io": bool(request.environ.get(ASYNC_IO_ENVIRON_KEY)),
+                "ua": request.headers.get("User-Agent"),
+            }
+
+        @app.route("/stream")
+        def stream():
+            def generate():
+                try:
+                    for i in range(3):
+                        yield from await_io(lambda: asyncio.sleep(0.01))
+                        yield json.dumps({"i": i, "path": request.path}) + "\n"
+                finally:
+                    state["closed"].set()
+            return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+        @app.route("/forever")
+        def forever():
+            def generate():
+                try:
+                    while True:
+                        yield from await_io(lambda: asyncio.sleep(0.01))
+                        yield "."
+                finally:
+                    state["closed"].set()
+            return Response(generate())
+
+        return app
+
+    def test_plain_request(self, flask_app, executor) -> None:
+        start, data, _ = _asgi_request(
+            WsgiBridge(flask_app, executor), "POST", "/echo",
+            body=b'{"x": 1}', query=b"q=hello",
+            headers=[(b"content-type", b"application/json"), (b"user-agent", b"pytest")],
+        )
+        assert start["status"] == 200
+        assert json.loads(data) == {"json": {"x": 1}, "q": "hello", "async_io": True, "ua": "pytest"}
+
+    def test_streaming_response_resolves_markers_in_request_context(self, flask_app, executor) -> None:
+        start, data, sent = _asgi_request(WsgiBridge(flask_app, executor), "GET", "/stream")
+        assert (b"content-type", b"application/x-ndjson") in start["headers"]
+        lines = [json.loads(line) for line in data.decode().splitlines()]
+        assert lines == [{"i": i, "path": "/stream"} for i in range(3)]
+        assert sent[-1] == {"type": "http.response.body", "body": b"", "more_body": False}
+        assert flask_app.config["STATE"]["closed"].is_set()
+
+    def test_client_disconnect_closes_the_stream(self, flask_app, executor) -> None:
+        _asgi_request(WsgiBridge(flask_app, executor), "GET", "/forever", disconnect_after=0.05)
+        assert flask_app.config["STATE"]["closed"].is_set()
+
+    def test_lifespan(self, flask_app) -> None:
+        messages = iter([{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+        sent: list[dict] = []
+
+        async def receive():
+            return next(messages)
+
+        async def send(message):
+            sent.append(message)
+
+        asyncio.run(WsgiBridge(flask_app)({"type": "lifespan"}, receive, send))
+        assert [m["type"] for m in sent] == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
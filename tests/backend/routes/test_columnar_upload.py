@@ -0,0 +1,172 @@
+"""Tests for Arrow IPC / parquet request bodies on table upload endpoints.
+
+Background
+----------
+``/create-table`` (raw data), ``/sync-table-data`` and the ephemeral
+``_workspace_tables`` payload only accepted JSON row objects, which the
+backend turned into DataFrames with ``pd.DataFrame(rows)``.  They now also
+accept columnar Arrow IPC or parquet bodies that are written straight to
+parquet; JSON keeps working unchanged.
+"""
+from __future__ import annotations
+
+import base64
+import gzip
+import io
+import json
+import shutil
+from unittest.mock import patch
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+import pytest
+from flask import Flask
+
+from data_formulator.datalake import ephemeral_workspace
+from data_formulator.datalake.parquet_utils import (
+    ARROW_STREAM_MIME_TYPE,
+    is_columnar_payload,
+    read_columnar_payload,
+)
+from data_formulator.datalake.workspace import Workspace
+from data_formulator.routes.tables import tables_bp
+
+pytestmark = [pytest.mark.backend]
+
+
+TABLE = pa.table({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+
+
+def _arrow_stream(table: pa.Table = TABLE) -> bytes:
+    sink = io.BytesIO()
+    with ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def _arrow_file(table: pa.Table = TABLE) -> bytes:
+    sink = io.BytesIO()
+    with ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def _parquet(table: pa.Table = TABLE) -> bytes:
+    sink = io.BytesIO()
+    pq.write_table(table, sink)
+    return sink.getvalue()
+
+
+@pytest.fixture()
+def tmp_workspace(tmp_path):
+    ws = Workspace("test-user", root_dir=tmp_path)
+    yield ws
+    shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+@pytest.fixture()
+def client(tmp_workspace):
+    from data_formulator.error_handler import register_error_handlers
+
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    app.register_blueprint(tables_bp)
+    register_error_handlers(app)
+    with patch("data_formulator.routes.tables._get_workspace", return_value=tmp_workspace):
+        with app.test_client() as c:
+            yield c
+
+
+class TestReadColumnarPayload:
+
+    @pytest.mark.parametrize("encode", [_arrow_stream, _arrow_file, _parquet])
+    def test_formats_are_sniffed(self, encode) -> None:
+        data = encode()
+        assert is_columnar_payload(data)
+        assert read_columnar_payload(data).equals(TABLE)
+
+    def test_gzip_is_unwrapped(self) -> None:
+        assert read_columnar_payload(gzip.compress(_arrow_stream())).equals(TABLE)
+
+    def test_json_is_not_columnar(self) -> None:
+        assert not is_columnar_payload(b'[{"id": 1}]')
+        assert is_columnar_payload(b"", ARROW_STREAM_MIME_TYPE + "; charset=binary")
+
+    def test_invalid_payload_raises_value_error(self) -> None:
+        with pytest.raises(ValueError):
+            read_columnar_payload(b"PAR1 definitely not parquet")
+
+
+class TestCreateTable:
+
+    def _create(self, client, payload: bytes, mimetype: str, filename: str) -> dict:
+        resp = client.post(
+            "/api/tables/create-table",
+            data={"table_name": "t", "raw_data": (io.BytesIO(payload), filename, mimetype)},
+            content_type="multipart/form-data",
+        )
+        return resp.get_json()
+
+    def test_arrow_raw_data(self, client, tmp_workspace) -> None:
+        body = self._create(client, _arrow_stream(), ARROW_STREAM_MIME_TYPE, "data.arrow")
+        assert body["status"] == "success"
+        assert body["data"]["row_count"] == 3
+        assert body["data"]["columns"] == ["id", "name"]
+        assert tmp_workspace.read_data_as_df("t")["name"].tolist() == ["a", "b", "c"]
+
+    def test_gzipped_json_still_works(self, client, tmp_workspace) -> None:
+        payload = gzip.compress(json.dumps([{"id": 1}, {"id": 2}]).encode())
+        body = self._create(client, payload, "application/gzip", "data.json.gz")
+        assert body["data"]["row_count"] == 2
+
+    def test_corrupt_arrow_is_validation_error(self, client) -> None:
+        body = self._create(client, b"garbage", ARROW_STREAM_MIME_TYPE, "data.arrow")
+        assert body["status"] == "error"
+        assert body["error"]["code"] == "VALIDATION_ERROR"
+
+
+class TestSyncTableData:
+
+    def _sync(self, client, payload: bytes, **fields) -> dict:
+        data = {k: v for k, v in fields.items()}
+        data["rows"] = (io.BytesIO(payload), "rows.arrow", ARROW_STREAM_MIME_TYPE)
+        resp = client.post("/api/tables/sync-table-data", data=data,
+                           content_type="multipart/form-data")
+        return resp.get_json()
+
+    def test_replace_with_arrow(self, client, tmp_workspace) -> None:
+        tmp_workspace.write_parquet(pd.DataFrame({"id": [9], "name": ["z"]}), "t")
+        body = self._sync(client, _arrow_stream(), table_name="t")
+        assert body["data"]["row_count"] == 3
+        assert tmp_workspace.read_data_as_df("t")["id"].tolist() == [1, 2, 3]
+
+    def test_upsert_with_arrow_and_form_key_columns(self, client, tmp_workspace) -> None:
+        tmp_workspace.write_parquet(pd.DataFrame({"id": [1, 4], "name": ["old", "d"]}), "t")
+        body = self._sync(client, _parquet(), table_name="t", mode="upsert",
+                          key_columns=json.dumps(["id"]))
+        assert body["data"]["rows_replaced"] == 1
+        df = tmp_workspace.read_data_as_df("t").set_index("id")
+        assert sorted(df.index) == [1, 2, 3, 4]
+        assert df.loc[1, "name"] == "a"
+
+    def test_json_body_still_works(self, client, tmp_workspace) -> None:
+        tmp_workspace.write_parquet(pd.DataFrame({"id": [9]}), "t")
+        resp = client.post("/api/tables/sync-table-data",
+                           data=json.dumps({"table_name": "t", "rows": [{"id": 1}]}),
+                           content_type="application/json")
+        assert resp.get_json()["data"]["row_count"] == 1
+
+
+class TestEphemeralWorkspaceTables:
+
+    def test_arrow_entries_are_materialized(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr(ephemeral_workspace, "_EPHEMERAL_ROOT", tmp_path)
+        ws = ephemeral_workspace.construct_scratch_workspace("u", "w", [
+            {"name": "columnar", "arrow": base64.b64encode(_arrow_file()).decode()},
+            {"name": "rows", "rows": [{"id": 1}]},
+            {"name": "broken", "arrow": "not base64!"},
+        ])
+        assert sorted(ws.list_tables()) == ["columnar", "rows"]
+        assert ws.read_data_as_df("columnar")["id"].tolist() == [1, 2, 3]
@@ -0,0 +1,216 @@
+"""Tests for cached counts and materialised result sets in ``/sample-table``.
+
+Background
+----------
+Scrolling a large table with ``method="head"``/``"bottom"`` and a growing
+``offset`` used to re-run the full filter + sort and a ``COUNT(*)`` for
+every page.  Counts are now cached per query shape, and once the grid
+scrolls past the first page the sorted rows are materialised once and
+paged by position.  Entries are keyed by the table's data identity
+(workspace, table name, file size/mtime) rather than its sampled
+``content_hash``, and every page breaks sort ties on ``#rowId``.
+"""
+from __future__ import annotations
+
+import json
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from flask import Flask
+
+from data_formulator.datalake.result_set_cache import ResultSetCache
+from data_formulator.datalake.workspace import Workspace
+from data_formulator.routes.tables import tables_bp
+
+pytestmark = [pytest.mark.backend]
+
+
+@pytest.fixture()
+def tmp_workspace(tmp_path):
+    ws = Workspace("test-user", root_dir=tmp_path / "ws")
+    yield ws
+    shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+@pytest.fixture()
+def cache(tmp_path):
+    return ResultSetCache(tmp_path / "result_sets")
+
+
+@pytest.fixture()
+def client(tmp_workspace, cache):
+    from data_formulator.error_handler import register_error_handlers
+
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    app.register_blueprint(tables_bp)
+    register_error_handlers(app)
+    with patch("data_formulator.routes.tables._get_workspace", return_value=tmp_workspace), \
+         patch("data_formulator.routes.tables._should_use_duckdb", return_value=True), \
+         patch("data_formulator.routes.tables.get_result_set_cache", return_value=cache):
+        with app.test_client() as c:
+            yield c
+
+
+@pytest.fixture()
+def seeded_table(tmp_workspace):
+    df = pd.DataFrame({
+        "value": [(i * 37) % 100 for i in range(100)],
+        "group": ["x" if i % 2 else "y" for i in range(100)],
+    })
+    tmp_workspace.write_parquet(df, "scroll_data")
+    return "scroll_data"
+
+
+def _sample(client, table: str, **kwargs) -> dict:
+    resp = client.post(
+        "/api/tables/sample-table",
+        data=json.dumps({"table": table, **kwargs}),
+        content_type="application/json",
+    )
+    assert resp.status_code == 200
+    return resp.get_json()["data"]
+
+
+def _values(data: dict) -> list:
+    return [r["value"] for r in data["rows"]]
+
+
+class TestSortedResultSetPaging:
+
+    def test_pages_follow_sort_order(self, client, seeded_table) -> None:
+        pages = [
+            _values(_sample(client, seeded_table, method="head", order_by_fields=["value"],
+                            size=10, offset=offset))
+            for offset in range(0, 100, 10)
+        ]
+        flat = [v for page in pages for v in page]
+        assert flat == sorted(flat)
+        assert len(flat) == 100
+
+    def test_bottom_with_filter(self, client, seeded_table) -> None:
+        kwargs = dict(method="bottom", order_by_fields=["value"], size=5,
+                      filters=[{"op": "in", "field": "group", "values": ["x"]}])
+        first = _sample(client, seeded_table, offset=0, **kwargs)
+        second = _sample(client, seeded_table, offset=5, **kwargs)
+        assert first["total_row_count"] == second["total_row_count"] == 50
+        values = _values(first) + _values(second)
+        assert values == sorted(values, reverse=True)
+
+    def test_deep_pages_do_not_rescan_the_table(self, client, tmp_workspace, seeded_table) -> None:
+        kwargs = dict(method="head", order_by_fields=["value"], size=10)
+        _sample(client, seeded_table, offset=10, **kwargs)
+        with patch.object(tmp_workspace, "run_parquet_sql", wraps=tmp_workspace.run_parquet_sql) as spy:
+            for offset in (20, 50, 90):
+                _sample(client, seeded_table, offset=offset, **kwargs)
+        assert spy.call_count == 0
+
+    def test_rewritten_table_invalidates_pages(self, client, tmp_workspace, seeded_table) -> None:
+        kwargs = dict(method="head", order_by_fields=["value"], size=10, offset=10)
+        _sample(client, seeded_table, **kwargs)
+        tmp_workspace.write_parquet(pd.DataFrame({"value": list(range(500, 520)), "group": ["x"] * 20}),
+                                    seeded_table)
+        data = _sample(client, seeded_table, **kwargs)
+        assert data["total_row_count"] == 20
+        assert _values(data) == list(range(510, 520))
+
+    def test_ties_keep_the_same_order_on_every_page(self, client, seeded_table) -> None:
+        # "group" has only two values, so the order rests on the tie-breaker.
+        kwargs = dict(method="head", order_by_fields=["group"], size=10)
+        rows = [r for offset in range(0, 100, 10)
+                for r in _sample(client, seeded_table, offset=offset, **kwargs)["rows"]]
+        keys = [(r["group"], r["#rowId"]) for r in rows]
+        assert keys == sorted(keys)
+        assert len({r["#rowId"] for r in rows}) == 100
+
+    def test_select_fields_keep_row_id(self, client, seeded_table) -> None:
+        data = _sample(client, seeded_table, method="head", order_by_fields=["value"],
+                       select_fields=["value"], size=3, offset=3)
+        assert list(data["rows"][0]) == ["#rowId", "value"]
+
+
+class TestCountCache:
+
+    def test_count_computed_once_per_shape(self, client, tmp_workspace, seeded_table) -> None:
+        _sample(client, seeded_table, method="random", size=5)
+        with patch.object(tmp_workspace, "run_parquet_sql", wraps=tmp_workspace.run_parquet_sql) as spy:
+            data = _sample(client, seeded_table, method="random", size=5)
+        assert data["total_row_count"] == 100
+        assert spy.call_count == 1  # the sample itself, not the count
+
+
+class TestTableDataIdentity:
+
+    def test_same_data_in_two_workspaces_does_not_share_entries(self, tmp_path, tmp_workspace, seeded_table) -> None:
+        other = Workspace("other-user", root_dir=tmp_path / "ws2")
+        other.write_parquet(tmp_workspace.read_data_as_df(seeded_table), seeded_table)
+        assert (other.get_table_metadata(seeded_table).content_hash
+                == tmp_workspace.get_table_metadata(seeded_table).content_hash)
+        assert other.table_data_identity(seeded_table) != tmp_workspace.table_data_identity(seeded_table)
+
+    def test_changes_when_rows_are_appended(self, tmp_workspace, seeded_table) -> None:
+        before = tmp_workspace.table_data_identity(seeded_table)
+        tmp_workspace.append_parquet(pd.DataFrame({"value": [1], "group": ["x"]}), seeded_table)
+        assert tmp_workspace.table_data_identity(seeded_table) != before
+
+    def test_unknown_table_is_not_cacheable(self, tmp_workspace) -> None:
+        assert tmp_workspace.table_data_identity("missing") is None
+
+
+class TestResultSetCache:
+
+    def test_lru_bounds_materialised_files(self, tmp_path) -> None:
+        cache = ResultSetCache(tmp_path, max_result_sets=2)
+
+        def _materialize(n: int):
+            def _write(target: str) -> None:
+                import duckdb
+                duckdb.connect().execute(
+                    f'COPY (SELECT range AS "#pos", range AS v FROM range({n})) TO {target} (FORMAT PARQUET)'
+                )
+            return _write
+
+        for i in range(3):
+            assert cache.get_page(f"k{i}", _materialize(10), 2, 3)["v"].tolist() == [2, 3, 4]
+        assert not cache.has_result_set("k0")
+        assert len(list(tmp_path.glob("*.parquet"))) == 2
+
+    def test_concurrent_requests_materialise_once(self, tmp_path) -> None:
+        cache = ResultSetCache(tmp_path)
+        calls: list[str] = []
+        builder: dict[str, int] = {}
+
+        class _SlowAfterBuild:
+            # Delays the builder's bookkeeping once its file is written,
+            # widening the gap in which a waiter used to start a second build.
+            def __init__(self, inner) -> None:
+                self._inner = inner
+
+            def __enter__(self):
+                if builder.get("done") == threading.get_ident():
+                    time.sleep(0.2)
+                return self._inner.__enter__()
+
+            def __exit__(self, *exc):
+                return self._inner.__exit__(*exc)
+
+        cache._lock = _SlowAfterBuild(cache._lock)
+
+        def _write(target: str) -> None:
+            import duckdb
+            calls.append(target)
+            time.sleep(0.05)
+            duckdb.connect().execute(
+                f'COPY (SELECT range AS "#pos", range AS v FROM range(10)) TO {target} (FORMAT PARQUET)'
+            )
+            builder.setdefault("done", threading.get_ident())
+
+        with ThreadPoolExecutor(4) as pool:
+            pages = list(pool.map(lambda _: cache.get_page("k", _write, 0, 2)["v"].tolist(), range(4)))
+        assert pages == [[0, 1]] * 4
+        assert len(calls) == 1
@@ -14,6 +14,9 @@ if str(PY_SRC) not in sys.path:
 
 # Snapshot captured at conftest load time — before any test or load_dotenv() runs.
 _PRISTINE_ENV: dict[str, str] = dict(os.environ)
+# Agent tests script LLM replies with mocks; a persistent response cache in
+# the developer's data home would replay answers across tests and runs.
+_PRISTINE_ENV.setdefault("LLM_RESPONSE_CACHE", "off")
 
 
 def _reset_to_pristine() -> None: